@@ -597,9 +597,16 @@ class ModuleWrapper(
 
         This is the sync-only part of initialization: fast module walking
         that populates self.components and triggers symbol generation.
+        The result is restored from / saved to a startup snapshot when the
+        module sources and wrapper configuration are unchanged.
         """
         import inspect
 
+        from adapters.module_wrapper.snapshot import load_snapshot, save_snapshot
+
+        if load_snapshot(self):
+            return
+
         logger.info(
             f"Introspecting module {self.module_name} (max depth: {self.max_depth})..."
         )
@@ -654,6 +661,8 @@ class ModuleWrapper(
         # Trigger lazy symbol generation so symbols are ready immediately
         _ = self.symbol_mapping
 
+        save_snapshot(self)
+
     def _run_pipeline_background(self, coll_name: str):
         """Run the ingestion pipeline in a background thread.
 
@@ -55,6 +55,7 @@ from adapters.module_wrapper.types import (
     TimestampedMixin,
     WrapperGetter,
 )
+from config.cache_registry import register_cache, sampled_size
 from config.enhanced_logging import setup_logger
 
 logger = setup_logger()
@@ -166,11 +167,27 @@ class LRUCache:
 
             self._cache[key] = entry
 
+    def evict_oldest(self, count: int) -> int:
+        """Evict up to *count* least recently used items via the callback."""
+        with self._lock:
+            evicted = 0
+            while self._cache and evicted < count:
+                evicted_key, evicted_entry = self._cache.popitem(last=False)
+                if self.on_evict:
+                    self.on_evict(evicted_key, evicted_entry)
+                evicted += 1
+            return evicted
+
     def remove(self, key: CacheKey) -> Optional[CacheEntry]:
         """Remove and return item without triggering eviction callback."""
         with self._lock:
             return self._cache.pop(key, None)
 
+    def get_quiet(self, key: CacheKey) -> Optional[CacheEntry]:
+        """Get item without updating recency (for inspection)."""
+        with self._lock:
+            return self._cache.get(key)
+
     def contains(self, key: CacheKey) -> bool:
         """Check if key exists without updating access time."""
         with self._lock:
@@ -238,6 +255,18 @@ class ComponentCache:
         # Load L2 index from disk
         self._load_l2_index()
 
+        # Memory budget: shrinking L1 spills entries to L2, so it is cheap
+        self._cache_handle = register_cache(
+            "component_cache_l1",
+            size_fn=lambda: sampled_size(
+                (self._l1.get_quiet(k) for k in self._l1.keys()), len(self._l1)
+            ),
+            evict_fn=lambda fraction: self._l1.evict_oldest(
+                max(1, int(len(self._l1) * fraction))
+            ),
+            priority=6,
+        )
+
         # Stats
         self._stats = {
             "l1_hits": 0,
@@ -444,10 +473,13 @@ class ComponentCache:
         entry = self._l1.get(key)
         if entry:
             self._stats["l1_hits"] += 1
+            self._cache_handle.hit()
             if self.auto_hydrate and not entry._is_hydrated:
                 self._hydrate_entry(entry)
             return entry
 
+        self._cache_handle.miss()
+
         # L2: Check pickle storage
         entry = self._load_from_l2(key)
         if entry:
@@ -16,9 +16,14 @@ COLBERT_DIM = _COLBERT_DIM
 RELATIONSHIPS_DIM = _RELATIONSHIPS_DIM
 
 # --- Import base class (mixin contract, _resolve_using, class-level state) ---
+# --- and all method implementations ---
+from ._async_search import (
+    _prefetch_candidates_async,
+    _query_grouped_candidates_async,
+    _query_prefetch_stages_async,
+    search_hybrid_dispatch_async,
+)
 from ._base import SearchMixin
-
-# --- Import all method implementations ---
 from ._basic import (
     _direct_component_lookup,
     _get_component_from_path,
@@ -52,6 +57,7 @@ from ._embedding import (
 )
 from ._hybrid_dispatch import (
     _run_shadow_scoring,
+    _search_methods_by_mode,
     search_hybrid_dispatch,
 )
 from ._hybrid_helpers import (
@@ -71,6 +77,7 @@ from ._learned_model import (
     _ensure_learned_dag,
     _load_learned_model,
     _resolve_checkpoint_path,
+    _score_learned_candidates,
 )
 from ._named_vector import search_hybrid, search_named_vector
 from ._result_processing import _merge_results_rrf
@@ -135,6 +142,13 @@ SearchMixin._categorize_scored_results = _categorize_scored_results
 # Hybrid dispatch
 SearchMixin.search_hybrid_dispatch = search_hybrid_dispatch
 SearchMixin._run_shadow_scoring = _run_shadow_scoring
+SearchMixin._search_methods_by_mode = _search_methods_by_mode
+
+# Async search (concurrent prefetch on AsyncQdrantClient)
+SearchMixin.search_hybrid_dispatch_async = search_hybrid_dispatch_async
+SearchMixin._prefetch_candidates_async = _prefetch_candidates_async
+SearchMixin._query_prefetch_stages_async = _query_prefetch_stages_async
+SearchMixin._query_grouped_candidates_async = _query_grouped_candidates_async
 
 # Scoring (static methods)
 SearchMixin._maxsim = staticmethod(_maxsim)
@@ -147,6 +161,7 @@ SearchMixin.search_hybrid_multidim = search_hybrid_multidim
 # Learned model
 SearchMixin._resolve_checkpoint_path = _resolve_checkpoint_path
 SearchMixin._load_learned_model = _load_learned_model
+SearchMixin._score_learned_candidates = _score_learned_candidates
 SearchMixin._ensure_learned_dag = _ensure_learned_dag
 SearchMixin._collection_has_content_vector = _collection_has_content_vector
 
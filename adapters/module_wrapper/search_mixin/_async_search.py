@@ -0,0 +1,324 @@
+"""Async search path: concurrent per-vector prefetch via AsyncQdrantClient.
+
+The sync hybrid searches issue one blocking ``query_points`` (server-side
+prefetch + fusion) from whatever thread the caller provides, so card tools
+end up parking an executor thread for the whole pipeline.  This path keeps
+the network I/O on the event loop instead:
+
+    1. Embed the query (CPU, short ``asyncio.to_thread`` hop)
+    2. multidim: issue each prefetch stage (components, inputs,
+       relationships, content) as its own ``query_points`` on the shared
+       AsyncQdrantClient, concurrently, and fuse the stage rankings
+       client-side with RRF.  learned: the same grouped
+       ``query_points_groups`` call as the sync path, awaited on the loop
+    3. Hand the fused candidates to the existing sync reranker
+       (multidim / learned) via ``prefetched=`` for the CPU-only scoring
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from adapters.module_wrapper.types import RELATIONSHIPS_DIM, PrefetchedCandidates
+from config.enhanced_logging import setup_logger
+
+from ._hybrid_dispatch import _resolve_search_mode
+from ._hybrid_learned import _learned_relationship_text
+from ._hybrid_multidim import _multidim_relationship_text
+
+logger = setup_logger()
+
+# Modes whose candidate collection can be split into concurrent stages.
+# "rrf" is already a single fused round-trip and "recursive" issues
+# data-dependent follow-up queries, so both run the sync pipeline off-loop.
+_ASYNC_PREFETCH_MODES = ("learned", "multidim")
+
+
+async def _query_prefetch_stages_async(
+    self,
+    client,
+    prefetch_list: list,
+    rrf_k: int = 60,
+) -> list:
+    """Run each prefetch stage concurrently and fuse the rankings with RRF.
+
+    Each ``Prefetch`` becomes an independent ``query_points`` call (with
+    vectors, for client-side reranking).  A failing stage is logged and
+    skipped so the remaining dimensions still contribute candidates.
+
+    Returns:
+        Deduplicated points ordered by fused RRF score.
+    """
+
+    async def _run_stage(prefetch):
+        response = await client.query_points(
+            collection_name=self.collection_name,
+            query=prefetch.query,
+            using=prefetch.using,
+            query_filter=prefetch.filter,
+            limit=prefetch.limit,
+            with_payload=True,
+            with_vectors=True,
+        )
+        return response.points
+
+    stage_results = await asyncio.gather(
+        *(_run_stage(p) for p in prefetch_list), return_exceptions=True
+    )
+
+    rrf_scores: Dict[Any, float] = {}
+    points_by_id: Dict[Any, Any] = {}
+    stage_counts = {}
+    for prefetch, result in zip(prefetch_list, stage_results):
+        if isinstance(result, BaseException):
+            logger.warning(
+                "Async prefetch stage '%s' failed: %s", prefetch.using, result
+            )
+            continue
+        stage_counts[prefetch.using] = len(result)
+        for rank, point in enumerate(result, start=1):
+            rrf_scores[point.id] = rrf_scores.get(point.id, 0.0) + 1.0 / (rrf_k + rank)
+            points_by_id.setdefault(point.id, point)
+
+    ordered_ids = sorted(rrf_scores, key=rrf_scores.__getitem__, reverse=True)
+    logger.info(
+        "Async prefetch: %d candidates from %d stages: %s",
+        len(ordered_ids),
+        len(stage_counts),
+        stage_counts,
+    )
+    return [points_by_id[pid] for pid in ordered_ids]
+
+
+async def _query_grouped_candidates_async(
+    self,
+    client,
+    prefetch_list: list,
+    candidate_pool_size: int,
+    group_size: int,
+) -> list:
+    """Async counterpart of ``_query_grouped_candidates`` (same query, same fallback)."""
+    from qdrant_client.models import Fusion, FusionQuery
+
+    try:
+        grouped = await client.query_points_groups(
+            collection_name=self.collection_name,
+            group_by="type",
+            prefetch=prefetch_list,
+            query=FusionQuery(fusion=Fusion.RRF),
+            limit=5,  # up to 5 type groups (class, instance_pattern, function, etc.)
+            group_size=group_size,
+            with_payload=True,
+            with_vectors=True,
+        )
+        points = [hit for group in grouped.groups for hit in group.hits]
+        logger.info(
+            "Async grouped query: %d points across %d groups",
+            len(points),
+            len(grouped.groups),
+        )
+        return points
+    except Exception as e:
+        logger.warning(
+            "Async query_points_groups failed (%s), falling back to query_points", e
+        )
+        # The sync fallback rebuilds the pipeline without the content stage
+        results = await client.query_points(
+            collection_name=self.collection_name,
+            prefetch=[p for p in prefetch_list if p.using != "content"],
+            query=FusionQuery(fusion=Fusion.RRF),
+            limit=candidate_pool_size * 3,
+            with_payload=True,
+            with_vectors=True,
+        )
+        return results.points
+
+
+async def _prefetch_candidates_async(
+    self,
+    client,
+    search_mode: str,
+    description: str,
+    component_paths: Optional[List[str]],
+    token_ratio: float,
+    content_feedback: Optional[str],
+    form_feedback: Optional[str],
+    include_classes: bool,
+    candidate_pool_size: int,
+    content_text: Optional[str],
+) -> Optional[PrefetchedCandidates]:
+    """Embed the query and gather candidates for ``search_mode`` asynchronously.
+
+    Mirrors the embedding text and prefetch stages of the sync multidim and
+    learned searches.  Returns None when the query cannot be embedded.
+    """
+    if search_mode == "learned":
+        rel_text = _learned_relationship_text(description, component_paths)
+        include_classes = True  # learned always scores classes + patterns
+    else:
+        rel_text = _multidim_relationship_text(description, component_paths)
+
+    def _embed():
+        colbert = self._embed_with_colbert(description, token_ratio)
+        minilm = self._embed_with_minilm(rel_text)
+        content = self._embed_with_minilm(content_text) if content_text else None
+        return colbert, minilm, content
+
+    query_colbert, query_minilm, query_content_minilm = await asyncio.to_thread(_embed)
+
+    if not query_colbert or (search_mode == "learned" and not query_minilm):
+        logger.warning("Could not embed query for async %s search", search_mode)
+        return None
+
+    prefetch_list = self._build_prefetch_list(
+        query_colbert,
+        query_minilm or [0.0] * RELATIONSHIPS_DIM,
+        candidate_pool_size,
+        include_classes=include_classes,
+        content_feedback=content_feedback,
+        form_feedback=form_feedback,
+        query_content_minilm=query_content_minilm,
+    )
+    if search_mode == "learned":
+        points = await self._query_grouped_candidates_async(
+            client,
+            prefetch_list,
+            candidate_pool_size,
+            group_size=candidate_pool_size,
+        )
+    else:
+        # Match the sync multidim pipeline: no components stage without
+        # classes, no relationships stage for a zero vector, pool * 3 fused.
+        prefetch_list = [
+            p
+            for p in prefetch_list
+            if not (p.using == "components" and not include_classes)
+            and not (p.using == "relationships" and not query_minilm)
+        ]
+        points = await self._query_prefetch_stages_async(client, prefetch_list)
+        points = points[: candidate_pool_size * 3]
+    return PrefetchedCandidates(
+        query_colbert=query_colbert,
+        query_minilm=query_minilm,
+        query_content_minilm=query_content_minilm,
+        points=points,
+    )
+
+
+async def search_hybrid_dispatch_async(
+    self,
+    description: str,
+    component_paths: Optional[List[str]] = None,
+    limit: int = 10,
+    token_ratio: float = 1.0,
+    content_feedback: Optional[str] = None,
+    form_feedback: Optional[str] = None,
+    include_classes: bool = True,
+    candidate_pool_size: int = 20,
+    content_text: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Async counterpart of ``search_hybrid_dispatch``.
+
+    For 'learned' and 'multidim' modes the prefetch stages are issued
+    concurrently on the shared AsyncQdrantClient and only the reranking
+    runs in a worker thread.  Other modes, or a missing async client,
+    fall back to running the sync dispatch in a thread.
+
+    Same signature and return shape as ``search_hybrid_dispatch``.
+    """
+    sync_kwargs = dict(
+        description=description,
+        component_paths=component_paths,
+        limit=limit,
+        token_ratio=token_ratio,
+        content_feedback=content_feedback,
+        form_feedback=form_feedback,
+        include_classes=include_classes,
+        candidate_pool_size=candidate_pool_size,
+        content_text=content_text,
+    )
+
+    if not self._require_qdrant("search_hybrid_dispatch_async"):
+        return [], [], []
+
+    search_mode, settings = _resolve_search_mode()
+    if search_mode not in _ASYNC_PREFETCH_MODES:
+        return await asyncio.to_thread(self.search_hybrid_dispatch, **sync_kwargs)
+
+    from config.qdrant_client import get_async_qdrant_client
+
+    client = await get_async_qdrant_client()
+    if client is None:
+        return await asyncio.to_thread(self.search_hybrid_dispatch, **sync_kwargs)
+
+    try:
+        from middleware.langfuse_integration import set_sampling_trace_context
+
+        set_sampling_trace_context(search_mode=search_mode)
+    except ImportError:
+        pass
+
+    # content_text only supported by learned (matches sync dispatch)
+    if search_mode != "learned":
+        content_text = None
+
+    logger.info("Using search mode: %s (async prefetch)", search_mode)
+    try:
+        prefetched = await self._prefetch_candidates_async(
+            client,
+            search_mode,
+            description=description,
+            component_paths=component_paths,
+            token_ratio=token_ratio,
+            content_feedback=content_feedback,
+            form_feedback=form_feedback,
+            include_classes=include_classes,
+            candidate_pool_size=candidate_pool_size,
+            content_text=content_text,
+        )
+    except Exception as e:
+        logger.warning("Async prefetch failed (%s), using sync dispatch", e)
+        return await asyncio.to_thread(self.search_hybrid_dispatch, **sync_kwargs)
+
+    if prefetched is None:
+        return [], [], []
+
+    rerank = (
+        self.search_hybrid_learned
+        if search_mode == "learned"
+        else self.search_hybrid_multidim
+    )
+    rerank_kwargs = dict(
+        description=description,
+        component_paths=component_paths,
+        limit=limit,
+        token_ratio=token_ratio,
+        content_feedback=content_feedback,
+        form_feedback=form_feedback,
+        include_classes=include_classes,
+        candidate_pool_size=candidate_pool_size,
+        prefetched=prefetched,
+    )
+    if content_text:
+        rerank_kwargs["content_text"] = content_text
+    result = await asyncio.to_thread(rerank, **rerank_kwargs)
+
+    if settings is not None and getattr(settings, "search_shadow_scoring", False):
+        common_kwargs = {
+            k: v
+            for k, v in sync_kwargs.items()
+            if k not in ("candidate_pool_size", "content_text")
+        }
+        pool_kwargs = {**common_kwargs, "candidate_pool_size": candidate_pool_size}
+        if content_text:
+            pool_kwargs["content_text"] = content_text
+        await asyncio.to_thread(
+            self._run_shadow_scoring,
+            active_mode=search_mode,
+            active_result=result,
+            search_methods=self._search_methods_by_mode(),
+            common_kwargs=common_kwargs,
+            pool_kwargs=pool_kwargs,
+            description=description,
+        )
+
+    return result
@@ -42,6 +42,7 @@ class SearchMixin:
             "search_named_vector",
             "search_hybrid",
             "search_hybrid_dispatch",
+            "search_hybrid_dispatch_async",
             "search_hybrid_multidim",
             "get_component_info",
             "list_components",
@@ -69,6 +70,7 @@ class SearchMixin:
 
     # --- Learned model class-level state ---
     _learned_model = None  # class-level cache for the trained model
+    _learned_runtime = None  # compiled NumPy forward for the cached model
     _learned_feature_version = 1  # 1=9D, 2=8D, 3=14D, 4=15D, 5=17D
     _learned_model_type = "single"  # "single", "dual_head", or "unified" (UnifiedTRN)
     _learned_model_domain = None  # domain_id from checkpoint
@@ -9,6 +9,37 @@ from config.enhanced_logging import setup_logger
 logger = setup_logger()
 
 
+def _resolve_search_mode() -> Tuple[str, Any]:
+    """Return (search_mode, settings) from the settings snapshot.
+
+    Falls back to ENABLE_MULTIDIM_SEARCH when SEARCH_MODE is left at 'rrf'.
+    ``settings`` is None if the snapshot could not be loaded.
+    """
+    search_mode = "rrf"
+    settings = None
+    try:
+        from config.settings import get_settings
+
+        settings = get_settings()
+        search_mode = settings.search_mode
+        # Backwards compat: ENABLE_MULTIDIM_SEARCH overrides if search_mode is default
+        if search_mode == "rrf" and settings.enable_multidim_search:
+            search_mode = "multidim"
+    except Exception:
+        pass
+    return search_mode, settings
+
+
+def _search_methods_by_mode(self) -> Dict[str, Any]:
+    """Map search mode names to the bound search methods."""
+    return {
+        "recursive": self.search_hybrid_recursive,
+        "learned": self.search_hybrid_learned,
+        "multidim": self.search_hybrid_multidim,
+        "rrf": self.search_hybrid,
+    }
+
+
 def search_hybrid_dispatch(
     self,
     description: str,
@@ -35,18 +66,7 @@ def search_hybrid_dispatch(
     if not self._require_qdrant("search_hybrid_dispatch"):
         return [], [], []
 
-    search_mode = "rrf"
-    settings = None
-    try:
-        from config.settings import Settings
-
-        settings = Settings()
-        search_mode = settings.search_mode
-        # Backwards compat: ENABLE_MULTIDIM_SEARCH overrides if search_mode is default
-        if search_mode == "rrf" and settings.enable_multidim_search:
-            search_mode = "multidim"
-    except Exception:
-        pass
+    search_mode, settings = _resolve_search_mode()
 
     try:
         from middleware.langfuse_integration import set_sampling_trace_context
@@ -56,12 +76,7 @@ def search_hybrid_dispatch(
         pass
 
     # Map mode names to methods
-    _search_methods = {
-        "recursive": self.search_hybrid_recursive,
-        "learned": self.search_hybrid_learned,
-        "multidim": self.search_hybrid_multidim,
-        "rrf": self.search_hybrid,
-    }
+    _search_methods = self._search_methods_by_mode()
 
     # Build common kwargs (rrf doesn't take candidate_pool_size)
     _common_kwargs = dict(
@@ -2,11 +2,21 @@
 
 from typing import Any, Dict, List, Optional, Tuple
 
+from adapters.module_wrapper.types import PrefetchedCandidates
 from config.enhanced_logging import setup_logger
 
 logger = setup_logger()
 
 
+def _learned_relationship_text(
+    description: str, component_paths: Optional[List[str]] = None
+) -> str:
+    """Text embedded for the relationships vector in learned search."""
+    if component_paths:
+        return f"{description} components: {', '.join(component_paths)}"
+    return description
+
+
 def search_hybrid_learned(
     self,
     description: str,
@@ -18,6 +28,7 @@ def search_hybrid_learned(
     include_classes: bool = True,
     candidate_pool_size: int = 20,
     content_text: Optional[str] = None,
+    prefetched: Optional[PrefetchedCandidates] = None,
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
     Search using a trained learned scorer for reranking.
@@ -28,13 +39,14 @@ def search_hybrid_learned(
       - SimilarityScorerMW: features(9D) → single score
 
     Same prefetch pipeline as search_hybrid_multidim, but replaces
-    multiplicative scoring with a trained reranker.
+    multiplicative scoring with a trained reranker.  When ``prefetched`` is
+    given (async path), embedding and the Qdrant query are skipped.
     """
     if not self._require_qdrant("search_hybrid_learned"):
         return [], [], []
 
     try:
-        import torch
+        import torch  # noqa: F401 -- availability check
     except ImportError:
         logger.warning("torch not installed, falling back to multidim")
         return self.search_hybrid_multidim(
@@ -47,6 +59,7 @@ def search_hybrid_learned(
             include_classes=include_classes,
             candidate_pool_size=candidate_pool_size,
             content_text=content_text,
+            prefetched=prefetched,
         )
 
     # Load model with domain awareness
@@ -66,6 +79,7 @@ def search_hybrid_learned(
             include_classes=include_classes,
             candidate_pool_size=candidate_pool_size,
             content_text=content_text,
+            prefetched=prefetched,
         )
 
     # Domain mismatch guard: don't use a gchat model to score email components
@@ -86,37 +100,42 @@ def search_hybrid_learned(
             include_classes=include_classes,
             candidate_pool_size=candidate_pool_size,
             content_text=content_text,
+            prefetched=prefetched,
         )
 
     try:
-        # --- Step 1: Embed query ---
-        query_colbert = self._embed_with_colbert(description, token_ratio)
-
-        rel_text = description
-        if component_paths:
-            rel_text = f"{description} components: {', '.join(component_paths)}"
-
-        query_minilm = self._embed_with_minilm(rel_text)
-
-        if not query_colbert or not query_minilm:
-            logger.warning("Could not embed query for learned search")
-            return [], [], []
-
-        # Embed content text if provided (same MiniLM model, 384D)
-        query_content_minilm = None
-        if content_text:
-            query_content_minilm = self._embed_with_minilm(content_text)
-
-        # --- Step 2: Grouped prefetch + query Qdrant ---
-        points = self._query_grouped_candidates(
-            query_colbert,
-            query_minilm,
-            candidate_pool_size,
-            content_feedback=content_feedback,
-            form_feedback=form_feedback,
-            group_size=candidate_pool_size,
-            query_content_minilm=query_content_minilm,
-        )
+        if prefetched is not None:
+            query_colbert = prefetched.query_colbert
+            query_minilm = prefetched.query_minilm
+            query_content_minilm = prefetched.query_content_minilm
+            points = prefetched.points
+        else:
+            # --- Step 1: Embed query ---
+            query_colbert = self._embed_with_colbert(description, token_ratio)
+
+            rel_text = _learned_relationship_text(description, component_paths)
+
+            query_minilm = self._embed_with_minilm(rel_text)
+
+            if not query_colbert or not query_minilm:
+                logger.warning("Could not embed query for learned search")
+                return [], [], []
+
+            # Embed content text if provided (same MiniLM model, 384D)
+            query_content_minilm = None
+            if content_text:
+                query_content_minilm = self._embed_with_minilm(content_text)
+
+            # --- Step 2: Grouped prefetch + query Qdrant ---
+            points = self._query_grouped_candidates(
+                query_colbert,
+                query_minilm,
+                candidate_pool_size,
+                content_feedback=content_feedback,
+                form_feedback=form_feedback,
+                group_size=candidate_pool_size,
+                query_content_minilm=query_content_minilm,
+            )
 
         if not points:
             logger.info("Learned search: no candidates found")
@@ -135,57 +154,30 @@ def search_hybrid_learned(
             query_content_minilm=query_content_minilm,
         )
 
-        features_tensor = torch.tensor(features_list, dtype=torch.float32)
         is_unified = self._learned_model_type == "unified"
-        is_dual = self._learned_model_type == "dual_head"
-
-        with torch.no_grad():
-            if is_unified:
-                # UnifiedTRN: split features into structural(17D) + content(384D)
-                # Content embedding = query MiniLM, broadcast to all candidates
-                content_emb = (
-                    query_content_minilm if query_content_minilm else query_minilm
-                )
-                content_tensor = torch.tensor(
-                    [content_emb] * len(features_list), dtype=torch.float32
-                )
-                result = model(features_tensor, content_tensor, mode="search")
-                form_scores = result["form_score"].squeeze(-1).tolist()
-                content_scores = result["content_score"].squeeze(-1).tolist()
-                # Alpha blend
-                alpha = 1.0 if not content_text else 0.6
-                try:
-                    from config.settings import Settings as _S
-
-                    alpha = _S().dual_head_form_weight
-                except Exception:
-                    pass
-                learned_scores = [
-                    alpha * f + (1 - alpha) * c
-                    for f, c in zip(form_scores, content_scores)
-                ]
-
-            elif is_dual:
-                form_t, content_t = model(features_tensor)
-                form_scores = form_t.squeeze(-1).tolist()
-                content_scores = content_t.squeeze(-1).tolist()
-                alpha = 1.0 if not content_text else 0.6
-                try:
-                    from config.settings import Settings as _S
-
-                    alpha = _S().dual_head_form_weight
-                except Exception:
-                    pass
-                learned_scores = [
-                    alpha * f + (1 - alpha) * c
-                    for f, c in zip(form_scores, content_scores)
-                ]
+        # UnifiedTRN: content embedding = query MiniLM, broadcast to all candidates
+        content_emb = None
+        if is_unified:
+            content_emb = query_content_minilm if query_content_minilm else query_minilm
+        form_scores, content_scores, _ = self._score_learned_candidates(
+            features_list, content_emb=content_emb
+        )
 
-            else:
-                scores_tensor = model(features_tensor).squeeze(-1)
-                learned_scores = scores_tensor.tolist()
-                form_scores = learned_scores
-                content_scores = [0.0] * len(learned_scores)
+        if content_scores is not None:
+            # Dual-head / UnifiedTRN: alpha blend form and content
+            alpha = 1.0 if not content_text else 0.6
+            try:
+                from config.settings import get_settings
+
+                alpha = get_settings().dual_head_form_weight
+            except Exception:
+                pass
+            learned_scores = [
+                alpha * f + (1 - alpha) * c for f, c in zip(form_scores, content_scores)
+            ]
+        else:
+            learned_scores = form_scores
+            content_scores = [0.0] * len(learned_scores)
 
         # Apply feedback boost
         scored = []
@@ -208,9 +200,9 @@ def search_hybrid_learned(
 
         # --- Step 3b: Per-candidate score logging (shadow A/B) ---
         try:
-            from config.settings import Settings as _S
+            from config.settings import get_settings
 
-            if _S().search_shadow_scoring:
+            if get_settings().search_shadow_scoring:
                 import hashlib
 
                 _qh = hashlib.md5(description.encode()).hexdigest()[:12]
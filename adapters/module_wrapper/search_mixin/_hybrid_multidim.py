@@ -3,6 +3,7 @@
 from typing import Any, Dict, List, Optional, Tuple
 
 from adapters.module_wrapper.types import RELATIONSHIPS_DIM as _RELATIONSHIPS_DIM
+from adapters.module_wrapper.types import PrefetchedCandidates
 from config.enhanced_logging import setup_logger
 
 logger = setup_logger()
@@ -10,6 +11,16 @@ logger = setup_logger()
 RELATIONSHIPS_DIM = _RELATIONSHIPS_DIM
 
 
+def _multidim_relationship_text(
+    description: str, component_paths: Optional[List[str]] = None
+) -> str:
+    """Text embedded for the relationships vector in multidim search."""
+    if component_paths:
+        comp_names = [p.split(".")[-1] for p in component_paths]
+        return f"{description} | {' '.join(comp_names)}"
+    return description
+
+
 def search_hybrid_multidim(
     self,
     description: str,
@@ -21,6 +32,7 @@ def search_hybrid_multidim(
     include_classes: bool = True,
     candidate_pool_size: int = 20,
     content_text: Optional[str] = None,
+    prefetched: Optional[PrefetchedCandidates] = None,
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
     Multi-dimensional scoring search using all four named vectors.
@@ -52,6 +64,8 @@ def search_hybrid_multidim(
         include_classes: Whether to include class results (default True)
         candidate_pool_size: How many candidates to retrieve per vector (default 20)
         content_text: Actual user content for content vector search (button texts, labels, etc.)
+        prefetched: Embeddings + candidates already gathered by the async path;
+            when given, steps 1-2 are skipped and only the rerank runs here.
 
     Returns:
         Tuple of (class_results, content_patterns, form_patterns)
@@ -64,126 +78,133 @@ def search_hybrid_multidim(
     try:
         from qdrant_client import models
 
-        # --- Step 1: Embed query into 3 vectors ---
-        query_colbert = self._embed_with_colbert(description, token_ratio)
-        if not query_colbert:
-            logger.warning("ColBERT embedding failed for multidim search")
-            return [], [], []
-
-        relationship_text = description
-        if component_paths:
-            comp_names = [p.split(".")[-1] for p in component_paths]
-            relationship_text = f"{description} | {' '.join(comp_names)}"
-
-        query_minilm = self._embed_with_minilm(relationship_text)
-        if not query_minilm:
-            query_minilm = [0.0] * RELATIONSHIPS_DIM
-
-        # Embed content text if provided (same MiniLM model, 384D)
-        query_content_minilm = None
-        if content_text:
-            query_content_minilm = self._embed_with_minilm(content_text)
-
-        # --- Step 2: Build prefetch pipeline (same pattern as search_hybrid) ---
-        # Qdrant executes these searches server-side in a single round-trip.
-        pool = candidate_pool_size
-        prefetch_list = []
-
-        # Prefetch 1: Components (classes)
-        if include_classes:
-            prefetch_list.append(
-                models.Prefetch(
-                    query=query_colbert,
-                    using="components",
-                    filter=models.Filter(
-                        must=[
-                            models.FieldCondition(
-                                key="type",
-                                match=models.MatchValue(value="class"),
-                            )
-                        ]
-                    ),
-                    limit=pool,
-                )
+        if prefetched is not None:
+            query_colbert = prefetched.query_colbert
+            query_minilm = prefetched.query_minilm or [0.0] * RELATIONSHIPS_DIM
+            query_content_minilm = prefetched.query_content_minilm
+            candidates = prefetched.points
+        else:
+            # --- Step 1: Embed query into 3 vectors ---
+            query_colbert = self._embed_with_colbert(description, token_ratio)
+            if not query_colbert:
+                logger.warning("ColBERT embedding failed for multidim search")
+                return [], [], []
+
+            relationship_text = _multidim_relationship_text(
+                description, component_paths
             )
 
-        # Prefetch 2: Inputs (instance patterns + content_feedback filter)
-        inputs_filter_conditions = [
-            models.FieldCondition(
-                key="type",
-                match=models.MatchValue(value="instance_pattern"),
-            )
-        ]
-        if content_feedback:
-            inputs_filter_conditions.append(
-                models.FieldCondition(
-                    key="content_feedback",
-                    match=models.MatchValue(value=content_feedback),
+            query_minilm = self._embed_with_minilm(relationship_text)
+            if not query_minilm:
+                query_minilm = [0.0] * RELATIONSHIPS_DIM
+
+            # Embed content text if provided (same MiniLM model, 384D)
+            query_content_minilm = None
+            if content_text:
+                query_content_minilm = self._embed_with_minilm(content_text)
+
+            # --- Step 2: Build prefetch pipeline (same pattern as search_hybrid) ---
+            # Qdrant executes these searches server-side in a single round-trip.
+            pool = candidate_pool_size
+            prefetch_list = []
+
+            # Prefetch 1: Components (classes)
+            if include_classes:
+                prefetch_list.append(
+                    models.Prefetch(
+                        query=query_colbert,
+                        using="components",
+                        filter=models.Filter(
+                            must=[
+                                models.FieldCondition(
+                                    key="type",
+                                    match=models.MatchValue(value="class"),
+                                )
+                            ]
+                        ),
+                        limit=pool,
+                    )
                 )
-            )
-        prefetch_list.append(
-            models.Prefetch(
-                query=query_colbert,
-                using="inputs",
-                filter=models.Filter(must=inputs_filter_conditions),
-                limit=pool,
-            )
-        )
 
-        # Prefetch 3: Relationships (instance patterns + form_feedback filter)
-        if query_minilm and query_minilm != [0.0] * RELATIONSHIPS_DIM:
-            rel_filter_conditions = [
+            # Prefetch 2: Inputs (instance patterns + content_feedback filter)
+            inputs_filter_conditions = [
                 models.FieldCondition(
                     key="type",
                     match=models.MatchValue(value="instance_pattern"),
                 )
             ]
-            if form_feedback:
-                rel_filter_conditions.append(
+            if content_feedback:
+                inputs_filter_conditions.append(
                     models.FieldCondition(
-                        key="form_feedback",
-                        match=models.MatchValue(value=form_feedback),
+                        key="content_feedback",
+                        match=models.MatchValue(value=content_feedback),
                     )
                 )
             prefetch_list.append(
                 models.Prefetch(
-                    query=query_minilm,
-                    using="relationships",
-                    filter=models.Filter(must=rel_filter_conditions),
+                    query=query_colbert,
+                    using="inputs",
+                    filter=models.Filter(must=inputs_filter_conditions),
                     limit=pool,
                 )
             )
 
-        # Prefetch 4: Content (instance patterns with actual content vectors)
-        if query_content_minilm:
-            prefetch_list.append(
-                models.Prefetch(
-                    query=query_content_minilm,
-                    using="content",
-                    filter=models.Filter(
-                        must=[
-                            models.FieldCondition(
-                                key="type",
-                                match=models.MatchValue(value="instance_pattern"),
-                            ),
-                        ]
-                    ),
-                    limit=pool,
+            # Prefetch 3: Relationships (instance patterns + form_feedback filter)
+            if query_minilm and query_minilm != [0.0] * RELATIONSHIPS_DIM:
+                rel_filter_conditions = [
+                    models.FieldCondition(
+                        key="type",
+                        match=models.MatchValue(value="instance_pattern"),
+                    )
+                ]
+                if form_feedback:
+                    rel_filter_conditions.append(
+                        models.FieldCondition(
+                            key="form_feedback",
+                            match=models.MatchValue(value=form_feedback),
+                        )
+                    )
+                prefetch_list.append(
+                    models.Prefetch(
+                        query=query_minilm,
+                        using="relationships",
+                        filter=models.Filter(must=rel_filter_conditions),
+                        limit=pool,
+                    )
+                )
+
+            # Prefetch 4: Content (instance patterns with actual content vectors)
+            if query_content_minilm:
+                prefetch_list.append(
+                    models.Prefetch(
+                        query=query_content_minilm,
+                        using="content",
+                        filter=models.Filter(
+                            must=[
+                                models.FieldCondition(
+                                    key="type",
+                                    match=models.MatchValue(value="instance_pattern"),
+                                ),
+                            ]
+                        ),
+                        limit=pool,
+                    )
                 )
+
+            # Single Qdrant call: prefetch expands pool, RRF deduplicates,
+            # with_vectors=True returns stored vectors for client-side reranking.
+            results = self.client.query_points(
+                collection_name=self.collection_name,
+                prefetch=prefetch_list,
+                query=models.FusionQuery(fusion=models.Fusion.RRF),
+                limit=pool * 3,  # Get full candidate pool
+                with_payload=True,
+                with_vectors=True,
             )
 
-        # Single Qdrant call: prefetch expands pool, RRF deduplicates,
-        # with_vectors=True returns stored vectors for client-side reranking.
-        results = self.client.query_points(
-            collection_name=self.collection_name,
-            prefetch=prefetch_list,
-            query=models.FusionQuery(fusion=models.Fusion.RRF),
-            limit=pool * 3,  # Get full candidate pool
-            with_payload=True,
-            with_vectors=True,
-        )
+            candidates = results.points
 
-        if not results.points:
+        if not candidates:
             logger.info("Multidim search: no candidates found")
             return [], [], []
 
@@ -191,7 +212,7 @@ def search_hybrid_multidim(
         # Qdrant's RRF gave us a deduplicated candidate pool with vectors.
         # Now we rescore using multiplicative cross-dim similarity.
         scored = []
-        for point in results.points:
+        for point in candidates:
             vectors = point.vector or {}
             payload = point.payload or {}
 
@@ -331,7 +352,7 @@ def search_hybrid_multidim(
         logger.info(
             f"Multidim search{filter_str}: {len(class_results)} classes, "
             f"{len(pattern_results)} patterns, {len(relationship_results)} relationships "
-            f"(from {len(results.points)} candidates)"
+            f"(from {len(candidates)} candidates)"
         )
 
         return (
@@ -43,9 +43,9 @@ def search_hybrid_recursive(
     alpha_decay = 0.1
     content_pool_size = 10
     try:
-        from config.settings import Settings
+        from config.settings import get_settings
 
-        _s = Settings()
+        _s = get_settings()
         max_cycles = _s.recursive_max_cycles
         halt_margin = _s.recursive_halt_margin
         alpha_init = _s.recursive_alpha_init
@@ -56,7 +56,7 @@ def search_hybrid_recursive(
         pass
 
     try:
-        import torch
+        import torch  # noqa: F401 -- availability check
     except ImportError:
         logger.warning("torch not installed, falling back to learned")
         return self.search_hybrid_learned(
@@ -167,54 +167,30 @@ def search_hybrid_recursive(
             if not features_list:
                 break
 
-            features_tensor = torch.tensor(features_list, dtype=torch.float32)
-
             # --- Model inference (architecture-dependent) ---
-            with torch.no_grad():
-                if is_unified:
-                    # UnifiedTRN: structural(17D) + content(384D) → form/content/halt
-                    content_emb = (
-                        query_content_minilm if query_content_minilm else query_minilm
-                    )
-                    content_tensor = torch.tensor(
-                        [content_emb] * len(features_list), dtype=torch.float32
-                    )
-                    result = model(features_tensor, content_tensor, mode="search")
-                    form_scores_t = result["form_score"].squeeze(-1)
-                    content_scores_t = result["content_score"].squeeze(-1)
-                    halt_probs = result["halt_prob"].squeeze(-1)
-
-                    # Adaptive alpha: form-dominant early, content grows
-                    cycle_alpha = max(0.3, alpha_init - (cycle * alpha_decay))
-                    scores_tensor = (
-                        cycle_alpha * form_scores_t
-                        + (1.0 - cycle_alpha) * content_scores_t
-                    )
-                    form_scores = form_scores_t.tolist()
-                    content_scores = content_scores_t.tolist()
-                    halt_probs_list = halt_probs.tolist()
-
-                elif is_dual:
-                    form_t, content_t = model(features_tensor)
-                    form_scores_t = form_t.squeeze(-1)
-                    content_scores_t = content_t.squeeze(-1)
-                    cycle_alpha = max(0.3, alpha_init - (cycle * alpha_decay))
-                    scores_tensor = (
-                        cycle_alpha * form_scores_t
-                        + (1.0 - cycle_alpha) * content_scores_t
-                    )
-                    form_scores = form_scores_t.tolist()
-                    content_scores = content_scores_t.tolist()
-                    halt_probs_list = None
-
-                else:
-                    scores_tensor = model(features_tensor).squeeze(-1)
-                    form_scores = None
-                    content_scores = None
-                    cycle_alpha = None
-                    halt_probs_list = None
-
-            scores = scores_tensor.tolist()
+            # UnifiedTRN: structural(17D) + content(384D) → form/content/halt
+            content_emb = None
+            if is_unified:
+                content_emb = (
+                    query_content_minilm if query_content_minilm else query_minilm
+                )
+            form_scores, content_scores, halt_probs_list = (
+                self._score_learned_candidates(
+                    features_list, content_emb=content_emb, with_halt=is_unified
+                )
+            )
+
+            if content_scores is not None:
+                # Adaptive alpha: form-dominant early, content grows
+                cycle_alpha = max(0.3, alpha_init - (cycle * alpha_decay))
+                scores = [
+                    cycle_alpha * f + (1.0 - cycle_alpha) * c
+                    for f, c in zip(form_scores, content_scores)
+                ]
+            else:
+                scores = form_scores
+                form_scores = None
+                cycle_alpha = None
 
             scored = sorted(
                 zip(scores, points_data),
@@ -122,63 +122,12 @@ def _load_learned_model(cls, domain: str | None = None):
 
     try:
         import torch
-        import torch.nn as nn
+
+        from adapters.scorer_models import DualHeadMLP, ScorerMLP
     except ImportError:
         logger.warning("torch not installed -- learned scorer unavailable")
         return None
 
-    class _ScorerMLP(nn.Module):
-        """Single-head MLP (SimilarityScorerMW)."""
-
-        def __init__(self, input_dim=9, hidden_dim=32, dropout=0.15):
-            super().__init__()
-            self.mlp = nn.Sequential(
-                nn.Linear(input_dim, hidden_dim),
-                nn.SiLU(),
-                nn.Dropout(dropout),
-                nn.Linear(hidden_dim, hidden_dim),
-                nn.SiLU(),
-                nn.Dropout(dropout),
-                nn.Linear(hidden_dim, 1),
-            )
-
-        def forward(self, x):
-            return self.mlp(x)
-
-    class _DualHeadMLP(nn.Module):
-        """Dual-head MLP (DualHeadScorerMW)."""
-
-        def __init__(
-            self,
-            input_dim=17,
-            hidden_dim=48,
-            head_dim=24,
-            dropout=0.15,
-        ):
-            super().__init__()
-            self.backbone = nn.Sequential(
-                nn.Linear(input_dim, hidden_dim),
-                nn.SiLU(),
-                nn.Dropout(dropout),
-                nn.Linear(hidden_dim, hidden_dim),
-                nn.SiLU(),
-                nn.Dropout(dropout),
-            )
-            self.form_head = nn.Sequential(
-                nn.Linear(hidden_dim, head_dim),
-                nn.SiLU(),
-                nn.Linear(head_dim, 1),
-            )
-            self.content_head = nn.Sequential(
-                nn.Linear(hidden_dim, head_dim),
-                nn.SiLU(),
-                nn.Linear(head_dim, 1),
-            )
-
-        def forward(self, x):
-            shared = self.backbone(x)
-            return self.form_head(shared), self.content_head(shared)
-
     # Resolve checkpoint path (supports registry, env var, or default)
     import os
 
@@ -227,7 +176,7 @@ def _load_learned_model(cls, domain: str | None = None):
         elif model_type == "dual_head":
             hidden_dim = ckpt.get("hidden_dim", 48)
             head_dim = ckpt.get("head_dim", 24)
-            model = _DualHeadMLP(
+            model = DualHeadMLP(
                 input_dim=ckpt.get("input_dim", 17),
                 hidden_dim=hidden_dim,
                 head_dim=head_dim,
@@ -236,7 +185,7 @@ def _load_learned_model(cls, domain: str | None = None):
             cls._learned_model_type = "dual_head"
 
         else:
-            model = _ScorerMLP(
+            model = ScorerMLP(
                 input_dim=ckpt.get("input_dim", 9),
                 hidden_dim=ckpt.get("hidden_dim", 32),
                 dropout=ckpt.get("dropout", 0.15),
@@ -246,6 +195,7 @@ def _load_learned_model(cls, domain: str | None = None):
         model.load_state_dict(ckpt["model_state_dict"])
         model.eval()
         cls._learned_model = model
+        cls._learned_runtime = _build_learned_runtime(model, cls._learned_model_type)
         n_params = sum(p.numel() for p in model.parameters())
         domain_str = cls._learned_model_domain or "unknown"
         logger.info(
@@ -269,6 +219,81 @@ def _load_learned_model(cls, domain: str | None = None):
         return None
 
 
+def _build_learned_runtime(model, model_type: str):
+    """Compile the loaded scorer for the hot path per ``learned_scorer_backend``.
+
+    Returns a NumPy LearnedScorerRuntime, or None to keep eager torch
+    inference (backend="torch" or an unsupported layer).
+    ``learned_scorer_threads`` only pins torch's intra-op threads.
+    """
+    from config.settings import get_settings
+
+    settings = get_settings()
+    if settings.learned_scorer_backend == "torch":
+        if settings.learned_scorer_threads > 0:
+            import torch
+
+            torch.set_num_threads(settings.learned_scorer_threads)
+        return None
+
+    try:
+        from adapters.scorer_runtime import LearnedScorerRuntime
+
+        return LearnedScorerRuntime.from_torch_model(model, model_type)
+    except Exception as e:
+        logger.warning(f"Could not compile learned scorer ({e}) -- using torch")
+        return None
+
+
+def _score_learned_candidates(
+    self,
+    features_list: list,
+    content_emb: Optional[list] = None,
+    with_halt: bool = False,
+):
+    """Run the cached scorer over one candidate pool.
+
+    Uses the compiled NumPy runtime when available, otherwise eager torch
+    with the query content embedding broadcast (``expand``) rather than
+    copied per candidate.
+
+    Returns:
+        (form_scores, content_scores, halt_probs) as lists; content_scores is
+        None for single-head models and halt_probs is None unless requested
+        from a UnifiedTRN model.
+    """
+    cls = type(self)
+    runtime = cls._learned_runtime
+    if runtime is not None:
+        out = runtime.score(features_list, content_emb=content_emb, with_halt=with_halt)
+        return (
+            out.form.tolist(),
+            out.content.tolist() if out.content is not None else None,
+            out.halt.tolist() if out.halt is not None else None,
+        )
+
+    import torch
+
+    model = cls._learned_model
+    features_tensor = torch.tensor(features_list, dtype=torch.float32)
+    with torch.no_grad():
+        if cls._learned_model_type == "unified":
+            content_tensor = torch.tensor(content_emb, dtype=torch.float32).expand(
+                features_tensor.shape[0], -1
+            )
+            result = model(features_tensor, content_tensor, mode="search")
+            halt = result["halt_prob"].squeeze(-1).tolist() if with_halt else None
+            return (
+                result["form_score"].squeeze(-1).tolist(),
+                result["content_score"].squeeze(-1).tolist(),
+                halt,
+            )
+        if cls._learned_model_type == "dual_head":
+            form_t, content_t = model(features_tensor)
+            return form_t.squeeze(-1).tolist(), content_t.squeeze(-1).tolist(), None
+        return model(features_tensor).squeeze(-1).tolist(), None, None
+
+
 def _ensure_learned_dag(self):
     """Lazily load DAG for structural feature computation (V2 only)."""
     cls = type(self)
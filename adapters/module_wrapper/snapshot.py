@@ -0,0 +1,303 @@
+"""
+Startup snapshots of ModuleWrapper introspection state.
+
+Every worker used to rebuild each wrapper from scratch: walking the target
+module, calling ``inspect.getsource`` on ~1,700 objects (most of the cost),
+extracting relationships and generating symbols.  The result only depends on
+the module's source and the wrapper configuration, so ``_introspect_module``
+now persists it once and later starts restore it:
+
+- components (name, paths, type, docstring, source, parent/children) with
+  their live objects re-resolved by attribute lookup instead of re-inspected;
+- root components, visited modules, the symbol table and the raw relationship
+  cache (including relationship texts).
+
+The snapshot file name is keyed by module version, wrapper configuration and
+snapshot format; inside, a SHA-256 per walked source file is checked on load.
+Any mismatch or resolution failure falls back to a full introspection, which
+rewrites the snapshot.  State added afterwards by domain hooks (custom
+components, input-resolution callables) is code-defined and still registered
+by the hooks; the relationship graph is derived lazily from the restored
+relationships as before.
+
+Usage:
+    if not load_snapshot(wrapper):
+        ...full introspection...
+        save_snapshot(wrapper)
+"""
+
+import hashlib
+import importlib
+import importlib.metadata
+import inspect
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+SNAPSHOT_FORMAT = 1  # Bump when the snapshot layout or introspection changes
+
+_MISSING = object()
+
+
+def _snapshot_dir() -> Optional[Path]:
+    """Snapshot directory, or None when snapshots are disabled."""
+    try:
+        from config.settings import get_settings
+
+        s = get_settings()
+    except Exception:
+        return None
+    if not s.module_wrapper_snapshot_enabled:
+        return None
+    if s.module_wrapper_snapshot_dir:
+        return Path(s.module_wrapper_snapshot_dir)
+    return Path(s.credentials_dir) / "model_cache" / "wrapper_snapshots"
+
+
+def _module_version(wrapper) -> str:
+    domain_cfg = getattr(wrapper, "_domain_config", None)
+    pip_name = getattr(domain_cfg, "pip_package", None)
+    if pip_name:
+        try:
+            return importlib.metadata.version(pip_name)
+        except Exception:
+            pass
+    top = sys.modules.get(wrapper.module.__name__.split(".")[0])
+    return str(getattr(top, "__version__", ""))
+
+
+def snapshot_key(wrapper) -> str:
+    """Hash of everything besides source files that shapes introspection."""
+    config = {
+        "format": SNAPSHOT_FORMAT,
+        "python": sys.version_info[:2],
+        "wrapper": type(wrapper).__qualname__,
+        "module": wrapper.module.__name__,
+        "version": _module_version(wrapper),
+        "index_nested": wrapper.index_nested,
+        "index_private": wrapper.index_private,
+        "max_depth": wrapper.max_depth,
+        "skip_standard_library": wrapper.skip_standard_library,
+        "include_modules": sorted(wrapper.include_modules),
+        "exclude_modules": sorted(wrapper.exclude_modules),
+        "priority_overrides": sorted((wrapper._priority_overrides or {}).items()),
+        "nl_patterns": sorted(
+            repr(item) for item in (wrapper._nl_relationship_patterns or {}).items()
+        ),
+    }
+    return hashlib.sha256(json.dumps(config, default=str).encode()).hexdigest()
+
+
+def _snapshot_path(wrapper) -> Optional[Path]:
+    directory = _snapshot_dir()
+    if directory is None:
+        return None
+    return directory / f"{wrapper.module.__name__}-{snapshot_key(wrapper)[:16]}.pkl"
+
+
+def _file_sha256(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _source_manifest(wrapper) -> Dict[str, str]:
+    """sha256 of every source file introspection walked."""
+    manifest = {}
+    for name in sorted(wrapper._visited_modules | {wrapper.module.__name__}):
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if path and path not in manifest:
+            digest = _file_sha256(path)
+            if digest:
+                manifest[path] = digest
+    return manifest
+
+
+def _owner_module(wrapper, component) -> Optional[str]:
+    """Module whose attribute ``component.name`` is ``component.obj``."""
+    candidates = [component.module_path, wrapper.module.__name__]
+    widgets = getattr(wrapper.module, "widgets", None)
+    if inspect.ismodule(widgets):
+        candidates.append(widgets.__name__)
+    for module_name in candidates:
+        module = sys.modules.get(module_name)
+        if module is not None and (
+            getattr(module, component.name, _MISSING) is component.obj
+        ):
+            return module_name
+    return None
+
+
+def save_snapshot(wrapper) -> bool:
+    """Persist the wrapper's introspected state; False if not possible."""
+    path = _snapshot_path(wrapper)
+    if path is None or not wrapper.components:
+        return False
+
+    records: List[Optional[Dict[str, Any]]] = []
+    index_of: Dict[int, int] = {}
+
+    def visit(component) -> int:
+        if id(component) in index_of:
+            return index_of[id(component)]
+        idx = len(records)
+        index_of[id(component)] = idx
+        records.append(None)
+        record = {
+            "name": component.name,
+            "module_path": component.module_path,
+            "component_type": component.component_type,
+            "docstring": component.docstring,
+            "source": component.source,
+            "has_obj": component.obj is not None,
+            "parent": visit(component.parent) if component.parent else None,
+            "owner": None,
+        }
+        if component.obj is not None and component.parent is None:
+            record["owner"] = _owner_module(wrapper, component)
+            if record["owner"] is None:
+                raise LookupError(component.full_path)
+        record["children"] = [visit(c) for c in component.children.values()]
+        records[idx] = record
+        return idx
+
+    try:
+        state = {
+            "format": SNAPSHOT_FORMAT,
+            "key": snapshot_key(wrapper),
+            "sources": _source_manifest(wrapper),
+            "components": [(key, visit(c)) for key, c in wrapper.components.items()],
+            "root_components": [
+                (name, visit(c)) for name, c in wrapper.root_components.items()
+            ],
+            "records": records,
+            "visited_modules": sorted(wrapper._visited_modules),
+            "symbol_mapping": dict(wrapper._symbol_mapping or {}),
+            "raw_relationships": wrapper._cached_raw_relationships,
+            "raw_relationships_depth": wrapper._cached_raw_relationships_depth,
+        }
+    except LookupError as e:
+        logger.debug(f"Snapshot skipped for {wrapper.module_name}: can't resolve {e}")
+        return False
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Could not write wrapper snapshot {path}: {e}")
+        return False
+    logger.info(
+        f"📸 Saved introspection snapshot for {wrapper.module_name} "
+        f"({len(wrapper.components)} components)"
+    )
+    return True
+
+
+def _member(holder: Any, name: str) -> Any:
+    """``getattr`` with ``inspect.getmembers``' fallback to class __dict__s."""
+    try:
+        return getattr(holder, name)
+    except AttributeError:
+        for base in getattr(holder, "__mro__", ()):
+            if name in base.__dict__:
+                return base.__dict__[name]
+        raise
+
+
+def _restore_components(wrapper, state: Dict[str, Any]) -> List[Any]:
+    """ModuleComponents for every record, objects resolved by attribute."""
+    from adapters.module_wrapper.core import ModuleComponent
+
+    records = state["records"]
+    built: List[Any] = [None] * len(records)
+
+    def build(idx: int):
+        if built[idx] is not None:
+            return built[idx]
+        record = records[idx]
+        parent = build(record["parent"]) if record["parent"] is not None else None
+        obj = None
+        if record["has_obj"]:
+            holder = (
+                parent.obj
+                if parent is not None
+                else importlib.import_module(record["owner"])
+            )
+            obj = _member(holder, record["name"])
+        component = ModuleComponent(
+            name=record["name"],
+            obj=obj,
+            module_path=record["module_path"],
+            component_type=record["component_type"],
+            docstring=record["docstring"],
+            source=record["source"],
+            parent=parent,
+        )
+        built[idx] = component
+        return component
+
+    for idx in range(len(records)):
+        build(idx)
+    for idx, record in enumerate(records):
+        for child_idx in record["children"]:
+            built[idx].add_child(built[child_idx])
+    return built
+
+
+def load_snapshot(wrapper) -> bool:
+    """Restore introspected state from a matching snapshot.
+
+    Returns False (leaving the wrapper untouched) when there is no snapshot,
+    it was built from different sources, or an object no longer resolves.
+    """
+    path = _snapshot_path(wrapper)
+    if path is None or not path.exists():
+        return False
+    try:
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if state.get("format") != SNAPSHOT_FORMAT or state.get("key") != (
+            snapshot_key(wrapper)
+        ):
+            return False
+        for source_path, digest in state["sources"].items():
+            if _file_sha256(source_path) != digest:
+                logger.info(
+                    f"📸 Snapshot for {wrapper.module_name} is stale "
+                    f"({source_path} changed) — re-introspecting"
+                )
+                return False
+        built = _restore_components(wrapper, state)
+    except Exception as e:
+        logger.info(f"📸 Ignoring snapshot {path.name}: {e}")
+        return False
+
+    wrapper.components = {key: built[idx] for key, idx in state["components"]}
+    wrapper.root_components = {
+        name: built[idx] for name, idx in state["root_components"]
+    }
+    wrapper._visited_modules = set(state["visited_modules"])
+    wrapper._current_depth = 0
+    wrapper._symbol_mapping = state["symbol_mapping"] or None
+    wrapper._reverse_symbol_mapping = None
+    wrapper._cached_raw_relationships = state["raw_relationships"]
+    wrapper._cached_raw_relationships_depth = state["raw_relationships_depth"]
+    wrapper._cached_relationships = None
+    wrapper._dsl_metadata_cache = None
+    logger.info(
+        f"📸 Restored {len(wrapper.components)} components for "
+        f"{wrapper.module_name} from snapshot"
+    )
+    return True
@@ -0,0 +1,227 @@
+"""
+Shared persistence for ToolRelationshipGraph.
+
+The co-usage graph is stored as an append-only log of edge-delta batches
+plus a periodic snapshot of the merged graph.  A restarted worker loads the
+snapshot and replays the log after the snapshot's cursor; running workers
+replay each other's batches from their own cursor, so every worker converges
+on the same counts:
+
+- ``FileToolGraphStore``: hourly ``edges-<hour>.jsonl`` segments
+  (flock-guarded appends) and ``snapshot.json``, for workers sharing a volume;
+- ``RedisToolGraphStore``: a Redis stream plus a snapshot key, for workers
+  on different hosts.
+
+Cursors are opaque strings that only move forward.  Log entries that a
+snapshot covers and that are older than the retention window are compacted
+away; attached graphs sync on a timer far more often than that, idle or
+not, so none misses a batch.
+
+Usage:
+    store = get_tool_graph_store()
+    await graph.attach_store(store)      # load snapshot + replay log
+    await graph.sync()                   # flush local deltas, apply others'
+"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+Batch = Tuple[str, List[list]]  # (batch id, events)
+
+
+class FileToolGraphStore:
+    """Edge log segments + snapshot file in a shared directory."""
+
+    SEGMENT_SECONDS = 3600
+
+    def __init__(self, directory: Path, retention_seconds: float = 86400):
+        self.directory = Path(directory)
+        self.retention_seconds = retention_seconds
+        self.snapshot_path = self.directory / "snapshot.json"
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / f"edges-{segment}.jsonl"
+
+    def _segments(self) -> List[int]:
+        segments = []
+        for path in self.directory.glob("edges-*.jsonl"):
+            try:
+                segments.append(int(path.stem.split("-", 1)[1]))
+            except ValueError:
+                continue
+        return sorted(segments)
+
+    @staticmethod
+    def _parse(cursor: Optional[str]) -> Tuple[int, int]:
+        if not cursor:
+            return (0, 0)
+        segment, offset = cursor.split(":")
+        return int(segment), int(offset)
+
+    def _append(self, events: List[list]) -> str:
+        import fcntl
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Never write behind the newest segment, even with clock skew
+        segment = max(
+            [int(time.time() // self.SEGMENT_SECONDS)] + self._segments()[-1:]
+        )
+        line = json.dumps({"t": time.time(), "events": events}) + "\n"
+        with open(self._segment_path(segment), "ab") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            offset = f.seek(0, os.SEEK_END)
+            f.write(line.encode())
+        return f"{segment}:{offset}"
+
+    def _read_since(self, cursor: Optional[str]) -> Tuple[List[Batch], str]:
+        segment, offset = self._parse(cursor)
+        batches: List[Batch] = []
+        for seg in self._segments():
+            if seg < segment:
+                continue
+            with open(self._segment_path(seg), "rb") as f:
+                f.seek(offset if seg == segment else 0)
+                while True:
+                    pos = f.tell()
+                    line = f.readline()
+                    if not line.endswith(b"\n"):
+                        break  # end of file, or an append still in progress
+                    segment, offset = seg, f.tell()
+                    try:
+                        batches.append((f"{seg}:{pos}", json.loads(line)["events"]))
+                    except (ValueError, KeyError):
+                        continue
+        return batches, f"{segment}:{offset}"
+
+    def _compact(self, cursor: Optional[str]) -> int:
+        covered, _ = self._parse(cursor)
+        expired = int((time.time() - self.retention_seconds) // self.SEGMENT_SECONDS)
+        removed = 0
+        for seg in self._segments():
+            if seg < covered and seg < expired:
+                self._segment_path(seg).unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def _save_snapshot(self, state: Dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, self.snapshot_path)
+        self._compact(state.get("cursor"))
+
+    def _load_snapshot(self) -> Optional[Dict[str, Any]]:
+        if not self.snapshot_path.exists():
+            return None
+        return json.loads(self.snapshot_path.read_text())
+
+    async def append(self, events: List[list]) -> str:
+        return await asyncio.to_thread(self._append, events)
+
+    async def read_since(self, cursor: Optional[str]) -> Tuple[List[Batch], str]:
+        return await asyncio.to_thread(self._read_since, cursor)
+
+    async def save_snapshot(self, state: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._save_snapshot, state)
+
+    async def load_snapshot(self) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._load_snapshot)
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisToolGraphStore:
+    """Edge log as a Redis stream + snapshot key."""
+
+    READ_COUNT = 1000
+
+    def __init__(
+        self,
+        url: str,
+        retention_seconds: float = 86400,
+        prefix: str = "gw-mcp:tool-graph",
+    ):
+        self.url = url
+        self.retention_seconds = retention_seconds
+        self.log_key = f"{prefix}:log"
+        self.snapshot_key = f"{prefix}:snapshot"
+        self._client = None
+
+    def _redis(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.url, decode_responses=True)
+        return self._client
+
+    async def append(self, events: List[list]) -> str:
+        return await self._redis().xadd(self.log_key, {"events": json.dumps(events)})
+
+    async def read_since(self, cursor: Optional[str]) -> Tuple[List[Batch], str]:
+        batches: List[Batch] = []
+        while True:
+            entries = await self._redis().xrange(
+                self.log_key,
+                min=f"({cursor}" if cursor else "-",
+                count=self.READ_COUNT,
+            )
+            for entry_id, fields in entries:
+                cursor = entry_id
+                try:
+                    batches.append((entry_id, json.loads(fields["events"])))
+                except (ValueError, KeyError):
+                    continue
+            if len(entries) < self.READ_COUNT:
+                return batches, cursor or "0-0"
+
+    async def save_snapshot(self, state: Dict[str, Any]) -> None:
+        client = self._redis()
+        await client.set(self.snapshot_key, json.dumps(state))
+        covered = state.get("cursor") or "0-0"
+        expired = f"{int((time.time() - self.retention_seconds) * 1000)}-0"
+        min_id = min(covered, expired, key=lambda i: tuple(map(int, i.split("-"))))
+        await client.xtrim(self.log_key, minid=min_id, approximate=True)
+
+    async def load_snapshot(self) -> Optional[Dict[str, Any]]:
+        raw = await self._redis().get(self.snapshot_key)
+        return json.loads(raw) if raw else None
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def get_tool_graph_store():
+    """Store for the configured ``tool_graph_backend``; None keeps it in memory."""
+    from config.settings import get_settings
+
+    s = get_settings()
+    backend = s.tool_graph_backend
+    if backend == "file":
+        directory = (
+            Path(s.tool_graph_dir)
+            if s.tool_graph_dir
+            else Path(s.credentials_dir) / "tool_graph"
+        )
+        return FileToolGraphStore(directory, s.tool_graph_retention_seconds)
+    if backend == "redis":
+        if not s.redis_io_url_string:
+            logger.warning(
+                "⚠️ TOOL_GRAPH_BACKEND=redis but REDIS_IO_URL_STRING is not set "
+                "— tool graph stays in memory"
+            )
+            return None
+        return RedisToolGraphStore(
+            s.redis_io_url_string, s.tool_graph_retention_seconds
+        )
+    return None
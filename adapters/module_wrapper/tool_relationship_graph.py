@@ -13,11 +13,23 @@ Graph analysis (all via rustworkx):
     - betweenness/closeness centrality
     - predecessor/successor frequency
     - cycle detection for recurring tool loops
+
+Persistence (optional, see tool_graph_store.py): every recorded call becomes
+additive node/edge deltas.  With a store attached, deltas are flushed as a
+batch on ``sync()`` and batches written by other workers are applied, so the
+graph survives restarts and is shared across workers.  Attached graphs sync
+every ``sync_interval_seconds`` from a background task, so an idle worker
+never falls behind the store's retention window.  Centrality and k-core
+metrics are recomputed on a copy of the graph in a background thread once
+enough structural changes accumulate, instead of on the next read.
 """
 
+import asyncio
+import threading
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 from config.enhanced_logging import setup_logger
 
@@ -69,6 +81,17 @@ class ToolEdgeData:
         return self.total_time_delta_ms / self.co_occurrence_count
 
 
+@dataclass
+class _SessionState:
+    """Bounded per-session history used to link predecessors."""
+
+    recent: Deque[Tuple[str, float]]
+    last_seen_ms: float = 0.0
+    # Edges already counted towards unique_session_count for this session,
+    # oldest first (a dict keeps insertion order for eviction)
+    edges: Dict[Tuple[str, str], None] = field(default_factory=dict)
+
+
 class ToolRelationshipGraph:
     """
     Rustworkx-based directed graph tracking tool co-occurrence.
@@ -83,32 +106,64 @@ class ToolRelationshipGraph:
         # Get relationship text for embedding
         text = graph.get_relationship_text("send_message", user_email="u@x.com", session_id="s1")
 
-        # Recompute expensive metrics periodically
-        graph.recompute_metrics()
+        # Persist and share across workers (syncs in the background)
+        await graph.attach_store(get_tool_graph_store())
+        await graph.close()
     """
 
     # How many recent tool calls per session to link as predecessors
     PREDECESSOR_WINDOW = 3
-    # Maximum number of sessions tracked before oldest are evicted
+    # Maximum number of sessions tracked before least recently active are evicted
     MAX_SESSIONS = 500
+    # Sessions idle longer than this are dropped when new sessions arrive
+    SESSION_MAX_AGE_SECONDS = 3600
+    # Cap on edges remembered per session for unique_session_count
+    MAX_SESSION_EDGES = 256
 
-    def __init__(self):
+    def __init__(
+        self,
+        metrics_edge_threshold: int = 25,
+        sync_interval_seconds: float = 30.0,
+        snapshot_interval_seconds: float = 600.0,
+    ):
         rx = _get_rustworkx()
         self._graph: Any = rx.PyDiGraph()  # rx.PyDiGraph
+        self._lock = threading.RLock()
 
         # Bidirectional name <-> index mappings
         self._name_to_idx: Dict[str, int] = {}
         self._idx_to_name: Dict[int, str] = {}
 
-        # Per-session recent tool history (for edge creation)
-        # Regular dict (not defaultdict) to control size via MAX_SESSIONS
-        self._session_history: Dict[str, List[Tuple[str, float]]] = {}
+        # Per-session recent tool history (for edge creation), least
+        # recently active first
+        self._session_history: "OrderedDict[str, _SessionState]" = OrderedDict()
 
-        # Cached graph metrics (recomputed periodically)
+        # Cached graph metrics, refreshed after metrics_edge_threshold
+        # structural changes (new nodes or edges, or edge count updates)
         self._betweenness: Dict[int, float] = {}
         self._closeness: Dict[int, float] = {}
         self._k_cores: Dict[int, int] = {}
-        self._metrics_stale = True
+        self._metrics_computed = False
+        self._metrics_refreshing = False
+        self._structure_changes = 0
+        self.metrics_edge_threshold = metrics_edge_threshold
+
+        # Shared persistence (see attach_store)
+        self._store: Optional[Any] = None
+        self._cursor: Optional[str] = None
+        self._own_batches: Set[str] = set()
+        self._pending_nodes: Dict[str, list] = {}
+        self._pending_edges: Dict[Tuple[str, str], list] = {}
+        self._sync_lock: Optional[asyncio.Lock] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        self.sync_interval_seconds = sync_interval_seconds
+        self.snapshot_interval_seconds = snapshot_interval_seconds
+        self._last_sync = 0.0
+        self._last_snapshot = time.monotonic()
+
+    @property
+    def _metrics_stale(self) -> bool:
+        return not self._metrics_computed or self._structure_changes > 0
 
     # =========================================================================
     # NODE / EDGE MANAGEMENT
@@ -139,10 +194,124 @@ class ToolRelationshipGraph:
         self._graph.add_edge(src_idx, dst_idx, data)
         return data
 
+    # =========================================================================
+    # DELTAS
+    # =========================================================================
+
+    def _apply_event(self, event: list, pending: bool = False) -> None:
+        """Apply one additive delta (caller holds the lock).
+
+        Events:
+            ["n", tool_name, service, calls, execution_ms, first_seen]
+            ["e", src_name, dst_name, co_occurrences, time_delta_ms, sessions]
+
+        With ``pending`` (locally recorded) and a store attached, the delta is
+        also queued for the next ``sync()``.
+        """
+        if event[0] == "n":
+            _, name, service, calls, execution_ms, first_seen = event
+            is_new = name not in self._name_to_idx
+            data: ToolNodeData = self._graph.get_node_data(
+                self._ensure_node(name, service)
+            )
+            data.call_count += calls
+            data.total_execution_ms += execution_ms
+            if service and not data.service:
+                data.service = service
+            if is_new:
+                data.first_seen = first_seen
+                self._structure_changes += 1
+            else:
+                data.first_seen = min(data.first_seen, first_seen)
+            if pending and self._store is not None:
+                queued = self._pending_nodes.setdefault(
+                    name, ["n", name, service, 0, 0.0, first_seen]
+                )
+                queued[3] += calls
+                queued[4] += execution_ms
+        elif event[0] == "e":
+            _, src, dst, count, time_delta_ms, sessions = event
+            edge = self._ensure_edge(self._ensure_node(src), self._ensure_node(dst))
+            edge.co_occurrence_count += count
+            edge.total_time_delta_ms += time_delta_ms
+            edge.unique_session_count += sessions
+            self._structure_changes += 1
+            if pending and self._store is not None:
+                queued = self._pending_edges.setdefault(
+                    (src, dst), ["e", src, dst, 0, 0.0, 0]
+                )
+                queued[3] += count
+                queued[4] += time_delta_ms
+                queued[5] += sessions
+
+    def _dump_events(self) -> List[list]:
+        """The whole graph as deltas from an empty graph."""
+        events: List[list] = []
+        for idx in self._graph.node_indices():
+            data: ToolNodeData = self._graph.get_node_data(idx)
+            events.append(
+                [
+                    "n",
+                    data.tool_name,
+                    data.service,
+                    data.call_count,
+                    data.total_execution_ms,
+                    data.first_seen,
+                ]
+            )
+        for src, dst, edge in self._graph.weighted_edge_list():
+            events.append(
+                [
+                    "e",
+                    self._idx_to_name[src],
+                    self._idx_to_name[dst],
+                    edge.co_occurrence_count,
+                    edge.total_time_delta_ms,
+                    edge.unique_session_count,
+                ]
+            )
+        return events
+
+    def _take_pending(self) -> List[list]:
+        events = list(self._pending_nodes.values()) + list(self._pending_edges.values())
+        self._pending_nodes = {}
+        self._pending_edges = {}
+        return events
+
+    def _reset_graph(self) -> None:
+        self._graph = _get_rustworkx().PyDiGraph()
+        self._name_to_idx = {}
+        self._idx_to_name = {}
+        self._betweenness = {}
+        self._closeness = {}
+        self._k_cores = {}
+        self._metrics_computed = False
+
     # =========================================================================
     # RECORDING
     # =========================================================================
 
+    def _session(self, session_id: str, now_ms: float) -> Tuple[_SessionState, bool]:
+        """Get or create session state, evicting idle and excess sessions."""
+        state = self._session_history.get(session_id)
+        if state is not None:
+            self._session_history.move_to_end(session_id)
+            return state, False
+
+        cutoff_ms = now_ms - self.SESSION_MAX_AGE_SECONDS * 1000
+        while self._session_history:
+            oldest = next(iter(self._session_history.values()))
+            if (
+                len(self._session_history) < self.MAX_SESSIONS
+                and oldest.last_seen_ms >= cutoff_ms
+            ):
+                break
+            self._session_history.popitem(last=False)
+
+        state = _SessionState(recent=deque(maxlen=self.PREDECESSOR_WINDOW))
+        self._session_history[session_id] = state
+        return state, True
+
     def record_tool_call(
         self,
         tool_name: str,
@@ -164,92 +333,246 @@ class ToolRelationshipGraph:
             timestamp_ms: Call timestamp (defaults to now)
         """
         now = timestamp_ms or (time.time() * 1000)
-        idx = self._ensure_node(tool_name, service)
-
-        # Update node stats
-        node_data: ToolNodeData = self._graph.get_node_data(idx)
-        node_data.call_count += 1
-        node_data.total_execution_ms += execution_time_ms
-        if service and not node_data.service:
-            node_data.service = service
+        with self._lock:
+            self._apply_event(
+                ["n", tool_name, service, 1, execution_time_ms, time.time()],
+                pending=True,
+            )
 
-        # Create edges from recent predecessors in this session
-        if session_id:
-            is_new_session = session_id not in self._session_history
-            history = self._session_history.setdefault(session_id, [])
-
-            # Evict oldest sessions if over cap (only when adding a new one)
-            if is_new_session:
-                while len(self._session_history) > self.MAX_SESSIONS:
-                    oldest_key = next(iter(self._session_history))
-                    del self._session_history[oldest_key]
-
-            # Link from each recent predecessor to this tool
-            window = history[-self.PREDECESSOR_WINDOW :]
-            for prev_name, prev_ts in window:
-                if prev_name == tool_name:
-                    continue  # Skip self-loops
-                prev_idx = self._name_to_idx.get(prev_name)
-                if prev_idx is None:
-                    continue
-                edge_data = self._ensure_edge(prev_idx, idx)
-                edge_data.co_occurrence_count += 1
-                edge_data.total_time_delta_ms += now - prev_ts
-                if is_new_session:
-                    edge_data.unique_session_count += 1
-
-            # Append to session history
-            history.append((tool_name, now))
-
-            # Trim old history to prevent unbounded growth
-            if len(history) > 50:
-                self._session_history[session_id] = history[-50:]
-
-        self._metrics_stale = True
+            # Create edges from recent predecessors in this session
+            if session_id:
+                session, _ = self._session(session_id, now)
+                for prev_name, prev_ts in session.recent:
+                    if prev_name == tool_name:
+                        continue  # Skip self-loops
+                    pair = (prev_name, tool_name)
+                    first_in_session = pair not in session.edges
+                    if first_in_session:
+                        if len(session.edges) >= self.MAX_SESSION_EDGES:
+                            del session.edges[next(iter(session.edges))]
+                        session.edges[pair] = None
+                    self._apply_event(
+                        [
+                            "e",
+                            prev_name,
+                            tool_name,
+                            1,
+                            now - prev_ts,
+                            1 if first_in_session else 0,
+                        ],
+                        pending=True,
+                    )
+                session.recent.append((tool_name, now))
+                session.last_seen_ms = now
+
+            self._maybe_refresh_metrics()
 
     # =========================================================================
-    # GRAPH ANALYSIS
+    # PERSISTENCE
     # =========================================================================
 
-    def recompute_metrics(self) -> None:
-        """Recompute expensive graph metrics (centrality, k-cores).
+    def _get_sync_lock(self) -> asyncio.Lock:
+        if self._sync_lock is None:
+            self._sync_lock = asyncio.Lock()
+        return self._sync_lock
+
+    async def attach_store(self, store: Optional[Any]) -> None:
+        """Load the shared graph from ``store`` and keep it in sync.
 
-        Call periodically (e.g., every N tool calls or on a timer),
-        not on every record_tool_call.
+        Calls recorded before attaching are merged in and flushed with the
+        first sync.  ``None`` keeps the graph in memory only.
         """
-        rx = _get_rustworkx()
-        graph = self._graph
+        if store is None:
+            return
+        async with self._get_sync_lock():
+            state = await store.load_snapshot()
+            with self._lock:
+                local = self._dump_events()
+                self._reset_graph()
+                self._store = store
+                self._cursor = None
+                if state:
+                    for event in state.get("events", []):
+                        self._apply_event(event)
+                    self._cursor = state.get("cursor")
+                for event in local:
+                    self._apply_event(event, pending=True)
+        await self.sync()
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_loop())
+        logger.info(
+            f"🕸️ Tool relationship graph loaded: {self._graph.num_nodes()} tools, "
+            f"{self._graph.num_edges()} edges"
+        )
 
-        if graph.num_nodes() == 0:
-            self._betweenness = {}
-            self._closeness = {}
-            self._k_cores = {}
-            self._metrics_stale = False
+    async def _sync_loop(self) -> None:
+        """Sync on a timer, independent of tool call traffic."""
+        while self._store is not None:
+            next_sync = self._last_sync + self.sync_interval_seconds
+            await asyncio.sleep(max(0.0, next_sync - time.monotonic()))
+            await self.maybe_sync()
+
+    async def sync(self, snapshot: bool = False) -> None:
+        """Flush local deltas, apply other workers' batches, maybe snapshot."""
+        store = self._store
+        if store is None:
+            return
+        async with self._get_sync_lock():
+            self._last_sync = time.monotonic()
+            with self._lock:
+                pending = self._take_pending()
+            if pending:
+                try:
+                    self._own_batches.add(await store.append(pending))
+                except Exception:
+                    # Re-queue so the deltas go out with the next sync
+                    with self._lock:
+                        for event in pending:
+                            self._requeue(event)
+                    raise
+
+            batches, cursor = await store.read_since(self._cursor)
+            with self._lock:
+                for batch_id, events in batches:
+                    if batch_id in self._own_batches:
+                        self._own_batches.discard(batch_id)
+                        continue
+                    for event in events:
+                        self._apply_event(event)
+                self._cursor = cursor
+                self._maybe_refresh_metrics()
+
+                due = (
+                    time.monotonic() - self._last_snapshot
+                    >= self.snapshot_interval_seconds
+                )
+                state = None
+                if snapshot or due:
+                    # Snapshot only what the log up to the cursor contains
+                    events = self._dump_events()
+                    unflushed = self._take_pending()
+                    for event in unflushed:
+                        self._requeue(event)
+                    state = {
+                        "format": 1,
+                        "cursor": cursor,
+                        "saved_at": time.time(),
+                        "events": _subtract(events, unflushed),
+                    }
+            if state is not None:
+                await store.save_snapshot(state)
+                self._last_snapshot = time.monotonic()
+
+    def _requeue(self, event: list) -> None:
+        """Put an unflushed delta back into the pending queue (lock held)."""
+        if event[0] == "n":
+            queued = self._pending_nodes.setdefault(
+                event[1], ["n", event[1], event[2], 0, 0.0, event[5]]
+            )
+            queued[3] += event[3]
+            queued[4] += event[4]
+        else:
+            queued = self._pending_edges.setdefault(
+                (event[1], event[2]), ["e", event[1], event[2], 0, 0.0, 0]
+            )
+            queued[3] += event[3]
+            queued[4] += event[4]
+            queued[5] += event[5]
+
+    async def maybe_sync(self) -> None:
+        """Sync when a store is attached and the sync interval has elapsed."""
+        if self._store is None:
             return
+        if time.monotonic() - self._last_sync < self.sync_interval_seconds:
+            return
+        try:
+            await self.sync()
+        except Exception as e:
+            logger.warning(f"🕸️ Tool graph sync failed: {e}")
+
+    async def close(self) -> None:
+        """Final sync with a snapshot, then release the store."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+        if self._store is None:
+            return
+        try:
+            await self.sync(snapshot=True)
+        finally:
+            await self._store.close()
+            self._store = None
+
+    # =========================================================================
+    # GRAPH ANALYSIS
+    # =========================================================================
+
+    @staticmethod
+    def _compute_metrics(graph: Any) -> Tuple[Any, Any, Any]:
+        """Betweenness, closeness and k-cores for ``graph``."""
+        rx = _get_rustworkx()
+        if graph.num_nodes() == 0:
+            return {}, {}, {}
 
         try:
-            self._betweenness = rx.digraph_betweenness_centrality(graph)
+            betweenness = rx.digraph_betweenness_centrality(graph)
         except Exception:
-            self._betweenness = {}
+            betweenness = {}
 
         try:
-            self._closeness = rx.digraph_closeness_centrality(graph)
+            closeness = rx.digraph_closeness_centrality(graph)
         except Exception:
-            self._closeness = {}
+            closeness = {}
 
         try:
             # k-core requires undirected graph
-            undirected = graph.to_undirected()
-            self._k_cores = rx.core_number(undirected)
+            k_cores = rx.core_number(graph.to_undirected())
         except Exception:
-            self._k_cores = {}
+            k_cores = {}
+        return betweenness, closeness, k_cores
 
-        self._metrics_stale = False
+    def recompute_metrics(self) -> None:
+        """Recompute expensive graph metrics (centrality, k-cores) now.
+
+        Normally not needed: metrics refresh in the background once
+        ``metrics_edge_threshold`` structural changes have accumulated.
+        """
+        with self._lock:
+            graph = self._graph.copy()
+            self._structure_changes = 0
+        metrics = self._compute_metrics(graph)
+        with self._lock:
+            self._betweenness, self._closeness, self._k_cores = metrics
+            self._metrics_computed = True
         logger.debug(
             f"Recomputed graph metrics: {graph.num_nodes()} nodes, "
             f"{graph.num_edges()} edges"
         )
 
+    def _maybe_refresh_metrics(self) -> None:
+        """Start a background refresh past the change threshold (lock held)."""
+        if (
+            self._metrics_refreshing
+            or not self._metrics_computed
+            or self._structure_changes < self.metrics_edge_threshold
+        ):
+            return
+        self._metrics_refreshing = True
+        threading.Thread(
+            target=self._refresh_metrics_in_background,
+            name="tool-graph-metrics",
+            daemon=True,
+        ).start()
+
+    def _refresh_metrics_in_background(self) -> None:
+        try:
+            self.recompute_metrics()
+        except Exception as e:
+            logger.debug(f"Tool graph metrics refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._metrics_refreshing = False
+
     def get_predecessors(self, tool_name: str, top_n: int = 3) -> List[Tuple[str, int]]:
         """Get top-N predecessors by co-occurrence count.
 
@@ -337,8 +660,9 @@ class ToolRelationshipGraph:
 
         node_data: ToolNodeData = self._graph.get_node_data(idx)
 
-        # Ensure metrics are computed
-        if self._metrics_stale:
+        # Compute metrics synchronously only the first time; later changes
+        # are picked up by background refreshes
+        if not self._metrics_computed:
             self.recompute_metrics()
 
         # Predecessors and successors
@@ -390,13 +714,14 @@ class ToolRelationshipGraph:
             Number of sessions removed.
         """
         cutoff_ms = (time.time() - max_age_seconds) * 1000
-        stale = [
-            sid
-            for sid, history in self._session_history.items()
-            if not history or history[-1][1] < cutoff_ms
-        ]
-        for sid in stale:
-            del self._session_history[sid]
+        with self._lock:
+            stale = [
+                sid
+                for sid, session in self._session_history.items()
+                if session.last_seen_ms < cutoff_ms
+            ]
+            for sid in stale:
+                del self._session_history[sid]
 
         if stale:
             logger.info(
@@ -416,6 +741,7 @@ class ToolRelationshipGraph:
             "edges": self._graph.num_edges(),
             "sessions_tracked": len(self._session_history),
             "metrics_stale": self._metrics_stale,
+            "persisted": self._store is not None,
         }
 
     def get_node_info(self, tool_name: str) -> Optional[Dict[str, Any]]:
@@ -446,6 +772,20 @@ class ToolRelationshipGraph:
         return set(self._name_to_idx.keys())
 
 
+def _subtract(events: List[list], deltas: List[list]) -> List[list]:
+    """``events`` minus matching additive ``deltas`` (same event keys)."""
+    by_key = {tuple(d[:3] if d[0] == "e" else d[:2]): d for d in deltas}
+    result = []
+    for event in events:
+        delta = by_key.get(tuple(event[:3] if event[0] == "e" else event[:2]))
+        if delta is not None:
+            event = list(event)
+            for i in range(3, 5 if event[0] == "n" else 6):
+                event[i] -= delta[i]
+        result.append(event)
+    return result
+
+
 __all__ = [
     "ToolRelationshipGraph",
     "ToolNodeData",
@@ -384,6 +384,21 @@ class SearchResult:
         )
 
 
+@dataclass
+class PrefetchedCandidates:
+    """Query embeddings plus candidate points gathered ahead of reranking.
+
+    Produced by the async search path (concurrent per-vector prefetch via
+    AsyncQdrantClient) and handed to the synchronous rerankers, which then
+    skip their own embedding and Qdrant round-trips.
+    """
+
+    query_colbert: Any
+    query_minilm: Any
+    query_content_minilm: Any = None
+    points: List[Any] = field(default_factory=list)
+
+
 @dataclass
 class ComponentInfo:
     """Lightweight component information for listings and summaries.
@@ -657,6 +672,7 @@ __all__ = [
     "QdrantConfig",
     "EmbeddingConfig",
     "SearchResult",
+    "PrefetchedCandidates",
     "ComponentInfo",
     "RelationshipInfo",
     "IndexingStats",
@@ -0,0 +1,73 @@
+"""Legacy learned-scorer MLPs — SimilarityScorerMW and DualHeadScorerMW.
+
+Inference definitions for the pre-UnifiedTRN checkpoints, shared by the
+ModuleWrapper learned search (``search_mixin/_learned_model.py``) and the
+diagnostic UI ML routes so neither rebuilds the classes on every load.
+
+Architecture:
+  SimilarityScorerMW (model_type="similarity_mw", 9D features):
+    mlp: Linear(in,h) → SiLU → Dropout → Linear(h,h) → SiLU → Dropout → Linear(h,1)
+  DualHeadScorerMW (model_type="dual_head", 17D features):
+    backbone: Linear(in,h) → SiLU → Dropout → Linear(h,h) → SiLU → Dropout
+    form_head / content_head: Linear(h,head) → SiLU → Linear(head,1)
+
+UnifiedTRN lives in ``adapters/unified_trn.py``.
+"""
+
+from __future__ import annotations
+
+import torch.nn as nn
+
+
+class ScorerMLP(nn.Module):
+    """Single-head MLP (SimilarityScorerMW)."""
+
+    def __init__(self, input_dim=9, hidden_dim=32, dropout=0.15):
+        super().__init__()
+        self.mlp = nn.Sequential(
+            nn.Linear(input_dim, hidden_dim),
+            nn.SiLU(),
+            nn.Dropout(dropout),
+            nn.Linear(hidden_dim, hidden_dim),
+            nn.SiLU(),
+            nn.Dropout(dropout),
+            nn.Linear(hidden_dim, 1),
+        )
+
+    def forward(self, x):
+        return self.mlp(x)
+
+
+class DualHeadMLP(nn.Module):
+    """Dual-head MLP (DualHeadScorerMW)."""
+
+    def __init__(
+        self,
+        input_dim=17,
+        hidden_dim=48,
+        head_dim=24,
+        dropout=0.15,
+    ):
+        super().__init__()
+        self.backbone = nn.Sequential(
+            nn.Linear(input_dim, hidden_dim),
+            nn.SiLU(),
+            nn.Dropout(dropout),
+            nn.Linear(hidden_dim, hidden_dim),
+            nn.SiLU(),
+            nn.Dropout(dropout),
+        )
+        self.form_head = nn.Sequential(
+            nn.Linear(hidden_dim, head_dim),
+            nn.SiLU(),
+            nn.Linear(head_dim, 1),
+        )
+        self.content_head = nn.Sequential(
+            nn.Linear(hidden_dim, head_dim),
+            nn.SiLU(),
+            nn.Linear(head_dim, 1),
+        )
+
+    def forward(self, x):
+        shared = self.backbone(x)
+        return self.form_head(shared), self.content_head(shared)
@@ -0,0 +1,215 @@
+"""NumPy inference runtime for the learned search scorers.
+
+The learned reranker runs on every ``send_dynamic_card`` search with a
+candidate pool of a few dozen rows, where eager PyTorch dispatch overhead
+dwarfs the actual math (~30K parameters).  ``LearnedScorerRuntime`` compiles
+a loaded scorer once into plain float32 NumPy matmuls:
+
+  - Sequential blocks are flattened to (linear | silu | layernorm | sigmoid)
+    ops; Dropout is dropped (inference only).
+  - UnifiedTRN's content encoder runs once per query and its backbone
+    contribution is broadcast across candidates instead of copying the
+    384D query embedding into every row.
+  - Feature rows are written into a reusable preallocated matrix.
+
+The matmuls are a few dozen rows by ~100 columns, below the size where BLAS
+threading starts, so ``LEARNED_SCORER_THREADS`` (a torch setting) does not
+apply to this backend.
+
+Usage:
+    runtime = LearnedScorerRuntime.from_torch_model(model, "unified")
+    out = runtime.score(features_list, content_emb=query_minilm)
+    out.form, out.content, out.halt  # np.ndarray [B] (content/halt may be None)
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# (op, *params) — op in {"linear", "silu", "layernorm", "sigmoid"}
+Op = Tuple[Any, ...]
+
+
+@dataclass
+class ScorerOutput:
+    """Per-candidate scores from one forward pass."""
+
+    form: np.ndarray
+    content: Optional[np.ndarray] = None
+    halt: Optional[np.ndarray] = None
+
+
+def _silu(x: np.ndarray) -> np.ndarray:
+    return x / (1.0 + np.exp(-x))
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def _run_ops(x: np.ndarray, ops: Sequence[Op]) -> np.ndarray:
+    for op in ops:
+        kind = op[0]
+        if kind == "linear":
+            x = x @ op[1]
+            if op[2] is not None:
+                x = x + op[2]
+        elif kind == "silu":
+            x = _silu(x)
+        elif kind == "sigmoid":
+            x = _sigmoid(x)
+        elif kind == "layernorm":
+            _, weight, bias, eps = op
+            mean = x.mean(axis=-1, keepdims=True)
+            var = x.var(axis=-1, keepdims=True)
+            x = (x - mean) / np.sqrt(var + eps)
+            if weight is not None:
+                x = x * weight + bias
+    return x
+
+
+def _compile_sequential(module) -> List[Op]:
+    """Flatten a torch Sequential into NumPy ops (float32, weights transposed)."""
+    import torch.nn as nn
+
+    ops: List[Op] = []
+    for layer in module.children() if isinstance(module, nn.Sequential) else [module]:
+        if isinstance(layer, nn.Linear):
+            weight = layer.weight.detach().cpu().numpy().astype(np.float32).T.copy()
+            bias = (
+                layer.bias.detach().cpu().numpy().astype(np.float32)
+                if layer.bias is not None
+                else None
+            )
+            ops.append(("linear", weight, bias))
+        elif isinstance(layer, nn.SiLU):
+            ops.append(("silu",))
+        elif isinstance(layer, nn.Sigmoid):
+            ops.append(("sigmoid",))
+        elif isinstance(layer, nn.LayerNorm):
+            weight = bias = None
+            if layer.elementwise_affine:
+                weight = layer.weight.detach().cpu().numpy().astype(np.float32)
+                bias = layer.bias.detach().cpu().numpy().astype(np.float32)
+            ops.append(("layernorm", weight, bias, float(layer.eps)))
+        elif isinstance(layer, nn.Dropout):
+            continue
+        elif isinstance(layer, nn.Sequential):
+            ops.extend(_compile_sequential(layer))
+        else:
+            raise TypeError(f"Unsupported scorer layer: {type(layer).__name__}")
+    return ops
+
+
+class LearnedScorerRuntime:
+    """Compiled NumPy forward pass for single-head, dual-head and UnifiedTRN scorers."""
+
+    def __init__(self, model_type: str, input_dim: int, **blocks: List[Op]):
+        self.model_type = model_type
+        self.input_dim = input_dim
+        self._blocks = blocks
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_torch_model(cls, model, model_type: str) -> "LearnedScorerRuntime":
+        """Compile a loaded (eval-mode) torch scorer.
+
+        Args:
+            model: ScorerMLP, DualHeadMLP or UnifiedTRN instance
+            model_type: "single", "dual_head" or "unified"
+        """
+        if model_type == "unified":
+            backbone = _compile_sequential(model.backbone)
+            # Split the first backbone Linear so the structural and content
+            # halves of torch.cat([s_enc, c_enc]) can be applied separately.
+            _, w_first, b_first = backbone[0]
+            enc_dim = w_first.shape[0] // 2
+            return cls(
+                model_type,
+                input_dim=model.structural_dim,
+                structural_enc=_compile_sequential(model.structural_enc),
+                content_enc=_compile_sequential(model.content_enc),
+                backbone_structural=[("linear", w_first[:enc_dim].copy(), b_first)],
+                backbone_content=[("linear", w_first[enc_dim:].copy(), None)],
+                backbone_rest=backbone[1:],
+                form_head=_compile_sequential(model.form_head),
+                content_head=_compile_sequential(model.content_head),
+                halt_head=_compile_sequential(model.halt_head),
+            )
+        if model_type == "dual_head":
+            backbone = _compile_sequential(model.backbone)
+            return cls(
+                model_type,
+                input_dim=backbone[0][1].shape[0],
+                backbone=backbone,
+                form_head=_compile_sequential(model.form_head),
+                content_head=_compile_sequential(model.content_head),
+            )
+        mlp = _compile_sequential(getattr(model, "mlp", model))
+        return cls(model_type, input_dim=mlp[0][1].shape[0], mlp=mlp)
+
+    # ------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------
+
+    def _features_matrix(self, features) -> np.ndarray:
+        """Copy feature rows into the preallocated matrix (grown on demand)."""
+        if isinstance(features, np.ndarray):
+            return features.astype(np.float32, copy=False)
+        n = len(features)
+        # One buffer per thread: searches run concurrently in executor threads
+        buf = getattr(self._local, "buffer", None)
+        if buf is None or buf.shape[0] < n:
+            buf = np.empty((max(n, 64), self.input_dim), dtype=np.float32)
+            self._local.buffer = buf
+        out = buf[:n]
+        for i, row in enumerate(features):
+            out[i] = row
+        return out
+
+    def score(
+        self,
+        features,
+        content_emb=None,
+        with_halt: bool = False,
+    ) -> ScorerOutput:
+        """Score one candidate pool.
+
+        Args:
+            features: [B, input_dim] feature rows (list of lists or ndarray)
+            content_emb: query content embedding (UnifiedTRN only), broadcast
+                across all candidates
+            with_halt: also compute UnifiedTRN's halt probability
+        """
+        x = self._features_matrix(features)
+        b = self._blocks
+
+        if self.model_type == "unified":
+            c = np.asarray(content_emb, dtype=np.float32).reshape(1, -1)
+            c_part = _run_ops(_run_ops(c, b["content_enc"]), b["backbone_content"])
+            s_part = _run_ops(
+                _run_ops(x, b["structural_enc"]), b["backbone_structural"]
+            )
+            shared = _run_ops(s_part + c_part, b["backbone_rest"])
+            return ScorerOutput(
+                form=_run_ops(shared, b["form_head"])[:, 0],
+                content=_run_ops(shared, b["content_head"])[:, 0],
+                halt=_run_ops(shared, b["halt_head"])[:, 0] if with_halt else None,
+            )
+
+        if self.model_type == "dual_head":
+            shared = _run_ops(x, b["backbone"])
+            return ScorerOutput(
+                form=_run_ops(shared, b["form_head"])[:, 0],
+                content=_run_ops(shared, b["content_head"])[:, 0],
+            )
+
+        return ScorerOutput(form=_run_ops(x, b["mlp"])[:, 0])
@@ -111,9 +111,9 @@ async def enforce_alpha_access(
         settings: App settings object (loaded from config if None)
     """
     if settings is None:
-        from config.settings import Settings
+        from config.settings import get_settings
 
-        settings = Settings()
+        settings = get_settings()
 
     if not settings.alpha_mode:
         return  # Alpha gating disabled
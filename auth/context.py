@@ -1,5 +1,6 @@
 """Session context management for multi-user OAuth authentication using FastMCP Context."""
 
+import itertools
 import json
 import threading
 from datetime import datetime, timedelta
@@ -18,6 +19,10 @@ logger = setup_logger()
 _session_store: Dict[str, Dict[str, Any]] = {}
 _store_lock = threading.Lock()
 
+# Source of SESSION_TOOLS_VERSION values — globally unique so a version never
+# repeats, even for a session that was cleared and recreated
+_tools_version_counter = itertools.count(1)
+
 # Global storage for middleware instances (this remains as it's not context-specific)
 _auth_middleware: Optional[Any] = None
 _middleware_lock = threading.Lock()
@@ -637,6 +642,10 @@ def store_session_data(session_id: str, key: str, value: Any) -> None:
 
         _session_store[session_id][key] = value
         _session_store[session_id]["last_accessed"] = datetime.now()
+        if key == SessionKey.SESSION_DISABLED_TOOLS:
+            _session_store[session_id][SessionKey.SESSION_TOOLS_VERSION] = next(
+                _tools_version_counter
+            )
 
     logger.debug(f"Stored session data for {session_id}: {key}")
 
@@ -659,6 +668,10 @@ def delete_session_data(session_id: str, key: str) -> bool:
     with _store_lock:
         if session_id in _session_store and key in _session_store[session_id]:
             del _session_store[session_id][key]
+            if key == SessionKey.SESSION_DISABLED_TOOLS:
+                _session_store[session_id][SessionKey.SESSION_TOOLS_VERSION] = next(
+                    _tools_version_counter
+                )
             logger.debug(f"Deleted session data for {session_id}: {key}")
             return True
 
@@ -853,6 +866,26 @@ async def disable_tool_for_session(
     return True
 
 
+def get_session_tools_version(session_id: str) -> int:
+    """
+    Version of a session's disabled-tool set.
+
+    Changes whenever the set is written (disable, enable, clear, restore),
+    so callers can memoize anything derived from it. 0 means never written.
+
+    Args:
+        session_id: Session identifier.
+
+    Returns:
+        Opaque version number for equality checks.
+    """
+    with _store_lock:
+        session_data = _session_store.get(session_id)
+        if not session_data:
+            return 0
+        return session_data.get(SessionKey.SESSION_TOOLS_VERSION, 0)
+
+
 def disable_tool_for_session_sync(tool_name: str, session_id: str) -> bool:
     """
     Disable a tool for a session (synchronous version).
@@ -1289,6 +1322,9 @@ def restore_session_tool_state(session_id: str) -> bool:
         _session_store[session_id][SessionKey.SESSION_DISABLED_TOOLS] = state.get(
             "disabled_tools", set()
         )
+        _session_store[session_id][SessionKey.SESSION_TOOLS_VERSION] = next(
+            _tools_version_counter
+        )
         _session_store[session_id]["minimal_startup_applied"] = state.get(
             "minimal_startup_applied", False
         )
@@ -1406,6 +1442,9 @@ def restore_session_tool_state_by_email(new_session_id: str, user_email: str) ->
         _session_store[new_session_id][SessionKey.SESSION_DISABLED_TOOLS] = (
             old_state.get("disabled_tools", set())
         )
+        _session_store[new_session_id][SessionKey.SESSION_TOOLS_VERSION] = next(
+            _tools_version_counter
+        )
         _session_store[new_session_id]["minimal_startup_applied"] = old_state.get(
             "minimal_startup_applied", False
         )
@@ -68,6 +68,7 @@ except ImportError:
     _COMPATIBILITY_AVAILABLE = False
     logging.warning("Compatibility shim not available, using fallback scopes")
 
+from config.cache_registry import register_cache, sampled_size
 from config.enhanced_logging import redact_email, setup_logger
 
 logger = setup_logger()
@@ -189,6 +190,25 @@ _service_cache: Dict[str, tuple[Any, datetime, str]] = {}
 _cache_ttl = timedelta(minutes=30)  # Cache services for 30 minutes
 
 
+def _evict_oldest_services(fraction: float) -> int:
+    """Drop the oldest ``fraction`` of cached services (memory budget)."""
+    oldest = sorted(_service_cache, key=lambda k: _service_cache[k][1])
+    victims = oldest[: max(1, int(len(oldest) * fraction))] if oldest else []
+    for key in victims:
+        _service_cache.pop(key, None)
+    return len(victims)
+
+
+_service_cache_handle = register_cache(
+    "google_services",
+    size_fn=lambda: sampled_size(
+        (entry[0] for entry in list(_service_cache.values())), len(_service_cache)
+    ),
+    evict_fn=_evict_oldest_services,
+    priority=7,  # rebuilding a service re-parses its discovery document
+)
+
+
 class GoogleServiceError(Exception):
     """Custom exception for Google service errors."""
 
@@ -238,8 +258,10 @@ def _get_cached_service(cache_key: str) -> Optional[tuple[Any, str]]:
             return None
 
         logger.debug(f"Using cached service for key: {cache_key}")
+        _service_cache_handle.hit()
         return service, user_email
 
+    _service_cache_handle.miss()
     return None
 
 
@@ -51,6 +51,9 @@ class SessionKey(str, Enum):
     API_KEY_OWNED_ACCOUNTS = "api_key_owned_accounts"
     SESSION_AUTHED_EMAILS = "session_authed_emails"
     SESSION_DISABLED_TOOLS = "session_disabled_tools"
+    SESSION_TOOLS_VERSION = (
+        "session_tools_version"  # Bumped on every SESSION_DISABLED_TOOLS write
+    )
     SERVICE_SELECTION_NEEDED = "service_selection_needed"
     CREDENTIALS = "credentials"
     PER_USER_ENCRYPTION_KEY = (
@@ -0,0 +1,291 @@
+"""
+Process-wide memory budget for in-process caches.
+
+Each cache registers once with a size estimate, a priority and an eviction
+callback::
+
+    from config.cache_registry import evict_first, register_cache, sampled_size
+
+    handle = register_cache(
+        "profile_cache",
+        size_fn=lambda: sampled_size(cache.values(), len(cache)),
+        evict_fn=lambda fraction: evict_first(cache, fraction),
+        priority=5,
+    )
+    handle.hit()  # / handle.miss() on lookups
+
+The registry keeps the sum of the estimates under a byte budget
+(``CACHE_MEMORY_BUDGET_MB``).  When the budget is exceeded, or when RSS
+sampling reports memory pressure, each cache gives up a share of the excess
+in proportion to its size and inversely to its priority.  Caches drop their
+least valuable entries (LRU/oldest), so nothing is wiped wholesale.
+"""
+
+import itertools
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+# Entries measured per cache when estimating its size
+_SIZE_SAMPLE = 8
+# Recursion limit for estimate_size (containers nested deeper are shallow-sized)
+_MAX_DEPTH = 4
+# Children measured per container before extrapolating
+_MAX_CHILDREN = 64
+
+_ATOMIC = (str, bytes, bytearray, int, float, bool, type(None))
+
+
+def estimate_size(obj: Any, max_depth: int = _MAX_DEPTH) -> int:
+    """Cheap, approximate deep size of *obj* in bytes.
+
+    Follows containers and instance ``__dict__``s to *max_depth* and
+    extrapolates large containers from their first children, so the cost
+    is bounded regardless of the object's real size.
+    """
+    seen: set = set()
+
+    def _size(o: Any, depth: int) -> int:
+        if id(o) in seen:
+            return 0
+        seen.add(id(o))
+        size = sys.getsizeof(o, 64)
+        nbytes = getattr(o, "nbytes", None)
+        if isinstance(nbytes, int) and not isinstance(o, _ATOMIC):
+            return max(size, nbytes)  # numpy arrays and friends
+        if depth >= max_depth or isinstance(o, _ATOMIC):
+            return size
+
+        if isinstance(o, dict):
+            count = 2 * len(o)
+            children: Iterable[Any] = itertools.chain.from_iterable(o.items())
+        elif isinstance(o, (list, tuple, set, frozenset, deque)):
+            count = len(o)
+            children = o
+        elif hasattr(o, "__dict__"):
+            return size + _size(vars(o), depth + 1)
+        else:
+            return size
+
+        measured = 0
+        total = 0
+        for child in itertools.islice(children, _MAX_CHILDREN):
+            total += _size(child, depth + 1)
+            measured += 1
+        if measured and count > measured:
+            total = total * count // measured
+        return size + total
+
+    try:
+        return _size(obj, 0)
+    except Exception:
+        return sys.getsizeof(obj, 64)
+
+
+def sampled_size(values: Iterable[Any], count: int) -> int:
+    """Estimate the total size of *count* values from a small sample."""
+    if count <= 0:
+        return 0
+    sample = list(itertools.islice(values, _SIZE_SAMPLE))
+    if not sample:
+        return 0
+    measured = sum(estimate_size(v) for v in sample)
+    return measured * count // len(sample)
+
+
+@dataclass
+class CacheHandle:
+    """A registered cache: how to size it, how to shrink it, and its metrics.
+
+    ``evict_fn(fraction)`` must drop roughly ``fraction`` (0-1] of the cache's
+    entries, least valuable first, and return the number evicted.  Higher
+    ``priority`` caches are more expensive to refill and give up less.
+    """
+
+    name: str
+    size_fn: Callable[[], int]
+    evict_fn: Callable[[float], int]
+    priority: int = 5
+    hits: int = 0
+    misses: int = 0
+    evicted_entries: int = 0
+    last_bytes: int = 0
+    last_sized_at: float = field(default=0.0)
+
+    def hit(self) -> None:
+        self.hits += 1
+
+    def miss(self) -> None:
+        self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def measure(self) -> int:
+        try:
+            self.last_bytes = max(0, int(self.size_fn()))
+        except Exception as e:
+            logger.debug(f"Cache size estimate failed for {self.name}: {e}")
+        self.last_sized_at = time.time()
+        return self.last_bytes
+
+
+class CacheRegistry:
+    """Registry of in-process caches sharing one memory budget."""
+
+    def __init__(self, budget_bytes: int = 0):
+        self.budget_bytes = budget_bytes
+        self._caches: Dict[str, CacheHandle] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        size_fn: Callable[[], int],
+        evict_fn: Callable[[float], int],
+        priority: int = 5,
+    ) -> CacheHandle:
+        """Register (or replace) the cache called *name*."""
+        handle = CacheHandle(
+            name=name, size_fn=size_fn, evict_fn=evict_fn, priority=max(1, priority)
+        )
+        with self._lock:
+            self._caches[name] = handle
+        logger.debug(f"Cache registry: registered {name} (priority={priority})")
+        return handle
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._caches.pop(name, None)
+
+    def get(self, name: str) -> Optional[CacheHandle]:
+        return self._caches.get(name)
+
+    def handles(self) -> List[CacheHandle]:
+        with self._lock:
+            return list(self._caches.values())
+
+    def measure(self) -> int:
+        """Refresh every cache's size estimate and return the total."""
+        return sum(handle.measure() for handle in self.handles())
+
+    def evict(self, excess_bytes: int) -> Dict[str, int]:
+        """Free roughly *excess_bytes* across caches, priority-weighted.
+
+        Cache *i* gives up ``excess * w_i / sum(w)`` bytes with
+        ``w_i = bytes_i / priority_i``, i.e. a fraction
+        ``excess / (priority_i * sum(w))`` of its entries.
+        """
+        handles = [h for h in self.handles() if h.last_bytes > 0]
+        weight = sum(h.last_bytes / h.priority for h in handles)
+        if excess_bytes <= 0 or weight <= 0:
+            return {}
+
+        evicted: Dict[str, int] = {}
+        for handle in handles:
+            fraction = min(1.0, excess_bytes / (handle.priority * weight))
+            try:
+                count = int(handle.evict_fn(fraction) or 0)
+            except Exception as e:
+                logger.warning(f"Cache eviction failed for {handle.name}: {e}")
+                continue
+            if count:
+                handle.evicted_entries += count
+                evicted[handle.name] = count
+        return evicted
+
+    def enforce(
+        self, pressure_bytes: int = 0, max_pressure_fraction: float = 0.25
+    ) -> Dict[str, int]:
+        """Measure caches and evict down to the budget.
+
+        Args:
+            pressure_bytes: Bytes to free because the process is over its RSS
+                target, even if caches are within budget.  Freed memory is not
+                always returned to the OS, so each call frees at most
+                ``max_pressure_fraction`` of the cached bytes — sustained
+                pressure shrinks caches gradually instead of wiping them.
+        """
+        total = self.measure()
+        over_budget = total - self.budget_bytes if self.budget_bytes else 0
+        pressure = min(pressure_bytes, int(total * max_pressure_fraction))
+        excess = max(over_budget, pressure)
+        if excess <= 0:
+            return {}
+        evicted = self.evict(min(excess, total))
+        if evicted:
+            after = self.measure()
+            logger.info(
+                f"🧹 Cache budget: evicted {sum(evicted.values())} entries "
+                f"({', '.join(f'{k}={v}' for k, v in evicted.items())}), "
+                f"{total / 1048576:.1f}MB -> {after / 1048576:.1f}MB"
+            )
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-cache bytes, hit rate and eviction counts (last measurement)."""
+        caches = {
+            h.name: {
+                "bytes": h.last_bytes,
+                "priority": h.priority,
+                "hits": h.hits,
+                "misses": h.misses,
+                "hit_rate": round(h.hit_rate, 4),
+                "evicted_entries": h.evicted_entries,
+            }
+            for h in self.handles()
+        }
+        return {
+            "budget_bytes": self.budget_bytes,
+            "total_bytes": sum(c["bytes"] for c in caches.values()),
+            "caches": caches,
+        }
+
+
+_registry: Optional[CacheRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_cache_registry() -> CacheRegistry:
+    """Return the process-wide cache registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                from config.settings import settings
+
+                _registry = CacheRegistry(
+                    budget_bytes=int(settings.cache_memory_budget_mb * 1048576)
+                )
+    return _registry
+
+
+def register_cache(
+    name: str,
+    size_fn: Callable[[], int],
+    evict_fn: Callable[[float], int],
+    priority: int = 5,
+) -> CacheHandle:
+    """Register a cache with the process-wide registry."""
+    return get_cache_registry().register(name, size_fn, evict_fn, priority)
+
+
+def evict_first(mapping: Any, fraction: float) -> int:
+    """Evict ``fraction`` of *mapping*'s entries in iteration order.
+
+    Suits insertion-ordered dicts and ``OrderedDict`` LRUs whose oldest /
+    least recently used entries come first.
+    """
+    count = min(len(mapping), max(1, int(len(mapping) * fraction)))
+    for key in list(itertools.islice(iter(mapping), count)):
+        mapping.pop(key, None)
+    return count
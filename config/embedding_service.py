@@ -230,6 +230,10 @@ class EmbeddingService:
         self._models[slot] = model
         return model
 
+    def get_model_name(self, slot: str) -> str:
+        """Get the configured FastEmbed model name for a slot."""
+        return self._model_names.get(slot, _SLOT_DEFAULTS[slot][1])
+
     def get_dimension(self, slot: str) -> int:
         """Get the embedding dimension for a loaded slot."""
         return self._dimensions.get(
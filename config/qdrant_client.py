@@ -16,8 +16,17 @@ Usage:
     client = get_qdrant_client()
     if client:
         collections = client.get_collections()
+
+Async callers use ``get_async_qdrant_client()`` instead, which returns a
+shared ``AsyncQdrantClient`` (one per event loop) with a pooled transport:
+
+    client = await get_async_qdrant_client()
+    if client:
+        results = await client.query_points(...)
 """
 
+import asyncio
+import weakref
 from typing import Optional
 
 from config.enhanced_logging import setup_logger
@@ -29,6 +38,10 @@ _qdrant_client = None
 _initialization_attempted = False
 _docker_launch_attempted = False
 
+# Async clients are bound to the event loop that created their transport,
+# so keep one per loop (weakly keyed so closed loops don't pin clients).
+_async_qdrant_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
 
 def _ensure_qdrant_available() -> bool:
     """
@@ -163,6 +176,90 @@ def close_qdrant_client():
     _docker_launch_attempted = False
 
 
+async def get_async_qdrant_client() -> Optional["AsyncQdrantClient"]:
+    """
+    Get the shared AsyncQdrantClient for the running event loop.
+
+    Uses the same URL/API key as the sync singleton.  The transport is
+    selected by ``qdrant_async_prefer_grpc`` (falling back to
+    ``qdrant_prefer_grpc``) and REST connections are pooled up to
+    ``qdrant_async_pool_size`` so concurrent searches reuse connections.
+
+    Must be awaited from within a running event loop.
+
+    Returns:
+        AsyncQdrantClient instance or None if unavailable
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("get_async_qdrant_client() called outside an event loop")
+        return None
+
+    client = _async_qdrant_clients.get(loop)
+    if client is not None:
+        return client
+
+    # Reuse the sync initialization path for Docker auto-launch + config checks.
+    # That path can launch Docker and test the connection, so keep it off the loop.
+    if await asyncio.to_thread(get_qdrant_client) is None:
+        return None
+    client = _async_qdrant_clients.get(loop)
+    if client is not None:  # Created by a concurrent first caller
+        return client
+
+    try:
+        from qdrant_client import AsyncQdrantClient
+
+        from config.settings import settings
+
+        prefer_grpc = settings.qdrant_async_prefer_grpc
+        if prefer_grpc is None:
+            prefer_grpc = settings.qdrant_prefer_grpc
+        pool_size = settings.qdrant_async_pool_size
+
+        if settings.qdrant_url:
+            client = AsyncQdrantClient(
+                url=settings.qdrant_url,
+                api_key=settings.qdrant_api_key,
+                prefer_grpc=prefer_grpc,
+                pool_size=pool_size,
+            )
+        else:
+            client = AsyncQdrantClient(
+                host=settings.qdrant_host or "localhost",
+                port=settings.qdrant_port or 6333,
+                api_key=settings.qdrant_api_key,
+                prefer_grpc=prefer_grpc,
+                pool_size=pool_size,
+            )
+        _async_qdrant_clients[loop] = client
+        logger.info(
+            f"✅ Async Qdrant client ready (gRPC: {prefer_grpc}, pool: {pool_size})"
+        )
+        return client
+    except ImportError as e:
+        logger.warning(f"⚠️ AsyncQdrantClient not available: {e}")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize async Qdrant client: {e}")
+    return None
+
+
+async def close_async_qdrant_client():
+    """Close the async Qdrant client bound to the running event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    client = _async_qdrant_clients.pop(loop, None)
+    if client is not None:
+        try:
+            await client.close()
+            logger.info("🔒 Async Qdrant client closed")
+        except Exception as e:
+            logger.warning(f"⚠️ Error closing async Qdrant client: {e}")
+
+
 def is_qdrant_available() -> bool:
     """Check if Qdrant client is available and connected."""
     client = get_qdrant_client()
@@ -1,7 +1,10 @@
 """Application configuration using Pydantic Settings."""
 
+import copy
 import logging
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
 from pydantic import AliasChoices, Field
@@ -82,6 +85,52 @@ class Settings(BaseSettings):
         json_schema_extra={"env": "TOOL_COLLECTION"},
     )
 
+    # Incremental tool/service usage counters (middleware/qdrant_core/usage_counters.py)
+    # read by dynamic instructions instead of scrolling the response history
+    usage_counters_path: str = Field(
+        default="",
+        description="JSON file for persisted usage counters. If empty, uses credentials_dir/usage_counters.json",
+        json_schema_extra={"env": "USAGE_COUNTERS_PATH"},
+    )
+    usage_counters_flush_seconds: float = Field(
+        default=60.0,
+        description="Minimum seconds between usage counter flushes to disk",
+        json_schema_extra={"env": "USAGE_COUNTERS_FLUSH_SECONDS"},
+    )
+
+    # Tool co-usage graph (adapters/module_wrapper/tool_relationship_graph.py)
+    # shared across workers via an edge log + snapshots (tool_graph_store.py)
+    tool_graph_backend: str = Field(
+        default="none",
+        description="Tool relationship graph: 'none' (disabled), 'memory', 'file' (shared directory), or 'redis' (REDIS_IO_URL_STRING)",
+        json_schema_extra={"env": "TOOL_GRAPH_BACKEND"},
+    )
+    tool_graph_dir: str = Field(
+        default="",
+        description="Directory for the 'file' tool graph backend. If empty, uses credentials_dir/tool_graph",
+        json_schema_extra={"env": "TOOL_GRAPH_DIR"},
+    )
+    tool_graph_sync_seconds: float = Field(
+        default=30.0,
+        description="Minimum seconds between tool graph syncs with the shared store",
+        json_schema_extra={"env": "TOOL_GRAPH_SYNC_SECONDS"},
+    )
+    tool_graph_snapshot_seconds: float = Field(
+        default=600.0,
+        description="Minimum seconds between tool graph snapshots (which compact the edge log)",
+        json_schema_extra={"env": "TOOL_GRAPH_SNAPSHOT_SECONDS"},
+    )
+    tool_graph_retention_seconds: float = Field(
+        default=86400.0,
+        description="How long edge-log batches are kept after a snapshot covers them",
+        json_schema_extra={"env": "TOOL_GRAPH_RETENTION_SECONDS"},
+    )
+    tool_graph_metrics_edge_threshold: int = Field(
+        default=25,
+        description="Graph changes that trigger a background centrality/k-core refresh",
+        json_schema_extra={"env": "TOOL_GRAPH_METRICS_EDGE_THRESHOLD"},
+    )
+
     # Qdrant Docker Auto-Launch Configuration
     # When enabled, automatically launches Qdrant via Docker if not reachable
     qdrant_auto_launch: bool = Field(
@@ -120,6 +169,20 @@ class Settings(BaseSettings):
         json_schema_extra={"env": "QDRANT_DOCKER_STOP_ON_EXIT"},
     )
 
+    # Async Qdrant access (ModuleWrapper async search path)
+    # None = follow qdrant_prefer_grpc; set explicitly to pick the transport
+    # for AsyncQdrantClient independently of the sync client.
+    qdrant_async_prefer_grpc: Optional[bool] = Field(
+        default=None,
+        description="Use gRPC for the async Qdrant client (default: same as QDRANT_PREFER_GRPC)",
+        json_schema_extra={"env": "QDRANT_ASYNC_PREFER_GRPC"},
+    )
+    qdrant_async_pool_size: int = Field(
+        default=20,
+        description="Connection pool size shared by the async Qdrant client",
+        json_schema_extra={"env": "QDRANT_ASYNC_POOL_SIZE"},
+    )
+
     # Logging
     log_level: str = "INFO"
 
@@ -128,6 +191,12 @@ class Settings(BaseSettings):
 
     # Gmail Allow List Configuration
     gmail_allow_list: str = ""  # Comma-separated list of email addresses
+    # Allowed contact-group members per user (people/allowlist_index.py)
+    allowlist_membership_ttl: float = Field(
+        default=300.0,
+        description="Seconds the expanded member set of allow-listed contact groups is reused before rebuilding",
+        json_schema_extra={"env": "ALLOWLIST_MEMBERSHIP_TTL"},
+    )
 
     # Gmail Elicitation Configuration (for MCP client compatibility)
     gmail_enable_elicitation: bool = True  # Enable elicitation for untrusted recipients
@@ -324,6 +393,18 @@ class Settings(BaseSettings):
         json_schema_extra={"env": "RELATIONSHIP_COLLECTION"},
     )
 
+    # Instance pattern retention (gchat/feedback_retention.py)
+    feedback_retention_interval_seconds: float = Field(
+        default=300.0,
+        description="Seconds between scheduled instance_pattern retention passes",
+        json_schema_extra={"env": "FEEDBACK_RETENTION_INTERVAL_SECONDS"},
+    )
+    feedback_retention_high_water: float = Field(
+        default=1.1,
+        description="Run retention early once patterns exceed this multiple of MAX_INSTANCE_PATTERNS",
+        json_schema_extra={"env": "FEEDBACK_RETENTION_HIGH_WATER"},
+    )
+
     # Google Chat Default Webhook URL
     # When set, this becomes the default webhook for all card tools (send_dynamic_card, etc.)
     # Useful for development/testing when you always want to send to the same space
@@ -333,6 +414,59 @@ class Settings(BaseSettings):
         json_schema_extra={"env": "MCP_CHAT_WEBHOOK"},
     )
 
+    # Per-user, per-space Chat member directory (gchat/member_directory.py)
+    chat_member_cache_ttl: float = Field(
+        default=600.0,
+        description="Seconds a cached Chat space member list is served before a background refresh",
+        json_schema_extra={"env": "CHAT_MEMBER_CACHE_TTL"},
+    )
+
+    # Cross-space Chat message search (gchat/message_search.py)
+    chat_search_concurrency: int = Field(
+        default=8,
+        description="Max spaces searched concurrently by search_messages (each gets its own Chat client)",
+        json_schema_extra={"env": "CHAT_SEARCH_CONCURRENCY"},
+    )
+    chat_search_deadline_seconds: float = Field(
+        default=20.0,
+        description="Global deadline for a cross-space search; unfinished spaces are reported in coverage",
+        json_schema_extra={"env": "CHAT_SEARCH_DEADLINE_SECONDS"},
+    )
+    chat_search_lookback_days: int = Field(
+        default=30,
+        description="How far back cross-space search and the message index look",
+        json_schema_extra={"env": "CHAT_SEARCH_LOOKBACK_DAYS"},
+    )
+    chat_index_max_messages_per_space: int = Field(
+        default=1000,
+        description="Max recent messages fetched/indexed per space for cross-space search",
+        json_schema_extra={"env": "CHAT_INDEX_MAX_MESSAGES_PER_SPACE"},
+    )
+
+    # Incremental chat://digest store (gchat/digest_store.py)
+    chat_digest_store_dir: str = Field(
+        default="",
+        description="Directory for persisted per-user chat digest state. If empty, uses credentials_dir/chat_digest",
+        json_schema_extra={"env": "CHAT_DIGEST_STORE_DIR"},
+    )
+    chat_digest_refresh_seconds: float = Field(
+        default=0.0,
+        description="Refresh the digest of recently read users in the background this often so reads return from the store (0 disables)",
+        json_schema_extra={"env": "CHAT_DIGEST_REFRESH_SECONDS"},
+    )
+
+    # Pooled card delivery (gchat/webhook_client.py)
+    chat_webhook_min_interval_seconds: float = Field(
+        default=1.0,
+        description="Minimum spacing between card messages sent to the same space (Chat allows ~1 msg/sec/space)",
+        json_schema_extra={"env": "CHAT_WEBHOOK_MIN_INTERVAL_SECONDS"},
+    )
+    chat_webhook_background_delivery: bool = Field(
+        default=False,
+        description="Queue webhook card sends and return once accepted instead of waiting for delivery",
+        json_schema_extra={"env": "CHAT_WEBHOOK_BACKGROUND_DELIVERY"},
+    )
+
     # Phase 1 OAuth Migration Feature Flags
     enable_unified_auth: bool = True
     legacy_compat_mode: bool = True
@@ -353,6 +487,92 @@ class Settings(BaseSettings):
         description="Default IANA timezone for calendar events when no timezone is specified (e.g., 'America/Chicago')",
         json_schema_extra={"env": "DEFAULT_TIMEZONE"},
     )
+    calendar_batch_size: int = Field(
+        default=50,
+        description="Requests per Calendar batch call in bulk operations (API maximum is 50)",
+        json_schema_extra={"env": "CALENDAR_BATCH_SIZE"},
+    )
+    calendar_batch_max_retries: int = Field(
+        default=3,
+        description="Retries for batch items that fail with a rate-limit or 5xx error",
+        json_schema_extra={"env": "CALENDAR_BATCH_MAX_RETRIES"},
+    )
+
+    # Sync-token backed event store (gcalendar/event_store.py)
+    calendar_event_cache_enabled: bool = Field(
+        default=True,
+        description="Serve list_events/get_event from a local per-calendar store kept current with sync tokens",
+        json_schema_extra={"env": "CALENDAR_EVENT_CACHE_ENABLED"},
+    )
+    calendar_event_cache_max_age: float = Field(
+        default=60.0,
+        description="Seconds cached calendar data is served before an incremental sync runs",
+        json_schema_extra={"env": "CALENDAR_EVENT_CACHE_MAX_AGE"},
+    )
+    calendar_sync_past_days: int = Field(
+        default=30,
+        description="Days before now covered by the event store's sync window",
+        json_schema_extra={"env": "CALENDAR_SYNC_PAST_DAYS"},
+    )
+    calendar_sync_future_days: int = Field(
+        default=180,
+        description="Days after now covered by the event store's sync window",
+        json_schema_extra={"env": "CALENDAR_SYNC_FUTURE_DAYS"},
+    )
+
+    # Shared Drive file metadata cache (drive/file_cache.py)
+    drive_file_cache_enabled: bool = Field(
+        default=True,
+        description="Share Drive file metadata across tools via a per-user cache filled by batched files.get",
+        json_schema_extra={"env": "DRIVE_FILE_CACHE_ENABLED"},
+    )
+    drive_file_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds cached Drive file metadata is served before it is refetched",
+        json_schema_extra={"env": "DRIVE_FILE_CACHE_TTL"},
+    )
+    drive_file_cache_max_entries: int = Field(
+        default=5000,
+        description="Max Drive file metadata records kept across all users (LRU)",
+        json_schema_extra={"env": "DRIVE_FILE_CACHE_MAX_ENTRIES"},
+    )
+    drive_changes_poll_seconds: float = Field(
+        default=0.0,
+        description="Poll Drive changes.list at most this often to refresh cached metadata (0 disables)",
+        json_schema_extra={"env": "DRIVE_CHANGES_POLL_SECONDS"},
+    )
+    recent_items_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds a per-user recent:// Drive snapshot is served before it is revalidated in the background",
+        json_schema_extra={"env": "RECENT_ITEMS_CACHE_TTL"},
+    )
+    recent_items_max_stale: float = Field(
+        default=900.0,
+        description="Seconds after which a recent:// snapshot is too old to serve while revalidating and is refetched inline",
+        json_schema_extra={"env": "RECENT_ITEMS_MAX_STALE"},
+    )
+    forms_schema_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds a cached form question map is trusted before a revisionId check",
+        json_schema_extra={"env": "FORMS_SCHEMA_CACHE_TTL"},
+    )
+    forms_export_inline_max: int = Field(
+        default=1000,
+        description="list_form_responses(export_all=True) returns at most this many responses inline before staging a JSONL file",
+        json_schema_extra={"env": "FORMS_EXPORT_INLINE_MAX"},
+    )
+
+    # service:// item resolution (middleware/service_item_resolvers.py)
+    service_item_index_ttl: float = Field(
+        default=300.0,
+        description="Seconds items seen in list tool results can answer service://{service}/{list_type}/{id} reads",
+        json_schema_extra={"env": "SERVICE_ITEM_INDEX_TTL"},
+    )
+    service_item_index_max_lists: int = Field(
+        default=256,
+        description="Max (user, service, list type) list results kept in the service item index (LRU)",
+        json_schema_extra={"env": "SERVICE_ITEM_INDEX_MAX_LISTS"},
+    )
 
     # Template Configuration
     jinja_template_strict_mode: bool = Field(
@@ -394,6 +614,21 @@ class Settings(BaseSettings):
         json_schema_extra={"env": "SEARCH_MODE"},
     )
 
+    # Learned scorer inference backend. "numpy" compiles the loaded checkpoint
+    # into plain matmuls (adapters/scorer_runtime.py) — the models are ~30K
+    # params, so per-op torch dispatch dominates at candidate-pool batch sizes.
+    learned_scorer_backend: str = Field(
+        default="numpy",
+        description="Learned scorer inference backend: 'numpy' (compiled) or 'torch' (eager)",
+        json_schema_extra={"env": "LEARNED_SCORER_BACKEND"},
+    )
+    # torch only: the NumPy runtime's matmuls are too small for BLAS threading
+    learned_scorer_threads: int = Field(
+        default=0,
+        description="torch intra-op threads for the 'torch' scorer backend (0 = torch default; ignored by 'numpy')",
+        json_schema_extra={"env": "LEARNED_SCORER_THREADS"},
+    )
+
     # Card-builder slot assignment: how much say the learned model gets over
     # where content lands. "always" pins an item whenever its current pool has
     # unmet DSL demand (legacy — the model is then never consulted).
@@ -491,6 +726,31 @@ class Settings(BaseSettings):
         json_schema_extra={"env": "MODEL_ARTIFACT_CHECKSUM_VERIFY"},
     )
 
+    # Semantic icon search index (gchat/icon_search.py). The embedded icon
+    # matrix is persisted per (model, icon list) and memory-mapped on startup.
+    icon_index_dir: str = Field(
+        default="",
+        description="Directory for the persisted icon embedding index. If empty, uses credentials_dir/model_cache/icon_index",
+        json_schema_extra={"env": "ICON_INDEX_DIR"},
+    )
+    icon_query_cache_size: int = Field(
+        default=1024,
+        description="Max cached icon query embeddings (0 = disabled)",
+        json_schema_extra={"env": "ICON_QUERY_CACHE_SIZE"},
+    )
+
+    # ModuleWrapper startup snapshots (adapters/module_wrapper/snapshot.py)
+    module_wrapper_snapshot_enabled: bool = Field(
+        default=True,
+        description="Restore ModuleWrapper introspection from on-disk snapshots when module sources are unchanged",
+        json_schema_extra={"env": "MODULE_WRAPPER_SNAPSHOT_ENABLED"},
+    )
+    module_wrapper_snapshot_dir: str = Field(
+        default="",
+        description="Directory for ModuleWrapper snapshots. If empty, uses credentials_dir/model_cache/wrapper_snapshots",
+        json_schema_extra={"env": "MODULE_WRAPPER_SNAPSHOT_DIR"},
+    )
+
     # Response Limiting Configuration
     response_limit_max_size: int = Field(
         default=500_000,
@@ -721,6 +981,18 @@ class Settings(BaseSettings):
         json_schema_extra={"env": "SAMPLING_MONTHLY_BUDGET_USD"},
     )
 
+    # In-process cache memory budget
+    cache_memory_budget_mb: int = Field(
+        default=256,
+        description="Byte budget (MB) shared by registered in-process caches; 0 = only evict under RSS pressure",
+        json_schema_extra={"env": "CACHE_MEMORY_BUDGET_MB"},
+    )
+    cache_budget_sample_seconds: int = Field(
+        default=30,
+        description="Seconds between RSS samples / cache budget enforcement passes",
+        json_schema_extra={"env": "CACHE_BUDGET_SAMPLE_SECONDS"},
+    )
+
     # Reactive Cache Keepalive
     cache_keepalive_reactive: bool = Field(
         default=True,
@@ -732,6 +1004,21 @@ class Settings(BaseSettings):
         description="Stop keepalive after this many seconds of no real sampling activity (default 1 hour)",
         json_schema_extra={"env": "CACHE_KEEPALIVE_IDLE_TIMEOUT_SECONDS"},
     )
+    cache_keepalive_ttl_seconds: int = Field(
+        default=3600,
+        description="Provider prompt-cache TTL; a module's keepalive always fires before its prefix is this old",
+        json_schema_extra={"env": "CACHE_KEEPALIVE_TTL_SECONDS"},
+    )
+    cache_keepalive_concurrency: int = Field(
+        default=2,
+        description="Maximum keepalive calls in flight when several modules are due at once",
+        json_schema_extra={"env": "CACHE_KEEPALIVE_CONCURRENCY"},
+    )
+    cache_keepalive_min_benefit_ratio: float = Field(
+        default=1.0,
+        description="Send a due keepalive only if expected cache savings are at least this multiple of its cost",
+        json_schema_extra={"env": "CACHE_KEEPALIVE_MIN_BENEFIT_RATIO"},
+    )
 
     # Argument Recovery
     sampling_argument_recovery_enabled: bool = Field(
@@ -1331,3 +1618,149 @@ class Settings(BaseSettings):
 
 # Global settings instance
 settings = Settings()
+
+
+# ---------------------------------------------------------------------------
+# Hot-path settings snapshot
+#
+# Constructing ``Settings()`` re-reads the environment and .env file and
+# re-runs pydantic validation.  Request paths (search dispatch, learned
+# scoring, alpha gating) read settings through ``get_settings()`` instead,
+# which returns a read-only snapshot validated once per process.
+# ``reload_settings()`` swaps in a freshly validated snapshot, refreshes the
+# module-level ``settings`` instance in place, and bumps
+# ``settings_version()`` so dependent caches know to invalidate.
+# ---------------------------------------------------------------------------
+
+
+class _FrozenSettings(Settings):
+    """Immutable deep copy of a ``Settings`` instance backing a snapshot."""
+
+    model_config = SettingsConfigDict(**Settings.model_config, frozen=True)
+
+    def __setattr__(self, name: str, value) -> None:
+        # pydantic's frozen check skips private attributes; block those too.
+        raise AttributeError(f"Settings snapshot is read-only (tried to set '{name}')")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"Settings snapshot is read-only (tried to delete '{name}')"
+        )
+
+
+def _freeze(source: Settings) -> _FrozenSettings:
+    """Deep-copy ``source`` into a frozen model without re-reading the env."""
+    frozen = _FrozenSettings.model_construct(
+        _fields_set=set(source.model_fields_set),
+        **copy.deepcopy(dict(source)),
+    )
+    object.__setattr__(
+        frozen, "__pydantic_private__", copy.deepcopy(source.__pydantic_private__)
+    )
+    return frozen
+
+
+class SettingsSnapshot:
+    """Read-only view over a frozen deep copy of a validated ``Settings``.
+
+    Attribute reads (including properties and methods) are delegated to the
+    wrapped instance; attribute writes raise ``AttributeError``.  Mutable
+    containers are returned as copies so callers cannot alter the snapshot.
+    """
+
+    __slots__ = ("_settings", "version")
+
+    def __init__(self, wrapped: Settings, version: int):
+        if not isinstance(wrapped, _FrozenSettings):
+            wrapped = _freeze(wrapped)
+        object.__setattr__(self, "_settings", wrapped)
+        object.__setattr__(self, "version", version)
+
+    def __getattr__(self, name: str):
+        value = getattr(self._settings, name)
+        if isinstance(value, (list, dict, set)):
+            return copy.deepcopy(value)
+        return value
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(
+            f"Settings snapshot is read-only (tried to set '{name}'); "
+            "use reload_settings() or override_settings() instead"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"Settings snapshot is read-only (tried to delete '{name}')"
+        )
+
+    def __repr__(self) -> str:
+        return f"SettingsSnapshot(version={self.version})"
+
+
+_snapshot_lock = threading.Lock()
+_snapshot_version = 0
+_snapshot: Optional[SettingsSnapshot] = None
+
+
+def get_settings() -> SettingsSnapshot:
+    """Return the process-wide settings snapshot (validated once, cheap to call)."""
+    snap = _snapshot
+    if snap is not None:
+        return snap
+    return _install_snapshot(settings, bump=False)
+
+
+def settings_version() -> int:
+    """Return the current snapshot version; changes on every reload/override."""
+    return _snapshot_version
+
+
+def reload_settings(**overrides) -> SettingsSnapshot:
+    """Re-read environment/.env, re-validate, and publish a new snapshot.
+
+    The module-level ``settings`` instance is refreshed in place with the
+    reloaded values, so modules that imported it directly observe the same
+    values as ``get_settings()`` readers.
+    """
+    fresh = Settings(**overrides)
+    with _snapshot_lock:
+        settings.__dict__.update(fresh.__dict__)
+        object.__setattr__(
+            settings, "__pydantic_fields_set__", set(fresh.model_fields_set)
+        )
+    return _install_snapshot(fresh)
+
+
+@contextmanager
+def override_settings(**values):
+    """Temporarily publish a snapshot with ``values`` applied (for tests).
+
+    Only ``get_settings()`` readers see the overrides; the module-level
+    ``settings`` instance is not modified.
+
+    Example::
+
+        with override_settings(search_mode="learned"):
+            assert get_settings().search_mode == "learned"
+    """
+    previous = get_settings()
+    snap = _install_snapshot(previous._settings.model_copy(update=values))
+    try:
+        yield snap
+    finally:
+        _install_snapshot(previous._settings)
+
+
+def _install_snapshot(wrapped: Settings, bump: bool = True) -> SettingsSnapshot:
+    global _snapshot, _snapshot_version
+    with _snapshot_lock:
+        if not bump and _snapshot is not None:
+            return _snapshot
+        if bump:
+            _snapshot_version += 1
+        _snapshot = SettingsSnapshot(wrapped, _snapshot_version)
+        return _snapshot
+        if bump:
+            _snapshot_version += 1
+        _snapshot = SettingsSnapshot(wrapped, _snapshot_version)
+        return _snapshot
@@ -44,6 +44,12 @@ from .drive_types import (
     ShareDriveFilesResponse,
     ShareFileResult,
 )
+from .file_cache import (
+    get_file_metadata,
+    get_files_metadata,
+    invalidate_file_metadata,
+    prime_file_metadata,
+)
 
 logger = setup_logger()
 
@@ -446,6 +452,7 @@ async def search_drive_files(
             drive_service.files().list(**list_params).execute
         )
         files = results.get("files", [])
+        prime_file_metadata(user_google_email, files)
 
         # Convert to structured file info
         structured_results: List[DriveFileInfo] = []
@@ -640,15 +647,12 @@ def setup_drive_comprehensive_tools(mcp: FastMCP) -> None:
         try:
             drive_service = await _get_drive_service_with_fallback(user_google_email)
 
-            # Get file metadata
-            file_metadata = await asyncio.to_thread(
-                drive_service.files()
-                .get(
-                    fileId=file_id,
-                    fields="id, name, mimeType, webViewLink",
-                    supportsAllDrives=True,
-                )
-                .execute
+            # Get file metadata (shared per-user cache)
+            file_metadata = await get_file_metadata(
+                drive_service,
+                user_google_email,
+                file_id,
+                fields="id, name, mimeType, webViewLink",
             )
 
             mime_type = file_metadata.get("mimeType", "")
@@ -790,10 +794,8 @@ def setup_drive_comprehensive_tools(mcp: FastMCP) -> None:
             folder_name = "My Drive (Root)"
             if folder_id != "root":
                 try:
-                    folder_meta = await asyncio.to_thread(
-                        drive_service.files()
-                        .get(fileId=folder_id, fields="name", supportsAllDrives=True)
-                        .execute
+                    folder_meta = await get_file_metadata(
+                        drive_service, user_google_email, folder_id, fields="name"
                     )
                     folder_name = folder_meta.get("name", "Unknown Folder")
                 except Exception as e:
@@ -839,6 +841,7 @@ def setup_drive_comprehensive_tools(mcp: FastMCP) -> None:
             )
 
             files = results.get("files", [])
+            prime_file_metadata(user_google_email, files)
 
             # Convert to structured items
             structured_items: List[DriveItemInfo] = []
@@ -1147,24 +1150,26 @@ def setup_drive_comprehensive_tools(mcp: FastMCP) -> None:
             successful_operations = 0
             failed_operations = 0
 
+            # Get file metadata for better reporting (one batched lookup)
+            metadata_by_id, metadata_errors = await get_files_metadata(
+                drive_service,
+                user_google_email,
+                file_ids,
+                fields="id, name, webViewLink",
+            )
+
             for file_id in file_ids:
-                # Get file metadata for better reporting
-                try:
-                    file_metadata = await asyncio.to_thread(
-                        drive_service.files()
-                        .get(
-                            fileId=file_id,
-                            fields="id, name, webViewLink",
-                            supportsAllDrives=True,
-                        )
-                        .execute
-                    )
+                if file_id in metadata_by_id:
+                    file_metadata = metadata_by_id[file_id]
                     file_name = file_metadata.get("name", "Unknown File")
                     file_link = file_metadata.get("webViewLink", "#")
-                except Exception as e:
+                else:
                     file_name = f"File ID: {file_id}"
                     file_link = "#"
-                    logger.warning(f"Could not fetch metadata for file {file_id}: {e}")
+                    logger.warning(
+                        f"Could not fetch metadata for file {file_id}: "
+                        f"{metadata_errors.get(file_id)}"
+                    )
 
                 recipients_processed = []
                 recipients_failed = []
@@ -1218,6 +1223,9 @@ def setup_drive_comprehensive_tools(mcp: FastMCP) -> None:
                 )
                 share_results.append(file_result)
 
+            # New permissions bump each file's version
+            invalidate_file_metadata(user_google_email, *file_ids)
+
             return ShareDriveFilesResponse(
                 success=failed_operations == 0,
                 totalFiles=len(file_ids),
@@ -1338,24 +1346,26 @@ def setup_drive_comprehensive_tools(mcp: FastMCP) -> None:
             successful_operations = 0
             failed_operations = 0
 
+            # Get file metadata for better reporting (one batched lookup)
+            metadata_by_id, metadata_errors = await get_files_metadata(
+                drive_service,
+                user_google_email,
+                file_ids,
+                fields="id, name, webViewLink",
+            )
+
             for file_id in file_ids:
-                # Get file metadata for better reporting
-                try:
-                    file_metadata = await asyncio.to_thread(
-                        drive_service.files()
-                        .get(
-                            fileId=file_id,
-                            fields="id, name, webViewLink",
-                            supportsAllDrives=True,
-                        )
-                        .execute
-                    )
+                if file_id in metadata_by_id:
+                    file_metadata = metadata_by_id[file_id]
                     file_name = file_metadata.get("name", "Unknown File")
                     file_link = file_metadata.get("webViewLink", "#")
-                except Exception as e:
+                else:
                     file_name = f"File ID: {file_id}"
                     file_link = "#"
-                    logger.warning(f"Could not fetch metadata for file {file_id}: {e}")
+                    logger.warning(
+                        f"Could not fetch metadata for file {file_id}: "
+                        f"{metadata_errors.get(file_id)}"
+                    )
 
                 file_result = PublicFileResult(
                     fileId=file_id,
@@ -1429,6 +1439,8 @@ def setup_drive_comprehensive_tools(mcp: FastMCP) -> None:
 
                 public_results.append(file_result)
 
+            invalidate_file_metadata(user_google_email, *file_ids)
+
             action = "made public" if public else "made private"
             return MakeDriveFilesPublicResponse(
                 success=failed_operations == 0,
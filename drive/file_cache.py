@@ -0,0 +1,382 @@
+"""
+Per-user Drive file metadata cache shared across tools.
+
+Calendar attachment resolution, sharing/publishing tools, file content reads
+and folder listings each used to issue their own ``files.get`` for the same
+file IDs.  ``DriveFileCache`` keeps one metadata record per (user, fileId):
+
+- misses are filled in bulk with batched ``files.get`` calls (up to 100 per
+  batch) that always request ``BASE_FIELDS`` plus whatever the caller needs,
+  so one fetch serves later tools asking for different fields;
+- ``files.list`` responses tools already receive prime the cache for free;
+- records are validated by ``version``/``modifiedTime``: a newer listing or
+  change replaces the record instead of merging into it, and records older
+  than ``DRIVE_FILE_CACHE_TTL`` are refetched;
+- this server's own writes (rename, move, delete, share) invalidate the
+  affected IDs, and ``DRIVE_CHANGES_POLL_SECONDS`` optionally enables
+  ``changes.list`` polling to pick up edits made elsewhere.
+
+Usage:
+    meta = await get_file_metadata(drive_service, user_email, file_id,
+                                   fields="name,mimeType")
+    metas = await get_files_metadata(drive_service, user_email, file_ids)
+    prime_file_metadata(user_email, list_response.get("files", []))
+    invalidate_file_metadata(user_email, file_id)
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+BASE_FIELDS = (
+    "id",
+    "name",
+    "mimeType",
+    "webViewLink",
+    "iconLink",
+    "modifiedTime",
+    "version",
+    "parents",
+    "size",
+    "trashed",
+)
+MAX_BATCH_SIZE = 100  # Drive API batch limit
+
+
+def _parse_fields(fields: Optional[str]) -> Set[str]:
+    """``"id, name,mimeType"`` -> {"id", "name", "mimeType"} (top-level only)."""
+    if not fields:
+        return set()
+    return {f.strip() for f in fields.split(",") if f.strip()}
+
+
+def _fields_param(requested: Set[str]) -> str:
+    return ",".join(sorted(set(BASE_FIELDS) | requested))
+
+
+def _same_revision(old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+    """Compare by ``version``, else ``modifiedTime``, when both sides carry it."""
+    for key in ("version", "modifiedTime"):
+        if key in old and key in new:
+            return old[key] == new[key]
+    return True
+
+
+@dataclass
+class _Entry:
+    metadata: Dict[str, Any]
+    fields: Set[str]  # Fields requested when fetched (absent ones are unset)
+    fetched_at: float = field(default_factory=time.monotonic)
+
+
+class DriveFileCache:
+    """LRU of Drive file metadata keyed by (user email, file ID)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 5000,
+        changes_poll_seconds: float = 0.0,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.changes_poll_seconds = changes_poll_seconds
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        # user -> (changes page token, last poll monotonic time)
+        self._change_tokens: Dict[str, Tuple[Optional[str], float]] = {}
+        self.stats = {"hits": 0, "misses": 0, "primed": 0, "invalidated": 0}
+
+    @staticmethod
+    def _key(user_email: str, file_id: str) -> Tuple[str, str]:
+        return ((user_email or "").lower(), file_id)
+
+    # ------------------------------------------------------------------
+    # Local state
+    # ------------------------------------------------------------------
+
+    def lookup(
+        self, user_email: str, file_id: str, fields: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Cached metadata if fresh and carrying every requested field."""
+        needed = _parse_fields(fields)
+        with self._lock:
+            entry = self._entries.get(self._key(user_email, file_id))
+            if entry is None:
+                return None
+            if time.monotonic() - entry.fetched_at > self.ttl_seconds:
+                return None
+            if not needed <= entry.fields:
+                return None
+            self._entries.move_to_end(self._key(user_email, file_id))
+            return dict(entry.metadata)
+
+    def store(
+        self,
+        user_email: str,
+        metadata: Dict[str, Any],
+        fields: Optional[Set[str]] = None,
+    ) -> None:
+        """Record ``metadata``; a changed revision replaces the old record."""
+        file_id = metadata.get("id")
+        if not file_id:
+            return
+        key = self._key(user_email, file_id)
+        fields = set(metadata) if fields is None else fields
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and _same_revision(entry.metadata, metadata):
+                entry.metadata.update(metadata)
+                entry.fields |= fields
+                entry.fetched_at = time.monotonic()
+            else:
+                self._entries[key] = _Entry(dict(metadata), set(fields))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def prime(self, user_email: str, files: Iterable[Dict[str, Any]]) -> None:
+        """Seed the cache from a ``files.list`` (or similar) response."""
+        count = 0
+        for metadata in files:
+            if metadata.get("id"):
+                self.store(user_email, metadata)
+                count += 1
+        self.stats["primed"] += count
+
+    def invalidate(self, user_email: str, *file_ids: str) -> None:
+        with self._lock:
+            for file_id in file_ids:
+                if self._entries.pop(self._key(user_email, file_id), None):
+                    self.stats["invalidated"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._change_tokens.clear()
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    def _batch_get_sync(
+        self, drive_service, file_ids: List[str], fields: str
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, Exception] = {}
+
+        def callback(request_id, response, exception):
+            if exception is None:
+                found[request_id] = response
+            else:
+                errors[request_id] = exception
+
+        for start in range(0, len(file_ids), MAX_BATCH_SIZE):
+            batch = drive_service.new_batch_http_request(callback=callback)
+            for file_id in file_ids[start : start + MAX_BATCH_SIZE]:
+                batch.add(
+                    drive_service.files().get(
+                        fileId=file_id, fields=fields, supportsAllDrives=True
+                    ),
+                    request_id=file_id,
+                )
+            batch.execute()
+        return found, errors
+
+    async def fetch_many(
+        self,
+        drive_service,
+        user_email: str,
+        file_ids: Iterable[str],
+        fields: Optional[str] = None,
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+        """Metadata for ``file_ids``: cache hits plus one batched fetch for misses.
+
+        Returns ``(found, errors)`` keyed by file ID.
+        """
+        await self.maybe_poll_changes(drive_service, user_email)
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for file_id in dict.fromkeys(file_ids):
+            cached = self.lookup(user_email, file_id, fields)
+            if cached is not None:
+                found[file_id] = cached
+            else:
+                missing.append(file_id)
+        self.stats["hits"] += len(found)
+        self.stats["misses"] += len(missing)
+
+        errors: Dict[str, Exception] = {}
+        if missing:
+            requested = set(BASE_FIELDS) | _parse_fields(fields)
+            fields_param = _fields_param(requested)
+            if len(missing) == 1:
+                try:
+                    fetched = {
+                        missing[0]: await asyncio.to_thread(
+                            drive_service.files()
+                            .get(
+                                fileId=missing[0],
+                                fields=fields_param,
+                                supportsAllDrives=True,
+                            )
+                            .execute
+                        )
+                    }
+                except Exception as e:
+                    fetched, errors = {}, {missing[0]: e}
+            else:
+                fetched, errors = await asyncio.to_thread(
+                    self._batch_get_sync, drive_service, missing, fields_param
+                )
+            for file_id, metadata in fetched.items():
+                self.store(user_email, metadata, requested)
+                found[file_id] = metadata
+        return found, errors
+
+    # ------------------------------------------------------------------
+    # Change polling
+    # ------------------------------------------------------------------
+
+    def _poll_changes_sync(self, drive_service, page_token: Optional[str]) -> Tuple:
+        if page_token is None:
+            start = (
+                drive_service.changes()
+                .getStartPageToken(supportsAllDrives=True)
+                .execute()
+            )
+            return start.get("startPageToken"), []
+        changes: List[Dict[str, Any]] = []
+        while True:
+            resp = (
+                drive_service.changes()
+                .list(
+                    pageToken=page_token,
+                    pageSize=1000,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                    fields=(
+                        "nextPageToken,newStartPageToken,"
+                        f"changes(fileId,removed,file({_fields_param(set())}))"
+                    ),
+                )
+                .execute()
+            )
+            changes.extend(resp.get("changes", []))
+            if resp.get("newStartPageToken"):
+                return resp["newStartPageToken"], changes
+            page_token = resp.get("nextPageToken")
+            if not page_token:
+                return None, changes
+
+    async def maybe_poll_changes(self, drive_service, user_email: str) -> int:
+        """Apply Drive ``changes.list`` when polling is enabled and due.
+
+        Returns the number of cached records refreshed or dropped.
+        """
+        if self.changes_poll_seconds <= 0 or not user_email:
+            return 0
+        user = user_email.lower()
+        token, last_poll = self._change_tokens.get(user, (None, 0.0))
+        if time.monotonic() - last_poll < self.changes_poll_seconds:
+            return 0
+        self._change_tokens[user] = (token, time.monotonic())
+        try:
+            new_token, changes = await asyncio.to_thread(
+                self._poll_changes_sync, drive_service, token
+            )
+        except Exception as e:
+            logger.debug(f"Drive changes poll failed for {user_email}: {e}")
+            return 0
+        self._change_tokens[user] = (new_token, time.monotonic())
+
+        applied = 0
+        for change in changes:
+            file_id = change.get("fileId")
+            metadata = change.get("file")
+            if not file_id:
+                continue
+            if change.get("removed") or not metadata or metadata.get("trashed"):
+                self.invalidate(user_email, file_id)
+            elif self.lookup(user_email, file_id) is not None:
+                self.store(user_email, metadata, set(BASE_FIELDS))
+            else:
+                continue
+            applied += 1
+        return applied
+
+
+_cache: Optional[DriveFileCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_drive_file_cache() -> Optional[DriveFileCache]:
+    """Process-wide Drive metadata cache, or None when disabled in settings."""
+    global _cache
+    from config.settings import get_settings
+
+    s = get_settings()
+    if not s.drive_file_cache_enabled:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DriveFileCache(
+                    ttl_seconds=s.drive_file_cache_ttl,
+                    max_entries=s.drive_file_cache_max_entries,
+                    changes_poll_seconds=s.drive_changes_poll_seconds,
+                )
+    return _cache
+
+
+async def get_files_metadata(
+    drive_service,
+    user_email: Optional[str],
+    file_ids: Iterable[str],
+    fields: Optional[str] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+    """Shared lookup for many files: ``(found, errors)`` keyed by file ID."""
+    cache = get_drive_file_cache()
+    if cache is None or not user_email:
+        # Uncached: still batch, but keep nothing
+        return await DriveFileCache(ttl_seconds=0).fetch_many(
+            drive_service, "", file_ids, fields
+        )
+    return await cache.fetch_many(drive_service, user_email, file_ids, fields)
+
+
+async def get_file_metadata(
+    drive_service,
+    user_email: Optional[str],
+    file_id: str,
+    fields: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Shared ``files.get``; raises the API error when the file can't be read."""
+    found, errors = await get_files_metadata(
+        drive_service, user_email, [file_id], fields
+    )
+    if file_id in errors:
+        raise errors[file_id]
+    return found[file_id]
+
+
+def prime_file_metadata(
+    user_email: Optional[str], files: Iterable[Dict[str, Any]]
+) -> None:
+    cache = get_drive_file_cache()
+    if cache is not None and user_email:
+        cache.prime(user_email, files)
+
+
+def invalidate_file_metadata(user_email: Optional[str], *file_ids: str) -> None:
+    """Drop cached records after this server changes the files."""
+    cache = get_drive_file_cache()
+    if cache is not None and user_email:
+        cache.invalidate(user_email, *file_ids)
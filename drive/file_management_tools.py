@@ -21,6 +21,7 @@ from auth.service_helpers import get_service
 from config.enhanced_logging import setup_logger
 from tools.common_types import UserGoogleEmail
 
+from .file_cache import get_file_metadata, invalidate_file_metadata
 from .file_management_types import (
     CopyDriveFilesResponse,
     CopyFileResult,
@@ -415,10 +416,8 @@ async def _handle_move_operation(
     target_folder_name = "My Drive (Root)"
     if target_folder_id != "root":
         try:
-            target_meta = await asyncio.to_thread(
-                drive_service.files()
-                .get(fileId=target_folder_id, fields="name", supportsAllDrives=True)
-                .execute
+            target_meta = await get_file_metadata(
+                drive_service, user_google_email, target_folder_id, fields="name"
             )
             target_folder_name = target_meta.get("name", "Unknown Folder")
         except Exception as e:
@@ -507,6 +506,8 @@ async def _handle_move_operation(
 
         move_results.append(file_result)
 
+    invalidate_file_metadata(user_google_email, *file_ids)
+
     return MoveDriveFilesResponse(
         success=failed_moves == 0,
         totalFiles=len(file_ids),
@@ -536,10 +537,8 @@ async def _handle_copy_operation(
     for file_id in file_ids:
         # Get original file metadata
         try:
-            file_metadata = await asyncio.to_thread(
-                drive_service.files()
-                .get(fileId=file_id, fields="id, name, parents", supportsAllDrives=True)
-                .execute
+            file_metadata = await get_file_metadata(
+                drive_service, user_google_email, file_id, fields="id, name, parents"
             )
             original_name = file_metadata.get("name", "Unknown File")
             original_parents = file_metadata.get("parents", [])
@@ -621,10 +620,8 @@ async def _handle_rename_operation(
     """Handle rename operation logic."""
     # Get current file metadata
     try:
-        file_metadata = await asyncio.to_thread(
-            drive_service.files()
-            .get(fileId=file_id, fields="id, name, webViewLink", supportsAllDrives=True)
-            .execute
+        file_metadata = await get_file_metadata(
+            drive_service, user_google_email, file_id, fields="id, name, webViewLink"
         )
         old_name = file_metadata.get("name", "Unknown File")
         file_link = file_metadata.get("webViewLink", "#")
@@ -652,6 +649,7 @@ async def _handle_rename_operation(
             )
             .execute
         )
+        invalidate_file_metadata(user_google_email, file_id)
 
         return RenameFileResponse(
             success=True,
@@ -743,6 +741,8 @@ async def _handle_delete_operation(
 
         delete_results.append(file_result)
 
+    invalidate_file_metadata(user_google_email, *file_ids)
+
     action = "permanently deleted" if permanent else "moved to trash"
     return DeleteDriveFilesResponse(
         success=failed_deletes == 0,
@@ -0,0 +1,342 @@
+"""
+Per-user snapshot of recently modified Drive files backing ``recent://``.
+
+``recent://all`` used to issue one ``files.list`` per Drive-based service
+(drive, docs, sheets, slides, forms) one after another, and the template
+processor reads it before every templated call.  ``RecentItemsCache``
+instead keeps one snapshot per (user, days back):
+
+- one ``files.list`` for the Workspace files (Docs, Sheets, Slides, Forms)
+  modified in the window, newest first, with a narrow fields mask; the
+  services are split out locally by mimeType.  When that page does not hold
+  every match, services still short of items get one targeted query each;
+- one ``files.list`` page of the newest non-folder files of any type for
+  ``recent://drive``;
+- snapshots are served for ``RECENT_ITEMS_CACHE_TTL`` seconds; after that
+  they are still served while a background task revalidates them against
+  Drive's ``changes.getStartPageToken`` — an unchanged token renews the
+  snapshot without listing, a changed one refetches it;
+- snapshots older than ``RECENT_ITEMS_MAX_STALE`` are refetched inline, and
+  concurrent readers of the same key share one fetch.
+
+Usage:
+    snapshot = await get_recent_items_cache().get(user_email, days_back=30)
+    docs = snapshot.for_service("docs", limit=20)
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config.cache_registry import (
+    CacheHandle,
+    evict_first,
+    register_cache,
+    sampled_size,
+)
+from config.enhanced_logging import setup_logger
+from drive.drive_enums import MimeTypeFilter
+from drive.file_cache import prime_file_metadata
+
+logger = setup_logger()
+
+# Workspace services split out of the snapshot by exact mimeType
+SERVICE_MIME_TYPES = {
+    "docs": MimeTypeFilter.GOOGLE_DOCS.to_mime_type(),
+    "sheets": MimeTypeFilter.GOOGLE_SHEETS.to_mime_type(),
+    "slides": MimeTypeFilter.GOOGLE_SLIDES.to_mime_type(),
+    "forms": MimeTypeFilter.GOOGLE_FORMS.to_mime_type(),
+}
+RECENT_FIELDS = (
+    "nextPageToken, "
+    "files(id, name, mimeType, size, webViewLink, iconLink, modifiedTime, createdTime)"
+)
+PAGE_SIZE = 1000  # files.list maximum
+MIN_PER_SERVICE = 20  # Largest recent:// page size
+
+
+@dataclass
+class RecentSnapshot:
+    """Recently modified files for one user, newest first.
+
+    Holds every Workspace file listed for the window plus the newest
+    non-folder files of any type, so each service's newest items are exact.
+    """
+
+    files: List[Dict[str, Any]]
+    days_back: int
+    query: str
+    start_page_token: Optional[str]
+    complete: bool  # False when older Workspace matches were left unread
+    fetched_at: float = field(default_factory=time.monotonic)
+    fetched_at_iso: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def for_service(self, service: str, limit: int) -> List[Dict[str, Any]]:
+        """Newest ``limit`` files for ``drive`` (all) or one Workspace service.
+
+        Files that have aged out of the window since a revalidated snapshot
+        was listed are skipped.
+        """
+        mime_type = SERVICE_MIME_TYPES.get(service)
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=self.days_back)).strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        )
+        matched: List[Dict[str, Any]] = []
+        for f in self.files:
+            if f.get("modifiedTime", "") < cutoff:
+                break  # newest first: the rest are older
+            if mime_type is None or f.get("mimeType") == mime_type:
+                matched.append(f)
+                if len(matched) >= limit:
+                    break
+        return matched
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+def _window_query(days_back: int, type_filter: str) -> str:
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days_back)).strftime(
+        "%Y-%m-%dT%H:%M:%S"
+    )
+    return f"modifiedTime > '{cutoff}' and trashed = false and {type_filter}"
+
+
+def _recent_query(days_back: int, mime_types: Optional[List[str]] = None) -> str:
+    """Files of ``mime_types`` (default: every Workspace service) in the window."""
+    types = mime_types or list(SERVICE_MIME_TYPES.values())
+    return _window_query(
+        days_back, "(" + " or ".join(f"mimeType = '{m}'" for m in types) + ")"
+    )
+
+
+def _short_services(files: List[Dict[str, Any]]) -> List[str]:
+    """Workspace mimeTypes with fewer than ``MIN_PER_SERVICE`` files."""
+    counts = dict.fromkeys(SERVICE_MIME_TYPES.values(), 0)
+    for f in files:
+        if f.get("mimeType") in counts:
+            counts[f["mimeType"]] += 1
+    return [mime for mime, count in counts.items() if count < MIN_PER_SERVICE]
+
+
+class RecentItemsCache:
+    """LRU of ``RecentSnapshot`` keyed by (user email, days back)."""
+
+    def __init__(
+        self,
+        service_factory: Callable[[str], Awaitable[Any]],
+        ttl_seconds: float = 60.0,
+        max_stale_seconds: float = 900.0,
+        max_snapshots: int = 256,
+    ):
+        self.service_factory = service_factory
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.max_snapshots = max_snapshots
+        self._snapshots: "OrderedDict[Tuple[str, int], RecentSnapshot]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, int], asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "fetched": 0,
+        }
+        self.cache_handle: Optional[CacheHandle] = None
+
+    @staticmethod
+    def _key(user_email: str, days_back: int) -> Tuple[str, int]:
+        return ((user_email or "").lower(), days_back)
+
+    def _count(self, stat: str) -> None:
+        self.stats[stat] += 1
+        if self.cache_handle is not None:
+            if stat == "misses":
+                self.cache_handle.miss()
+            else:
+                self.cache_handle.hit()
+
+    async def get(self, user_email: str, days_back: int = 30) -> RecentSnapshot:
+        """The user's snapshot, fetching inline only when missing or too old."""
+        key = self._key(user_email, days_back)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                self._snapshots.move_to_end(key)
+
+        if snapshot is not None and snapshot.age_seconds <= self.ttl_seconds:
+            self._count("hits")
+            return snapshot
+        if snapshot is not None and snapshot.age_seconds <= self.max_stale_seconds:
+            self._count("stale_hits")
+            self._refresh_task(key, user_email, days_back, snapshot)
+            return snapshot
+
+        self._count("misses")
+        return await self._refresh_task(key, user_email, days_back, snapshot)
+
+    def _refresh_task(
+        self,
+        key: Tuple[str, int],
+        user_email: str,
+        days_back: int,
+        previous: Optional[RecentSnapshot],
+    ) -> asyncio.Task:
+        """Start (or join) the single in-flight refresh for ``key``."""
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.create_task(
+                self._refresh(key, user_email, days_back, previous)
+            )
+            task.add_done_callback(lambda t: self._refresh_done(key, t))
+            self._inflight[key] = task
+        return task
+
+    def _refresh_done(self, key: Tuple[str, int], task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                f"Recent items refresh failed for {key[0]}: {task.exception()}"
+            )
+
+    async def _refresh(
+        self,
+        key: Tuple[str, int],
+        user_email: str,
+        days_back: int,
+        previous: Optional[RecentSnapshot],
+    ) -> RecentSnapshot:
+        drive_service = await self.service_factory(user_email)
+        token = await asyncio.to_thread(self._start_page_token_sync, drive_service)
+        if previous is not None and token and token == previous.start_page_token:
+            previous.fetched_at = time.monotonic()
+            self.stats["revalidated"] += 1
+            return previous
+
+        query = _recent_query(days_back)
+        files, complete = await asyncio.to_thread(
+            self._list_recent_sync, drive_service, days_back
+        )
+        prime_file_metadata(user_email, files)
+        snapshot = RecentSnapshot(
+            files=files,
+            days_back=days_back,
+            query=query,
+            start_page_token=token,
+            complete=complete,
+        )
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        self.stats["fetched"] += 1
+        logger.debug(
+            f"📸 Recent items snapshot for {user_email}: {len(files)} files "
+            f"({days_back}d, complete={complete})"
+        )
+        return snapshot
+
+    @staticmethod
+    def _start_page_token_sync(drive_service) -> Optional[str]:
+        try:
+            response = (
+                drive_service.changes()
+                .getStartPageToken(supportsAllDrives=True)
+                .execute()
+            )
+            return response.get("startPageToken")
+        except Exception as e:
+            logger.debug(f"Drive getStartPageToken failed: {e}")
+            return None
+
+    @staticmethod
+    def _list_page_sync(drive_service, query: str, page_size: int) -> Dict[str, Any]:
+        return (
+            drive_service.files()
+            .list(
+                q=query,
+                orderBy="modifiedTime desc",
+                pageSize=page_size,
+                fields=RECENT_FIELDS,
+                corpora="allDrives",
+                supportsAllDrives=True,
+                includeItemsFromAllDrives=True,
+            )
+            .execute()
+        )
+
+    @classmethod
+    def _list_recent_sync(
+        cls, drive_service, days_back: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        response = cls._list_page_sync(
+            drive_service, _recent_query(days_back), PAGE_SIZE
+        )
+        files = response.get("files", [])
+        complete = not response.get("nextPageToken")
+        if not complete:
+            # More Workspace files than one page: fill only the short services
+            for mime_type in _short_services(files):
+                files += cls._list_page_sync(
+                    drive_service,
+                    _recent_query(days_back, [mime_type]),
+                    MIN_PER_SERVICE,
+                ).get("files", [])
+        files += cls._list_page_sync(
+            drive_service,
+            _window_query(days_back, MimeTypeFilter.EXCLUDE_FOLDERS.to_query_filter()),
+            MIN_PER_SERVICE,
+        ).get("files", [])
+
+        by_id = {f["id"]: f for f in files if f.get("id")}
+        merged = sorted(
+            by_id.values(), key=lambda f: f.get("modifiedTime", ""), reverse=True
+        )
+        return merged, complete
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
+_cache: Optional[RecentItemsCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_recent_items_cache() -> RecentItemsCache:
+    """Process-wide recent items cache, registered with the cache budget."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from config.settings import get_settings
+                from drive.drive_tools import _get_drive_service_with_fallback
+
+                s = get_settings()
+                cache = RecentItemsCache(
+                    service_factory=_get_drive_service_with_fallback,
+                    ttl_seconds=s.recent_items_cache_ttl,
+                    max_stale_seconds=s.recent_items_max_stale,
+                )
+                cache.cache_handle = register_cache(
+                    "recent_items",
+                    size_fn=lambda: sampled_size(
+                        (snap.files for snap in list(cache._snapshots.values())),
+                        len(cache._snapshots),
+                    ),
+                    evict_fn=lambda fraction: evict_first(cache._snapshots, fraction),
+                    priority=4,
+                )
+                _cache = cache
+    return _cache
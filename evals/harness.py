@@ -6,45 +6,52 @@ attaches a *client-side* sampling handler per model config.  Every
 process with the model under test, so the model is the only variable between
 runs.  A LiteLLM ``CustomLogger`` records per-call token usage, latency, and
 cost while an eval item is active.
+
+Items run concurrently: each model gets a ``ClientPool`` of initialized
+clients, an item checks one out for its tool call, and the client's sampling
+handler marks every LiteLLM call it makes with that item's usage bucket
+through a context variable.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import json
 import os
-from typing import Any, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
 
 import httpx
 from litellm.integrations.custom_logger import CustomLogger
 
+# Usage bucket of the eval item whose sampling call is running.  LiteLLM runs
+# its logging callbacks in a copy of the caller's context, so the value set
+# around a sampling handler call reaches the collector.
+_active_bucket: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "eval_usage_bucket", default=None
+)
 
-class SamplingUsageCollector(CustomLogger):
-    """Collect per-call LLM usage from LiteLLM while an eval item is active.
 
-    Eval items run strictly sequentially, so a single active bucket is enough.
-    ``begin()`` before the tool call, ``end()`` after — every LiteLLM
-    completion in between (client-side sampling calls triggered by the server)
-    is attributed to that item.
-    """
+def new_bucket(item_id: str, model_label: str) -> dict:
+    return {
+        "item_id": item_id,
+        "model_label": model_label,
+        "calls": [],
+        "failures": 0,
+    }
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._bucket: Optional[dict] = None
 
-    def begin(self, item_id: str, model_label: str) -> None:
-        self._bucket = {
-            "item_id": item_id,
-            "model_label": model_label,
-            "calls": [],
-            "failures": 0,
-        }
+class SamplingUsageCollector(CustomLogger):
+    """Collect per-call LLM usage from LiteLLM into the active item's bucket.
 
-    def end(self) -> dict:
-        bucket, self._bucket = self._bucket, None
-        return bucket or {"calls": [], "failures": 0}
+    The bucket comes from a context variable, so concurrently running items
+    (and models) each get only their own calls; LiteLLM calls made outside
+    an item (e.g. the judge) are ignored.
+    """
 
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
-        bucket = self._bucket
+        bucket = _active_bucket.get()
         if bucket is None:
             return
         usage = getattr(response_obj, "usage", None)
@@ -71,8 +78,9 @@ class SamplingUsageCollector(CustomLogger):
         )
 
     async def async_log_failure_event(self, kwargs, response_obj, start_time, end_time):
-        if self._bucket is not None:
-            self._bucket["failures"] += 1
+        bucket = _active_bucket.get()
+        if bucket is not None:
+            bucket["failures"] += 1
 
 
 def install_collector() -> SamplingUsageCollector:
@@ -111,6 +119,93 @@ def build_sampling_handler(model_cfg: dict):
     )
 
 
+class PooledClient:
+    """An entered MCP client plus the usage bucket of the item using it."""
+
+    def __init__(self) -> None:
+        self.client: Any = None
+        self.tools: set[str] = set()
+        self.bucket: Optional[dict] = None
+        self.broken = False
+
+    def attributed(self, handler):
+        """Wrap a sampling handler so its LLM calls land in ``self.bucket``."""
+
+        async def sampling_handler(*args, **kwargs):
+            token = _active_bucket.set(self.bucket)
+            try:
+                return await handler(*args, **kwargs)
+            finally:
+                _active_bucket.reset(token)
+
+        return sampling_handler
+
+    async def close(self) -> None:
+        try:
+            await self.client.__aexit__(None, None, None)
+        except Exception:
+            pass
+
+
+class ClientPool:
+    """Up to ``size`` initialized clients for one model, reused across items.
+
+    Replaces a connect + ``list_tools`` handshake per item.  A client whose
+    transport failed (``broken``) is closed instead of returned to the pool.
+    """
+
+    def __init__(self, model_cfg: dict, size: int) -> None:
+        self.model_cfg = model_cfg
+        self.size = size
+        self._idle: list[PooledClient] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def _connect(self) -> PooledClient:
+        pooled = PooledClient()
+        handler = pooled.attributed(build_sampling_handler(self.model_cfg))
+        # One retry on connect — the server can be slow to accept a new
+        # session while still finishing a previous long-running tool call.
+        for attempt in (1, 2):
+            pooled.client = make_client(handler)
+            try:
+                await pooled.client.__aenter__()
+                break
+            except Exception:
+                if attempt == 2:
+                    raise
+                await asyncio.sleep(10)
+        try:
+            pooled.tools = {t.name for t in await pooled.client.list_tools()}
+        except Exception:
+            await pooled.close()
+            raise
+        return pooled
+
+    @asynccontextmanager
+    async def checkout(self, item_id: str) -> AsyncIterator[PooledClient]:
+        """Exclusive use of a client, with usage attributed to ``item_id``."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        async with self._slots:
+            pooled = self._idle.pop() if self._idle else await self._connect()
+            pooled.bucket = new_bucket(item_id, self.model_cfg["label"])
+            try:
+                yield pooled
+            except BaseException:
+                pooled.broken = True
+                raise
+            finally:
+                pooled.bucket = None
+                if pooled.broken:
+                    await pooled.close()
+                else:
+                    self._idle.append(pooled)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(pooled.close() for pooled in idle))
+
+
 def server_url() -> str:
     return os.getenv("MCP_SERVER_URL", "https://localhost:8002/mcp")
 
@@ -1,17 +1,23 @@
 """Run cross-model evals of dynamic MCP tools, logged as Langfuse dataset runs.
 
-For each model in evals/models.json a FastMCP client connects to the running
-server with that model as its client-side sampling handler and executes every
-dataset scenario (via code-mode `execute` when the server hides direct tools).
-Each (model, scenario) pair becomes a Langfuse experiment/dataset-run item with
-scores: success, latency, sampling calls, tokens, cost, and an LLM-judged
-quality score.
+For each model in evals/models.json, pooled FastMCP clients connect to the
+running server with that model as their client-side sampling handler and
+execute every dataset scenario (via code-mode `execute` when the server hides
+direct tools).  Each (model, scenario) pair becomes a Langfuse
+experiment/dataset-run item with scores: success, latency, sampling calls,
+tokens, cost, and an LLM-judged quality score.
+
+Models run in parallel (--model-workers), each with up to --workers items in
+flight on reused clients; judging overlaps with the next items' tool calls.
+Every finished row is appended to results/run-<stamp>.jsonl, so an
+interrupted run continues with --resume <stamp> (items that errored re-run).
 
 Usage (server must be running):
     uv run python -m evals.run_evals                       # all models, all items
     uv run python -m evals.run_evals --models venice-glm-4.6
     uv run python -m evals.run_evals --items card-status-simple --no-judge
-    uv run python -m evals.run_evals --run-prefix nightly
+    uv run python -m evals.run_evals --run-prefix nightly --workers 8
+    uv run python -m evals.run_evals --resume latest
 """
 
 from __future__ import annotations
@@ -20,7 +26,9 @@ import argparse
 import asyncio
 import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -96,6 +104,58 @@ def _sync_dataset(lf, spec: dict) -> None:
         )
 
 
+class RunCheckpoint:
+    """Rows of one run, appended to a JSONL file as items finish."""
+
+    DONE_STATUSES = ("ok", "skipped")
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.rows: list[dict] = []
+        self._lock = threading.Lock()  # Langfuse runs models on threads
+        if path.exists():
+            for line in path.read_text().splitlines():
+                try:
+                    self.rows.append(json.loads(line))
+                except ValueError:
+                    continue  # torn line from an interrupted write
+
+    def done(self, label: str) -> set[str]:
+        """Item ids already finished for a model (errors are retried)."""
+        return {
+            r["item"]
+            for r in self.rows
+            if r.get("model") == label and r.get("status") in self.DONE_STATUSES
+        }
+
+    def record(self, row: dict) -> None:
+        slim = {**row, "output_text": (row.get("output_text") or "")[:500]}
+        with self._lock:
+            self.rows.append(slim)
+            with open(self.path, "a") as f:
+                f.write(json.dumps(slim, ensure_ascii=False) + "\n")
+
+    def latest_rows(self) -> list[dict]:
+        """Last row per (model, item), so retried items replace their errors."""
+        latest: dict[tuple, dict] = {}
+        for r in self.rows:
+            latest[(r.get("model"), r.get("item"))] = r
+        return list(latest.values())
+
+
+def _resolve_stamp(resume: str | None) -> str:
+    if not resume:
+        return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    if resume == "latest":
+        runs = sorted(RESULTS_DIR.glob("run-*.jsonl"))
+        if not runs:
+            raise SystemExit("No run checkpoints to resume")
+        return runs[-1].stem.removeprefix("run-")
+    if not (RESULTS_DIR / f"run-{resume}.jsonl").exists():
+        raise SystemExit(f"No checkpoint for run {resume}")
+    return resume
+
+
 def _item_field(item, field: str, default=None):
     """Read a field from a DatasetItem object or a plain dict item."""
     if isinstance(item, dict):
@@ -103,18 +163,15 @@ def _item_field(item, field: str, default=None):
     return getattr(item, field, default)
 
 
-def make_task(model_cfg: dict, collector, rows_sink: list):
+def make_task(model_cfg: dict, pool):
     """Build the experiment task fn: run one scenario against the MCP server."""
 
     label = model_cfg["label"]
 
     async def task(*, item, **kwargs):
-        from evals.harness import (
-            build_sampling_handler,
-            make_client,
-            result_to_text,
-            summarize_usage,
-        )
+        from fastmcp.exceptions import ToolError
+
+        from evals.harness import result_to_text, summarize_usage
 
         inp = _item_field(item, "input") or {}
         meta = _item_field(item, "metadata") or {}
@@ -122,27 +179,12 @@ def make_task(model_cfg: dict, collector, rows_sink: list):
         item_id = meta.get("item_id", tool)
         call_timeout = meta.get("timeout_s") or 240
 
-        handler = build_sampling_handler(model_cfg)
-
         ok, output_text, skipped = True, "", False
         latency_s = 0.0
         usage = summarize_usage({"calls": []})
         try:
-            # One retry on connect — the server can be slow to accept a new
-            # session while still finishing a previous long-running tool call.
-            client = None
-            for attempt in (1, 2):
-                client = make_client(handler)
-                try:
-                    await client.__aenter__()
-                    break
-                except Exception:
-                    if attempt == 2:
-                        raise
-                    await asyncio.sleep(10)
-            try:
-                available = {t.name for t in await client.list_tools()}
-                collector.begin(item_id, label)
+            async with pool.checkout(item_id) as pooled:
+                client = pooled.client
                 t0 = time.perf_counter()
                 try:
                     # Direct call works even in Code Mode (tools are only
@@ -154,7 +196,7 @@ def make_task(model_cfg: dict, collector, rows_sink: list):
                         "unknown tool" in str(e1).lower()
                         or "not found" in str(e1).lower()
                     )
-                    if not_found and "execute" in available:
+                    if not_found and "execute" in pooled.tools:
                         try:
                             code = f"return await call_tool({tool!r}, {args!r})"
                             result = await client.call_tool(
@@ -164,6 +206,7 @@ def make_task(model_cfg: dict, collector, rows_sink: list):
                         except Exception as e2:
                             ok = False
                             output_text = f"ERROR: {e2}"
+                            pooled.broken = not isinstance(e2, ToolError)
                     elif not_found:
                         skipped = True
                         ok = False
@@ -171,10 +214,10 @@ def make_task(model_cfg: dict, collector, rows_sink: list):
                     else:
                         ok = False
                         output_text = f"ERROR: {e1}"
+                        # Transport failures/timeouts: reconnect for the next item
+                        pooled.broken = not isinstance(e1, ToolError)
                 latency_s = round(time.perf_counter() - t0, 3)
-                usage = summarize_usage(collector.end())
-            finally:
-                await client.__aexit__(None, None, None)
+                usage = summarize_usage(pooled.bucket)
         except Exception as e:
             ok = False
             output_text = f"ERROR: connection failed: {e}"
@@ -213,7 +256,6 @@ def make_task(model_cfg: dict, collector, rows_sink: list):
             **usage,
             "output_text": output_text,
         }
-        rows_sink.append(row)
         icon = "⏭️ " if skipped else ("✅" if ok else "❌")
         print(
             f"   {icon} [{label}] {item_id}: {latency_s}s, "
@@ -239,7 +281,7 @@ def metrics_evaluator(*, input, output, expected_output=None, metadata=None, **k
     return evals
 
 
-def make_judge_evaluator(judge_cfg: dict, rows_sink: list):
+def make_judge_evaluator(judge_cfg: dict):
     async def judge_evaluator(
         *, input, output, expected_output=None, metadata=None, **kwargs
     ):
@@ -261,11 +303,9 @@ def make_judge_evaluator(judge_cfg: dict, rows_sink: list):
         if res["score"] < 0:
             print(f"      ⚖️  judge failed: {res['rationale'][:150]}")
             return []
-        # Attach quality back onto the local row for the console summary
-        for row in rows_sink:
-            if row is output:
-                row["quality"] = res["score"]
-                row["quality_rationale"] = res["rationale"]
+        # Attach quality back onto the row for the checkpoint and summary
+        output["quality"] = res["score"]
+        output["quality_rationale"] = res["rationale"]
         print(f"      ⚖️  quality={res['score']:.2f} — {res['rationale'][:100]}")
         return [
             Evaluation(name="quality", value=res["score"], comment=res["rationale"])
@@ -274,6 +314,27 @@ def make_judge_evaluator(judge_cfg: dict, rows_sink: list):
     return judge_evaluator
 
 
+def make_checkpoint_evaluator(checkpoint: RunCheckpoint):
+    """Last evaluator: record the finished (and judged) row."""
+
+    def checkpoint_evaluator(*, output, **kwargs):
+        if isinstance(output, dict):
+            checkpoint.record(output)
+        return []
+
+    return checkpoint_evaluator
+
+
+def make_pool_closer(pool):
+    """Run-level evaluator closing the model's clients on the experiment's loop."""
+
+    async def close_pool(**kwargs):
+        await pool.close()
+        return []
+
+    return close_pool
+
+
 def _print_summary(rows: list[dict]) -> None:
     by_model: dict[str, list[dict]] = {}
     for r in rows:
@@ -317,6 +378,17 @@ def main() -> None:
     parser.add_argument(
         "--no-judge", action="store_true", help="skip LLM-as-judge scoring"
     )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="items in flight per model"
+    )
+    parser.add_argument(
+        "--model-workers", type=int, default=3, help="models run in parallel"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="STAMP",
+        help="continue an interrupted run ('latest' or its stamp)",
+    )
     args = parser.parse_args()
 
     _setup_env()
@@ -361,57 +433,48 @@ def main() -> None:
 
     from evals.harness import install_collector
 
-    collector = install_collector()
+    install_collector()
 
-    stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-    all_rows: list[dict] = []
-    for model_cfg in model_cfgs:
-        label = model_cfg["label"]
-        run_name = f"{args.run_prefix}-{label}-{stamp}"
-        print(f"\n🚀 Running {len(selected)} items on {label} ({model_cfg['model']})")
+    RESULTS_DIR.mkdir(exist_ok=True)
+    stamp = _resolve_stamp(args.resume)
+    checkpoint = RunCheckpoint(RESULTS_DIR / f"run-{stamp}.jsonl")
+    if args.resume:
+        print(f"↩️  Resuming run {stamp} ({len(checkpoint.rows)} rows recorded)")
 
-        rows_sink: list[dict] = []
-        task = make_task(model_cfg, collector, rows_sink)
-        evaluators = [metrics_evaluator]
-        if judge_cfg:
-            evaluators.append(make_judge_evaluator(judge_cfg, rows_sink))
+    if lf:
 
-        try:
-            if lf:
-                result = lf.run_experiment(
-                    name=f"{args.run_prefix}-{label}",
-                    run_name=run_name,
-                    description=f"Dynamic-tool eval, sampling model {model_cfg['model']}",
-                    data=lf_items,
-                    task=task,
-                    evaluators=evaluators,
-                    max_concurrency=1,
-                    metadata={"model": model_cfg["model"], "label": label},
-                )
-                url = getattr(result, "dataset_run_url", None) or getattr(
-                    result, "run_url", None
-                )
-                if url:
-                    print(f"   🔭 {url}")
-            else:
-                asyncio.run(_run_local_with_judge(selected, task, judge_cfg, rows_sink))
-        except Exception as e:
-            print(f"   ❌ [{label}] run failed: {e}")
-            rows_sink.append(
-                {"model": label, "item": "*", "status": "error", "note": str(e)}
+        def run_model(model_cfg: dict) -> None:
+            done = checkpoint.done(model_cfg["label"])
+            _run_langfuse_model(
+                lf,
+                model_cfg,
+                [it for it in lf_items if it.metadata.get("item_id") not in done],
+                judge_cfg,
+                checkpoint,
+                run_prefix=args.run_prefix,
+                stamp=stamp,
+                workers=args.workers,
             )
-        all_rows.extend(rows_sink)
 
-    if lf:
+        with ThreadPoolExecutor(max_workers=max(1, args.model_workers)) as executor:
+            list(executor.map(run_model, model_cfgs))
         lf.flush()
+    else:
+        asyncio.run(
+            _run_local(
+                model_cfgs,
+                selected,
+                judge_cfg,
+                checkpoint,
+                workers=args.workers,
+                model_workers=args.model_workers,
+            )
+        )
 
-    RESULTS_DIR.mkdir(exist_ok=True)
+    all_rows = checkpoint.latest_rows()
     out_path = RESULTS_DIR / f"run-{stamp}.json"
-    slim_rows = [
-        {**r, "output_text": (r.get("output_text") or "")[:500]} for r in all_rows
-    ]
     out_path.write_text(
-        json.dumps({"stamp": stamp, "rows": slim_rows}, indent=2, ensure_ascii=False)
+        json.dumps({"stamp": stamp, "rows": all_rows}, indent=2, ensure_ascii=False)
     )
     _print_summary(all_rows)
     print(f"\n💾 Results saved to {out_path}")
@@ -422,12 +485,73 @@ def main() -> None:
         )
 
 
-async def _run_local_with_judge(
-    scenarios: list[dict], task, judge_cfg: dict | None, rows_sink: list
+def _run_langfuse_model(
+    lf,
+    model_cfg: dict,
+    items: list,
+    judge_cfg: dict | None,
+    checkpoint: RunCheckpoint,
+    *,
+    run_prefix: str,
+    stamp: str,
+    workers: int,
+) -> None:
+    """One model's Langfuse experiment (runs on its own thread and loop)."""
+    from evals.harness import ClientPool
+
+    label = model_cfg["label"]
+    print(f"\n🚀 Running {len(items)} items on {label} ({model_cfg['model']})")
+    if not items:
+        return
+
+    pool = ClientPool(model_cfg, workers)
+    evaluators = [metrics_evaluator]
+    if judge_cfg:
+        evaluators.append(make_judge_evaluator(judge_cfg))
+    evaluators.append(make_checkpoint_evaluator(checkpoint))
+    try:
+        result = lf.run_experiment(
+            name=f"{run_prefix}-{label}",
+            run_name=f"{run_prefix}-{label}-{stamp}",
+            description=f"Dynamic-tool eval, sampling model {model_cfg['model']}",
+            data=items,
+            task=make_task(model_cfg, pool),
+            evaluators=evaluators,
+            run_evaluators=[make_pool_closer(pool)],
+            # Pool size bounds tool calls; the extra slots let finished
+            # items be judged while the next ones run
+            max_concurrency=workers * 2 if judge_cfg else workers,
+            metadata={"model": model_cfg["model"], "label": label},
+        )
+        url = getattr(result, "dataset_run_url", None) or getattr(
+            result, "run_url", None
+        )
+        if url:
+            print(f"   🔭 {url}")
+    except Exception as e:
+        print(f"   ❌ [{label}] run failed: {e}")
+        checkpoint.record(
+            {"model": label, "item": "*", "status": "error", "note": str(e)}
+        )
+
+
+async def _run_local(
+    model_cfgs: list[dict],
+    scenarios: list[dict],
+    judge_cfg: dict | None,
+    checkpoint: RunCheckpoint,
+    *,
+    workers: int,
+    model_workers: int,
 ) -> None:
+    """Run all models without Langfuse, judging rows as they finish."""
+    from evals.harness import ClientPool
     from evals.judge import judge_quality
 
-    for scenario in scenarios:
+    model_slots = asyncio.Semaphore(max(1, model_workers))
+    judge_slots = asyncio.Semaphore(max(1, workers))
+
+    async def run_item(task, scenario: dict) -> None:
         row = await task(
             item={
                 "input": {"tool": scenario["tool"], "args": scenario["args"]},
@@ -440,19 +564,41 @@ async def _run_local_with_judge(
             }
         )
         if judge_cfg and row.get("status") == "ok":
-            res = await judge_quality(
-                tool=scenario["tool"],
-                args=scenario["args"],
-                criteria=scenario.get("judge_criteria", ""),
-                output_text=row.get("output_text", ""),
-                judge_model=judge_cfg["model"],
-                api_key=os.getenv(judge_cfg.get("api_key_env", "")) or None,
-                api_base=judge_cfg.get("api_base"),
-            )
+            async with judge_slots:
+                res = await judge_quality(
+                    tool=scenario["tool"],
+                    args=scenario["args"],
+                    criteria=scenario.get("judge_criteria", ""),
+                    output_text=row.get("output_text", ""),
+                    judge_model=judge_cfg["model"],
+                    api_key=os.getenv(judge_cfg.get("api_key_env", "")) or None,
+                    api_base=judge_cfg.get("api_base"),
+                )
             if res["score"] >= 0:
                 row["quality"] = res["score"]
                 row["quality_rationale"] = res["rationale"]
                 print(f"      ⚖️  quality={res['score']:.2f} — {res['rationale'][:100]}")
+        checkpoint.record(row)
+
+    async def run_model(model_cfg: dict) -> None:
+        label = model_cfg["label"]
+        done = checkpoint.done(label)
+        todo = [s for s in scenarios if s["id"] not in done]
+        async with model_slots:
+            print(f"\n🚀 Running {len(todo)} items on {label} ({model_cfg['model']})")
+            pool = ClientPool(model_cfg, workers)
+            task = make_task(model_cfg, pool)
+            try:
+                await asyncio.gather(*(run_item(task, s) for s in todo))
+            except Exception as e:
+                print(f"   ❌ [{label}] run failed: {e}")
+                checkpoint.record(
+                    {"model": label, "item": "*", "status": "error", "note": str(e)}
+                )
+            finally:
+                await pool.close()
+
+    await asyncio.gather(*(run_model(m) for m in model_cfgs))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,158 @@
+"""
+Per-form schema cache for mapping response answers to questions.
+
+``list_form_responses`` and ``get_form_response`` used to call ``forms.get``
+after every ``responses.list`` / ``responses.get`` just to rebuild the
+question map, so paging through responses refetched the whole form each
+page.  ``FormSchemaCache`` keeps the question map per (user, formId) tagged
+with the form's ``revisionId``:
+
+- within ``FORMS_SCHEMA_CACHE_TTL`` the cached schema is used as-is;
+- after that a ``forms.get(fields="revisionId")`` check revalidates it, and
+  only a changed revision triggers a full refetch;
+- this server's own form edits invalidate the entry.
+
+Usage:
+    schema = await get_form_schema_cache().get(forms_service, user, form_id)
+    answers = map_answers(response.get("answers", {}), schema.question_map)
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+
+@dataclass
+class FormSchema:
+    form_id: str
+    revision_id: Optional[str]
+    title: str
+    question_map: Dict[str, Dict[str, Any]]  # questionId -> form item
+    fetched_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_form(cls, form_id: str, form: Dict[str, Any]) -> "FormSchema":
+        question_map = {}
+        for item in form.get("items", []):
+            if "questionItem" in item:
+                question_map[item["itemId"]] = item
+        return cls(
+            form_id=form_id,
+            revision_id=form.get("revisionId"),
+            title=form.get("info", {}).get("title", "Untitled Form"),
+            question_map=question_map,
+        )
+
+
+def map_answers(
+    answers: Dict[str, Any], question_map: Dict[str, Dict[str, Any]]
+) -> List[Dict[str, str]]:
+    """Structured ``FormResponseAnswer`` dicts for one response's answers."""
+    structured = []
+    for question_id, answer_data in answers.items():
+        question = question_map.get(question_id, {})
+        text_answers = answer_data.get("textAnswers", {})
+        if text_answers and "answers" in text_answers:
+            answer_text = ", ".join(
+                ans.get("value", "") for ans in text_answers["answers"]
+            )
+        else:
+            answer_text = "[No answer]"
+        structured.append(
+            {
+                "questionId": question_id,
+                "questionTitle": question.get("title", f"Question {question_id}"),
+                "answer": answer_text,
+            }
+        )
+    return structured
+
+
+class FormSchemaCache:
+    """LRU of form schemas keyed by (user email, form ID)."""
+
+    def __init__(self, ttl_seconds: float = 60.0, max_forms: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_forms = max_forms
+        self._schemas: "OrderedDict[Tuple[str, str], FormSchema]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "revalidated": 0, "fetches": 0}
+
+    @staticmethod
+    def _key(user_email: Optional[str], form_id: str) -> Tuple[str, str]:
+        return ((user_email or "").lower(), form_id)
+
+    def store(
+        self, user_email: Optional[str], form_id: str, form: Dict[str, Any]
+    ) -> FormSchema:
+        """Cache the schema from a full ``forms.get`` result."""
+        schema = FormSchema.from_form(form_id, form)
+        key = self._key(user_email, form_id)
+        with self._lock:
+            self._schemas[key] = schema
+            self._schemas.move_to_end(key)
+            while len(self._schemas) > self.max_forms:
+                self._schemas.popitem(last=False)
+        return schema
+
+    def invalidate(self, user_email: Optional[str], form_id: str) -> None:
+        with self._lock:
+            self._schemas.pop(self._key(user_email, form_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+
+    async def get(
+        self, forms_service, user_email: Optional[str], form_id: str
+    ) -> FormSchema:
+        """Schema for ``form_id``, revalidating by revisionId once stale."""
+        key = self._key(user_email, form_id)
+        with self._lock:
+            cached = self._schemas.get(key)
+
+        if cached is not None:
+            if time.monotonic() - cached.fetched_at < self.ttl_seconds:
+                self.stats["hits"] += 1
+                return cached
+            if cached.revision_id:
+                current = await asyncio.to_thread(
+                    forms_service.forms()
+                    .get(formId=form_id, fields="revisionId")
+                    .execute
+                )
+                if current.get("revisionId") == cached.revision_id:
+                    cached.fetched_at = time.monotonic()
+                    self.stats["revalidated"] += 1
+                    return cached
+
+        form = await asyncio.to_thread(
+            forms_service.forms().get(formId=form_id).execute
+        )
+        self.stats["fetches"] += 1
+        return self.store(user_email, form_id, form)
+
+
+_cache: Optional[FormSchemaCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_form_schema_cache() -> FormSchemaCache:
+    """Process-wide form schema cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from config.settings import get_settings
+
+                _cache = FormSchemaCache(
+                    ttl_seconds=get_settings().forms_schema_cache_ttl
+                )
+    return _cache
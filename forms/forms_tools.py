@@ -55,13 +55,16 @@ Note: Full HTML web forms require custom web development - Google Forms API is d
 
 import asyncio
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from googleapiclient.errors import HttpError
 from pydantic import Field
 from typing_extensions import Annotated, Any, Dict, List, Optional, Tuple
 
 from auth.service_helpers import get_service
 from config.enhanced_logging import setup_logger
+from drive.file_cache import invalidate_file_metadata
+from forms.form_schema_cache import get_form_schema_cache, map_answers
+from forms.response_export import export_responses, to_response_info
 
 # Import our custom type for consistent parameter definition
 from tools.common_types import UserGoogleEmailForms
@@ -700,6 +703,7 @@ def setup_forms_tools(mcp: FastMCP) -> None:
             form = await asyncio.to_thread(
                 forms_service.forms().get(formId=form_id).execute
             )
+            get_form_schema_cache().store(user_google_email, form_id, form)
 
             edit_url = f"https://docs.google.com/forms/d/{form_id}/edit"
             title = form.get("info", {}).get("title", "Untitled Form")
@@ -780,6 +784,7 @@ def setup_forms_tools(mcp: FastMCP) -> None:
             form = await asyncio.to_thread(
                 forms_service.forms().get(formId=form_id).execute
             )
+            get_form_schema_cache().store(user_google_email, form_id, form)
 
             # Extract form info
             info = form.get("info", {})
@@ -924,6 +929,7 @@ def setup_forms_tools(mcp: FastMCP) -> None:
             form = await asyncio.to_thread(
                 forms_service.forms().get(formId=form_id).execute
             )
+            get_form_schema_cache().store(user_google_email, form_id, form)
 
             state = (
                 "accepting responses"
@@ -1090,6 +1096,9 @@ def setup_forms_tools(mcp: FastMCP) -> None:
                     except HttpError as e:
                         results.append(f"⚠️ Failed to share with {email}: {e}")
 
+            if anyone_can_respond or share_with_emails:
+                invalidate_file_metadata(user_google_email, form_id)
+
             # Build final response
             success_msg = f"✅ Successfully published form '{title}'"
             edit_url = f"https://docs.google.com/forms/d/{form_id}/edit"
@@ -1191,43 +1200,13 @@ def setup_forms_tools(mcp: FastMCP) -> None:
                 .execute
             )
 
-            # Get form metadata to map questions
-            form = await asyncio.to_thread(
-                forms_service.forms().get(formId=form_id).execute
+            # Map answers to questions via the cached form schema
+            schema = await get_form_schema_cache().get(
+                forms_service, user_google_email, form_id
+            )
+            structured_answers: List[FormResponseAnswer] = map_answers(
+                response.get("answers", {}), schema.question_map
             )
-
-            # Format answers with question context
-            answers = response.get("answers", {})
-            items = form.get("items", [])
-
-            # Create a mapping of question IDs to questions
-            question_map = {}
-            for item in items:
-                if "questionItem" in item:
-                    question_map[item["itemId"]] = item
-
-            # Convert to structured format
-            structured_answers: List[FormResponseAnswer] = []
-            for question_id, answer_data in answers.items():
-                question = question_map.get(question_id, {})
-                question_title = question.get("title", f"Question {question_id}")
-
-                text_answers = answer_data.get("textAnswers", {})
-                answer_text = ""
-                if text_answers and "answers" in text_answers:
-                    answer_values = [
-                        ans.get("value", "") for ans in text_answers["answers"]
-                    ]
-                    answer_text = ", ".join(answer_values)
-                else:
-                    answer_text = "[No answer]"
-
-                answer_info: FormResponseAnswer = {
-                    "questionId": question_id,
-                    "questionTitle": question_title,
-                    "answer": answer_text,
-                }
-                structured_answers.append(answer_info)
 
             success_msg = f"✅ Retrieved response {response_id}"
 
@@ -1287,6 +1266,7 @@ def setup_forms_tools(mcp: FastMCP) -> None:
         },
     )
     async def list_form_responses(
+        ctx: Context,
         form_id: Annotated[
             str,
             Field(
@@ -1307,6 +1287,18 @@ def setup_forms_tools(mcp: FastMCP) -> None:
                 description="Token for pagination continuation. Use nextPageToken from previous response for subsequent pages. Set to None to start over from the beginning."
             ),
         ] = None,
+        export_all: Annotated[
+            bool,
+            Field(
+                description="Walk every page server-side and return all responses in one call (page_size and page_token are ignored). Large exports are delivered as a JSONL download URL."
+            ),
+        ] = False,
+        stage_to_file: Annotated[
+            Optional[bool],
+            Field(
+                description="With export_all: True always writes a JSONL file and returns exportUrl, False always returns responses inline, None (default) stages automatically for large forms."
+            ),
+        ] = None,
         user_google_email: UserGoogleEmailForms = None,
     ) -> FormResponsesListResponse:
         """
@@ -1316,6 +1308,9 @@ def setup_forms_tools(mcp: FastMCP) -> None:
             form_id: Form ID to retrieve responses from
             page_size: Number of responses per page (1-100, default 10)
             page_token: Pagination token from previous response (None to start over)
+            export_all: Fetch every page in this call (with next-page prefetch)
+            stage_to_file: With export_all, force (True) or suppress (False) the
+                JSONL file; None stages above FORMS_EXPORT_INLINE_MAX responses
             user_google_email: Google account for authentication
 
         Returns:
@@ -1325,6 +1320,49 @@ def setup_forms_tools(mcp: FastMCP) -> None:
         try:
             forms_service = await _get_forms_service_with_fallback(user_google_email)
 
+            # Question map comes from the revision-checked schema cache
+            schema = await get_form_schema_cache().get(
+                forms_service, user_google_email, form_id
+            )
+            title = schema.title
+
+            if export_all:
+                from config.settings import get_settings
+
+                settings = get_settings()
+
+                async def _report(pages: int, count: int) -> None:
+                    await ctx.info(f"Fetched {count} responses ({pages} pages)...")
+
+                export = await export_responses(
+                    forms_service,
+                    form_id,
+                    schema,
+                    inline_max=settings.forms_export_inline_max,
+                    stage_to_file=stage_to_file,
+                    on_page=_report,
+                )
+                export_url = None
+                if export.file_id:
+                    from gmail.attachment_server import generate_attachment_url
+
+                    export_url = generate_attachment_url(
+                        settings.base_url, export.file_id, export.filename
+                    )
+
+                return FormResponsesListResponse(
+                    responses=export.responses,
+                    count=export.count,
+                    formId=form_id,
+                    formTitle=title,
+                    userEmail=user_google_email or "",
+                    pageToken=None,
+                    nextPageToken=None,
+                    pagesFetched=export.pages,
+                    exportUrl=export_url,
+                    error=None,
+                )
+
             # Build request parameters
             params = {"pageSize": page_size}
             if page_token:
@@ -1335,57 +1373,13 @@ def setup_forms_tools(mcp: FastMCP) -> None:
                 forms_service.forms().responses().list(formId=form_id, **params).execute
             )
 
-            raw_responses = result.get("responses", [])
             next_page_token = result.get("nextPageToken")
 
-            # Get form metadata to map questions
-            form = await asyncio.to_thread(
-                forms_service.forms().get(formId=form_id).execute
-            )
-            title = form.get("info", {}).get("title", "Untitled Form")
-
-            # Create a mapping of question IDs to questions
-            items = form.get("items", [])
-            question_map = {}
-            for item in items:
-                if "questionItem" in item:
-                    question_map[item["itemId"]] = item
-
             # Convert to structured format
-            responses: List[FormResponseInfo] = []
-            for response in raw_responses:
-                # Format answers with question context
-                structured_answers: List[FormResponseAnswer] = []
-                answers = response.get("answers", {})
-
-                for question_id, answer_data in answers.items():
-                    question = question_map.get(question_id, {})
-                    question_title = question.get("title", f"Question {question_id}")
-
-                    text_answers = answer_data.get("textAnswers", {})
-                    answer_text = ""
-                    if text_answers and "answers" in text_answers:
-                        answer_values = [
-                            ans.get("value", "") for ans in text_answers["answers"]
-                        ]
-                        answer_text = ", ".join(answer_values)
-                    else:
-                        answer_text = "[No answer]"
-
-                    answer_info: FormResponseAnswer = {
-                        "questionId": question_id,
-                        "questionTitle": question_title,
-                        "answer": answer_text,
-                    }
-                    structured_answers.append(answer_info)
-
-                response_info: FormResponseInfo = {
-                    "responseId": response.get("responseId", ""),
-                    "submittedTime": response.get("lastSubmittedTime", "Unknown"),
-                    "respondentEmail": response.get("respondentEmail"),
-                    "answers": structured_answers,
-                }
-                responses.append(response_info)
+            responses: List[FormResponseInfo] = [
+                to_response_info(response, schema.question_map)
+                for response in result.get("responses", [])
+            ]
 
             logger.info(
                 f"Successfully retrieved {len(responses)} responses for form {form_id}"
@@ -1509,6 +1503,7 @@ def setup_forms_tools(mcp: FastMCP) -> None:
             form = await asyncio.to_thread(
                 forms_service.forms().get(formId=form_id).execute
             )
+            get_form_schema_cache().store(user_google_email, form_id, form)
 
             success_msg = f"✅ Successfully updated {len(valid_updates)} questions"
             title = form.get("info", {}).get("title", "Untitled")
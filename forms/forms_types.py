@@ -35,6 +35,8 @@ class FormResponsesListResponse(TypedDict):
     userEmail: str
     pageToken: Optional[str]  # For pagination
     nextPageToken: Optional[str]  # Next page token if more results available
+    pagesFetched: NotRequired[int]  # export_all: API pages walked
+    exportUrl: NotRequired[Optional[str]]  # export_all: signed JSONL download URL
     error: NotRequired[Optional[str]]
 
 
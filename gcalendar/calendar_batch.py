@@ -0,0 +1,396 @@
+"""
+Paginated reads and chunked batch writes for bulk Calendar operations.
+
+The bulk tools used to read a single ``events.list`` page and then issue one
+``events.insert`` per event followed by one unbounded batch of deletes.  This
+module provides the pieces they share instead:
+
+- ``list_events_sync``: follows ``nextPageToken`` until the caller's limit.
+- ``run_batched``: executes requests in batch calls of at most
+  ``CALENDAR_BATCH_SIZE`` (the API rejects batches larger than 50), retries
+  items that fail with a rate-limit or 5xx error with exponential backoff,
+  and reports progress after every chunk.
+- ``insert_events``: batched ``events.insert`` with client-supplied event
+  IDs, so retrying a 5xx whose insert actually landed cannot create a
+  duplicate (the retry gets 409 and the event is read back instead).
+- ``move_events``: uses the native ``events.move`` (keeps the event ID,
+  attendees and their responses) and falls back to copy + delete only for
+  events the API cannot move (non-default event types, events organised by
+  another calendar).  Recurring instances (``singleEvents=True``) are moved
+  by moving their series master once, never instance by instance, which
+  would break the series.
+
+Usage:
+    events = await asyncio.to_thread(list_events_sync, service, params, 1000)
+    outcome = await run_batched(service, [(key, lambda: req), ...])
+    outcome.succeeded[key]  # API response
+    outcome.failed[key]     # error string
+"""
+
+import asyncio
+import random
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+LIST_PAGE_SIZE = 2500  # API maximum for events.list
+MAX_BATCH_SIZE = 50  # API maximum for Calendar batch requests
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+# events.move rejections that copy + delete can still handle (lowercased)
+CANNOT_MOVE_REASONS = (
+    "cannotchangeorganizer",
+    "cannotchangeorganizerofinstance",
+    "forbiddenfornonorganizer",
+    "eventtyperestriction",
+)
+BACKOFF_BASE_SECONDS = 1.0
+
+# (key, factory returning a fresh HttpRequest)
+BatchItem = Tuple[str, Callable[[], Any]]
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+# Fields copied when an event has to be recreated rather than moved
+_COPY_FIELDS = (
+    "summary",
+    "description",
+    "location",
+    "start",
+    "end",
+    "attendees",
+    "reminders",
+    "colorId",
+    "transparency",
+    "visibility",
+)
+
+
+@dataclass
+class BatchOutcome:
+    """Per-key results of ``run_batched``."""
+
+    succeeded: Dict[str, Any] = field(default_factory=dict)
+    failed: Dict[str, str] = field(default_factory=dict)
+    failed_statuses: Dict[str, Optional[int]] = field(default_factory=dict)
+    retries: int = 0
+
+
+def list_events_sync(
+    calendar_service, params: Dict[str, Any], limit: int
+) -> List[Dict[str, Any]]:
+    """All events matching ``params`` (every page), up to ``limit``."""
+    events: List[Dict[str, Any]] = []
+    page_token = None
+    while len(events) < limit:
+        kwargs = dict(params, maxResults=min(LIST_PAGE_SIZE, limit - len(events)))
+        if page_token:
+            kwargs["pageToken"] = page_token
+        response = calendar_service.events().list(**kwargs).execute()
+        events.extend(response.get("items", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+    return events[:limit]
+
+
+def _status(exception) -> Optional[int]:
+    status = getattr(getattr(exception, "resp", None), "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable(exception) -> bool:
+    status = _status(exception)
+    if status in RETRYABLE_STATUSES:
+        return True
+    return status == 403 and "ratelimitexceeded" in str(exception).lower()
+
+
+async def run_batched(
+    calendar_service,
+    items: List[BatchItem],
+    batch_size: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    success_statuses: Tuple[int, ...] = (),
+    retry_success_statuses: Tuple[int, ...] = (),
+) -> BatchOutcome:
+    """Execute ``items`` in chunked batch calls with per-item retries.
+
+    ``success_statuses`` lists HTTP errors that count as success (e.g. 404/410
+    for deletes of events that are already gone); ``retry_success_statuses``
+    count as success only on a retry (e.g. 409 for an insert whose earlier
+    attempt landed despite the error).  Both record a ``None`` response.
+    """
+    from config.settings import get_settings
+
+    s = get_settings()
+    size = max(1, min(batch_size or s.calendar_batch_size, MAX_BATCH_SIZE))
+    retries_left = s.calendar_batch_max_retries if max_retries is None else max_retries
+    outcome = BatchOutcome()
+    factories = dict(items)
+    pending = [key for key, _ in items]
+    total = len(pending)
+    attempt = 0
+
+    while pending:
+        retry: List[str] = []
+        for start in range(0, len(pending), size):
+            chunk = pending[start : start + size]
+            batch = calendar_service.new_batch_http_request()
+
+            def callback(request_id, response, exception):
+                if exception is None:
+                    outcome.succeeded[request_id] = response
+                elif _status(exception) in success_statuses or (
+                    attempt > 0 and _status(exception) in retry_success_statuses
+                ):
+                    outcome.succeeded[request_id] = None
+                elif _is_retryable(exception) and attempt < retries_left:
+                    retry.append(request_id)
+                else:
+                    outcome.failed[request_id] = str(exception)
+                    outcome.failed_statuses[request_id] = _status(exception)
+
+            for key in chunk:
+                batch.add(factories[key](), request_id=key, callback=callback)
+            await asyncio.to_thread(batch.execute)
+
+            if on_progress:
+                done = len(outcome.succeeded) + len(outcome.failed)
+                await on_progress(done, total)
+
+        if retry:
+            attempt += 1
+            outcome.retries += len(retry)
+            delay = BACKOFF_BASE_SECONDS * (2 ** (attempt - 1))
+            logger.info(
+                f"📅 Retrying {len(retry)} Calendar batch item(s) in {delay:.1f}s "
+                f"(attempt {attempt}/{retries_left})"
+            )
+            await asyncio.sleep(delay + random.uniform(0, delay / 2))
+        pending = retry
+
+    return outcome
+
+
+def new_event_id() -> str:
+    """A client-supplied event ID (hex digits are valid base32hex)."""
+    return uuid.uuid4().hex
+
+
+async def insert_events(
+    calendar_service,
+    items: List[Tuple[str, Dict[str, Any]]],
+    on_progress: Optional[ProgressCallback] = None,
+) -> BatchOutcome:
+    """Batched ``events.insert`` of ``(key, insert kwargs)`` that is safe to retry.
+
+    Bodies without an ``id`` get a client-supplied one, so a 5xx retry of an
+    insert that actually landed fails with 409 instead of creating a second
+    event; those keys are read back with ``events.get``.
+    """
+    kwargs_by_key: Dict[str, Dict[str, Any]] = {}
+    for key, kwargs in items:
+        body = dict(kwargs["body"])
+        body.setdefault("id", new_event_id())
+        kwargs_by_key[key] = dict(kwargs, body=body)
+
+    outcome = await run_batched(
+        calendar_service,
+        [
+            (key, lambda kw=kw: calendar_service.events().insert(**kw))
+            for key, kw in kwargs_by_key.items()
+        ],
+        on_progress=on_progress,
+        retry_success_statuses=(409,),
+    )
+
+    landed = [key for key, response in outcome.succeeded.items() if response is None]
+    if landed:
+        fetched = await run_batched(
+            calendar_service,
+            [
+                (
+                    key,
+                    lambda kw=kwargs_by_key[key]: calendar_service.events().get(
+                        calendarId=kw["calendarId"], eventId=kw["body"]["id"]
+                    ),
+                )
+                for key in landed
+            ],
+        )
+        for key in landed:
+            outcome.succeeded[key] = fetched.succeeded.get(key) or {
+                "id": kwargs_by_key[key]["body"]["id"]
+            }
+    return outcome
+
+
+def _copy_body(event: Dict[str, Any]) -> Dict[str, Any]:
+    body = {k: event.get(k) for k in _COPY_FIELDS}
+    body["summary"] = body["summary"] or "No Title"
+    return {k: v for k, v in body.items() if v is not None}
+
+
+def _is_movable(event: Dict[str, Any]) -> bool:
+    """Whether ``events.move`` applies to the event itself (not a series instance)."""
+    return not event.get("recurringEventId") and event.get("eventType", "default") in (
+        "default",
+        None,
+    )
+
+
+def _cannot_move(status: Optional[int], error: str) -> bool:
+    """Whether ``events.move`` refused the event itself (not a transient error)."""
+    error = error.lower()
+    return status in (400, 403) and any(r in error for r in CANNOT_MOVE_REASONS)
+
+
+async def copy_events(
+    calendar_service,
+    events: List[Dict[str, Any]],
+    target_calendar_id: str,
+    on_progress: Optional[ProgressCallback] = None,
+) -> BatchOutcome:
+    """Batched ``events.insert`` of event copies, keyed by source event ID."""
+    return await insert_events(
+        calendar_service,
+        [
+            (event["id"], {"calendarId": target_calendar_id, "body": _copy_body(event)})
+            for event in events
+        ],
+        on_progress=on_progress,
+    )
+
+
+async def delete_events(
+    calendar_service,
+    event_ids: List[str],
+    calendar_id: str,
+    on_progress: Optional[ProgressCallback] = None,
+) -> BatchOutcome:
+    """Batched ``events.delete``; events already gone count as deleted."""
+    return await run_batched(
+        calendar_service,
+        [
+            (
+                event_id,
+                lambda event_id=event_id: calendar_service.events().delete(
+                    calendarId=calendar_id, eventId=event_id
+                ),
+            )
+            for event_id in event_ids
+        ],
+        on_progress=on_progress,
+        success_statuses=(404, 410),
+    )
+
+
+async def move_events(
+    calendar_service,
+    events: List[Dict[str, Any]],
+    source_calendar_id: str,
+    target_calendar_id: str,
+    on_progress: Optional[ProgressCallback] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Move events to another calendar.
+
+    Returns ``{source event ID: {"newId", "status", "error"}}`` where status
+    is ``moved`` (native move or copy + delete), ``copied`` (copy succeeded
+    but the source delete failed) or ``failed``.  Instances of a recurring
+    event share their series' outcome: the whole series moves (including
+    instances outside the listed window) or none of it does.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    total = len(events)
+    completed = 0
+
+    async def _progress(done: int, _total: int) -> None:
+        if on_progress:
+            await on_progress(min(completed + done, total), total)
+
+    def _move(event_id: str):
+        return lambda: calendar_service.events().move(
+            calendarId=source_calendar_id,
+            eventId=event_id,
+            destination=target_calendar_id,
+        )
+
+    # Series master ID -> IDs of its listed instances
+    series: Dict[str, List[str]] = {}
+    for event in events:
+        if event.get("recurringEventId"):
+            series.setdefault(event["recurringEventId"], []).append(event["id"])
+
+    movable = [e for e in events if _is_movable(e)]
+    moved = await run_batched(
+        calendar_service,
+        [(event["id"], _move(event["id"])) for event in movable]
+        + [(f"series:{master_id}", _move(master_id)) for master_id in series],
+        on_progress=_progress,
+    )
+    for key, response in moved.succeeded.items():
+        if key.startswith("series:"):
+            # Instance IDs derive from the series ID, which the move keeps
+            for event_id in series[key[len("series:") :]]:
+                results[event_id] = {
+                    "newId": event_id,
+                    "status": "moved",
+                    "error": None,
+                }
+        else:
+            results[key] = {
+                "newId": (response or {}).get("id", key),
+                "status": "moved",
+                "error": None,
+            }
+    for master_id, instance_ids in series.items():
+        error = moved.failed.get(f"series:{master_id}")
+        if error is not None:
+            for event_id in instance_ids:
+                results[event_id] = {"newId": None, "status": "failed", "error": error}
+
+    # Copy + delete only what events.move cannot handle (never recurring
+    # instances).  Other failures may have landed on a retry, so copying them
+    # could duplicate the event.
+    fallback = []
+    for event in events:
+        if event["id"] in results:
+            continue
+        error = moved.failed.get(event["id"])
+        if error is None or _cannot_move(moved.failed_statuses.get(event["id"]), error):
+            fallback.append(event)
+        else:
+            results[event["id"]] = {"newId": None, "status": "failed", "error": error}
+    completed = len(results)
+    if fallback:
+        logger.info(
+            f"📅 {len(fallback)} event(s) need copy + delete "
+            f"({sum(e['id'] in moved.failed for e in fallback)} rejected by "
+            f"events.move)"
+        )
+        copied = await copy_events(
+            calendar_service, fallback, target_calendar_id, _progress
+        )
+        for event_id, error in copied.failed.items():
+            results[event_id] = {"newId": None, "status": "failed", "error": error}
+
+        deleted = await delete_events(
+            calendar_service, list(copied.succeeded), source_calendar_id
+        )
+        for event_id, response in copied.succeeded.items():
+            results[event_id] = {
+                "newId": (response or {}).get("id"),
+                "status": "moved" if event_id in deleted.succeeded else "copied",
+                "error": deleted.failed.get(event_id),
+            }
+
+    if on_progress:
+        await on_progress(total, total)
+    return results
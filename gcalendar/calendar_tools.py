@@ -21,8 +21,16 @@ from typing_extensions import Annotated, Any, Dict, List, Optional
 
 from auth.service_helpers import get_service
 from config.enhanced_logging import setup_logger
+from drive.file_cache import get_file_metadata, get_files_metadata
 from tools.common_types import UserGoogleEmailCalendar
 
+from .calendar_batch import (
+    copy_events,
+    delete_events,
+    insert_events,
+    list_events_sync,
+    move_events,
+)
 from .calendar_types import (
     BulkCreateEventResponse,
     BulkEventResult,
@@ -41,6 +49,7 @@ from .calendar_types import (
     MoveEventResult,
     MoveEventsResponse,
 )
+from .event_store import get_event_store
 
 logger = setup_logger()
 
@@ -182,6 +191,41 @@ async def _get_drive_service_with_fallback(user_google_email: str):
     return await _get_service_with_fallback("drive", user_google_email)
 
 
+def _invalidate_event_cache(user_google_email: str, *calendar_ids: str) -> None:
+    """Mark cached calendars stale after this server writes to them."""
+    store = get_event_store()
+    if store is not None:
+        store.invalidate(user_google_email, *calendar_ids)
+
+
+async def _query_event_store(
+    calendar_service,
+    user_google_email: str,
+    calendar_id: str,
+    time_min: Optional[str],
+    time_max: Optional[str],
+    max_results: Optional[int],
+    max_age_seconds: Optional[float] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """Events from the local sync-token store, or None to query the API."""
+    store = get_event_store()
+    if store is None or not time_max:
+        return None
+    try:
+        return await store.query(
+            calendar_service,
+            user_google_email,
+            calendar_id,
+            time_min,
+            time_max,
+            max_results,
+            max_age_seconds,
+        )
+    except Exception as e:
+        logger.warning(f"Event store query failed, using live API: {e}")
+        return None
+
+
 # ============================================================================
 # ERROR HANDLING DECORATORS
 # ============================================================================
@@ -212,45 +256,46 @@ def handle_calendar_errors(func):
 
 
 async def _batch_delete_events(
-    calendar_service, event_ids: List[str], calendar_id: str = "primary"
+    calendar_service,
+    event_ids: List[str],
+    calendar_id: str = "primary",
+    on_progress=None,
 ) -> Dict[str, Any]:
     """
-    Helper function to delete multiple events in batch.
+    Helper function to delete multiple events in chunked batches.
 
     Args:
         calendar_service: Google Calendar service object
         event_ids: List of event IDs to delete
         calendar_id: Calendar ID (default: 'primary')
+        on_progress: Optional async callback(done, total) after each chunk
 
     Returns:
         Dictionary with results and errors
     """
-    results = {"succeeded": [], "failed": [], "total": len(event_ids)}
+    outcome = await delete_events(calendar_service, event_ids, calendar_id, on_progress)
+    return {
+        "succeeded": [eid for eid in event_ids if eid in outcome.succeeded],
+        "failed": [
+            {"event_id": eid, "error": error} for eid, error in outcome.failed.items()
+        ],
+        "total": len(event_ids),
+    }
 
-    # Create batch request
-    batch = calendar_service.new_batch_http_request()
 
-    def callback(request_id, response, exception):
-        """Callback for batch request."""
-        if exception is not None:
-            results["failed"].append(
-                {"event_id": event_ids[int(request_id)], "error": str(exception)}
-            )
-        else:
-            results["succeeded"].append(event_ids[int(request_id)])
-
-    # Add delete requests to batch
-    for idx, event_id in enumerate(event_ids):
-        batch.add(
-            calendar_service.events().delete(calendarId=calendar_id, eventId=event_id),
-            request_id=str(idx),
-            callback=callback,
-        )
+def _split_attachments(attachments) -> List[str]:
+    """Attachments arrive as a list or a comma-separated string."""
+    if isinstance(attachments, str):
+        return [a.strip() for a in attachments.split(",") if a.strip()]
+    return list(attachments or [])
 
-    # Execute batch request
-    await asyncio.to_thread(batch.execute)
 
-    return results
+def _attachment_file_id(att: str) -> Optional[str]:
+    """Drive file ID from a file URL (/d/<id>, /file/d/<id>, ?id=<id>) or bare ID."""
+    if att.startswith("https://"):
+        match = re.search(r"(?:/d/|/file/d/|id=)([\w-]+)", att)
+        return match.group(1) if match else None
+    return att
 
 
 async def _batch_create_events(
@@ -259,6 +304,7 @@ async def _batch_create_events(
     events_data: List[Dict[str, Any]],
     calendar_id: str = "primary",
     ctx: Optional[Context] = None,
+    user_google_email: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Helper function to create multiple events in batch.
@@ -269,46 +315,35 @@ async def _batch_create_events(
         events_data: List of event data dictionaries
         calendar_id: Calendar ID (default: 'primary')
         ctx: Optional FastMCP context for progress reporting
+        user_google_email: Owner of the Drive metadata cache for attachments
 
     Returns:
         Dictionary with success and failure results
     """
     results = {"succeeded": [], "failed": [], "total": len(events_data)}
 
-    # Create batch request
-    batch = calendar_service.new_batch_http_request()
-
-    # Store processed event bodies for the callback
-    event_bodies = []
-
-    def callback(request_id, response, exception):
-        """Callback for batch request."""
-        idx = int(request_id)
-        event_data = events_data[idx]
+    # Resolve every attachment's Drive metadata in one batched lookup
+    attachment_metadata: Dict[str, Dict[str, Any]] = {}
+    if drive_service:
+        attachment_ids = [
+            file_id
+            for event_data in events_data
+            for att in _split_attachments(event_data.get("attachments"))
+            if (file_id := _attachment_file_id(att))
+        ]
+        if attachment_ids:
+            try:
+                attachment_metadata, _ = await get_files_metadata(
+                    drive_service,
+                    user_google_email,
+                    attachment_ids,
+                    fields="mimeType,name",
+                )
+            except Exception as e:
+                logger.warning(f"Could not fetch attachment metadata: {e}")
 
-        if exception is not None:
-            failure_result: BulkEventResult = {
-                "eventId": None,
-                "summary": event_data.get("summary", "Unknown Event"),
-                "start_time": event_data.get("start_time", ""),
-                "htmlLink": None,
-                "status": "failed",
-                "error": str(exception),
-                "input_data": event_data,
-            }
-            results["failed"].append(failure_result)
-        else:
-            success_result: BulkEventResult = {
-                "eventId": response.get("id"),
-                "summary": response.get(
-                    "summary", event_data.get("summary", "Unknown Event")
-                ),
-                "start_time": event_data.get("start_time", ""),
-                "htmlLink": response.get("htmlLink", ""),
-                "status": "success",
-                "error": None,
-            }
-            results["succeeded"].append(success_result)
+    # (request key, events.insert kwargs) pairs for the chunked batch run
+    batch_items = []
 
     # Process each event and add to batch
     for idx, event_data in enumerate(events_data):
@@ -368,39 +403,18 @@ async def _batch_create_events(
             # Handle attachments
             if event_data.get("attachments") and drive_service:
                 event_body["attachments"] = []
-                attachments = event_data["attachments"]
-                if isinstance(attachments, str):
-                    attachments = [
-                        a.strip() for a in attachments.split(",") if a.strip()
-                    ]
 
-                for att in attachments:
-                    file_id = None
-                    if att.startswith("https://"):
-                        # Extract file ID from URL
-                        match = re.search(r"(?:/d/|/file/d/|id=)([\w-]+)", att)
-                        file_id = match.group(1) if match else None
-                    else:
-                        file_id = att
+                for att in _split_attachments(event_data["attachments"]):
+                    file_id = _attachment_file_id(att)
 
                     if file_id:
                         file_url = f"https://drive.google.com/open?id={file_id}"
-                        mime_type = "application/vnd.google-apps.drive-sdk"
-                        title = "Drive Attachment"
-
-                        # Try to get metadata from Drive
-                        try:
-                            file_metadata = await asyncio.to_thread(
-                                lambda: drive_service.files()
-                                .get(fileId=file_id, fields="mimeType,name")
-                                .execute()
-                            )
-                            mime_type = file_metadata.get("mimeType", mime_type)
-                            filename = file_metadata.get("name")
-                            if filename:
-                                title = filename
-                        except Exception:
-                            pass  # Use defaults if metadata fetch fails
+                        # Use defaults if the metadata fetch failed
+                        file_metadata = attachment_metadata.get(file_id, {})
+                        mime_type = file_metadata.get(
+                            "mimeType", "application/vnd.google-apps.drive-sdk"
+                        )
+                        title = file_metadata.get("name") or "Drive Attachment"
 
                         event_body["attachments"].append(
                             {
@@ -410,27 +424,11 @@ async def _batch_create_events(
                             }
                         )
 
-            event_bodies.append(event_body)
-
             # Add to batch
+            insert_kwargs = {"calendarId": calendar_id, "body": event_body}
             if event_data.get("attachments"):
-                batch.add(
-                    calendar_service.events().insert(
-                        calendarId=calendar_id,
-                        body=event_body,
-                        supportsAttachments=True,
-                    ),
-                    request_id=str(idx),
-                    callback=callback,
-                )
-            else:
-                batch.add(
-                    calendar_service.events().insert(
-                        calendarId=calendar_id, body=event_body
-                    ),
-                    request_id=str(idx),
-                    callback=callback,
-                )
+                insert_kwargs["supportsAttachments"] = True
+            batch_items.append((str(idx), insert_kwargs))
 
         except Exception as e:
             # Handle individual event processing errors
@@ -445,13 +443,39 @@ async def _batch_create_events(
             }
             results["failed"].append(failure_result)
 
-    # Execute batch request
-    if batch._order:  # Only execute if there are requests in the batch
+    # Execute in chunked batch requests (rate-limited items are retried;
+    # client-supplied event IDs keep those retries from duplicating events)
+    if batch_items:
         if ctx:
-            await ctx.info(
-                f"Executing batch creation for {len(batch._order)} events..."
-            )
-        await asyncio.to_thread(batch.execute)
+            await ctx.info(f"Executing batch creation for {len(batch_items)} events...")
+        outcome = await insert_events(calendar_service, batch_items)
+
+        for key, _ in batch_items:
+            event_data = events_data[int(key)]
+            if key in outcome.failed:
+                failure_result: BulkEventResult = {
+                    "eventId": None,
+                    "summary": event_data.get("summary", "Unknown Event"),
+                    "start_time": event_data.get("start_time", ""),
+                    "htmlLink": None,
+                    "status": "failed",
+                    "error": outcome.failed[key],
+                    "input_data": event_data,
+                }
+                results["failed"].append(failure_result)
+            else:
+                response = outcome.succeeded[key]
+                success_result: BulkEventResult = {
+                    "eventId": response.get("id"),
+                    "summary": response.get(
+                        "summary", event_data.get("summary", "Unknown Event")
+                    ),
+                    "start_time": event_data.get("start_time", ""),
+                    "htmlLink": response.get("htmlLink", ""),
+                    "status": "success",
+                    "error": None,
+                }
+                results["succeeded"].append(success_result)
 
     # Report final progress
     if ctx:
@@ -471,6 +495,19 @@ async def _batch_create_events(
 # ============================================================================
 
 
+def _calendar_info(cal: Dict[str, Any]) -> CalendarInfo:
+    """``list_calendars`` entry for a calendarList resource."""
+    return {
+        "id": cal.get("id", ""),
+        "summary": cal.get("summary", "No Summary"),
+        "description": cal.get("description"),
+        "primary": cal.get("primary", False),
+        "timeZone": cal.get("timeZone"),
+        "backgroundColor": cal.get("backgroundColor"),
+        "foregroundColor": cal.get("foregroundColor"),
+    }
+
+
 async def list_calendars(
     user_google_email: UserGoogleEmailCalendar = None,
 ) -> CalendarListResponse:
@@ -504,16 +541,7 @@ async def list_calendars(
         # Convert to structured format
         calendars: List[CalendarInfo] = []
         for cal in items:
-            calendar_info: CalendarInfo = {
-                "id": cal.get("id", ""),
-                "summary": cal.get("summary", "No Summary"),
-                "description": cal.get("description"),
-                "primary": cal.get("primary", False),
-                "timeZone": cal.get("timeZone"),
-                "backgroundColor": cal.get("backgroundColor"),
-                "foregroundColor": cal.get("foregroundColor"),
-            }
-            calendars.append(calendar_info)
+            calendars.append(_calendar_info(cal))
 
         logger.info(
             f"Successfully listed {len(calendars)} calendars for {user_google_email}."
@@ -668,9 +696,9 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
 
             # Create the calendar
             created_calendar = await asyncio.to_thread(
-                lambda: calendar_service.calendars()
-                .insert(body=calendar_body)
-                .execute()
+                lambda: (
+                    calendar_service.calendars().insert(body=calendar_body).execute()
+                )
             )
 
             calendar_id = created_calendar.get("id")
@@ -767,6 +795,14 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
                 le=2500,
             ),
         ] = 25,
+        max_staleness_seconds: Annotated[
+            Optional[float],
+            Field(
+                default=None,
+                description="Freshness bound for locally synced events: data older than this triggers an incremental sync first. 0 always syncs; omit for the server default",
+                ge=0,
+            ),
+        ] = None,
     ) -> EventListResponse:
         """
         Retrieves a list of events from a specified Google Calendar within a given time range.
@@ -778,6 +814,7 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
             time_min (Optional[str]): The start of the time range (inclusive) in RFC3339 format (e.g., '2024-05-12T10:00:00Z' or '2024-05-12'). If omitted, defaults to the current time.
             time_max (Optional[str]): The end of the time range (exclusive) in RFC3339 format. If omitted, defaults to 10 days from the start time.
             max_results (int): The maximum number of events to return. Defaults to 25.
+            max_staleness_seconds (Optional[float]): Max age of locally synced data before an incremental sync.
 
         Returns:
             EventListResponse: Structured event list with metadata.
@@ -887,10 +924,20 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
 
             logger.info(f"[list_events] Final API parameters: {api_params}")
 
-            events_result = await asyncio.to_thread(
-                lambda: calendar_service.events().list(**api_params).execute()
+            items = await _query_event_store(
+                calendar_service,
+                user_google_email,
+                calendar_id,
+                effective_time_min,
+                effective_time_max,
+                max_results,
+                max_staleness_seconds,
             )
-            items = events_result.get("items", [])
+            if items is None:
+                events_result = await asyncio.to_thread(
+                    lambda: calendar_service.events().list(**api_params).execute()
+                )
+                items = events_result.get("items", [])
 
             # Convert to structured format
             events: List[EventInfo] = []
@@ -1238,8 +1285,14 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
 
                 # Execute batch creation with progress reporting
                 results = await _batch_create_events(
-                    calendar_service, drive_service, events_data, calendar_id, ctx
+                    calendar_service,
+                    drive_service,
+                    events_data,
+                    calendar_id,
+                    ctx,
+                    user_google_email=user_google_email,
                 )
+                _invalidate_event_cache(user_google_email, calendar_id)
 
                 # Format result message
                 success_count = len(results["succeeded"])
@@ -1422,10 +1475,11 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
                             # Try to get the actual MIME type and filename from Drive
                             if drive_service:
                                 try:
-                                    file_metadata = await asyncio.to_thread(
-                                        lambda: drive_service.files()
-                                        .get(fileId=file_id, fields="mimeType,name")
-                                        .execute()
+                                    file_metadata = await get_file_metadata(
+                                        drive_service,
+                                        user_google_email,
+                                        file_id,
+                                        fields="mimeType,name",
                                     )
                                     mime_type = file_metadata.get("mimeType", mime_type)
                                     filename = file_metadata.get("name")
@@ -1450,20 +1504,25 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
                                 }
                             )
                     created_event = await asyncio.to_thread(
-                        lambda: calendar_service.events()
-                        .insert(
-                            calendarId=calendar_id,
-                            body=event_body,
-                            supportsAttachments=True,
+                        lambda: (
+                            calendar_service.events()
+                            .insert(
+                                calendarId=calendar_id,
+                                body=event_body,
+                                supportsAttachments=True,
+                            )
+                            .execute()
                         )
-                        .execute()
                     )
                 else:
                     created_event = await asyncio.to_thread(
-                        lambda: calendar_service.events()
-                        .insert(calendarId=calendar_id, body=event_body)
-                        .execute()
+                        lambda: (
+                            calendar_service.events()
+                            .insert(calendarId=calendar_id, body=event_body)
+                            .execute()
+                        )
                     )
+                _invalidate_event_cache(user_google_email, calendar_id)
                 link = created_event.get("htmlLink", "No link available")
                 event_id = created_event.get("id")
                 confirmation_message = f"Successfully created event '{created_event.get('summary', summary)}' for {user_google_email}. Link: {link}"
@@ -1754,9 +1813,11 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
             # Try to get the event first to verify it exists
             try:
                 await asyncio.to_thread(
-                    lambda: calendar_service.events()
-                    .get(calendarId=calendar_id, eventId=event_id)
-                    .execute()
+                    lambda: (
+                        calendar_service.events()
+                        .get(calendarId=calendar_id, eventId=event_id)
+                        .execute()
+                    )
                 )
                 logger.info(
                     "[modify_event] Successfully verified event exists before update"
@@ -1786,10 +1847,13 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
             # Use patch() instead of update() so unspecified fields
             # (including recurrence rules) are preserved.
             updated_event = await asyncio.to_thread(
-                lambda: calendar_service.events()
-                .patch(calendarId=calendar_id, eventId=event_id, body=event_body)
-                .execute()
+                lambda: (
+                    calendar_service.events()
+                    .patch(calendarId=calendar_id, eventId=event_id, body=event_body)
+                    .execute()
+                )
             )
+            _invalidate_event_cache(user_google_email, calendar_id)
 
             link = updated_event.get("htmlLink", "No link available")
             confirmation_message = f"Successfully modified event '{updated_event.get('summary', summary)}' (ID: {event_id}) for {user_google_email}. Link: {link}"
@@ -1960,9 +2024,11 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
                 # Try to get the event first to verify it exists
                 try:
                     await asyncio.to_thread(
-                        lambda: calendar_service.events()
-                        .get(calendarId=calendar_id, eventId=event_id_single)
-                        .execute()
+                        lambda: (
+                            calendar_service.events()
+                            .get(calendarId=calendar_id, eventId=event_id_single)
+                            .execute()
+                        )
                     )
                     logger.info(
                         "[delete_event] Successfully verified event exists before deletion"
@@ -1993,10 +2059,13 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
 
                 # Proceed with single deletion
                 await asyncio.to_thread(
-                    lambda: calendar_service.events()
-                    .delete(calendarId=calendar_id, eventId=event_id_single)
-                    .execute()
+                    lambda: (
+                        calendar_service.events()
+                        .delete(calendarId=calendar_id, eventId=event_id_single)
+                        .execute()
+                    )
                 )
+                _invalidate_event_cache(user_google_email, calendar_id)
 
                 confirmation_message = f"✅ Successfully deleted event (ID: {event_id_single}) from calendar '{calendar_id}' for {user_google_email}."
                 logger.info(f"Event deleted successfully. ID: {event_id_single}")
@@ -2022,6 +2091,7 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
                 results = await _batch_delete_events(
                     calendar_service, event_ids, calendar_id
                 )
+                _invalidate_event_cache(user_google_email, calendar_id)
 
                 # Format result message
                 success_count = len(results["succeeded"])
@@ -2115,6 +2185,7 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
         },
     )
     async def bulk_calendar_operations(
+        ctx: Context,
         operation: Annotated[
             str,
             Field(description="Operation to perform", pattern="^(delete|list|export)$"),
@@ -2245,7 +2316,6 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
             api_params = {
                 "calendarId": calendar_id,
                 "timeMin": formatted_time_min,
-                "maxResults": max_results,
                 "singleEvents": True,
                 "orderBy": "startTime",
             }
@@ -2253,11 +2323,21 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
             if formatted_time_max:
                 api_params["timeMax"] = formatted_time_max
 
-            # Fetch events
-            events_result = await asyncio.to_thread(
-                lambda: calendar_service.events().list(**api_params).execute()
+            # Fetch events (local store when it covers the window, otherwise
+            # every API page up to max_results)
+            all_events = await _query_event_store(
+                calendar_service,
+                user_google_email,
+                calendar_id,
+                formatted_time_min,
+                formatted_time_max,
+                max_results,
+                0 if operation == "delete" else None,
             )
-            all_events = events_result.get("items", [])
+            if all_events is None:
+                all_events = await asyncio.to_thread(
+                    list_events_sync, calendar_service, api_params, max_results
+                )
 
             # Apply filters
             filtered_events = []
@@ -2322,8 +2402,12 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
                 event_ids = [event["id"] for event in filtered_events]
                 if event_ids:
                     results = await _batch_delete_events(
-                        calendar_service, event_ids, calendar_id
+                        calendar_service,
+                        event_ids,
+                        calendar_id,
+                        ctx.report_progress if ctx else None,
                     )
+                    _invalidate_event_cache(user_google_email, calendar_id)
                     message_parts.append("\n**Deletion Results:**")
                     message_parts.append(f"✅ Deleted: {len(results['succeeded'])}")
                     message_parts.append(f"❌ Failed: {len(results['failed'])}")
@@ -2424,6 +2508,7 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
         },
     )
     async def move_events_between_calendars(
+        ctx: Context,
         source_calendar_id: Annotated[str, "Source calendar ID to move events from"],
         target_calendar_id: Annotated[str, "Target calendar ID to move events to"],
         time_min: Annotated[
@@ -2447,14 +2532,17 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
         max_results: Annotated[
             int,
             Field(
-                default=50, description="Maximum number of events to move", ge=1, le=500
+                default=50,
+                description="Maximum number of events to move",
+                ge=1,
+                le=2500,
             ),
         ] = 50,
         delete_from_source: Annotated[
             bool,
             Field(
                 default=False,
-                description="If True, delete events from source after copying (move). If False, only copy events (duplicate)",
+                description="If True, move events (native events.move, keeping IDs and attendee responses; copy + delete only where move is unsupported). If False, only copy events (duplicate)",
             ),
         ] = False,
         user_google_email: UserGoogleEmailCalendar = None,
@@ -2470,7 +2558,7 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
             time_max (Optional[str]): End of time range (RFC3339 format).
             title_pattern (Optional[str]): Regex pattern to match event titles.
             max_results (int): Maximum number of events to move (default: 50).
-            delete_from_source (bool): If True, delete from source after copying (default: False).
+            delete_from_source (bool): If True, move instead of copy (default: False).
 
         Returns:
             MoveEventsResponse: Structured response with move operation results and status.
@@ -2518,7 +2606,6 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
             api_params = {
                 "calendarId": source_calendar_id,
                 "timeMin": formatted_time_min,
-                "maxResults": max_results,
                 "singleEvents": True,
                 "orderBy": "startTime",
             }
@@ -2526,11 +2613,10 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
             if formatted_time_max:
                 api_params["timeMax"] = formatted_time_max
 
-            # Fetch events from source
-            events_result = await asyncio.to_thread(
-                lambda: calendar_service.events().list(**api_params).execute()
+            # Fetch events from source (every page, up to max_results)
+            source_events = await asyncio.to_thread(
+                list_events_sync, calendar_service, api_params, max_results
             )
-            source_events = events_result.get("items", [])
 
             # Apply title filter if specified
             if title_pattern:
@@ -2540,72 +2626,54 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
                     if re.search(title_pattern, event.get("summary", ""), re.IGNORECASE)
                 ]
 
-            # Copy events to target calendar
+            progress = ctx.report_progress if ctx else None
+            if delete_from_source:
+                # Native events.move keeps IDs and attendee responses; only
+                # events it rejects fall back to copy + delete.
+                outcomes = await move_events(
+                    calendar_service,
+                    source_events,
+                    source_calendar_id,
+                    target_calendar_id,
+                    progress,
+                )
+            else:
+                copy_outcome = await copy_events(
+                    calendar_service, source_events, target_calendar_id, progress
+                )
+                outcomes = {
+                    event_id: {"newId": response.get("id"), "status": "copied"}
+                    for event_id, response in copy_outcome.succeeded.items()
+                }
+                outcomes.update(
+                    {
+                        event_id: {"newId": None, "status": "failed", "error": error}
+                        for event_id, error in copy_outcome.failed.items()
+                    }
+                )
+            _invalidate_event_cache(
+                user_google_email, source_calendar_id, target_calendar_id
+            )
+
             copied_events: List[MoveEventResult] = []
             failed_copies: List[MoveEventResult] = []
-
+            delete_failures: List[MoveEventResult] = []
             for event in source_events:
-                try:
-                    # Create new event body (remove readonly fields)
-                    new_event = {
-                        "summary": event.get("summary", "No Title"),
-                        "description": event.get("description"),
-                        "location": event.get("location"),
-                        "start": event.get("start"),
-                        "end": event.get("end"),
-                        "attendees": event.get("attendees", []),
-                        "reminders": event.get("reminders"),
-                    }
-
-                    # Remove None values
-                    new_event = {k: v for k, v in new_event.items() if v is not None}
-
-                    # Create event in target calendar
-                    created = await asyncio.to_thread(
-                        lambda: calendar_service.events()
-                        .insert(calendarId=target_calendar_id, body=new_event)
-                        .execute()
-                    )
-
-                    result: MoveEventResult = {
-                        "originalId": event["id"],
-                        "newId": created["id"],
-                        "summary": event.get("summary", "No Title"),
-                        "status": "copied",
-                        "error": None,
-                    }
-                    copied_events.append(result)
-
-                except Exception as e:
-                    result: MoveEventResult = {
-                        "originalId": event["id"],
-                        "newId": None,
-                        "summary": event.get("summary", "No Title"),
-                        "status": "failed",
-                        "error": str(e),
-                    }
+                outcome = outcomes.get(event["id"], {})
+                result: MoveEventResult = {
+                    "originalId": event["id"],
+                    "newId": outcome.get("newId"),
+                    "summary": event.get("summary", "No Title"),
+                    "status": outcome.get("status", "failed"),
+                    "error": outcome.get("error"),
+                }
+                if result["status"] == "failed":
                     failed_copies.append(result)
-
-            # Delete from source if requested
-            deleted_count = 0
-            delete_failures = []
-            if delete_from_source and copied_events:
-                event_ids_to_delete = [e["originalId"] for e in copied_events]
-                delete_results = await _batch_delete_events(
-                    calendar_service, event_ids_to_delete, source_calendar_id
-                )
-                deleted_count = len(delete_results["succeeded"])
-
-                # Update status for deleted events
-                for event_result in copied_events:
-                    if event_result["originalId"] in delete_results["succeeded"]:
-                        event_result["status"] = "moved"
-                    else:
-                        # Find the delete error
-                        for failure in delete_results["failed"]:
-                            if failure["event_id"] == event_result["originalId"]:
-                                delete_failures.append(failure)
-                                break
+                else:
+                    copied_events.append(result)
+                    if delete_from_source and result["status"] == "copied":
+                        delete_failures.append(result)
+            deleted_count = sum(1 for r in copied_events if r["status"] == "moved")
 
             # Format results message
             message_parts = [
@@ -2743,11 +2811,23 @@ def setup_calendar_tools(mcp: FastMCP) -> None:
                 user_google_email
             )
 
-            event = await asyncio.to_thread(
-                lambda: calendar_service.events()
-                .get(calendarId=calendar_id, eventId=event_id)
-                .execute()
-            )
+            event = None
+            store = get_event_store()
+            if store is not None:
+                try:
+                    event = await store.get(
+                        calendar_service, user_google_email, calendar_id, event_id
+                    )
+                except Exception as e:
+                    logger.warning(f"[get_event] Event store unavailable: {e}")
+            if event is None:
+                event = await asyncio.to_thread(
+                    lambda: (
+                        calendar_service.events()
+                        .get(calendarId=calendar_id, eventId=event_id)
+                        .execute()
+                    )
+                )
 
             # Extract attendee emails
             attendee_emails = None
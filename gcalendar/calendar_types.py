@@ -214,7 +214,7 @@ class MoveEventResult(TypedDict):
     originalId: str
     newId: Optional[str]
     summary: str
-    status: str  # 'copied', 'deleted', 'failed'
+    status: str  # 'moved', 'copied', 'failed'
     error: NotRequired[Optional[str]]
 
 
@@ -0,0 +1,337 @@
+"""
+Per-user, per-calendar event store kept current with Calendar sync tokens.
+
+Assistant workflows ask for overlapping time windows many times per
+conversation, and every ``list_events`` / ``get_event`` used to be a full
+``events.list`` / ``events.get`` round-trip.  The store instead:
+
+- does one full sync per (user, calendar) over a rolling window
+  (``CALENDAR_SYNC_PAST_DAYS`` back, ``CALENDAR_SYNC_FUTURE_DAYS`` ahead),
+  keeping ``nextSyncToken``;
+- answers time-windowed queries inside that window locally, running an
+  incremental sync (changes only) first when the data is older than the
+  freshness bound (``CALENDAR_EVENT_CACHE_MAX_AGE`` or a per-call value);
+- re-syncs from scratch when the token expires (``410 Gone``) or the window
+  has drifted, and falls back to the caller's live query for windows it does
+  not cover;
+- is marked stale by this server's own create/modify/delete/move tools, so
+  the next read picks up their changes through the sync token.
+
+Usage:
+    store = get_event_store()
+    events = await store.query(service, user_email, "primary", time_min,
+                               time_max, max_results)   # None -> not covered
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from googleapiclient.errors import HttpError
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+SYNC_PAGE_SIZE = 2500  # API maximum for events.list
+
+
+def _parse_rfc3339(value: str) -> Optional[datetime]:
+    """Parse an RFC3339 timestamp or date into an aware UTC datetime."""
+    if not value:
+        return None
+    try:
+        if "T" not in value:
+            return datetime.combine(
+                date.fromisoformat(value), datetime.min.time(), timezone.utc
+            )
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+    except ValueError:
+        return None
+
+
+def _event_bound(boundary: Dict[str, Any], calendar_tz: str) -> Optional[datetime]:
+    """Start/end of an event as UTC; all-day dates use the calendar timezone."""
+    if not boundary:
+        return None
+    if boundary.get("dateTime"):
+        return _parse_rfc3339(boundary["dateTime"])
+    if boundary.get("date"):
+        try:
+            tz = ZoneInfo(boundary.get("timeZone") or calendar_tz or "UTC")
+        except Exception:
+            tz = timezone.utc
+        day = date.fromisoformat(boundary["date"])
+        return datetime.combine(day, datetime.min.time(), tz).astimezone(timezone.utc)
+    return None
+
+
+@dataclass
+class _CalendarCache:
+    events: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    sync_token: Optional[str] = None
+    synced_at: float = 0.0  # monotonic; 0 means stale
+    window: Tuple[Optional[datetime], Optional[datetime]] = (None, None)
+    time_zone: str = "UTC"
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class EventStore:
+    """LRU of synced calendars keyed by (user email, calendar ID)."""
+
+    def __init__(
+        self,
+        past_days: int = 30,
+        future_days: int = 180,
+        max_age_seconds: float = 60.0,
+        max_calendars: int = 64,
+    ):
+        self.past_days = past_days
+        self.future_days = future_days
+        self.max_age_seconds = max_age_seconds
+        self.max_calendars = max_calendars
+        self._calendars: "OrderedDict[Tuple[str, str], _CalendarCache]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "incremental_syncs": 0, "full_syncs": 0}
+
+    @staticmethod
+    def _key(user_email: Optional[str], calendar_id: str) -> Tuple[str, str]:
+        user = (user_email or "").lower()
+        calendar = (calendar_id or "primary").lower()
+        # The user's own address and "primary" name the same calendar
+        if calendar == user:
+            calendar = "primary"
+        return (user, calendar)
+
+    def _entry(self, key) -> _CalendarCache:
+        with self._lock:
+            entry = self._calendars.get(key)
+            if entry is None:
+                entry = _CalendarCache()
+                self._calendars[key] = entry
+                while len(self._calendars) > self.max_calendars:
+                    self._calendars.popitem(last=False)
+            self._calendars.move_to_end(key)
+            return entry
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def _target_window(self) -> Tuple[datetime, datetime]:
+        now = datetime.now(timezone.utc)
+        return now - timedelta(days=self.past_days), now + timedelta(
+            days=self.future_days
+        )
+
+    def _list_pages(self, calendar_service, params: Dict[str, Any]):
+        """Yield every ``events.list`` page for ``params``."""
+        page_token = None
+        while True:
+            kwargs = dict(params, maxResults=SYNC_PAGE_SIZE)
+            if page_token:
+                kwargs["pageToken"] = page_token
+            response = calendar_service.events().list(**kwargs).execute()
+            yield response
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return
+
+    def _full_sync_sync(self, calendar_service, calendar_id: str, entry) -> None:
+        window_min, window_max = self._target_window()
+        params = {
+            "calendarId": calendar_id,
+            "singleEvents": True,
+            "timeMin": window_min.isoformat().replace("+00:00", "Z"),
+            "timeMax": window_max.isoformat().replace("+00:00", "Z"),
+        }
+        events: Dict[str, Dict[str, Any]] = {}
+        sync_token = None
+        time_zone = entry.time_zone
+        for page in self._list_pages(calendar_service, params):
+            time_zone = page.get("timeZone", time_zone)
+            for event in page.get("items", []):
+                if event.get("status") != "cancelled":
+                    events[event["id"]] = event
+            sync_token = page.get("nextSyncToken", sync_token)
+        entry.events = events
+        entry.sync_token = sync_token
+        entry.window = (window_min, window_max)
+        entry.time_zone = time_zone
+        entry.synced_at = time.monotonic()
+        self.stats["full_syncs"] += 1
+        logger.info(
+            f"📅 Full sync of {calendar_id}: {len(events)} events"
+            f"{'' if sync_token else ' (no sync token; snapshot only)'}"
+        )
+
+    def _incremental_sync_sync(self, calendar_service, calendar_id: str, entry) -> int:
+        params = {
+            "calendarId": calendar_id,
+            "singleEvents": True,
+            "syncToken": entry.sync_token,
+        }
+        changed = 0
+        sync_token = entry.sync_token
+        for page in self._list_pages(calendar_service, params):
+            for event in page.get("items", []):
+                changed += 1
+                if event.get("status") == "cancelled":
+                    entry.events.pop(event["id"], None)
+                else:
+                    entry.events[event["id"]] = event
+            sync_token = page.get("nextSyncToken", sync_token)
+        entry.sync_token = sync_token
+        entry.synced_at = time.monotonic()
+        self.stats["incremental_syncs"] += 1
+        return changed
+
+    def _sync_sync(self, calendar_service, calendar_id: str, entry) -> None:
+        """Bring ``entry`` up to date (incremental when possible)."""
+        window_min, _ = self._target_window()
+        drifted = entry.window[0] is None or window_min - entry.window[0] > timedelta(
+            days=1
+        )
+        if entry.sync_token and not drifted:
+            try:
+                self._incremental_sync_sync(calendar_service, calendar_id, entry)
+                return
+            except HttpError as e:
+                if getattr(e.resp, "status", None) != 410:
+                    raise
+                logger.info(f"📅 Sync token for {calendar_id} expired; full re-sync")
+        self._full_sync_sync(calendar_service, calendar_id, entry)
+
+    async def _ensure_fresh(
+        self,
+        calendar_service,
+        user_email: Optional[str],
+        calendar_id: str,
+        max_age_seconds: Optional[float],
+    ) -> _CalendarCache:
+        entry = self._entry(self._key(user_email, calendar_id))
+        max_age = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+        async with entry.lock:
+            if entry.synced_at and time.monotonic() - entry.synced_at <= max_age:
+                self.stats["hits"] += 1
+            else:
+                await asyncio.to_thread(
+                    self._sync_sync, calendar_service, calendar_id, entry
+                )
+        return entry
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def covers(self, time_min: Optional[str], time_max: Optional[str]) -> bool:
+        """Whether a query window lies inside the synced window."""
+        window_min, window_max = self._target_window()
+        start, end = _parse_rfc3339(time_min or ""), _parse_rfc3339(time_max or "")
+        # Allow a day of slack for window drift between syncs
+        slack = timedelta(days=1)
+        return (
+            start is not None
+            and end is not None
+            and start >= window_min + slack
+            and end <= window_max - slack
+        )
+
+    async def query(
+        self,
+        calendar_service,
+        user_email: Optional[str],
+        calendar_id: str,
+        time_min: Optional[str],
+        time_max: Optional[str],
+        max_results: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Events overlapping [time_min, time_max) ordered by start time.
+
+        Returns None when the window is outside the synced range; the caller
+        should then query the API directly.
+        """
+        if not self.covers(time_min, time_max):
+            return None
+        entry = await self._ensure_fresh(
+            calendar_service, user_email, calendar_id, max_age_seconds
+        )
+        start, end = _parse_rfc3339(time_min), _parse_rfc3339(time_max)
+        matched = []
+        for event in list(entry.events.values()):
+            ev_start = _event_bound(event.get("start", {}), entry.time_zone)
+            ev_end = _event_bound(event.get("end", {}), entry.time_zone) or ev_start
+            if ev_start is None:
+                continue
+            # Same semantics as events.list: end > timeMin and start < timeMax
+            if ev_end > start and ev_start < end:
+                matched.append((ev_start, event))
+        matched.sort(key=lambda item: item[0])
+        events = [event for _, event in matched]
+        return events[:max_results] if max_results else events
+
+    async def get(
+        self,
+        calendar_service,
+        user_email: Optional[str],
+        calendar_id: str,
+        event_id: str,
+        max_age_seconds: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """A cached event, if its calendar has been synced; None otherwise."""
+        with self._lock:
+            synced = self._calendars.get(self._key(user_email, calendar_id))
+        if synced is None or not synced.synced_at and not synced.sync_token:
+            return None
+        entry = await self._ensure_fresh(
+            calendar_service, user_email, calendar_id, max_age_seconds
+        )
+        return entry.events.get(event_id)
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate(self, user_email: Optional[str], *calendar_ids: str) -> None:
+        """Mark calendars stale so the next read syncs (keeps the sync token)."""
+        with self._lock:
+            for calendar_id in calendar_ids:
+                entry = self._calendars.get(self._key(user_email, calendar_id))
+                if entry is not None:
+                    entry.synced_at = 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._calendars.clear()
+
+
+_store: Optional[EventStore] = None
+_store_lock = threading.Lock()
+
+
+def get_event_store() -> Optional[EventStore]:
+    """Process-wide event store, or None when disabled in settings."""
+    global _store
+    from config.settings import get_settings
+
+    s = get_settings()
+    if not s.calendar_event_cache_enabled:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = EventStore(
+                    past_days=s.calendar_sync_past_days,
+                    future_days=s.calendar_sync_future_days,
+                    max_age_seconds=s.calendar_event_cache_max_age,
+                )
+    return _store
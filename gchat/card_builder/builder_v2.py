@@ -124,6 +124,15 @@ from gchat.card_builder.prepared_pattern import (
 from gchat.card_builder.utils import fire_and_forget
 
 
+class _BuildState(threading.local):
+    """State of the build running on the current thread."""
+
+    def __init__(self):
+        self.jinja_applied = False
+        self.description_rendered: Optional[str] = None
+        self.supply_map: Optional[Dict[str, Any]] = None
+
+
 class SmartCardBuilderV2:
     """
     Streamlined card builder using DSL + Qdrant embeddings.
@@ -144,7 +153,9 @@ class SmartCardBuilderV2:
         self._qdrant_client = None
         self._embedder = None
         self._jinja_env = None
-        self._jinja_applied = False  # Track if Jinja processing was applied
+        # Per-build state (Jinja tracking, supply map): builds run
+        # concurrently on worker threads, each with its own copy
+        self._build_state = _BuildState()
 
         # Performance optimization: LRU cache for Qdrant pattern queries
         # Cache entries expire after 5 minutes to balance freshness vs performance
@@ -153,6 +164,33 @@ class SmartCardBuilderV2:
         self._pattern_cache_ttl = 300  # 5 minutes
         self._pattern_cache_max_size = 100
 
+    @property
+    def _jinja_applied(self) -> bool:
+        """Whether Jinja processing changed any text in the current build."""
+        return self._build_state.jinja_applied
+
+    @_jinja_applied.setter
+    def _jinja_applied(self, value: bool) -> None:
+        self._build_state.jinja_applied = value
+
+    @property
+    def _description_rendered(self) -> Optional[str]:
+        """Jinja-rendered description of the current build, if it differs."""
+        return self._build_state.description_rendered
+
+    @_description_rendered.setter
+    def _description_rendered(self, value: Optional[str]) -> None:
+        self._build_state.description_rendered = value
+
+    @property
+    def _supply_map(self) -> Optional[Dict[str, Any]]:
+        """Supply map of the current DSL build (for content vector storage)."""
+        return self._build_state.supply_map
+
+    @_supply_map.setter
+    def _supply_map(self, value: Optional[Dict[str, Any]]) -> None:
+        self._build_state.supply_map = value
+
     # =========================================================================
     # INFRASTRUCTURE
     # =========================================================================
@@ -1551,6 +1589,23 @@ class SmartCardBuilderV2:
     # PARAM-DRIVEN BUILD ENTRY POINT
     # =========================================================================
 
+    async def build_from_params_async(
+        self,
+        description: str,
+        card_params: Dict[str, Any],
+        suggested_dsl: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """``build_from_params`` for async tools.
+
+        The build runs in a worker thread; its Qdrant pattern searches run
+        on the caller's event loop through the async search path.
+        """
+        from gchat.card_builder.search import run_with_async_search
+
+        return await run_with_async_search(
+            self.build_from_params, description, card_params, suggested_dsl
+        )
+
     def build_from_params(
         self,
         description: str,
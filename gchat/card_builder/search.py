@@ -11,10 +11,13 @@ This module provides standalone functions for:
 Extracted from SmartCardBuilderV2 (Phase 3 of migration plan).
 """
 
+import asyncio
 import hashlib
 import re
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from typing import Any, Dict, List, Optional
 
 from adapters.module_wrapper.types import ComponentPaths, JsonDict, Payload
@@ -135,6 +138,10 @@ def get_cache_key(
     return hashlib.md5(key_str.encode()).hexdigest()
 
 
+# Card builds run concurrently on worker threads and share the pattern cache
+_pattern_cache_lock = threading.Lock()
+
+
 def get_cached_pattern(
     cache_key: str,
     pattern_cache: Dict[str, Dict[str, Any]],
@@ -152,16 +159,17 @@ def get_cached_pattern(
     Returns:
         Cached pattern dict, or None if not found / expired
     """
-    if cache_key in pattern_cache:
-        timestamp = pattern_cache_timestamps.get(cache_key, 0)
-        if time.time() - timestamp < pattern_cache_ttl:
-            logger.debug(f"⚡ Cache hit for pattern query: {cache_key[:8]}...")
-            return pattern_cache[cache_key]
-        else:
-            # Expired, remove from cache
-            del pattern_cache[cache_key]
-            del pattern_cache_timestamps[cache_key]
-    return None
+    with _pattern_cache_lock:
+        if cache_key in pattern_cache:
+            timestamp = pattern_cache_timestamps.get(cache_key, 0)
+            if time.time() - timestamp < pattern_cache_ttl:
+                logger.debug(f"⚡ Cache hit for pattern query: {cache_key[:8]}...")
+                return pattern_cache[cache_key]
+            else:
+                # Expired, remove from cache
+                del pattern_cache[cache_key]
+                del pattern_cache_timestamps[cache_key]
+        return None
 
 
 def cache_pattern(
@@ -180,14 +188,18 @@ def cache_pattern(
         pattern_cache_timestamps: The timestamps dict (mutated in place)
         pattern_cache_max_size: Max entries before LRU eviction
     """
-    # Evict oldest entries if cache is full
-    if len(pattern_cache) >= pattern_cache_max_size:
-        oldest_key = min(pattern_cache_timestamps, key=pattern_cache_timestamps.get)
-        del pattern_cache[oldest_key]
-        del pattern_cache_timestamps[oldest_key]
+    with _pattern_cache_lock:
+        # Evict oldest entries if cache is full
+        if (
+            cache_key not in pattern_cache
+            and len(pattern_cache) >= pattern_cache_max_size
+        ):
+            oldest_key = min(pattern_cache_timestamps, key=pattern_cache_timestamps.get)
+            del pattern_cache[oldest_key]
+            del pattern_cache_timestamps[oldest_key]
 
-    pattern_cache[cache_key] = pattern
-    pattern_cache_timestamps[cache_key] = time.time()
+        pattern_cache[cache_key] = pattern
+        pattern_cache_timestamps[cache_key] = time.time()
 
 
 # =============================================================================
@@ -195,6 +207,171 @@ def cache_pattern(
 # =============================================================================
 
 
+def _wrapper_search_inputs(wrapper, description: str, card_params):
+    """Detect DSL and extract content_text for a wrapper pattern search.
+
+    Returns:
+        (has_dsl, content_text)
+    """
+    # Check for DSL in description (fast, synchronous - determines search strategy)
+    extracted = wrapper.extract_dsl_from_text(description)
+    has_dsl = extracted.get("has_dsl")
+
+    if has_dsl:
+        logger.info(f"🔤 DSL detected: {extracted['dsl']}")
+
+    # Extract content text from card_params for content-aware search
+    content_text = None
+    if card_params:
+        try:
+            from adapters.module_wrapper.pipeline_mixin import (
+                extract_content_text_from_params,
+            )
+
+            # Flatten symbol-keyed _items into standard keys for extraction
+            flat_params = {}
+            if isinstance(card_params, str):
+                import json
+
+                card_params = json.loads(card_params)
+            for k, v in card_params.items():
+                if isinstance(v, dict) and "_items" in v:
+                    # Symbol key with _items — extract text from items
+                    for item in v["_items"][:10]:
+                        if isinstance(item, dict):
+                            for field in (
+                                "text",
+                                "title",
+                                "label",
+                                "top_label",
+                                "bottom_label",
+                            ):
+                                val = item.get(field)
+                                if val and isinstance(val, str):
+                                    flat_params.setdefault("items", []).append(item)
+                elif not isinstance(v, dict):
+                    flat_params[k] = v
+            content_text = extract_content_text_from_params(flat_params, description)
+            if content_text:
+                logger.info(
+                    "📝 Extracted content_text for search: %s",
+                    content_text[:80] + "..."
+                    if len(content_text) > 80
+                    else content_text,
+                )
+        except Exception:
+            pass
+
+    return has_dsl, content_text
+
+
+def _select_wrapper_pattern(
+    content_patterns: List[Payload], dsl_results: Optional[List[Payload]]
+) -> Optional[Dict[str, Any]]:
+    """Pick the best wrapper search result (DSL match first, styles merged in)."""
+    # Find patterns with actual style_metadata content (for auto-styling)
+    styled_pattern = None
+    for pattern in content_patterns:
+        instance_params = pattern.get("instance_params", {})
+        style_meta = instance_params.get("style_metadata", {})
+        # Check for actual style content, not just empty dict
+        if style_meta.get("semantic_styles") or style_meta.get("jinja_filters"):
+            styled_pattern = pattern
+            logger.info(f"🎨 Found pattern with style_metadata: {style_meta}")
+            break
+
+    # Process DSL results if available
+    if dsl_results:
+        best = dsl_results[0]
+        component_paths = extract_paths_from_pattern(best)
+        instance_params = best.get("instance_params", {})
+
+        # Check if DSL result has actual style content (not just empty dict)
+        dsl_style = instance_params.get("style_metadata", {})
+        dsl_has_styles = dsl_style.get("semantic_styles") or dsl_style.get(
+            "jinja_filters"
+        )
+
+        # Merge style_metadata from styled_pattern if DSL result lacks actual styles
+        if styled_pattern and not dsl_has_styles:
+            styled_instance_params = styled_pattern.get("instance_params", {})
+            styled_style = styled_instance_params.get("style_metadata", {})
+            if styled_style.get("semantic_styles") or styled_style.get("jinja_filters"):
+                instance_params = {
+                    **instance_params,
+                    "style_metadata": styled_style,
+                }
+                logger.info(
+                    f"🎨 Merged style_metadata from similar pattern: {styled_style}"
+                )
+
+        return {
+            "component_paths": component_paths,
+            "instance_params": instance_params,
+            "structure_description": best.get("structure_description", ""),
+            "score": best.get("score", 0),
+            "source": "wrapper_dsl",
+        }
+
+    # No DSL results - use hybrid search results
+    if content_patterns:
+        # Prefer patterns with style_metadata
+        best = styled_pattern if styled_pattern else content_patterns[0]
+        component_paths = extract_paths_from_pattern(best)
+        return {
+            "component_paths": component_paths,
+            "instance_params": best.get("instance_params", {}),
+            "structure_description": best.get("structure_description", ""),
+            "score": best.get("score", 0),
+            "source": "wrapper_hybrid",
+        }
+
+    return None
+
+
+def _hybrid_search_kwargs(description: str, content_text: Optional[str]) -> dict:
+    return dict(
+        description=description,
+        component_paths=None,
+        limit=5,
+        token_ratio=1.0,
+        content_feedback="positive",
+        form_feedback="positive",
+        include_classes=False,  # Only want patterns
+        content_text=content_text,
+    )
+
+
+def _dsl_search_kwargs(description: str) -> dict:
+    return dict(
+        text=description,
+        limit=5,
+        score_threshold=0.3,
+        vector_name="inputs",  # Search for patterns
+        type_filter="instance_pattern",
+    )
+
+
+# Event loop of an async caller that moved card building to a worker thread
+# (see ``run_with_async_search``); sync searches are handed back to it.
+_search_loop: ContextVar[Optional[asyncio.AbstractEventLoop]] = ContextVar(
+    "card_search_loop", default=None
+)
+
+
+async def run_with_async_search(fn, /, *args, **kwargs):
+    """Run sync card-building ``fn`` in a worker thread.
+
+    Pattern searches made by ``fn`` run as ``query_wrapper_patterns_async``
+    on the calling event loop instead of blocking it.
+    """
+    token = _search_loop.set(asyncio.get_running_loop())
+    try:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    finally:
+        _search_loop.reset(token)
+
+
 def query_wrapper_patterns(
     description: str,
     card_params: Optional[Dict[str, Any]] = None,
@@ -205,7 +382,9 @@ def query_wrapper_patterns(
     Uses DSL-aware search when DSL symbols are detected in the description,
     otherwise falls back to hybrid V7 search with positive feedback filters.
 
-    Searches are parallelized when DSL is detected for improved latency.
+    Inside ``run_with_async_search`` the search is delegated to
+    ``query_wrapper_patterns_async`` on the caller's loop; otherwise the two
+    searches run in parallel threads.
 
     Args:
         description: Card description (may include DSL symbols)
@@ -214,153 +393,74 @@ def query_wrapper_patterns(
     Returns:
         Dict with component_paths, instance_params from best match, or None
     """
+    loop = _search_loop.get()
+    if loop is not None and loop.is_running():
+        return asyncio.run_coroutine_threadsafe(
+            query_wrapper_patterns_async(description, card_params), loop
+        ).result()
+
     try:
         from gchat.card_framework_wrapper import get_card_framework_wrapper
 
         wrapper = get_card_framework_wrapper()
-
-        # Check for DSL in description (fast, synchronous - determines search strategy)
-        extracted = wrapper.extract_dsl_from_text(description)
-        has_dsl = extracted.get("has_dsl")
-
-        if has_dsl:
-            logger.info(f"🔤 DSL detected: {extracted['dsl']}")
-
-        # Extract content text from card_params for content-aware search
-        content_text = None
-        if card_params:
-            try:
-                from adapters.module_wrapper.pipeline_mixin import (
-                    extract_content_text_from_params,
-                )
-
-                # Flatten symbol-keyed _items into standard keys for extraction
-                flat_params = {}
-                if isinstance(card_params, str):
-                    import json
-
-                    card_params = json.loads(card_params)
-                for k, v in card_params.items():
-                    if isinstance(v, dict) and "_items" in v:
-                        # Symbol key with _items — extract text from items
-                        for item in v["_items"][:10]:
-                            if isinstance(item, dict):
-                                for field in (
-                                    "text",
-                                    "title",
-                                    "label",
-                                    "top_label",
-                                    "bottom_label",
-                                ):
-                                    val = item.get(field)
-                                    if val and isinstance(val, str):
-                                        flat_params.setdefault("items", []).append(item)
-                    elif not isinstance(v, dict):
-                        flat_params[k] = v
-                content_text = extract_content_text_from_params(
-                    flat_params, description
-                )
-                if content_text:
-                    logger.info(
-                        "📝 Extracted content_text for search: %s",
-                        content_text[:80] + "..."
-                        if len(content_text) > 80
-                        else content_text,
-                    )
-            except Exception:
-                pass
+        has_dsl, content_text = _wrapper_search_inputs(
+            wrapper, description, card_params
+        )
 
         # Run searches in parallel when DSL is detected (both searches are independent)
         with ThreadPoolExecutor(max_workers=2) as executor:
             # Always submit hybrid search for style_metadata extraction
             hybrid_future = executor.submit(
                 wrapper.search_hybrid_dispatch,
-                description=description,
-                component_paths=None,
-                limit=5,
-                token_ratio=1.0,
-                content_feedback="positive",
-                form_feedback="positive",
-                include_classes=False,  # Only want patterns
-                content_text=content_text,
+                **_hybrid_search_kwargs(description, content_text),
             )
-
-            # Conditionally submit DSL search in parallel
-            dsl_future = None
-            if has_dsl:
-                dsl_future = executor.submit(
-                    wrapper.search_by_dsl,
-                    text=description,
-                    limit=5,
-                    score_threshold=0.3,
-                    vector_name="inputs",  # Search for patterns
-                    type_filter="instance_pattern",
+            dsl_future = (
+                executor.submit(
+                    wrapper.search_by_dsl, **_dsl_search_kwargs(description)
                 )
+                if has_dsl
+                else None
+            )
 
             # Gather results (blocks until complete)
-            class_results, content_patterns, form_patterns = hybrid_future.result()
+            _, content_patterns, _ = hybrid_future.result()
             dsl_results = dsl_future.result() if dsl_future else None
 
-        # Find patterns with actual style_metadata content (for auto-styling)
-        styled_pattern = None
-        for pattern in content_patterns:
-            instance_params = pattern.get("instance_params", {})
-            style_meta = instance_params.get("style_metadata", {})
-            # Check for actual style content, not just empty dict
-            if style_meta.get("semantic_styles") or style_meta.get("jinja_filters"):
-                styled_pattern = pattern
-                logger.info(f"🎨 Found pattern with style_metadata: {style_meta}")
-                break
-
-        # Process DSL results if available
-        if dsl_results:
-            best = dsl_results[0]
-            component_paths = extract_paths_from_pattern(best)
-            instance_params = best.get("instance_params", {})
-
-            # Check if DSL result has actual style content (not just empty dict)
-            dsl_style = instance_params.get("style_metadata", {})
-            dsl_has_styles = dsl_style.get("semantic_styles") or dsl_style.get(
-                "jinja_filters"
-            )
+        return _select_wrapper_pattern(content_patterns, dsl_results)
 
-            # Merge style_metadata from styled_pattern if DSL result lacks actual styles
-            if styled_pattern and not dsl_has_styles:
-                styled_instance_params = styled_pattern.get("instance_params", {})
-                styled_style = styled_instance_params.get("style_metadata", {})
-                if styled_style.get("semantic_styles") or styled_style.get(
-                    "jinja_filters"
-                ):
-                    instance_params = {
-                        **instance_params,
-                        "style_metadata": styled_style,
-                    }
-                    logger.info(
-                        f"🎨 Merged style_metadata from similar pattern: {styled_style}"
-                    )
+    except Exception as e:
+        logger.debug(f"Wrapper pattern search failed: {e}")
+        return None
 
-            return {
-                "component_paths": component_paths,
-                "instance_params": instance_params,
-                "structure_description": best.get("structure_description", ""),
-                "score": best.get("score", 0),
-                "source": "wrapper_dsl",
-            }
 
-        # No DSL results - use hybrid search results
-        if content_patterns:
-            # Prefer patterns with style_metadata
-            best = styled_pattern if styled_pattern else content_patterns[0]
-            component_paths = extract_paths_from_pattern(best)
-            return {
-                "component_paths": component_paths,
-                "instance_params": best.get("instance_params", {}),
-                "structure_description": best.get("structure_description", ""),
-                "score": best.get("score", 0),
-                "source": "wrapper_hybrid",
-            }
+async def query_wrapper_patterns_async(
+    description: str,
+    card_params: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Async ``query_wrapper_patterns``: hybrid search via ``search_hybrid_dispatch_async``."""
+    try:
+        from gchat.card_framework_wrapper import get_card_framework_wrapper
 
-        return None
+        wrapper = get_card_framework_wrapper()
+        has_dsl, content_text = _wrapper_search_inputs(
+            wrapper, description, card_params
+        )
+
+        hybrid = wrapper.search_hybrid_dispatch_async(
+            **_hybrid_search_kwargs(description, content_text)
+        )
+        if has_dsl:
+            (_, content_patterns, _), dsl_results = await asyncio.gather(
+                hybrid,
+                asyncio.to_thread(
+                    wrapper.search_by_dsl, **_dsl_search_kwargs(description)
+                ),
+            )
+        else:
+            _, content_patterns, _ = await hybrid
+            dsl_results = None
+
+        return _select_wrapper_pattern(content_patterns, dsl_results)
 
     except Exception as e:
         logger.debug(f"Wrapper pattern search failed: {e}")
@@ -1,19 +1,21 @@
 """Centralized card delivery with auto-split and retry.
 
 Detects oversized payloads, splits them on section boundaries,
-and sends each part with exponential-backoff retry.
+and sends each part with exponential-backoff retry.  Webhook parts go
+through the pooled async client in ``gchat.webhook_client`` (per-space rate
+limit, ``Retry-After``-aware backoff) and can optionally be queued so the
+caller returns as soon as the card is accepted.
 """
 
 import asyncio
 import copy
 import json
 import math
-import time
 import urllib.parse
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-import requests
+import httpx
 
 from auth.audit import log_security_event
 from config.enhanced_logging import setup_logger
@@ -24,6 +26,7 @@ from gchat.card_tools import (
     _redact_webhook_url,
     _validate_webhook_url,
 )
+from gchat.webhook_client import get_delivery_queue, get_webhook_client
 
 logger = setup_logger(__name__)
 
@@ -33,10 +36,8 @@ logger = setup_logger(__name__)
 
 GCHAT_WEBHOOK_MAX_BYTES = 32_000  # Empirically determined webhook limit (~32KB)
 GCHAT_WEBHOOK_SAFE_BYTES = 24_000  # 75% of max — split threshold
-GCHAT_WEBHOOK_TIMEOUT = 30  # seconds per request
 GCHAT_DELIVERY_MAX_RETRIES = 3
 GCHAT_MAX_BACKOFF_SECONDS = 16
-GCHAT_INTER_PART_DELAY = 0.5  # seconds between split parts
 
 
 # ---------------------------------------------------------------------------
@@ -53,6 +54,8 @@ class DeliveryResult:
     thread_key: Optional[str] = None
     error: Optional[str] = None
     failed_part: Optional[int] = None  # 1-indexed
+    queued: bool = False  # accepted for background delivery, not yet sent
+    delivery_id: Optional[str] = None  # DeliveryQueue ID when queued
 
 
 # ---------------------------------------------------------------------------
@@ -314,46 +317,6 @@ def _is_retryable_status(code: int) -> bool:
     return code == 429 or code >= 500
 
 
-def _post_webhook_with_retry(
-    url: str,
-    payload: dict,
-    *,
-    max_retries: int = GCHAT_DELIVERY_MAX_RETRIES,
-    timeout: int = GCHAT_WEBHOOK_TIMEOUT,
-) -> requests.Response:
-    """POST *payload* to *url* with exponential-backoff retry."""
-    last_exc: Optional[Exception] = None
-    for attempt in range(max_retries):
-        try:
-            resp = requests.post(
-                url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=timeout,
-            )
-            if not _is_retryable_status(resp.status_code):
-                return resp
-            # Retryable HTTP status — fall through to backoff
-            last_exc = None
-        except (requests.Timeout, requests.ConnectionError) as exc:
-            last_exc = exc
-
-        if attempt < max_retries - 1:
-            delay = min(2**attempt, GCHAT_MAX_BACKOFF_SECONDS)
-            logger.warning(
-                "Webhook POST attempt %d/%d failed — retrying in %ds",
-                attempt + 1,
-                max_retries,
-                delay,
-            )
-            time.sleep(delay)
-
-    # Final attempt (or return last retryable response)
-    if last_exc is not None:
-        raise last_exc
-    return resp  # type: ignore[possibly-undefined]
-
-
 async def _send_api_with_retry(
     chat_service: Any,
     request_params: dict,
@@ -371,8 +334,7 @@ async def _send_api_with_retry(
             )
             return result
         except HttpError as exc:
-            status = exc.resp.status
-            if (status == 429 or status >= 500) and attempt < max_retries - 1:
+            if _is_retryable_status(exc.resp.status) and attempt < max_retries - 1:
                 last_exc = exc
             else:
                 raise
@@ -396,6 +358,65 @@ async def _send_api_with_retry(
     raise RuntimeError("_send_api_with_retry called with max_retries=0")
 
 
+async def _deliver_webhook_parts(
+    webhook_url: str, parts: List[dict], thread_key: Optional[str]
+) -> DeliveryResult:
+    """Send prepared parts in order through the pooled webhook client."""
+    client = get_webhook_client()
+    total_parts = len(parts)
+    resp = None
+
+    for idx, part in enumerate(parts):
+        part_num = idx + 1
+        logger.info(
+            "Sending part %d/%d via webhook (%d bytes)",
+            part_num,
+            total_parts,
+            _estimate_payload_bytes(part),
+        )
+        logger.debug("Webhook URL: %s", _redact_webhook_url(webhook_url))
+        logger.debug("Payload: %s", json.dumps(part, indent=2))
+
+        try:
+            resp = await client.post(webhook_url, part)
+        except httpx.TransportError as exc:
+            return DeliveryResult(
+                success=False,
+                error=f"Part {part_num}/{total_parts} network error: {exc}",
+                parts_sent=idx,
+                failed_part=part_num,
+                thread_key=thread_key,
+            )
+
+        logger.info(
+            "Part %d/%d response: status=%d body=%s",
+            part_num,
+            total_parts,
+            resp.status_code,
+            resp.text[:200],
+        )
+
+        if resp.status_code >= 400:
+            return DeliveryResult(
+                success=False,
+                status_code=resp.status_code,
+                response_text=resp.text,
+                error=f"Part {part_num}/{total_parts} failed: HTTP {resp.status_code}",
+                parts_sent=idx,
+                failed_part=part_num,
+                thread_key=thread_key,
+            )
+
+    # All parts succeeded — return last response info
+    return DeliveryResult(
+        success=True,
+        status_code=resp.status_code if resp is not None else None,
+        response_text=resp.text if resp is not None else None,
+        parts_sent=total_parts,
+        thread_key=thread_key,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
@@ -409,6 +430,7 @@ async def deliver_card_message(
     space_id: Optional[str] = None,
     thread_key: Optional[str] = None,
     builder: Any = None,
+    background: bool = False,
 ) -> DeliveryResult:
     """Estimate payload size, split if needed, and deliver with retry.
 
@@ -422,6 +444,8 @@ async def deliver_card_message(
         space_id: Target space (required for API path).
         thread_key: Thread key for threading all parts together.
         builder: SmartCardBuilderV2 instance (used for ``_clean_card_metadata``).
+        background: Webhook only — queue the parts and return immediately with
+            ``queued=True`` and a ``delivery_id`` instead of waiting for sends.
     """
     # --- estimate & split (before metadata cleaning) -----------------------
     cleaned_body = clean_card_metadata(message_body)
@@ -473,63 +497,24 @@ async def deliver_card_message(
             },
         )
 
-        for idx, part in enumerate(parts):
-            part_num = idx + 1
-            logger.info(
-                "Sending part %d/%d via webhook (%d bytes)",
-                part_num,
-                total_parts,
-                _estimate_payload_bytes(part),
+        if background:
+            delivery_id = get_delivery_queue().submit(
+                lambda: _deliver_webhook_parts(webhook_url, parts, thread_key)
             )
-            logger.debug("Webhook URL: %s", _redact_webhook_url(webhook_url))
-            logger.debug("Payload: %s", json.dumps(part, indent=2))
-
-            try:
-                resp = await asyncio.to_thread(
-                    _post_webhook_with_retry,
-                    webhook_url,
-                    part,
-                )
-            except (requests.Timeout, requests.ConnectionError) as exc:
-                return DeliveryResult(
-                    success=False,
-                    error=f"Part {part_num}/{total_parts} network error: {exc}",
-                    parts_sent=idx,
-                    failed_part=part_num,
-                    thread_key=thread_key_for_result,
-                )
-
             logger.info(
-                "Part %d/%d response: status=%d body=%s",
-                part_num,
+                "Queued %d part(s) for webhook delivery (id=%s)",
                 total_parts,
-                resp.status_code,
-                resp.text[:200],
+                delivery_id,
             )
-
-            if _is_retryable_status(resp.status_code) or resp.status_code >= 400:
-                return DeliveryResult(
-                    success=False,
-                    status_code=resp.status_code,
-                    response_text=resp.text,
-                    error=f"Part {part_num}/{total_parts} failed: HTTP {resp.status_code}",
-                    parts_sent=idx,
-                    failed_part=part_num,
-                    thread_key=thread_key_for_result,
-                )
-
-            # Inter-part delay
-            if part_num < total_parts:
-                await asyncio.sleep(GCHAT_INTER_PART_DELAY)
-
-        # All parts succeeded — return last response info
-        return DeliveryResult(
-            success=True,
-            status_code=resp.status_code,  # type: ignore[possibly-undefined]
-            response_text=resp.text,  # type: ignore[possibly-undefined]
-            parts_sent=total_parts,
-            thread_key=thread_key_for_result,
-        )
+            return DeliveryResult(
+                success=True,
+                status_code=202,
+                parts_sent=total_parts,
+                thread_key=thread_key_for_result,
+                queued=True,
+                delivery_id=delivery_id,
+            )
+        return await _deliver_webhook_parts(webhook_url, parts, thread_key)
 
     # --- API delivery ------------------------------------------------------
     if chat_service is None:
@@ -544,6 +529,7 @@ async def deliver_card_message(
         _process_thread_key_for_request(request_params, thread_key)
 
         logger.info("Sending part %d/%d via Chat API", part_num, total_parts)
+        await get_webhook_client().acquire_slot(f"api:{space_id}")
 
         try:
             api_result = await _send_api_with_retry(chat_service, request_params)
@@ -563,9 +549,6 @@ async def deliver_card_message(
                 thread_key = thread_name
                 thread_key_for_result = thread_name
 
-        if part_num < total_parts:
-            await asyncio.sleep(GCHAT_INTER_PART_DELAY)
-
     return DeliveryResult(
         success=True,
         response_text=json.dumps(api_result),  # type: ignore[possibly-undefined]
@@ -36,6 +36,7 @@ from gchat.wrapper_api import (
     parse_dsl,
     search_components,
     search_patterns_for_card,
+    search_patterns_for_card_async,
     validate_dsl,
 )
 from gchat.wrapper_setup import (
@@ -102,5 +103,6 @@ __all__ = [
     "parse_dsl",
     "search_components",
     "search_patterns_for_card",
+    "search_patterns_for_card_async",
     "validate_dsl",
 ]
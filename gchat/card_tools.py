@@ -667,7 +667,7 @@ def setup_card_tools(mcp: FastMCP) -> None:
 
             # Build card via SmartCardBuilder (same path as normal send)
             builder = get_smart_card_builder()
-            google_format_card = builder.build_from_params(
+            google_format_card = await builder.build_from_params_async(
                 description=variation.card_description,
                 card_params=var_params,
             )
@@ -690,10 +690,8 @@ def setup_card_tools(mcp: FastMCP) -> None:
 
             if delivery.success:
                 variations_sent.append(variation.label)
-
-            # Rate limit safety between sends
-            if idx < 3:
-                await asyncio.sleep(0.5)
+            # Spacing between sends is handled by the per-space rate limit
+            # in deliver_card_message
 
         return SendDynamicCardResponse(
             success=len(variations_sent) > 0,
@@ -989,7 +987,7 @@ def setup_card_tools(mcp: FastMCP) -> None:
                 try:
                     builder = get_smart_card_builder()
 
-                    google_format_card = builder.build_from_params(
+                    google_format_card = await builder.build_from_params_async(
                         description=card_description,
                         card_params=card_params,
                         suggested_dsl=suggested_dsl,
@@ -1259,6 +1257,8 @@ def setup_card_tools(mcp: FastMCP) -> None:
                 space_id=space_id,
                 thread_key=thread_key,
                 builder=builder,
+                background=bool(webhook_url)
+                and settings.chat_webhook_background_delivery,
             )
 
             # Build response — common fields shared by success and failure
@@ -1314,11 +1314,16 @@ def setup_card_tools(mcp: FastMCP) -> None:
                 pass
 
             if delivery.success:
-                msg = (
-                    f"Card message sent successfully via {delivery_method}"
-                    if webhook_url
-                    else f"Card message sent successfully to space '{space_id}'"
-                )
+                if delivery.queued:
+                    msg = (
+                        f"Card message queued for {delivery_method} delivery "
+                        f"(delivery_id={delivery.delivery_id}; status at "
+                        f"chat://delivery/{delivery.delivery_id})"
+                    )
+                elif webhook_url:
+                    msg = f"Card message sent successfully via {delivery_method}"
+                else:
+                    msg = f"Card message sent successfully to space '{space_id}'"
                 return SendDynamicCardResponse(
                     success=True,
                     validationIssues=content_issues if content_issues else None,
@@ -71,7 +71,6 @@ For more details: https://developers.google.com/chat/format-messages
 """
 
 import asyncio
-import json
 
 from fastmcp import FastMCP
 from googleapiclient.errors import HttpError
@@ -96,6 +95,8 @@ from .chat_types import (
     SpaceInfo,
     SpaceListResponse,
 )
+from .member_directory import get_member_directory, resolve_sender
+from .message_search import search_all_spaces
 
 logger = setup_logger()
 
@@ -402,6 +403,18 @@ async def _get_chat_service_with_fallback(user_google_email: UserGoogleEmail):
     return None
 
 
+def _space_info(space: Dict[str, Any]) -> SpaceInfo:
+    """``list_spaces`` entry for a Chat API space resource."""
+    return {
+        "id": space.get("name", ""),
+        "displayName": space.get("displayName", "Unnamed Space"),
+        "spaceType": space.get("spaceType", "UNKNOWN"),
+        "singleUserBotDm": space.get("singleUserBotDm"),
+        "threaded": space.get("threaded"),
+        "spaceHistoryState": space.get("spaceHistoryState"),
+    }
+
+
 async def _send_text_message_helper(
     space_id: str,
     message_text: str,
@@ -558,15 +571,7 @@ def setup_chat_tools(mcp: FastMCP) -> None:
             # Convert to structured format
             spaces: List[SpaceInfo] = []
             for space in items:
-                space_info: SpaceInfo = {
-                    "id": space.get("name", ""),
-                    "displayName": space.get("displayName", "Unnamed Space"),
-                    "spaceType": space.get("spaceType", "UNKNOWN"),
-                    "singleUserBotDm": space.get("singleUserBotDm"),
-                    "threaded": space.get("threaded"),
-                    "spaceHistoryState": space.get("spaceHistoryState"),
-                }
-                spaces.append(space_info)
+                spaces.append(_space_info(space))
 
             logger.info(
                 f"Found {len(spaces)} Chat spaces (type: {space_type}) for {user_email}"
@@ -657,103 +662,30 @@ def setup_chat_tools(mcp: FastMCP) -> None:
             # Convert to structured format with enriched sender information
             messages: List[MessageInfo] = []
 
-            # Collect unique sender IDs for batch lookup
-            sender_ids = set()
-            for msg in items:
-                sender = msg.get("sender", {})
-                sender_id = sender.get("name")
-                if sender_id and sender_id.startswith("users/"):
-                    sender_ids.add(sender_id)
-
-            # Fetch sender details in batch if we have any IDs
-            sender_details_cache = {}
-            if sender_ids:
-                logger.info(
-                    f"🔍 Fetching member details for {len(sender_ids)} unique senders..."
-                )
-                for sender_id in sender_ids:
-                    try:
-                        # Extract just the numeric ID from "users/12345" format
-                        member_id = (
-                            sender_id.split("/")[-1] if "/" in sender_id else sender_id
-                        )
-                        # Correct format: spaces/{space}/members/{numericId}
-                        member_resource_name = f"{space_id}/members/{member_id}"
-                        logger.debug(
-                            f"📝 Fetching member: {member_resource_name} (from sender_id: {sender_id})"
-                        )
-
-                        member_info = await asyncio.to_thread(
-                            chat_service.spaces()
-                            .members()
-                            .get(name=member_resource_name)
-                            .execute
-                        )
-
-                        # DEBUG: Log the full API response to see what data is available
-                        logger.info(f"📊 API Response for {member_resource_name}:")
-                        logger.info(f"   Response keys: {list(member_info.keys())}")
-                        logger.info(
-                            f"   Full response: {json.dumps(member_info, indent=2, default=str)}"
-                        )
-
-                        # Extract user information from member response
-                        member_data = member_info.get("member", {})
-                        logger.info(
-                            f"   member_data keys: {list(member_data.keys()) if member_data else 'None'}"
-                        )
-
-                        display_name = (
-                            member_data.get("displayName")
-                            or member_info.get("displayName")
-                            or member_data.get("name", "Unknown User")
-                        )
-                        email = member_data.get("email") or member_info.get("email")
-
-                        sender_details_cache[sender_id] = {
-                            "displayName": display_name,
-                            "email": email,
-                        }
-                        logger.info(
-                            f"✅ Extracted - {sender_id}: {display_name} ({email or 'no email'})"
-                        )
-
-                    except HttpError as http_err:
-                        logger.warning(
-                            f"❌ HTTP error fetching member {sender_id}: {http_err}"
-                        )
-                        sender_details_cache[sender_id] = {
-                            "displayName": sender_id,
-                            "email": None,
-                        }
-                    except Exception as e:
-                        logger.warning(
-                            f"❌ Could not fetch member details for {sender_id}: {e}"
-                        )
-                        sender_details_cache[sender_id] = {
-                            "displayName": sender_id,
-                            "email": None,
-                        }
+            # Resolve senders from the cached space member directory (one
+            # paginated members.list per cold space, not one get per sender)
+            members = {}
+            if any(
+                (msg.get("sender", {}).get("name") or "").startswith("users/")
+                for msg in items
+            ):
+                try:
+                    members = await get_member_directory().get_members(
+                        chat_service,
+                        user_google_email,
+                        space_id,
+                        service_factory=lambda: _get_chat_service_with_fallback(
+                            user_google_email
+                        ),
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not load members for {space_id}: {e}")
 
             # Process messages with enriched sender data
             for msg in items:
-                sender = msg.get("sender", {})
-                sender_id = sender.get("name", "")
-
-                # Use cached sender details if available
-                if sender_id in sender_details_cache:
-                    sender_name = sender_details_cache[sender_id]["displayName"]
-                    sender_email = sender_details_cache[sender_id]["email"]
-                else:
-                    # Fallback to original extraction
-                    sender_name = (
-                        sender.get("displayName") or sender_id or "Unknown Sender"
-                    )
-                    sender_email = (
-                        sender.get("email")
-                        or sender.get("emailAddress")
-                        or sender.get("user", {}).get("email")
-                    )
+                sender_name, sender_email = resolve_sender(
+                    msg.get("sender", {}), members
+                )
 
                 message_info: MessageInfo = {
                     "id": msg.get("name", ""),
@@ -949,6 +881,7 @@ def setup_chat_tools(mcp: FastMCP) -> None:
         space_id: Optional[str] = None,
         user_google_email: UserGoogleEmail = None,
         page_size: int = 25,
+        mode: Literal["live", "index"] = "live",
     ) -> SearchMessagesResponse:
         """
         Searches for messages in Google Chat spaces by text content.
@@ -958,6 +891,10 @@ def setup_chat_tools(mcp: FastMCP) -> None:
             query (str): The search query. Required.
             space_id (Optional[str]): Search within a specific space ID (default: search all).
             page_size (int): Number of results per space (default: 25).
+            mode (str): Cross-space strategy when no space_id is given: 'live'
+                fetches every space concurrently under a deadline; 'index'
+                incrementally refreshes and queries a local index of recent
+                messages. Coverage metadata reports any skipped spaces.
 
         Returns:
             SearchMessagesResponse: Structured response with search results.
@@ -1006,42 +943,52 @@ def setup_chat_tools(mcp: FastMCP) -> None:
                     )
                     search_results.append(result)
             else:
-                # Search across all accessible spaces
-                spaces_response = await asyncio.to_thread(
-                    chat_service.spaces().list(pageSize=100).execute
+                # Search every accessible space (bounded fan-out + deadline)
+                hits, coverage = await search_all_spaces(
+                    chat_service,
+                    lambda: _get_chat_service_with_fallback(user_google_email),
+                    user_google_email,
+                    query,
+                    per_space_limit=page_size,
+                    mode=mode,
                 )
-                spaces = spaces_response.get("spaces", [])
                 search_scope = "all_spaces"
 
-                for space in spaces[:10]:  # Limit to first 10 spaces to avoid timeout
-                    try:
-                        space_messages = await asyncio.to_thread(
-                            chat_service.spaces()
-                            .messages()
-                            .list(
-                                parent=space.get("name"),
-                                pageSize=5,
-                                filter=f'text:"{query}"',
-                            )
-                            .execute
+                for msg in hits:
+                    search_results.append(
+                        SearchMessageResult(
+                            messageId=msg.get("name", ""),
+                            text=msg.get("text", "No text content"),
+                            senderName=msg["_senderName"],
+                            createTime=msg.get("createTime", "Unknown Time"),
+                            spaceName=msg["_spaceName"],
+                            spaceId=msg["_spaceId"],
                         )
-                        space_msgs = space_messages.get("messages", [])
-                        space_name = space.get("displayName", "Unknown Space")
-
-                        for msg in space_msgs:
-                            result = SearchMessageResult(
-                                messageId=msg.get("name", ""),
-                                text=msg.get("text", "No text content"),
-                                senderName=msg.get("sender", {}).get(
-                                    "displayName", "Unknown Sender"
-                                ),
-                                createTime=msg.get("createTime", "Unknown Time"),
-                                spaceName=space_name,
-                                spaceId=space.get("name", ""),
-                            )
-                            search_results.append(result)
-                    except HttpError:
-                        continue  # Skip spaces we can't access
+                    )
+
+                if not coverage["complete"]:
+                    logger.warning(
+                        f"[search_messages] Partial coverage: "
+                        f"{coverage['spacesSearched']}/{coverage['spacesTotal']} spaces "
+                        f"({coverage['spacesTimedOut']} timed out, "
+                        f"{coverage['spacesFailed']} failed)"
+                    )
+                return SearchMessagesResponse(
+                    success=True,
+                    query=query,
+                    results=search_results,
+                    totalResults=len(search_results),
+                    searchScope=search_scope,
+                    spaceId=None,
+                    userEmail=user_google_email or "",
+                    message=(
+                        f"Found {len(search_results)} messages matching '{query}' in "
+                        f"{coverage['spacesSearched']}/{coverage['spacesTotal']} spaces"
+                        + ("" if coverage["complete"] else " (partial results)")
+                    ),
+                    error=None,
+                    coverage=coverage,
+                )
 
             return SearchMessagesResponse(
                 success=True,
@@ -1247,26 +1194,23 @@ def setup_chat_tools(mcp: FastMCP) -> None:
                         error="Service unavailable",
                     )
 
-                response = await asyncio.to_thread(
-                    chat_service.spaces()
-                    .members()
-                    .list(parent=space_id, pageSize=100)
-                    .execute
+                # Always read through to the API: a cached list would hide a
+                # permission error (e.g. access revoked) for up to the TTL.
+                # The fresh result still repopulates the directory.
+                directory_members = await get_member_directory().get_members(
+                    chat_service, user_google_email, space_id, force_refresh=True
                 )
-                memberships = response.get("memberships", [])
-                members = []
-                for m in memberships:
-                    member_data = m.get("member", {})
-                    members.append(
-                        MemberInfo(
-                            name=m.get("name", ""),
-                            email=member_data.get("email"),
-                            displayName=member_data.get("displayName", "Unknown"),
-                            role=m.get("role", "ROLE_MEMBER"),
-                            type=member_data.get("type", "HUMAN"),
-                            createTime=m.get("createTime"),
-                        )
+                members = [
+                    MemberInfo(
+                        name=m["membership"],
+                        email=m.get("email"),
+                        displayName=m.get("displayName", "Unknown"),
+                        role=m.get("role", "ROLE_MEMBER"),
+                        type=m.get("type", "HUMAN"),
+                        createTime=m.get("createTime"),
                     )
+                    for m in directory_members.values()
+                ]
                 return ManageSpaceResponse(
                     success=True,
                     action=action,
@@ -1322,6 +1266,9 @@ def setup_chat_tools(mcp: FastMCP) -> None:
                     .create(parent=space_id, body=membership_body)
                     .execute
                 )
+                get_member_directory().record_membership(
+                    user_google_email, space_id, result
+                )
                 return ManageSpaceResponse(
                     success=True,
                     action=action,
@@ -1355,6 +1302,7 @@ def setup_chat_tools(mcp: FastMCP) -> None:
                 await asyncio.to_thread(
                     chat_service.spaces().members().delete(name=member_name).execute
                 )
+                get_member_directory().remove_membership(user_google_email, member_name)
                 return ManageSpaceResponse(
                     success=True,
                     action=action,
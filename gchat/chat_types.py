@@ -7,7 +7,7 @@ enabling FastMCP to automatically generate JSON schemas for better MCP client in
 
 from pydantic import BaseModel
 from pydantic import Field as PydanticField
-from typing_extensions import List, NotRequired, Optional, TypedDict
+from typing_extensions import Any, Dict, List, NotRequired, Optional, TypedDict
 
 
 class SpaceInfo(TypedDict):
@@ -172,6 +172,8 @@ class SearchMessagesResponse(TypedDict):
     userEmail: str
     message: str
     error: NotRequired[Optional[str]]
+    # all_spaces only: mode, spacesTotal/Searched/Failed/TimedOut, complete, ...
+    coverage: NotRequired[Dict[str, Any]]
 
 
 class MemberInfo(TypedDict):
@@ -0,0 +1,410 @@
+"""
+Per-user incremental state behind ``chat://digest``.
+
+The digest used to be rebuilt from scratch on every read: ``spaces.list``
+and then a ``messages.list`` per space, all on one thread, re-downloading
+messages the previous read had already returned.  ``ChatDigestStore`` keeps,
+per user and space:
+
+- ``lastMessageCreateTime`` — the newest message seen; later refreshes ask
+  only for ``createTime > watermark``;
+- the space's ``lastActiveTime`` — spaces whose activity has not advanced
+  since the last refresh are not queried at all;
+- the newest ``MAX_MESSAGES_PER_SPACE`` messages inside ``MAX_HOURS``, with
+  senders already resolved, which is everything a digest read can ask for.
+
+State is saved as one encrypted file per user (``CHAT_DIGEST_STORE_DIR``)
+so restarts resume from the watermarks.  The file holds message text, so it
+is gzipped JSON sealed with a per-user Fernet key derived from the server
+secret (``.auth_encryption_key``); without that secret the store stays in
+memory only.  With ``CHAT_DIGEST_REFRESH_SECONDS``
+set, users who read the digest are refreshed in the background and reads are
+answered from the store without any API call.
+
+Usage:
+    store = get_digest_store(user_email)
+    await store.refresh(chat_service)               # or refresh(..., space_id)
+    spaces = store.build(hours_back=24, limit=10)   # List[DigestSpace]
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from config.cache_registry import (
+    CacheHandle,
+    evict_first,
+    register_cache,
+    sampled_size,
+)
+from config.enhanced_logging import setup_logger
+from gchat.chat_types import DigestMessage, DigestSpace
+from gchat.member_directory import get_member_directory, resolve_sender
+from gchat.message_search import fetch_messages_since_sync
+
+logger = setup_logger()
+
+MAX_SPACES = 15  # Spaces scanned per refresh (first page of spaces.list)
+MAX_HOURS = 168  # Largest digest window
+MAX_MESSAGES_PER_SPACE = 50  # Largest per-space digest limit
+_STORE_VERSION = 2
+_MAX_STORES = 64
+_IDLE_STOP_SECONDS = 1800  # Background refresh stops after this long unread
+
+ServiceFactory = Callable[[], Awaitable[Any]]
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _cutoff(hours: float) -> str:
+    return _iso(datetime.now(timezone.utc) - timedelta(hours=hours))
+
+
+@dataclass
+class _SpaceState:
+    display_name: str = "Unnamed Space"
+    space_type: str = "UNKNOWN"
+    last_active_time: Optional[str] = None
+    last_message_create_time: Optional[str] = None  # watermark
+    # DigestMessage dicts, newest first
+    messages: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class ChatDigestStore:
+    """Digest state for one user: per-space watermarks and recent messages."""
+
+    def __init__(
+        self,
+        user_email: str,
+        path: Optional[Path] = None,
+        fernet: Optional[Fernet] = None,
+    ):
+        self.user_email = user_email
+        # Message text never touches disk unencrypted
+        self.path = path if fernet is not None else None
+        self._fernet = fernet
+        self._spaces: Dict[str, _SpaceState] = {}
+        self._order: List[str] = []  # Space IDs from the last full refresh
+        self._lock = threading.Lock()
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self.refreshed_at: Optional[float] = None  # unix seconds
+        self.last_read_at = time.time()
+        self.stats = {"fetched_spaces": 0, "skipped_spaces": 0, "new_messages": 0}
+        self._background: Optional[asyncio.Task] = None
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Refresh (runs on one worker thread: httplib2 is not thread-safe)
+    # ------------------------------------------------------------------
+
+    def _refresh_space_sync(self, chat_service, space: Dict[str, Any]) -> None:
+        space_id = space.get("name", "")
+        active = space.get("lastActiveTime")
+        with self._lock:
+            state = self._spaces.setdefault(space_id, _SpaceState())
+            state.display_name = space.get("displayName", state.display_name)
+            state.space_type = space.get("spaceType", state.space_type)
+            if active and state.last_active_time and active <= state.last_active_time:
+                self.stats["skipped_spaces"] += 1
+                return
+            cutoff = _cutoff(MAX_HOURS)
+            since = max(state.last_message_create_time or cutoff, cutoff)
+
+        raw = fetch_messages_since_sync(
+            chat_service, space_id, since, MAX_MESSAGES_PER_SPACE
+        )
+        members = {}
+        if raw:
+            try:
+                members = get_member_directory().get_members_sync(
+                    chat_service, self.user_email, space_id
+                )
+            except Exception as e:
+                logger.debug(f"No member directory for {space_id}: {e}")
+
+        new = []
+        for msg in raw:
+            sender_name, sender_email = resolve_sender(msg.get("sender", {}), members)
+            new.append(
+                DigestMessage(
+                    id=msg.get("name", ""),
+                    text=msg.get("text", ""),
+                    sender_name=sender_name,
+                    sender_email=sender_email,
+                    create_time=msg.get("createTime", ""),
+                    thread_id=msg.get("thread", {}).get("name")
+                    if "thread" in msg
+                    else None,
+                ).model_dump()
+            )
+
+        with self._lock:
+            merged = {m["id"]: m for m in state.messages}
+            merged.update((m["id"], m) for m in new)
+            state.messages = sorted(
+                (m for m in merged.values() if m["create_time"] > cutoff),
+                key=lambda m: m["create_time"],
+                reverse=True,
+            )[:MAX_MESSAGES_PER_SPACE]
+            if new:
+                state.last_message_create_time = max(
+                    state.last_message_create_time or "",
+                    max(m["create_time"] for m in new),
+                )
+            state.last_active_time = active or state.last_active_time
+            self.stats["fetched_spaces"] += 1
+            self.stats["new_messages"] += len(new)
+
+    def refresh_sync(self, chat_service, space_id: Optional[str] = None) -> int:
+        """Bring every scanned space (or just ``space_id``) up to date.
+
+        Returns the number of spaces checked.
+        """
+        if space_id:
+            try:
+                spaces = [chat_service.spaces().get(name=space_id).execute()]
+            except Exception as e:
+                logger.warning(f"Could not fetch space info for {space_id}: {e}")
+                spaces = [{"name": space_id}]
+        else:
+            response = chat_service.spaces().list(pageSize=MAX_SPACES).execute()
+            spaces = response.get("spaces", [])[:MAX_SPACES]
+
+        for space in spaces:
+            try:
+                self._refresh_space_sync(chat_service, space)
+            except Exception as e:
+                logger.debug(f"Skipping space {space.get('name')}: {e}")
+
+        with self._lock:
+            if not space_id:
+                self._order = [sp.get("name", "") for sp in spaces]
+                for stale in set(self._spaces) - set(self._order):
+                    del self._spaces[stale]
+                self.refreshed_at = time.time()
+        self.save()
+        return len(spaces)
+
+    async def refresh(self, chat_service, space_id: Optional[str] = None) -> int:
+        """Async wrapper: one refresh per store at a time, on a worker thread."""
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            return await asyncio.to_thread(self.refresh_sync, chat_service, space_id)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def build(
+        self, hours_back: int, limit: int, space_id: Optional[str] = None
+    ) -> List[DigestSpace]:
+        """Digest entries for spaces with messages inside ``hours_back``."""
+        cutoff = _cutoff(hours_back)
+        self.last_read_at = time.time()
+        with self._lock:
+            space_ids = [space_id] if space_id else list(self._order)
+            result = []
+            for sid in space_ids:
+                state = self._spaces.get(sid)
+                if state is None:
+                    continue
+                messages = [
+                    DigestMessage(**m)
+                    for m in state.messages[:limit]
+                    if m["create_time"] > cutoff
+                ]
+                if messages:
+                    result.append(
+                        DigestSpace(
+                            space_id=sid,
+                            display_name=state.display_name,
+                            space_type=state.space_type,
+                            message_count=len(messages),
+                            messages=messages,
+                        )
+                    )
+        return result
+
+    @property
+    def spaces_checked(self) -> int:
+        return len(self._order)
+
+    def is_fresh(self, max_age_seconds: float) -> bool:
+        return (
+            self.refreshed_at is not None
+            and time.time() - self.refreshed_at < max_age_seconds
+        )
+
+    # ------------------------------------------------------------------
+    # Background refresh
+    # ------------------------------------------------------------------
+
+    def ensure_background_refresh(
+        self, service_factory: ServiceFactory, interval_seconds: float
+    ) -> None:
+        """Keep this store refreshed every ``interval_seconds`` while it is read."""
+        if interval_seconds <= 0:
+            return
+        if self._background is not None and not self._background.done():
+            return
+
+        async def _loop():
+            while time.time() - self.last_read_at < _IDLE_STOP_SECONDS:
+                await asyncio.sleep(interval_seconds)
+                try:
+                    chat_service = await service_factory()
+                    if chat_service is not None:
+                        await self.refresh(chat_service)
+                except Exception as e:
+                    logger.debug(f"Background digest refresh failed: {e}")
+            logger.debug("Chat digest background refresh stopped (idle)")
+
+        self._background = asyncio.create_task(_loop())
+
+    def stop_background_refresh(self) -> None:
+        """Cancel the background refresh task, from any thread."""
+        task, self._background = self._background, None
+        if task is None or task.done():
+            return
+        loop = task.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            task.cancel()
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(task.cancel)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            raw = self._fernet.decrypt(self.path.read_bytes())
+            data = json.loads(gzip.decompress(raw))
+            if data.get("version") != _STORE_VERSION:
+                return
+            self._spaces = {
+                sid: _SpaceState(**state) for sid, state in data["spaces"].items()
+            }
+            self._order = data.get("order", [])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable chat digest store {self.path}: {e}")
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            payload = {
+                "version": _STORE_VERSION,
+                "order": list(self._order),
+                "spaces": {sid: asdict(s) for sid, s in self._spaces.items()},
+            }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            raw = gzip.compress(json.dumps(payload, separators=(",", ":")).encode())
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(self._fernet.encrypt(raw))
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save chat digest store {self.path}: {e}")
+
+
+_stores: "OrderedDict[str, ChatDigestStore]" = OrderedDict()
+_stores_lock = threading.Lock()
+_cache_handle: Optional[CacheHandle] = None
+
+
+def _store_dir() -> Path:
+    from config.settings import get_settings
+
+    s = get_settings()
+    if s.chat_digest_store_dir:
+        return Path(s.chat_digest_store_dir)
+    return Path(s.credentials_dir) / "chat_digest"
+
+
+def _store_fernet(key: str) -> Optional[Fernet]:
+    """Per-user Fernet derived from the server secret, or None without one."""
+    from config.settings import get_settings
+
+    secret_path = Path(get_settings().credentials_dir) / ".auth_encryption_key"
+    if not secret_path.exists():
+        return None
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"chat-digest-store-salt-v1",
+        info=f"chat-digest-store-v1:{key}".encode("utf-8"),
+    )
+    return Fernet(
+        base64.urlsafe_b64encode(hkdf.derive(secret_path.read_bytes().strip()))
+    )
+
+
+def _evict_stores(fraction: float) -> int:
+    """Drop the least recently used stores and stop their background refresh."""
+    with _stores_lock:
+        before = list(_stores.values())
+        count = evict_first(_stores, fraction)
+    for store in before[:count]:
+        store.stop_background_refresh()
+    return count
+
+
+def get_digest_store(user_email: str) -> ChatDigestStore:
+    """Per-user digest store (LRU over users, loaded from disk on first use)."""
+    global _cache_handle
+    key = (user_email or "").lower()
+    with _stores_lock:
+        if _cache_handle is None:
+            # Evicted stores are already on disk (when encrypted) and reload
+            # on next use; their background refresh is cancelled so a new
+            # store for the same user is the only writer of its file
+            _cache_handle = register_cache(
+                "chat_digest",
+                size_fn=lambda: sampled_size(
+                    (s._spaces for s in list(_stores.values())), len(_stores)
+                ),
+                evict_fn=_evict_stores,
+                priority=4,
+            )
+        store = _stores.get(key)
+        if store is None:
+            _cache_handle.miss()
+            name = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+            directory = _store_dir()
+            # Version 1 stores were plaintext
+            (directory / f"{name}.json.gz").unlink(missing_ok=True)
+            store = ChatDigestStore(
+                user_email, directory / f"{name}.enc", _store_fernet(key)
+            )
+            _stores[key] = store
+            while len(_stores) > _MAX_STORES:
+                _stores.popitem(last=False)[1].stop_background_refresh()
+        else:
+            _cache_handle.hit()
+        _stores.move_to_end(key)
+        return store
@@ -69,6 +69,7 @@ class FeedbackLoop:
         self._wrapper = None  # ModuleWrapper for SearchMixin methods
         self._component_cache = None  # Tiered component cache
         self._variation_generator = None  # Variation generator for pattern expansion
+        self._retention = None  # InstancePatternRetention (lazy)
 
     def _get_wrapper(self):
         """
@@ -601,6 +602,7 @@ class FeedbackLoop:
             "feedback": PayloadSchemaType.KEYWORD,
             "content_feedback": PayloadSchemaType.KEYWORD,
             "form_feedback": PayloadSchemaType.KEYWORD,
+            "created_at": PayloadSchemaType.FLOAT,  # retention order_by
         }
 
         # Check which indexes already exist
@@ -718,6 +720,13 @@ class FeedbackLoop:
             )
             logger.info(f"   ✅ Created index on 'card_id' field")
 
+            client.create_payload_index(
+                collection_name=COLLECTION_NAME,
+                field_name="created_at",
+                field_schema=PayloadSchemaType.FLOAT,
+            )
+            logger.info(f"   ✅ Created index on 'created_at' field")
+
             return True
 
         except Exception as e:
@@ -1142,6 +1151,8 @@ class FeedbackLoop:
         try:
             from qdrant_client.models import PointStruct
 
+            now = datetime.now()
+
             # Create the point with all four named vectors
             point = PointStruct(
                 id=point_id,
@@ -1176,7 +1187,9 @@ class FeedbackLoop:
                     "user_email": user_email,
                     "card_id": card_id,
                     "structure_description": structure_description,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now.isoformat(),
+                    # Numeric copy for ordered retention (range-indexed)
+                    "created_at": now.timestamp(),
                 },
             )
 
@@ -1222,8 +1235,11 @@ class FeedbackLoop:
                         f"for {cache_key}"
                     )
 
-            # Cleanup old patterns if we exceed the limit
-            self._cleanup_old_instance_patterns()
+            # Retention runs in the background on a schedule or above the
+            # high-water mark, not on every store
+            retention = self._get_retention()
+            retention.record_store()
+            retention.maybe_run()
 
             return point_id
 
@@ -1231,108 +1247,31 @@ class FeedbackLoop:
             logger.error(f"❌ Failed to store instance_pattern: {e}")
             return None
 
+    def _get_retention(self):
+        """Get the instance_pattern retention manager (lazy)."""
+        if self._retention is None:
+            from gchat.feedback_retention import InstancePatternRetention
+
+            self._retention = InstancePatternRetention(
+                client_getter=self._get_client,
+                collection_name=COLLECTION_NAME,
+                max_patterns=MAX_INSTANCE_PATTERNS,
+                high_water_ratio=settings.feedback_retention_high_water,
+                interval_seconds=settings.feedback_retention_interval_seconds,
+            )
+        return self._retention
+
     def _cleanup_old_instance_patterns(self) -> int:
         """
         Remove oldest instance_pattern points when count exceeds MAX_INSTANCE_PATTERNS.
 
-        Keeps the most recent patterns (by timestamp), deletes oldest ones.
-        Patterns with positive feedback are preserved longer (deleted last).
+        Runs a retention pass synchronously. Patterns without positive
+        feedback are deleted first, oldest-first by ``created_at``.
 
         Returns:
             Number of patterns deleted
         """
-        client = self._get_client()
-        if not client:
-            return 0
-
-        try:
-            from qdrant_client import models
-
-            # Count current instance_patterns
-            count_result = client.count(
-                collection_name=COLLECTION_NAME,
-                count_filter=models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="type",
-                            match=models.MatchValue(value="instance_pattern"),
-                        )
-                    ]
-                ),
-            )
-            current_count = count_result.count
-
-            if current_count <= MAX_INSTANCE_PATTERNS:
-                return 0  # Under limit, no cleanup needed
-
-            # Calculate how many to delete
-            to_delete = current_count - MAX_INSTANCE_PATTERNS
-
-            logger.info(
-                f"🧹 Cleaning up instance_patterns: {current_count} > {MAX_INSTANCE_PATTERNS} limit, "
-                f"deleting {to_delete} oldest"
-            )
-
-            # Get all instance_patterns, then sort to delete expendable ones first.
-            # Uses only the 'type' field filter (always indexed) to avoid
-            # dependency on content_feedback/form_feedback keyword indices
-            # which may not exist yet.
-            patterns_to_delete = []
-
-            results, _ = client.scroll(
-                collection_name=COLLECTION_NAME,
-                scroll_filter=models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="type",
-                            match=models.MatchValue(value="instance_pattern"),
-                        )
-                    ],
-                ),
-                limit=to_delete + 200,
-                with_payload=[
-                    "timestamp",
-                    "card_id",
-                    "content_feedback",
-                    "form_feedback",
-                ],
-            )
-
-            # Sort: patterns WITHOUT positive feedback first (expendable),
-            # then by timestamp oldest-first within each group
-            def _delete_priority(p):
-                payload = p.payload or {}
-                has_positive = (
-                    payload.get("content_feedback") == "positive"
-                    or payload.get("form_feedback") == "positive"
-                )
-                # 0 = no positive feedback (delete first), 1 = has positive (keep longer)
-                return (
-                    1 if has_positive else 0,
-                    payload.get("timestamp", "2000-01-01"),
-                )
-
-            sorted_results = sorted(results, key=_delete_priority)
-            patterns_to_delete = [p.id for p in sorted_results[:to_delete]]
-
-            # Delete the patterns in batches (Qdrant has limits on batch size)
-            deleted_count = 0
-            batch_size = 100
-            if patterns_to_delete:
-                for i in range(0, len(patterns_to_delete), batch_size):
-                    batch = patterns_to_delete[i : i + batch_size]
-                    client.delete(
-                        collection_name=COLLECTION_NAME,
-                        points_selector=models.PointIdsList(points=batch),
-                    )
-                    deleted_count += len(batch)
-                logger.info(f"🧹 Deleted {deleted_count} old instance_patterns")
-
-            return deleted_count
-
-        except Exception as e:
-            logger.error(f"❌ Failed to cleanup instance_patterns: {e}")
-            return 0
+        return self._get_retention().run()
 
     def update_feedback(
         self,
@@ -0,0 +1,261 @@
+"""
+Retention for FeedbackLoop instance_pattern points.
+
+``store_instance_pattern`` used to count the collection and, once over
+``MAX_INSTANCE_PATTERNS``, scroll an arbitrary ``to_delete + 200`` points and
+sort them in Python on every store — two extra Qdrant round-trips per card
+send, and the unordered scroll did not reliably find the oldest patterns.
+
+``InstancePatternRetention`` instead:
+
+- runs from ``maybe_run()`` only when the estimated pattern count passes a
+  high-water mark (``FEEDBACK_RETENTION_HIGH_WATER`` x the limit) or the
+  schedule interval (``FEEDBACK_RETENTION_INTERVAL_SECONDS``) elapsed, on a
+  background thread so the write path never waits;
+- orders by the indexed numeric ``created_at`` payload (Qdrant ``order_by``),
+  deleting patterns without positive feedback first, then the oldest of the
+  rest, by the IDs of each scrolled page (legacy points can share one
+  ``created_at``, so a range delete could remove more than the excess);
+- pages through the whole excess, and backfills ``created_at`` once for
+  legacy points that only carry the ISO ``timestamp`` string, one batched
+  update per page.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+INSTANCE_PATTERN = "instance_pattern"
+CREATED_AT_FIELD = "created_at"
+RETENTION_PAGE_SIZE = 1000
+BACKFILL_PAGE_SIZE = 256
+
+
+def _type_condition():
+    from qdrant_client import models
+
+    return models.FieldCondition(
+        key="type", match=models.MatchValue(value=INSTANCE_PATTERN)
+    )
+
+
+def _positive_conditions():
+    from qdrant_client import models
+
+    return [
+        models.FieldCondition(key=field, match=models.MatchValue(value="positive"))
+        for field in ("content_feedback", "form_feedback")
+    ]
+
+
+def _parse_timestamp(value: Any) -> float:
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class InstancePatternRetention:
+    """Keeps instance_pattern points at or below ``max_patterns``."""
+
+    def __init__(
+        self,
+        client_getter: Callable[[], Any],
+        collection_name: str,
+        max_patterns: int,
+        high_water_ratio: float = 1.1,
+        interval_seconds: float = 300.0,
+    ):
+        self._get_client = client_getter
+        self.collection_name = collection_name
+        self.max_patterns = max_patterns
+        self.high_water = max(max_patterns, int(max_patterns * high_water_ratio))
+        self.interval_seconds = interval_seconds
+        self._estimated_count: Optional[int] = None
+        self._last_run = 0.0
+        self._backfilled = False
+        self._run_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def record_store(self) -> None:
+        """Account for one stored pattern (no Qdrant calls)."""
+        with self._state_lock:
+            if self._estimated_count is not None:
+                self._estimated_count += 1
+
+    def is_due(self) -> bool:
+        with self._state_lock:
+            if time.monotonic() - self._last_run >= self.interval_seconds:
+                return True
+            return (
+                self._estimated_count is not None
+                and self._estimated_count > self.high_water
+            )
+
+    def maybe_run(self, background: bool = True) -> bool:
+        """Start a retention pass if due. Returns True when one was started."""
+        if not self.is_due() or self._run_lock.locked():
+            return False
+        if not background:
+            self.run()
+            return True
+        threading.Thread(
+            target=self.run, name="feedback-retention", daemon=True
+        ).start()
+        return True
+
+    # ------------------------------------------------------------------
+    # Retention pass
+    # ------------------------------------------------------------------
+
+    def ensure_index(self, client) -> None:
+        """Create the float range index ``order_by`` needs (idempotent)."""
+        from qdrant_client.models import PayloadSchemaType
+
+        try:
+            client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=CREATED_AT_FIELD,
+                field_schema=PayloadSchemaType.FLOAT,
+            )
+        except Exception as e:
+            logger.debug(f"created_at index not created: {e}")
+
+    def _backfill_created_at(self, client) -> int:
+        """Give legacy points a numeric ``created_at`` from their timestamp."""
+        from qdrant_client import models
+
+        missing = models.Filter(
+            must=[
+                _type_condition(),
+                models.IsEmptyCondition(
+                    is_empty=models.PayloadField(key=CREATED_AT_FIELD)
+                ),
+            ]
+        )
+        updated = 0
+        while True:
+            points, _ = client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=missing,
+                limit=BACKFILL_PAGE_SIZE,
+                with_payload=["timestamp"],
+            )
+            if not points:
+                return updated
+            by_value = defaultdict(list)
+            for point in points:
+                value = _parse_timestamp((point.payload or {}).get("timestamp"))
+                by_value[value].append(point.id)
+            client.batch_update_points(
+                collection_name=self.collection_name,
+                update_operations=[
+                    models.SetPayloadOperation(
+                        set_payload=models.SetPayload(
+                            payload={CREATED_AT_FIELD: value}, points=ids
+                        )
+                    )
+                    for value, ids in by_value.items()
+                ],
+            )
+            updated += len(points)
+
+    def _count(self, client) -> int:
+        from qdrant_client import models
+
+        return client.count(
+            collection_name=self.collection_name,
+            count_filter=models.Filter(must=[_type_condition()]),
+            exact=True,
+        ).count
+
+    def _delete_oldest(self, client, base_filter, limit: int) -> int:
+        """Delete up to ``limit`` oldest points matching ``base_filter``."""
+        from qdrant_client import models
+
+        deleted = 0
+        while deleted < limit:
+            page_limit = min(RETENTION_PAGE_SIZE, limit - deleted)
+            page, _ = client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=base_filter,
+                limit=page_limit,
+                order_by=models.OrderBy(
+                    key=CREATED_AT_FIELD, direction=models.Direction.ASC
+                ),
+                with_payload=False,
+            )
+            if not page:
+                break
+            client.delete(
+                collection_name=self.collection_name,
+                points_selector=models.PointIdsList(points=[p.id for p in page]),
+            )
+            deleted += len(page)
+            if len(page) < page_limit:
+                break  # Tail exhausted
+        return deleted
+
+    def run(self) -> int:
+        """One retention pass. Returns the number of patterns deleted."""
+        if not self._run_lock.acquire(blocking=False):
+            return 0
+        try:
+            client = self._get_client()
+            if not client:
+                return 0
+            from qdrant_client import models
+
+            if not self._backfilled:
+                self.ensure_index(client)
+                backfilled = self._backfill_created_at(client)
+                if backfilled:
+                    logger.info(f"🧹 Backfilled created_at on {backfilled} patterns")
+                self._backfilled = True
+
+            current = self._count(client)
+            excess = current - self.max_patterns
+            deleted = 0
+            if excess > 0:
+                logger.info(
+                    f"🧹 Cleaning up instance_patterns: {current} > "
+                    f"{self.max_patterns} limit, deleting {excess} oldest"
+                )
+                # Expendable (no positive feedback) first, then anything oldest
+                deleted = self._delete_oldest(
+                    client,
+                    models.Filter(
+                        must=[_type_condition()], must_not=_positive_conditions()
+                    ),
+                    excess,
+                )
+                if deleted < excess:
+                    deleted += self._delete_oldest(
+                        client,
+                        models.Filter(must=[_type_condition()]),
+                        excess - deleted,
+                    )
+                current = self._count(client)
+                logger.info(
+                    f"🧹 Deleted {deleted} old instance_patterns ({current} remain)"
+                )
+
+            with self._state_lock:
+                self._estimated_count = current
+                self._last_run = time.monotonic()
+            return deleted
+        except Exception as e:
+            logger.error(f"❌ Failed to cleanup instance_patterns: {e}")
+            return 0
+        finally:
+            self._run_lock.release()
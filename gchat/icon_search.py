@@ -6,35 +6,158 @@ When a bad/unknown icon name comes in (e.g., "CONFIRMATION_NUMBER_ICON",
 icon by semantic similarity over the full 2,209 icon set.
 
 Architecture:
-    - On first use, embeds all icon names with FastEmbed (cached in memory)
-    - Uses numpy dot product for instant nearest-neighbor search
-    - No Qdrant dependency — pure in-memory, ~50ms cold start
+    - Icon embeddings are persisted as a .npy artifact keyed by embedding
+      model and icon-list hash, and memory-mapped on first use; only a
+      cache miss embeds the icon set (then writes the artifact)
+    - Query embeddings are LRU-cached (ICON_QUERY_CACHE_SIZE)
+    - Uses numpy dot product + argpartition for nearest-neighbor search
+    - No Qdrant dependency
 
 Usage:
     from gchat.icon_search import semantic_icon_search
 
     # Returns "trending_up" for "TREND_UP"
     result = semantic_icon_search("TREND_UP")
+
+Prebuild the index (e.g. at image build time):
+    python -m gchat.icon_search --build
 """
 
+import hashlib
+import os
+import re
 import threading
+from collections import OrderedDict
+from pathlib import Path
 from typing import List, Optional, Tuple
 
 import numpy as np
 
+from config.cache_registry import evict_first, register_cache
 from config.enhanced_logging import setup_logger
 
 logger = setup_logger()
 
+_EMBED_SLOT = "bge-small"
+
 # Lazy-loaded singletons (guarded by _init_lock)
 _embedder = None
 _icon_names: Optional[List[str]] = None
 _icon_embeddings: Optional[np.ndarray] = None
 _init_lock = threading.Lock()
 
+# Normalized query text -> L2-normalized embedding (LRU, guarded by _cache_lock)
+_query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _query_cache_bytes() -> int:
+    with _cache_lock:
+        return sum(v.nbytes for v in _query_cache.values())
+
+
+def _evict_query_cache(fraction: float) -> int:
+    with _cache_lock:
+        return evict_first(_query_cache, fraction)
+
+
+def _icon_index_bytes() -> int:
+    matrix = _icon_embeddings
+    if matrix is None or isinstance(matrix, np.memmap):
+        return 0  # memory-mapped pages are reclaimable by the OS
+    return matrix.nbytes
+
+
+def _spill_icon_index(fraction: float) -> int:
+    """Swap a freshly built in-heap index for its memory-mapped artifact."""
+    global _icon_embeddings
+    with _init_lock:
+        if _icon_names is None or _icon_index_bytes() == 0:
+            return 0
+        from config.embedding_service import get_embedding_service
+
+        model_name = get_embedding_service().get_model_name(_EMBED_SLOT)
+        mapped = _load_index(_index_path(model_name, _icon_names), len(_icon_names))
+        if mapped is None:
+            return 0
+        _icon_embeddings = mapped
+        return 1
+
+
+_query_cache_handle = register_cache(
+    "icon_query_embeddings",
+    size_fn=_query_cache_bytes,
+    evict_fn=_evict_query_cache,
+    priority=3,
+)
+register_cache(
+    "icon_index",
+    size_fn=_icon_index_bytes,
+    evict_fn=_spill_icon_index,
+    priority=8,
+)
+
+
+def _index_dir() -> Path:
+    """Directory holding persisted icon index artifacts."""
+    from config.settings import get_settings
+
+    s = get_settings()
+    if s.icon_index_dir:
+        return Path(s.icon_index_dir)
+    return Path(s.credentials_dir) / "model_cache" / "icon_index"
+
+
+def _index_path(model_name: str, icon_names: List[str]) -> Path:
+    """Artifact path for (embedding model, icon list) — changes to either miss."""
+    icons_hash = hashlib.sha256("\n".join(icon_names).encode()).hexdigest()[:16]
+    model_slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+    return _index_dir() / f"icons_{model_slug}_{icons_hash}.npy"
+
+
+def _load_index(path: Path, n_icons: int) -> Optional[np.ndarray]:
+    """Memory-map a persisted index, or None if missing/mismatched."""
+    if not path.exists():
+        return None
+    try:
+        matrix = np.load(path, mmap_mode="r")
+    except Exception as e:
+        logger.warning(f"Could not load icon index {path}: {e}")
+        return None
+    if matrix.ndim != 2 or matrix.shape[0] != n_icons:
+        logger.warning(f"Ignoring icon index {path}: shape {matrix.shape}")
+        return None
+    return matrix
+
+
+def _save_index(path: Path, matrix: np.ndarray) -> None:
+    """Write the index atomically so concurrent workers never read a partial file."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(tmp, matrix)
+        os.replace(tmp, path)
+        logger.info(f"Saved icon search index to {path}")
+    except OSError as e:
+        logger.warning(f"Could not persist icon index to {path}: {e}")
+
+
+def _embed_icons(embedder, icon_names: List[str]) -> np.ndarray:
+    """Embed all icon names and L2-normalize the rows."""
+    # "trending_up" -> "trending up" (underscores to spaces for semantic meaning)
+    texts = [name.replace("_", " ") for name in icon_names]
+
+    # Embed all icons in one batch
+    embeddings = np.array(list(embedder.embed(texts)), dtype=np.float32)
+
+    # L2-normalize for cosine similarity via dot product
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms = np.where(norms == 0, 1, norms)
+    return embeddings / norms
+
 
 def _ensure_index():
-    """Build the in-memory icon embedding index on first use."""
+    """Load (or build and persist) the icon embedding index on first use."""
     global _embedder, _icon_names, _icon_embeddings
 
     if _icon_embeddings is not None:
@@ -48,25 +171,70 @@ def _ensure_index():
         from config.embedding_service import get_embedding_service
         from gchat.material_icons import MATERIAL_ICONS
 
-        logger.info(f"Building icon search index ({len(MATERIAL_ICONS)} icons)...")
+        service = get_embedding_service()
+        _embedder = service.get_model_sync(_EMBED_SLOT)
+        icon_names = sorted(MATERIAL_ICONS)
+        path = _index_path(service.get_model_name(_EMBED_SLOT), icon_names)
 
-        _embedder = get_embedding_service().get_model_sync("bge-small")
+        matrix = _load_index(path, len(icon_names))
+        if matrix is None:
+            logger.info(f"Building icon search index ({len(icon_names)} icons)...")
+            matrix = _embed_icons(_embedder, icon_names)
+            _save_index(path, matrix)
 
-        # Prepare icon names with readable descriptions for better embeddings
-        # "trending_up" -> "trending up" (underscores to spaces for semantic meaning)
-        _icon_names = sorted(MATERIAL_ICONS)
-        texts = [name.replace("_", " ") for name in _icon_names]
+        _icon_names = icon_names
+        _icon_embeddings = matrix
 
-        # Embed all icons in one batch
-        embeddings = list(_embedder.embed(texts))
-        _icon_embeddings = np.array(embeddings, dtype=np.float32)
+    logger.info(f"Icon search index ready: {_icon_embeddings.shape}")
 
-        # L2-normalize for cosine similarity via dot product
-        norms = np.linalg.norm(_icon_embeddings, axis=1, keepdims=True)
-        norms = np.where(norms == 0, 1, norms)
-        _icon_embeddings = _icon_embeddings / norms
 
-    logger.info(f"Icon search index ready: {_icon_embeddings.shape}")
+def build_icon_index() -> Path:
+    """Embed and persist the icon index unconditionally (build-time hook)."""
+    from config.embedding_service import get_embedding_service
+    from gchat.material_icons import MATERIAL_ICONS
+
+    service = get_embedding_service()
+    icon_names = sorted(MATERIAL_ICONS)
+    path = _index_path(service.get_model_name(_EMBED_SLOT), icon_names)
+    _save_index(path, _embed_icons(service.get_model_sync(_EMBED_SLOT), icon_names))
+    return path
+
+
+def _embed_query(query: str) -> np.ndarray:
+    """Embed a normalized query, served from the LRU cache when possible."""
+    from config.settings import get_settings
+
+    # Normalize query: underscores to spaces, lowercase
+    query_text = query.strip().replace("_", " ").lower()
+
+    with _cache_lock:
+        cached = _query_cache.get(query_text)
+        if cached is not None:
+            _query_cache.move_to_end(query_text)
+            _query_cache_handle.hit()
+            return cached
+    _query_cache_handle.miss()
+
+    query_emb = np.array(list(_embedder.embed([query_text]))[0], dtype=np.float32)
+    query_emb = query_emb / (np.linalg.norm(query_emb) or 1)
+
+    max_size = get_settings().icon_query_cache_size
+    if max_size > 0:
+        with _cache_lock:
+            _query_cache[query_text] = query_emb
+            while len(_query_cache) > max_size:
+                _query_cache.popitem(last=False)
+    return query_emb
+
+
+def _top_k(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the top-k scores, best first, without a full sort."""
+    top_k = max(1, min(top_k, scores.shape[0]))
+    if top_k == scores.shape[0]:
+        candidates = np.arange(top_k)
+    else:
+        candidates = np.argpartition(scores, -top_k)[-top_k:]
+    return candidates[np.argsort(scores[candidates])[::-1]]
 
 
 def semantic_icon_search(
@@ -87,21 +255,12 @@ def semantic_icon_search(
     """
     _ensure_index()
 
-    # Normalize query: underscores to spaces, lowercase
-    query_text = query.strip().replace("_", " ").lower()
-
-    # Embed the query
-    query_emb = list(_embedder.embed([query_text]))[0]
-    query_emb = np.array(query_emb, dtype=np.float32)
-    query_emb = query_emb / (np.linalg.norm(query_emb) or 1)
+    query_emb = _embed_query(query)
 
     # Cosine similarity via dot product (both are L2-normalized)
     scores = _icon_embeddings @ query_emb
 
-    # Get top-k indices
-    top_indices = np.argsort(scores)[-top_k:][::-1]
-
-    best_idx = top_indices[0]
+    best_idx = _top_k(scores, 1)[0]
     best_score = scores[best_idx]
 
     if best_score < min_score:
@@ -133,18 +292,22 @@ def semantic_icon_search_top_k(
     """
     _ensure_index()
 
-    query_text = query.strip().replace("_", " ").lower()
-    query_emb = list(_embedder.embed([query_text]))[0]
-    query_emb = np.array(query_emb, dtype=np.float32)
-    query_emb = query_emb / (np.linalg.norm(query_emb) or 1)
-
+    query_emb = _embed_query(query)
     scores = _icon_embeddings @ query_emb
-    top_indices = np.argsort(scores)[-top_k:][::-1]
 
     results = []
-    for idx in top_indices:
+    for idx in _top_k(scores, top_k):
         score = float(scores[idx])
         if score >= min_score:
             results.append((_icon_names[idx], score))
 
     return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--build" in sys.argv:
+        print(build_icon_index())
+    else:
+        print("usage: python -m gchat.icon_search --build")
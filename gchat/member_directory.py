@@ -0,0 +1,294 @@
+"""
+Per-user, per-space Google Chat member directory cache.
+
+Resolving message senders one ``spaces.members.get`` at a time costs a
+round-trip per unique sender on every ``list_messages`` page.  The directory
+instead loads a space's whole membership with paginated
+``spaces.members.list`` (one call per page) and keeps it for
+``CHAT_MEMBER_CACHE_TTL`` seconds, keyed by (user email, space).
+
+- Stale entries are served immediately while a background task refreshes
+  them (stale-while-revalidate); only a cold space blocks on the API.
+- ``manage_space`` membership writes update/evict cached entries so the
+  directory never shows a removed member.
+- A cached map also hides API errors: a user whose access to a space was
+  revoked keeps seeing its members until the entry expires.  Callers that
+  must surface permission errors (``manage_space`` ``list_members``) pass
+  ``force_refresh=True``, which always reads through and re-caches.
+- All API calls for one fetch run on a single worker thread (httplib2 is
+  not thread-safe), and ``get_members_sync`` lets code that is already on a
+  worker thread (the chat digest) share the same cache.
+
+Usage:
+    directory = get_member_directory()
+    members = await directory.get_members(chat_service, user_email, space_id,
+                                          service_factory=...)
+    members.get("users/123")  # {"displayName", "email", "role", "type", "membership"}
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+MEMBERS_PAGE_SIZE = 1000  # API maximum for spaces.members.list
+
+# member resource ("users/123") -> summary dict
+MemberMap = Dict[str, Dict[str, Any]]
+
+
+@dataclass
+class _DirectoryEntry:
+    members: MemberMap = field(default_factory=dict)
+    fetched_at: float = 0.0
+
+
+def _member_summary(membership: Dict[str, Any]) -> Tuple[Optional[str], Dict]:
+    """Map one Membership resource to (member name, summary)."""
+    member = membership.get("member", {}) or {}
+    key = member.get("name")
+    return key, {
+        "displayName": member.get("displayName")
+        or membership.get("displayName")
+        or key
+        or "Unknown User",
+        "email": member.get("email") or membership.get("email"),
+        "role": membership.get("role", "ROLE_MEMBER"),
+        "type": member.get("type", "HUMAN"),
+        "membership": membership.get("name", ""),
+        "createTime": membership.get("createTime"),
+    }
+
+
+def fetch_space_members_sync(chat_service, space_id: str) -> MemberMap:
+    """Load all members of a space via paginated ``spaces.members.list``."""
+    members: MemberMap = {}
+    page_token = None
+    pages = 0
+    while True:
+        kwargs = {"parent": space_id, "pageSize": MEMBERS_PAGE_SIZE}
+        if page_token:
+            kwargs["pageToken"] = page_token
+        response = chat_service.spaces().members().list(**kwargs).execute()
+        pages += 1
+        for membership in response.get("memberships", []):
+            key, summary = _member_summary(membership)
+            if key:
+                members[key] = summary
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+    logger.debug(f"👥 Loaded {len(members)} members for {space_id} in {pages} page(s)")
+    return members
+
+
+class MemberDirectory:
+    """TTL-bounded LRU of space member maps keyed by (user email, space)."""
+
+    def __init__(self, ttl_seconds: float = 600.0, max_spaces: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_spaces = max_spaces
+        self._entries: "OrderedDict[Tuple[str, str], _DirectoryEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+        self._refresh_tasks: set = set()  # strong refs for in-flight refreshes
+
+    @staticmethod
+    def _key(user_email: Optional[str], space_id: str) -> Tuple[str, str]:
+        return ((user_email or "").lower(), space_id)
+
+    def _lookup(self, key) -> Optional[_DirectoryEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key, members: MemberMap) -> None:
+        with self._lock:
+            self._entries[key] = _DirectoryEntry(members, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_spaces:
+                self._entries.popitem(last=False)
+
+    def _is_fresh(self, entry: _DirectoryEntry) -> bool:
+        return time.monotonic() - entry.fetched_at < self.ttl_seconds
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_members_sync(
+        self,
+        chat_service,
+        user_email: Optional[str],
+        space_id: str,
+        force_refresh: bool = False,
+    ) -> MemberMap:
+        """Blocking variant for callers already on a worker thread."""
+        key = self._key(user_email, space_id)
+        entry = self._lookup(key)
+        if entry is not None and not force_refresh and self._is_fresh(entry):
+            return entry.members
+        members = fetch_space_members_sync(chat_service, space_id)
+        self._store(key, members)
+        return members
+
+    async def get_members(
+        self,
+        chat_service,
+        user_email: Optional[str],
+        space_id: str,
+        service_factory: Optional[Callable[[], Awaitable[Any]]] = None,
+        force_refresh: bool = False,
+    ) -> MemberMap:
+        """Member map for a space.
+
+        Fresh entries are returned directly.  A stale entry is returned as-is
+        when ``service_factory`` is given and refreshed in the background with
+        its own Chat service (so two threads never share one client);
+        otherwise stale and cold spaces block on a paginated fetch.
+        """
+        key = self._key(user_email, space_id)
+        entry = self._lookup(key)
+        if entry is not None and not force_refresh:
+            if self._is_fresh(entry):
+                return entry.members
+            if service_factory is not None:
+                self._schedule_refresh(key, service_factory)
+                return entry.members
+
+        members = await asyncio.to_thread(
+            fetch_space_members_sync, chat_service, space_id
+        )
+        self._store(key, members)
+        return members
+
+    def peek(
+        self,
+        user_email: Optional[str],
+        space_id: str,
+        service_factory: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Optional[MemberMap]:
+        """Cached member map without fetching (None for a cold space).
+
+        Like ``get_members``, a stale entry is returned and refreshed in the
+        background when ``service_factory`` is given.
+        """
+        key = self._key(user_email, space_id)
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        if not self._is_fresh(entry):
+            if service_factory is None:
+                return None
+            self._schedule_refresh(key, service_factory)
+        return entry.members
+
+    def _schedule_refresh(self, key, service_factory) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        async def _refresh():
+            try:
+                service = await service_factory()
+                if service is None:
+                    return
+                members = await asyncio.to_thread(
+                    fetch_space_members_sync, service, key[1]
+                )
+                self._store(key, members)
+            except Exception as e:
+                logger.debug(f"👥 Background member refresh failed for {key[1]}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        task = asyncio.get_running_loop().create_task(_refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    # ------------------------------------------------------------------
+    # Writes (manage_space membership operations)
+    # ------------------------------------------------------------------
+
+    def record_membership(
+        self, user_email: Optional[str], space_id: str, membership: Dict[str, Any]
+    ) -> None:
+        """Add/replace a member in a cached space (no-op if space not cached)."""
+        entry = self._lookup(self._key(user_email, space_id))
+        if entry is None:
+            return
+        key, summary = _member_summary(membership)
+        if key:
+            with self._lock:
+                entry.members[key] = summary
+
+    def remove_membership(
+        self, user_email: Optional[str], membership_name: str
+    ) -> None:
+        """Drop a member (by ``spaces/{space}/members/{member}``) from the cache."""
+        space_id = membership_name.split("/members/")[0]
+        entry = self._lookup(self._key(user_email, space_id))
+        if entry is None:
+            return
+        with self._lock:
+            for key, summary in list(entry.members.items()):
+                if summary.get("membership") == membership_name:
+                    del entry.members[key]
+
+    def invalidate(
+        self, user_email: Optional[str] = None, space_id: Optional[str] = None
+    ) -> None:
+        """Drop cached spaces for a user/space (both None clears everything)."""
+        with self._lock:
+            if user_email is None and space_id is None:
+                self._entries.clear()
+                return
+            for key in list(self._entries):
+                if (user_email is None or key[0] == (user_email or "").lower()) and (
+                    space_id is None or key[1] == space_id
+                ):
+                    del self._entries[key]
+
+
+def resolve_sender(
+    sender: Dict[str, Any], members: MemberMap
+) -> Tuple[str, Optional[str]]:
+    """(display name, email) for a message sender, preferring the directory."""
+    sender_id = sender.get("name", "")
+    cached = members.get(sender_id)
+    if cached:
+        return cached["displayName"], cached.get("email")
+    return (
+        sender.get("displayName") or sender_id or "Unknown Sender",
+        sender.get("email")
+        or sender.get("emailAddress")
+        or sender.get("user", {}).get("email"),
+    )
+
+
+_directory: Optional[MemberDirectory] = None
+_directory_lock = threading.Lock()
+
+
+def get_member_directory() -> MemberDirectory:
+    """Process-wide member directory."""
+    global _directory
+    if _directory is None:
+        with _directory_lock:
+            if _directory is None:
+                from config.settings import get_settings
+
+                _directory = MemberDirectory(
+                    ttl_seconds=get_settings().chat_member_cache_ttl
+                )
+    return _directory
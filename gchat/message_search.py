@@ -0,0 +1,455 @@
+"""
+Cross-space Google Chat message search.
+
+``search_messages`` without a space used to scan only the first 10 spaces,
+sequentially, 5 messages each.  This module searches every space the user
+belongs to, in one of two modes:
+
+- live:  fan out one fetch per space with bounded concurrency and a global
+         deadline; spaces that fail or miss the deadline are reported in the
+         coverage metadata instead of being silently dropped.
+- index: keep a per-user in-memory index of recent messages, refreshed
+         incrementally from per-space ``createTime`` watermarks (only new
+         messages are fetched), and answer the query from the index.
+         Spaces whose ``lastActiveTime`` has not advanced since their last
+         refresh are not fetched at all.
+
+Matching is done locally (case-insensitive, all query terms must appear) over
+messages inside the lookback window.  Senders are resolved from the member
+directory; spaces with hits that are not cached yet are loaded by the same
+bounded fan-out, within what is left of the deadline.  Each concurrent worker gets its own Chat
+service because httplib2 clients are not thread-safe.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config.cache_registry import (
+    CacheHandle,
+    evict_first,
+    register_cache,
+    sampled_size,
+)
+from config.enhanced_logging import setup_logger
+from gchat.member_directory import get_member_directory, resolve_sender
+
+logger = setup_logger()
+
+SPACES_PAGE_SIZE = 1000
+MESSAGES_PAGE_SIZE = 1000
+
+ServiceFactory = Callable[[], Awaitable[Any]]
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def list_all_spaces_sync(chat_service) -> List[Dict[str, Any]]:
+    """Every space the caller belongs to (paginated ``spaces.list``)."""
+    spaces: List[Dict[str, Any]] = []
+    page_token = None
+    while True:
+        kwargs = {"pageSize": SPACES_PAGE_SIZE}
+        if page_token:
+            kwargs["pageToken"] = page_token
+        response = chat_service.spaces().list(**kwargs).execute()
+        spaces.extend(response.get("spaces", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return spaces
+
+
+def fetch_messages_since_sync(
+    chat_service, space_id: str, since: str, max_messages: int
+) -> List[Dict[str, Any]]:
+    """Messages created after ``since`` (newest first), up to ``max_messages``."""
+    messages: List[Dict[str, Any]] = []
+    page_token = None
+    while len(messages) < max_messages:
+        kwargs = {
+            "parent": space_id,
+            "pageSize": min(MESSAGES_PAGE_SIZE, max_messages - len(messages)),
+            "filter": f'createTime > "{since}"',
+            "orderBy": "createTime desc",
+        }
+        if page_token:
+            kwargs["pageToken"] = page_token
+        response = chat_service.spaces().messages().list(**kwargs).execute()
+        messages.extend(response.get("messages", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+    return messages[:max_messages]
+
+
+def _terms(query: str) -> List[str]:
+    return [t for t in query.lower().split() if t]
+
+
+def _matches(text: str, terms: List[str]) -> bool:
+    return all(t in text for t in terms)
+
+
+# ---------------------------------------------------------------------------
+# Bounded-concurrency fan-out with a global deadline
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class FanOutResult:
+    """Per-space outcomes of a fan-out."""
+
+    results: Dict[str, Any] = field(default_factory=dict)
+    failed: List[str] = field(default_factory=list)
+    timed_out: List[str] = field(default_factory=list)
+
+
+async def fan_out(
+    space_ids: List[str],
+    worker: Callable[[Any, str], Any],
+    service_factory: ServiceFactory,
+    concurrency: int,
+    deadline_seconds: float,
+) -> FanOutResult:
+    """Run ``worker(chat_service, space_id)`` for every space.
+
+    At most ``concurrency`` workers run at once, each on its own Chat service
+    (created lazily, reused across spaces).  Spaces still pending when the
+    deadline expires are reported as timed out.
+    """
+    outcome = FanOutResult()
+    pool: asyncio.Queue = asyncio.Queue()
+    created = 0
+    create_lock = asyncio.Lock()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _acquire():
+        nonlocal created
+        if pool.empty():
+            async with create_lock:
+                if pool.empty() and created < concurrency:
+                    created += 1
+                    try:
+                        service = await service_factory()
+                    except BaseException:
+                        created -= 1
+                        raise
+                    if service is None:
+                        # Free the slot so a later space can try again
+                        created -= 1
+                        raise RuntimeError("Chat service unavailable")
+                    return service
+        return await pool.get()
+
+    async def _run(space_id: str):
+        async with semaphore:
+            service = await _acquire()
+            try:
+                result = await asyncio.to_thread(worker, service, space_id)
+            except asyncio.CancelledError:
+                # Timed out: the thread may still be using the service, so it
+                # stays out of the pool.
+                raise
+            except Exception:
+                pool.put_nowait(service)
+                raise
+            pool.put_nowait(service)
+            return result
+
+    tasks = {asyncio.ensure_future(_run(sid)): sid for sid in space_ids}
+    if not tasks:
+        return outcome
+    done, pending = await asyncio.wait(tasks, timeout=deadline_seconds)
+
+    for task in pending:
+        task.cancel()
+        outcome.timed_out.append(tasks[task])
+    for task in done:
+        space_id = tasks[task]
+        if task.exception() is not None:
+            logger.debug(f"Chat search skipped {space_id}: {task.exception()}")
+            outcome.failed.append(space_id)
+        else:
+            outcome.results[space_id] = task.result()
+    return outcome
+
+
+# ---------------------------------------------------------------------------
+# Incremental per-user index
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _SpaceIndex:
+    watermark: Optional[str] = None  # newest createTime seen
+    last_active: Optional[str] = None  # space lastActiveTime at last refresh
+    # message name -> (createTime, lowercased text, raw message)
+    messages: Dict[str, Tuple[str, str, Dict[str, Any]]] = field(default_factory=dict)
+
+
+class ChatMessageIndex:
+    """Recent messages for one user, keyed by space, updated by watermark."""
+
+    def __init__(self, lookback_days: int, max_per_space: int):
+        self.lookback_days = lookback_days
+        self.max_per_space = max_per_space
+        self._spaces: Dict[str, _SpaceIndex] = {}
+        self._space_names: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.last_refresh: Optional[float] = None
+
+    def _cutoff(self) -> str:
+        return _iso(datetime.now(timezone.utc) - timedelta(days=self.lookback_days))
+
+    def needs_refresh(self, space_id: str, last_active: Optional[str]) -> bool:
+        """Whether the space may have messages the index has not seen."""
+        with self._lock:
+            entry = self._spaces.get(space_id)
+            return (
+                entry is None
+                or not last_active
+                or entry.last_active is None
+                or last_active > entry.last_active
+            )
+
+    def refresh_space_sync(
+        self, chat_service, space_id: str, last_active: Optional[str] = None
+    ) -> int:
+        """Fetch messages newer than the space watermark. Returns count added.
+
+        ``last_active`` is the space's ``lastActiveTime`` from the
+        ``spaces.list`` that scheduled this refresh; it is recorded only once
+        the fetch succeeds.
+        """
+        with self._lock:
+            entry = self._spaces.setdefault(space_id, _SpaceIndex())
+            cutoff = self._cutoff()
+            since = max(entry.watermark or cutoff, cutoff)
+
+        new_messages = fetch_messages_since_sync(
+            chat_service, space_id, since, self.max_per_space
+        )
+
+        with self._lock:
+            for msg in new_messages:
+                create_time = msg.get("createTime", "")
+                entry.messages[msg.get("name", "")] = (
+                    create_time,
+                    (msg.get("text") or "").lower(),
+                    msg,
+                )
+                if not entry.watermark or create_time > entry.watermark:
+                    entry.watermark = create_time
+            # Drop messages past the lookback window, then cap per space
+            kept = sorted(
+                (item for item in entry.messages.items() if item[1][0] > cutoff),
+                key=lambda item: item[1][0],
+                reverse=True,
+            )[: self.max_per_space]
+            entry.messages = dict(kept)
+            if last_active:
+                entry.last_active = last_active
+        return len(new_messages)
+
+    def set_space_names(self, spaces: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            for space in spaces:
+                self._space_names[space.get("name", "")] = space.get(
+                    "displayName", "Unknown Space"
+                )
+
+    def search(
+        self, query: str, space_ids: List[str], per_space_limit: int
+    ) -> List[Dict[str, Any]]:
+        """Matching raw messages (newest first), ``per_space_limit`` per space."""
+        terms = _terms(query)
+        cutoff = self._cutoff()
+        hits: List[Tuple[str, str, Dict[str, Any]]] = []
+        with self._lock:
+            for space_id in space_ids:
+                entry = self._spaces.get(space_id)
+                if entry is None:
+                    continue
+                matched = sorted(
+                    (
+                        (ct, space_id, msg)
+                        for ct, text, msg in entry.messages.values()
+                        if ct > cutoff and _matches(text, terms)
+                    ),
+                    key=lambda hit: hit[0],
+                    reverse=True,
+                )[:per_space_limit]
+                hits.extend(matched)
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+        return [dict(msg, _spaceId=sid) for _, sid, msg in hits]
+
+    def space_name(self, space_id: str) -> str:
+        return self._space_names.get(space_id, "Unknown Space")
+
+    @property
+    def indexed_spaces(self) -> int:
+        return len(self._spaces)
+
+
+_indexes: "OrderedDict[str, ChatMessageIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+_cache_handle: Optional[CacheHandle] = None
+_MAX_INDEXED_USERS = 64
+
+
+def get_message_index(user_email: Optional[str]) -> ChatMessageIndex:
+    """Per-user message index (LRU over users)."""
+    from config.settings import get_settings
+
+    global _cache_handle
+    key = (user_email or "").lower()
+    with _indexes_lock:
+        if _cache_handle is None:
+            # Evicted users rebuild from the API on their next index search
+            _cache_handle = register_cache(
+                "chat_message_index",
+                size_fn=lambda: sampled_size(
+                    (i._spaces for i in list(_indexes.values())), len(_indexes)
+                ),
+                evict_fn=lambda fraction: evict_first(_indexes, fraction),
+                priority=3,
+            )
+        index = _indexes.get(key)
+        if index is None:
+            _cache_handle.miss()
+            s = get_settings()
+            index = ChatMessageIndex(
+                lookback_days=s.chat_search_lookback_days,
+                max_per_space=s.chat_index_max_messages_per_space,
+            )
+            _indexes[key] = index
+            while len(_indexes) > _MAX_INDEXED_USERS:
+                _indexes.popitem(last=False)
+        else:
+            _cache_handle.hit()
+        _indexes.move_to_end(key)
+        return index
+
+
+# ---------------------------------------------------------------------------
+# Search entry point
+# ---------------------------------------------------------------------------
+
+
+async def search_all_spaces(
+    chat_service,
+    service_factory: ServiceFactory,
+    user_email: Optional[str],
+    query: str,
+    per_space_limit: int,
+    mode: str = "live",
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Search every space; returns (matching messages, coverage metadata).
+
+    Each returned message carries ``_spaceId``, ``_spaceName`` and
+    ``_senderName`` keys.
+    """
+    from config.settings import get_settings
+
+    s = get_settings()
+    started = time.monotonic()
+    spaces = await asyncio.to_thread(list_all_spaces_sync, chat_service)
+    space_ids = [sp.get("name", "") for sp in spaces if sp.get("name")]
+    names = {
+        sp.get("name", ""): sp.get("displayName", "Unknown Space") for sp in spaces
+    }
+
+    skipped = 0
+    if mode == "index":
+        index = get_message_index(user_email)
+        index.set_space_names(spaces)
+        last_active = {sp.get("name", ""): sp.get("lastActiveTime") for sp in spaces}
+        stale = [sid for sid in space_ids if index.needs_refresh(sid, last_active[sid])]
+        skipped = len(space_ids) - len(stale)
+        outcome = await fan_out(
+            stale,
+            lambda service, sid: index.refresh_space_sync(
+                service, sid, last_active[sid]
+            ),
+            service_factory,
+            s.chat_search_concurrency,
+            s.chat_search_deadline_seconds,
+        )
+        index.last_refresh = time.time()
+        hits = index.search(query, space_ids, per_space_limit)
+    else:
+        terms = _terms(query)
+        since = _iso(
+            datetime.now(timezone.utc) - timedelta(days=s.chat_search_lookback_days)
+        )
+
+        def _search_space(service, space_id):
+            return [
+                msg
+                for msg in fetch_messages_since_sync(
+                    service, space_id, since, s.chat_index_max_messages_per_space
+                )
+                if _matches((msg.get("text") or "").lower(), terms)
+            ][:per_space_limit]
+
+        outcome = await fan_out(
+            space_ids,
+            _search_space,
+            service_factory,
+            s.chat_search_concurrency,
+            s.chat_search_deadline_seconds,
+        )
+        hits = [
+            dict(msg, _spaceId=sid)
+            for sid, msgs in outcome.results.items()
+            for msg in msgs
+        ]
+        hits.sort(key=lambda m: m.get("createTime", ""), reverse=True)
+
+    # Senders: cached member maps first, cold hit spaces in one more bounded
+    # fan-out that shares the search deadline
+    directory = get_member_directory()
+    members: Dict[str, Dict[str, Any]] = {}
+    cold: List[str] = []
+    for sid in dict.fromkeys(hit["_spaceId"] for hit in hits):
+        cached = directory.peek(user_email, sid, service_factory)
+        if cached is None:
+            cold.append(sid)
+        else:
+            members[sid] = cached
+    remaining = s.chat_search_deadline_seconds - (time.monotonic() - started)
+    if cold and remaining > 0:
+        lookup = await fan_out(
+            cold,
+            lambda service, sid: directory.get_members_sync(service, user_email, sid),
+            service_factory,
+            s.chat_search_concurrency,
+            remaining,
+        )
+        members.update(lookup.results)
+
+    for hit in hits:
+        hit["_spaceName"] = names.get(hit["_spaceId"], "Unknown Space")
+        hit["_senderName"], _ = resolve_sender(
+            hit.get("sender", {}), members.get(hit["_spaceId"], {})
+        )
+
+    searched = len(outcome.results) + skipped
+    coverage = {
+        "mode": mode,
+        "spacesTotal": len(space_ids),
+        "spacesSearched": searched,
+        "spacesUnchanged": skipped,
+        "spacesFailed": len(outcome.failed),
+        "spacesTimedOut": len(outcome.timed_out),
+        "complete": searched == len(space_ids),
+        "lookbackDays": s.chat_search_lookback_days,
+        "elapsedMs": int((time.monotonic() - started) * 1000),
+    }
+    return hits, coverage
@@ -0,0 +1,314 @@
+"""Async, pooled Google Chat webhook delivery.
+
+``card_delivery`` used to POST with blocking ``requests.post`` inside a worker
+thread, sleeping with ``time.sleep`` between retries and opening a new
+connection for every part.  This module provides:
+
+- ``WebhookClient``: one pooled ``httpx.AsyncClient`` per webhook host
+  (HTTP/2 when the optional ``h2`` package is installed), non-blocking
+  full-jitter backoff that honours ``Retry-After``, and a per-space rate
+  limit (Chat accepts about one message per second per space).
+- ``DeliveryQueue``: an optional in-process queue so a tool can return once
+  a card is accepted for delivery; results are kept for status lookups.
+- ``shutdown_webhook_delivery``: called from the server lifespan; finishes
+  queued deliveries, then closes every pooled client.
+
+Usage:
+    resp = await get_webhook_client().post(url, payload)
+    delivery_id = get_delivery_queue().submit(coro_factory)
+"""
+
+import asyncio
+import random
+import time
+import urllib.parse
+import uuid
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+import httpx
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger(__name__)
+
+try:
+    import h2  # noqa: F401 -- enables HTTP/2 in httpx
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_TIMEOUT = 30.0
+BACKOFF_BASE_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 16.0
+MAX_RETRY_AFTER_SECONDS = 60.0
+SHUTDOWN_DRAIN_SECONDS = 30.0
+
+
+def is_retryable_status(code: int) -> bool:
+    return code == 429 or code >= 500
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse ``Retry-After`` (delta-seconds or HTTP-date)."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+async def _close_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception:
+        pass
+
+
+def _space_key(url: str) -> str:
+    """Rate-limit key: webhook host + path (``/v1/spaces/{space}/messages``)."""
+    parsed = urllib.parse.urlparse(url)
+    return f"{parsed.hostname}{parsed.path}"
+
+
+class WebhookClient:
+    """Pooled async webhook poster with retry and per-space rate limiting."""
+
+    def __init__(
+        self, min_interval_seconds: float = 1.0, timeout: float = DEFAULT_TIMEOUT
+    ):
+        self.min_interval_seconds = min_interval_seconds
+        self.timeout = timeout
+        # host -> (event loop, client); clients are bound to the loop that made them
+        self._clients: Dict[
+            str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]
+        ] = {}
+        # Close tasks for clients replaced after a loop change
+        self._closing: Set[asyncio.Task] = set()
+        self._next_slot: Dict[str, float] = {}
+        self._slot_locks: Dict[str, asyncio.Lock] = {}
+
+    def _client_for(self, url: str) -> httpx.AsyncClient:
+        host = urllib.parse.urlparse(url).hostname or ""
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(host)
+        if entry is None or entry[0] is not loop or entry[1].is_closed:
+            if entry is not None:
+                self._retire(*entry)
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+                headers={"Content-Type": "application/json"},
+            )
+            self._clients[host] = (loop, client)
+            return client
+        return entry[1]
+
+    def _retire(
+        self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+    ) -> None:
+        """Close a client that is being dropped from the pool.
+
+        A client whose loop is still running elsewhere is closed on that loop;
+        otherwise it is closed on the current loop (connections that died with
+        their loop just fail to close quietly).
+        """
+        if client.is_closed:
+            return
+        current = asyncio.get_running_loop()
+        if loop is not current and loop.is_running():
+            asyncio.run_coroutine_threadsafe(_close_quietly(client), loop)
+            return
+        task = current.create_task(_close_quietly(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def acquire_slot(self, key: str) -> None:
+        """Space sends to the same webhook at least ``min_interval_seconds`` apart."""
+        if self.min_interval_seconds <= 0:
+            return
+        lock = self._slot_locks.setdefault(key, asyncio.Lock())
+        # Reserve the next free slot under the lock, then sleep without it so
+        # later callers can queue their own slots behind this one.
+        async with lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(key, 0.0))
+            self._next_slot[key] = slot + self.min_interval_seconds
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def _push_back(self, key: str, delay: float) -> None:
+        """After a 429, hold further sends to the space until the delay passes."""
+        self._next_slot[key] = max(
+            self._next_slot.get(key, 0.0), time.monotonic() + delay
+        )
+
+    async def post(
+        self,
+        url: str,
+        payload: dict,
+        *,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> httpx.Response:
+        """POST ``payload`` with rate limiting and jittered retry.
+
+        Returns the last response (possibly a retryable status once retries
+        are exhausted); raises ``httpx.TransportError`` if every attempt
+        failed at the transport level.
+        """
+        key = _space_key(url)
+        client = self._client_for(url)
+        last_exc: Optional[Exception] = None
+        response: Optional[httpx.Response] = None
+
+        for attempt in range(max_retries):
+            await self.acquire_slot(key)
+            retry_after = None
+            try:
+                response = await client.post(url, json=payload)
+                if not is_retryable_status(response.status_code):
+                    return response
+                last_exc = None
+                retry_after = _retry_after_seconds(response)
+            except httpx.TransportError as exc:
+                last_exc = exc
+
+            if attempt < max_retries - 1:
+                cap = min(MAX_BACKOFF_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+                delay = (
+                    min(retry_after, MAX_RETRY_AFTER_SECONDS)
+                    if retry_after is not None
+                    else random.uniform(0, cap)
+                )
+                if response is not None and response.status_code == 429:
+                    self._push_back(key, delay)
+                logger.warning(
+                    "Webhook POST attempt %d/%d failed — retrying in %.1fs",
+                    attempt + 1,
+                    max_retries,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+        if last_exc is not None:
+            raise last_exc
+        return response  # type: ignore[return-value]
+
+    async def aclose(self) -> None:
+        """Close every pooled client, including ones replaced on a loop change."""
+        entries = list(self._clients.values())
+        self._clients.clear()
+        for loop, client in entries:
+            self._retire(loop, client)
+        if self._closing:
+            await asyncio.gather(*list(self._closing))
+
+
+class DeliveryQueue:
+    """Background delivery jobs with bounded result history."""
+
+    def __init__(self, max_results: int = 256):
+        self.max_results = max_results
+        self._results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tasks: set = set()
+
+    def submit(self, job: Callable[[], Awaitable[Any]]) -> str:
+        """Schedule ``job`` on the running loop; returns a delivery ID."""
+        delivery_id = uuid.uuid4().hex[:12]
+        self._record(delivery_id, {"status": "queued", "result": None})
+
+        async def _run():
+            try:
+                result = await job()
+                status = "delivered" if getattr(result, "success", True) else "failed"
+                self._record(delivery_id, {"status": status, "result": result})
+                if status == "failed":
+                    logger.warning(
+                        "Queued card delivery %s failed: %s",
+                        delivery_id,
+                        getattr(result, "error", None),
+                    )
+            except Exception as exc:
+                logger.error("Queued card delivery %s raised: %s", delivery_id, exc)
+                self._record(
+                    delivery_id, {"status": "failed", "result": None, "error": str(exc)}
+                )
+
+        task = asyncio.get_running_loop().create_task(_run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return delivery_id
+
+    def _record(self, delivery_id: str, entry: Dict[str, Any]) -> None:
+        self._results[delivery_id] = entry
+        self._results.move_to_end(delivery_id)
+        while len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+
+    def status(self, delivery_id: str) -> Optional[Dict[str, Any]]:
+        return self._results.get(delivery_id)
+
+    @property
+    def pending(self) -> int:
+        """Deliveries submitted but not yet finished."""
+        return len(self._tasks)
+
+    async def drain(self) -> None:
+        """Wait for all in-flight deliveries (used at shutdown and in tests)."""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+
+_client: Optional[WebhookClient] = None
+_queue: Optional[DeliveryQueue] = None
+
+
+def get_webhook_client() -> WebhookClient:
+    """Process-wide webhook client."""
+    global _client
+    if _client is None:
+        from config.settings import get_settings
+
+        _client = WebhookClient(
+            min_interval_seconds=get_settings().chat_webhook_min_interval_seconds
+        )
+    return _client
+
+
+def get_delivery_queue() -> DeliveryQueue:
+    """Process-wide background delivery queue."""
+    global _queue
+    if _queue is None:
+        _queue = DeliveryQueue()
+    return _queue
+
+
+async def shutdown_webhook_delivery(
+    drain_timeout: float = SHUTDOWN_DRAIN_SECONDS,
+) -> None:
+    """Finish queued deliveries (cancelling any left after ``drain_timeout``),
+    then close the pooled webhook clients."""
+    if _queue is not None and _queue.pending:
+        pending = _queue.pending
+        try:
+            await asyncio.wait_for(_queue.drain(), drain_timeout)
+            logger.info("📨 Drained %d queued card delivery(ies)", pending)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "⚠️ Cancelled %d card delivery(ies) still queued after %.0fs",
+                _queue.pending,
+                drain_timeout,
+            )
+    if _client is not None:
+        await _client.aclose()
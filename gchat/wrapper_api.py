@@ -364,6 +364,87 @@ def search_patterns_for_card(
     return result
 
 
+async def search_patterns_for_card_async(
+    description: str,
+    limit: int = 5,
+    require_positive_feedback: bool = True,
+) -> Dict[str, Any]:
+    """
+    Async variant of search_patterns_for_card for use inside async tools.
+
+    The hybrid branch uses ``search_hybrid_dispatch_async`` (concurrent
+    prefetch stages on the shared AsyncQdrantClient) so the caller no longer
+    needs to hold an executor thread for the whole search.  The two DSL
+    searches run concurrently.
+
+    Args/Returns: same as search_patterns_for_card.
+    """
+    import asyncio
+
+    wrapper = _setup.get_card_framework_wrapper()
+
+    extracted = wrapper.extract_dsl_from_text(description)
+
+    result = {
+        "has_dsl": extracted.get("has_dsl", False),
+        "dsl": extracted.get("dsl"),
+        "query_description": extracted.get("description", description),
+        "patterns": [],
+        "classes": [],
+    }
+
+    if extracted.get("has_dsl"):
+        logger.info(f"🔤 DSL search (async): {extracted['dsl']}")
+
+        pattern_results, class_results = await asyncio.gather(
+            asyncio.to_thread(
+                wrapper.search_by_dsl,
+                text=description,
+                limit=limit,
+                score_threshold=0.3,
+                vector_name="inputs",
+                type_filter="instance_pattern",
+            ),
+            asyncio.to_thread(
+                wrapper.search_by_dsl,
+                text=description,
+                limit=limit,
+                score_threshold=0.3,
+                vector_name="components",
+                type_filter="class",
+            ),
+        )
+
+        result["patterns"] = pattern_results
+        result["classes"] = class_results
+    else:
+        feedback_filter = "positive" if require_positive_feedback else None
+
+        (
+            class_results,
+            content_patterns,
+            form_patterns,
+        ) = await wrapper.search_hybrid_dispatch_async(
+            description=description,
+            component_paths=None,
+            limit=limit,
+            token_ratio=1.0,
+            content_feedback=feedback_filter,
+            form_feedback=feedback_filter,
+            include_classes=True,
+        )
+
+        result["classes"] = class_results
+        result["patterns"] = content_patterns
+
+    logger.info(
+        f"Pattern search (async): {len(result['classes'])} classes, "
+        f"{len(result['patterns'])} patterns (DSL={result['has_dsl']})"
+    )
+
+    return result
+
+
 # =============================================================================
 # AUTO-GENERATED DSL DOCUMENTATION
 # =============================================================================
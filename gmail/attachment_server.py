@@ -94,6 +94,28 @@ def _get_secure_temp_dir() -> str:
     return temp_dir
 
 
+def allocate_attachment(filename: str) -> tuple[str, str]:
+    """Reserve a UUID-prefixed temp path for content written incrementally.
+
+    Args:
+        filename: Original filename (sanitized).
+
+    Returns:
+        ``(file_id, file_path)``; write to ``file_path``, then serve
+        ``file_id`` via ``generate_attachment_url()``.
+    """
+    temp_dir = _get_secure_temp_dir()
+    file_id = uuid.uuid4().hex
+    safe_name = os.path.basename(filename) or "attachment"
+    file_path = os.path.join(temp_dir, f"{file_id}_{safe_name}")
+    # Ensure cleanup task is running
+    try:
+        start_cleanup_task()
+    except RuntimeError:
+        pass  # No event loop yet — cleanup will happen on next save
+    return file_id, file_path
+
+
 def save_attachment(raw_bytes: bytes, filename: str) -> str:
     """Save attachment bytes to temp dir with UUID prefix.
 
@@ -104,21 +126,12 @@ def save_attachment(raw_bytes: bytes, filename: str) -> str:
     Returns:
         file_id: UUID string used to retrieve the file.
     """
-    temp_dir = _get_secure_temp_dir()
-    file_id = uuid.uuid4().hex
-    safe_name = os.path.basename(filename) or "attachment"
-    disk_name = f"{file_id}_{safe_name}"
-    file_path = os.path.join(temp_dir, disk_name)
+    file_id, file_path = allocate_attachment(filename)
 
     with open(file_path, "wb") as f:
         f.write(raw_bytes)
 
     logger.info("Attachment saved: %s (%d bytes)", file_id[:8], len(raw_bytes))
-    # Ensure cleanup task is running
-    try:
-        start_cleanup_task()
-    except RuntimeError:
-        pass  # No event loop yet — cleanup will happen on next save
     return file_id
 
 
@@ -21,6 +21,8 @@ from typing_extensions import Annotated, List, Literal, Optional, Union
 from auth.context import get_auth_middleware
 from config.enhanced_logging import setup_logger
 from config.settings import settings
+from people.allowlist_index import get_allowlist_index
+from people.contact_index import normalize_email
 from tools.common_types import UserGoogleEmail
 
 from .gmail_types import (
@@ -339,117 +341,14 @@ async def _get_people_service_for_allow_list(user_email: UserGoogleEmail):
         return None
 
 
-async def _resolve_allowed_group_ids(
-    group_specs: List[str], people_service
-) -> List[str]:
-    """
-    Resolve configured group specs into concrete contact group resourceNames.
-
-    Supports:
-      - "group:Team A" → resolved via contactGroups.list() name matching
-      - "groupId:contactGroups/123" → used as-is
-
-    Returns:
-        List of contact group resourceNames to treat as trusted groups.
-    """
-    allowed_ids: List[str] = []
-    try:
-        # Fetch user's contact groups once for name → resourceName mapping
-        def _list_groups():
-            return people_service.contactGroups().list(pageSize=200).execute()
-
-        result = await asyncio.to_thread(_list_groups)
-        groups = result.get("contactGroups", []) or []
-        name_to_id = {
-            g.get("name", ""): g.get("resourceName")
-            for g in groups
-            if g.get("name") and g.get("resourceName")
-        }
-
-        for spec in group_specs:
-            value = spec.strip()
-            lower = value.lower()
-            if lower.startswith("groupid:"):
-                gid = value[len("groupId:") :].strip()
-                if gid:
-                    allowed_ids.append(gid)
-            elif lower.startswith("group:"):
-                group_name = value[len("group:") :].strip()
-                gid = name_to_id.get(group_name)
-                if gid:
-                    allowed_ids.append(gid)
-                else:
-                    logger.warning(
-                        f"[allow_list_groups] No contact group found with name '{group_name}'"
-                    )
-            else:
-                logger.warning(
-                    f"[allow_list_groups] Unknown group spec format: {value}"
-                )
-
-    except Exception as e:
-        logger.error(
-            f"Failed to resolve allow list group specs via People API: {e}",
-            exc_info=True,
-        )
-
-    return allowed_ids
-
-
-async def _get_contact_group_ids_for_email(email: str, people_service) -> List[str]:
-    """
-    Fetch contact group resourceNames for a given email using People API.
-
-    This uses people.searchContacts with readMask including memberships.
-    Returns:
-        List of contact group resourceNames the person belongs to.
-    """
-    group_ids: List[str] = []
-    try:
-
-        def _search():
-            # searchContacts returns results containing person objects
-            return (
-                people_service.people()
-                .searchContacts(query=email, readMask="emailAddresses,memberships")
-                .execute()
-            )
-
-        result = await asyncio.to_thread(_search)
-        # Handle both "results" (searchContacts) and possible "connections"/"people" structures
-        containers = (
-            result.get("results")
-            or result.get("connections")
-            or result.get("people")
-            or []
-        )
-
-        for item in containers:
-            person = item.get("person", item)
-            for membership in person.get("memberships", []):
-                cgm = membership.get("contactGroupMembership")
-                if cgm:
-                    gid = cgm.get("contactGroupResourceName")
-                    if gid:
-                        group_ids.append(gid)
-
-    except Exception as e:
-        logger.error(
-            f"Failed to fetch contact group memberships for {email}: {e}", exc_info=True
-        )
-
-    return group_ids
-
-
 async def _filter_recipients_allowed_by_groups(
     recipients: List[str], group_specs: List[str], user_google_email: UserGoogleEmail
 ) -> List[str]:
     """
     Determine which recipients should be considered allowed based on group specs.
 
-    Uses People API to:
-      1) Resolve configured group specs → contact group resourceNames
-      2) For each recipient, fetch memberships and see if they belong to any allowed group
+    Members of the configured contact groups are expanded once per user by
+    the allow-list membership index; each recipient is then a set lookup.
 
     Returns:
         List of recipient emails that are allowed via contact group membership.
@@ -460,21 +359,23 @@ async def _filter_recipients_allowed_by_groups(
     if not people_service:
         return allowed_recipients
 
-    allowed_group_ids = await _resolve_allowed_group_ids(group_specs, people_service)
-    if not allowed_group_ids:
+    try:
+        allowed_emails = await get_allowlist_index(user_google_email).allowed_emails(
+            people_service, group_specs
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to expand allow list group members via People API: {e}",
+            exc_info=True,
+        )
         return allowed_recipients
 
-    allowed_group_ids_set = set(allowed_group_ids)
-
     # De-duplicate recipients for efficiency
-    unique_recipients = sorted(set(recipients))
-    for email in unique_recipients:
-        group_ids = await _get_contact_group_ids_for_email(email, people_service)
-        if not group_ids:
-            continue
-
-        if allowed_group_ids_set.intersection(group_ids):
-            allowed_recipients.append(email)
+    allowed_recipients = [
+        email
+        for email in sorted(set(recipients))
+        if normalize_email(email) in allowed_emails
+    ]
 
     if allowed_recipients:
         logger.info(
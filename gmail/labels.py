@@ -427,6 +427,22 @@ def _handle_gmail_api_error(error: Exception, operation: str) -> str:
 # user_google_email: UserGoogleEmail = None,,
 
 
+def _label_info(label: Dict[str, Any]) -> GmailLabelInfo:
+    """``list_gmail_labels`` entry for a Gmail label resource."""
+    return {
+        "id": label.get("id", ""),
+        "name": label.get("name", ""),
+        "type": label.get("type", "user"),
+        "messageListVisibility": label.get("messageListVisibility"),
+        "labelListVisibility": label.get("labelListVisibility"),
+        "color": label.get("color"),
+        "messagesTotal": label.get("messagesTotal"),
+        "messagesUnread": label.get("messagesUnread"),
+        "threadsTotal": label.get("threadsTotal"),
+        "threadsUnread": label.get("threadsUnread"),
+    }
+
+
 async def list_gmail_labels(
     user_google_email: UserGoogleEmail = None,
 ) -> GmailLabelsResponse:
@@ -560,61 +576,16 @@ async def list_gmail_labels(
         for label_data in labels_data:
             label_id = label_data.get("id", "")
 
-            # Use detailed data from batch response if available, otherwise use basic data
-            if label_id in label_details:
-                detailed_label = label_details[label_id]
-                # Additional safety check to ensure it's a dictionary (should be guaranteed by batch_callback fix)
-                if isinstance(detailed_label, dict):
-                    label_info: GmailLabelInfo = {
-                        "id": detailed_label.get("id", ""),
-                        "name": detailed_label.get("name", ""),
-                        "type": detailed_label.get("type", "user"),
-                        "messageListVisibility": detailed_label.get(
-                            "messageListVisibility"
-                        ),
-                        "labelListVisibility": detailed_label.get(
-                            "labelListVisibility"
-                        ),
-                        "color": detailed_label.get("color"),
-                        "messagesTotal": detailed_label.get("messagesTotal"),
-                        "messagesUnread": detailed_label.get("messagesUnread"),
-                        "threadsTotal": detailed_label.get("threadsTotal"),
-                        "threadsUnread": detailed_label.get("threadsUnread"),
-                    }
-                else:
-                    # This should not happen anymore due to batch_callback fix, but adding as extra safety
-                    logger.warning(
-                        f"Invalid detailed_label type for {label_id}: {type(detailed_label)}, falling back to basic info"
-                    )
-                    # Fallback to basic info if detailed response is not a dict
-                    label_info: GmailLabelInfo = {
-                        "id": label_id,
-                        "name": label_data.get("name", ""),
-                        "type": label_data.get("type", "user"),
-                        "messageListVisibility": label_data.get(
-                            "messageListVisibility"
-                        ),
-                        "labelListVisibility": label_data.get("labelListVisibility"),
-                        "color": label_data.get("color"),
-                        "messagesTotal": None,  # Not available without detailed info
-                        "messagesUnread": None,  # Not available without detailed info
-                        "threadsTotal": None,  # Not available without detailed info
-                        "threadsUnread": None,  # Not available without detailed info
-                    }
-            else:
-                # Fallback to basic info if batch request failed for this label
-                label_info: GmailLabelInfo = {
-                    "id": label_id,
-                    "name": label_data.get("name", ""),
-                    "type": label_data.get("type", "user"),
-                    "messageListVisibility": label_data.get("messageListVisibility"),
-                    "labelListVisibility": label_data.get("labelListVisibility"),
-                    "color": label_data.get("color"),
-                    "messagesTotal": None,  # Not available without detailed info
-                    "messagesUnread": None,  # Not available without detailed info
-                    "threadsTotal": None,  # Not available without detailed info
-                    "threadsUnread": None,  # Not available without detailed info
-                }
+            # Use detailed data from batch response if available, otherwise use
+            # basic data (message/thread counts are then None)
+            detailed_label = label_details.get(label_id)
+            if detailed_label is not None and not isinstance(detailed_label, dict):
+                # This should not happen anymore due to batch_callback fix, but adding as extra safety
+                logger.warning(
+                    f"Invalid detailed_label type for {label_id}: {type(detailed_label)}, falling back to basic info"
+                )
+                detailed_label = None
+            label_info = _label_info(detailed_label or label_data)
 
             all_labels.append(label_info)
 
@@ -10,8 +10,9 @@ Lifespan Composition Order (enter left-to-right, exit right-to-left):
 2. colbert_lifespan → Initialize ColBERT wrapper (if enabled)
 3. session_state_lifespan → Setup session filtering middleware
 4. cache_middleware_lifespan → Setup template & profile middleware
-5. memory_cleanup_lifespan → Periodic cleanup of stale sessions & expired caches
-6. dynamic_instructions_lifespan → Update MCP instructions with Qdrant data
+5. webhook_delivery_lifespan → Drain queued card deliveries, close webhook clients
+6. memory_cleanup_lifespan → Periodic cleanup of stale sessions & expired caches
+7. dynamic_instructions_lifespan → Update MCP instructions with Qdrant data
 
 Context Available to Tools:
 After lifespan composition, ctx.lifespan_context will contain:
@@ -36,6 +37,7 @@ from .server_lifespans import (
     register_qdrant_middleware,
     register_template_middleware,
     session_state_lifespan,
+    webhook_delivery_lifespan,
 )
 
 __all__ = [
@@ -44,6 +46,7 @@ __all__ = [
     "colbert_lifespan",
     "session_state_lifespan",
     "cache_middleware_lifespan",
+    "webhook_delivery_lifespan",
     "memory_cleanup_lifespan",
     "dynamic_instructions_lifespan",
     "combined_server_lifespan",
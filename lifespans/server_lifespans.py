@@ -132,6 +132,16 @@ async def qdrant_lifespan(server: Any):
     # Async initialization with background reindexing
     await qdrant_middleware.initialize_middleware_and_reindexing()
 
+    # Load the shared tool co-usage graph (if enabled)
+    tool_graph = getattr(qdrant_middleware, "_tool_relationship_graph", None)
+    if tool_graph is not None:
+        from adapters.module_wrapper.tool_graph_store import get_tool_graph_store
+
+        try:
+            await tool_graph.attach_store(get_tool_graph_store())
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load tool relationship graph: {e}")
+
     logger.info("✅ Qdrant lifespan: Initialization complete")
 
     try:
@@ -141,11 +151,27 @@ async def qdrant_lifespan(server: Any):
         logger.info("🔄 Qdrant lifespan: Starting shutdown...")
         await qdrant_middleware.stop_background_reindexing()
 
+        # Persist usage counters recorded since the last periodic flush
+        from middleware.qdrant_core.usage_counters import get_usage_counters
+
+        await asyncio.to_thread(get_usage_counters().flush)
+
+        # Flush and snapshot the tool graph so restarts resume from it
+        if tool_graph is not None:
+            try:
+                await tool_graph.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Could not persist tool relationship graph: {e}")
+
         # Close the Qdrant client connection, cancel tracked background tasks,
         # and release the embedding model memory
         from middleware.qdrant_core.client import close_global_client_manager
 
         await close_global_client_manager()
+
+        from config.qdrant_client import close_async_qdrant_client
+
+        await close_async_qdrant_client()
         logger.info(
             "✅ Qdrant lifespan shutdown complete (reindexing stopped, client closed, memory released)"
         )
@@ -278,6 +304,30 @@ async def cache_middleware_lifespan(server: Any):
         )
 
 
+@lifespan
+async def webhook_delivery_lifespan(server: Any):
+    """
+    Chat webhook delivery lifecycle.
+
+    On shutdown, waits for cards queued for background delivery
+    (gchat/webhook_client.py) and then closes the pooled webhook clients.
+
+    Yields:
+        Dict with 'webhook_delivery_managed' flag
+    """
+    try:
+        yield {"webhook_delivery_managed": True}
+    finally:
+        logger.info("🔄 Webhook delivery lifespan: Draining queued deliveries...")
+        try:
+            from gchat.webhook_client import shutdown_webhook_delivery
+
+            await shutdown_webhook_delivery()
+            logger.info("✅ Webhook delivery shutdown complete (clients closed)")
+        except Exception as e:
+            logger.warning(f"⚠️ Webhook delivery shutdown failed: {e}")
+
+
 # =========================================================================
 # Memory monitoring & watchdog configuration
 # =========================================================================
@@ -369,16 +419,58 @@ def _gc_callback(phase: str, info: Dict[str, Any]) -> None:
         )
 
 
+# RSS after the last pressure eviction; only growth past it counts as new
+# pressure.  Most RSS is model weights that cache eviction cannot free, so
+# measuring pressure from the warn threshold alone would evict a quarter of
+# every cache on each pass until they were empty.
+_pressure_floor_mb: Optional[float] = None
+# Pressure tracking resets once RSS falls this far below the warn threshold
+_PRESSURE_RESET_PCT = 0.9
+
+
+def _enforce_cache_budget() -> Dict[str, int]:
+    """Sample RSS and shrink registered caches if over budget or under pressure.
+
+    Above the warn threshold, caches shrink once and then only again while RSS
+    keeps growing past the level seen after the previous pressure eviction.
+    """
+    global _pressure_floor_mb
+    from config.cache_registry import get_cache_registry
+
+    rss_mb = _get_rss_mb()
+    if rss_mb < _WARN_THRESHOLD_MB * _PRESSURE_RESET_PCT:
+        _pressure_floor_mb = None
+    floor_mb = max(_WARN_THRESHOLD_MB, _pressure_floor_mb or 0.0)
+    pressure_mb = max(0.0, rss_mb - floor_mb)
+    evicted = get_cache_registry().enforce(pressure_bytes=int(pressure_mb * 1048576))
+    if pressure_mb > 0:
+        _pressure_floor_mb = rss_mb
+    return evicted
+
+
+async def _cache_budget_loop(interval_seconds: Optional[float] = None) -> None:
+    """Background task: keeps in-process caches within the memory budget.
+
+    RSS sampling is a single syscall and size estimates are sampled, so this
+    runs often and evicts a little at a time rather than walking the heap.
+    """
+    from config.settings import settings
+
+    interval = interval_seconds or settings.cache_budget_sample_seconds
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            _enforce_cache_budget()
+        except Exception as e:
+            logger.warning(f"Cache budget enforcement error: {e}")
+
+
 async def _periodic_memory_cleanup(
     interval_seconds: float = _CLEANUP_INTERVAL,
     shutdown_event: Optional[asyncio.Event] = None,
 ) -> None:
     """Background task: cleans stale data, monitors RSS, triggers watchdog."""
-    import objgraph
-
-    # Prime objgraph baseline (first call returns everything, subsequent calls show deltas)
-    loop = asyncio.get_running_loop()
-    await loop.run_in_executor(None, objgraph.growth, 0)
+    from config.cache_registry import get_cache_registry
 
     cycle_count = 0
 
@@ -427,19 +519,15 @@ async def _periodic_memory_cleanup(
             if cycle_count % 6 == 0 or rss_mb > _WARN_THRESHOLD_MB:
                 health = _get_process_health()
                 logger.info(f"Process health: {health}")
-
-            # objgraph growth check every 3rd cycle (~15 min)
-            # Run in executor — gc.get_objects() walks the entire heap and blocks
-            if cycle_count % 3 == 0:
-                loop = asyncio.get_running_loop()
-                growth = await loop.run_in_executor(None, objgraph.growth, 10)
-                if growth:
-                    notable = [(t, c, d) for t, c, d in growth if d > 100]
-                    if notable:
-                        logger.warning(
-                            "Object growth: "
-                            + ", ".join(f"{t}(+{d})" for t, _, d in notable)
-                        )
+                cache_stats = get_cache_registry().stats()
+                logger.info(
+                    f"Cache memory: {cache_stats['total_bytes'] / 1048576:.1f}MB "
+                    f"of {cache_stats['budget_bytes'] / 1048576:.0f}MB budget — "
+                    + ", ".join(
+                        f"{name}={c['bytes'] / 1048576:.1f}MB/{c['hit_rate']:.0%} hit"
+                        for name, c in cache_stats["caches"].items()
+                    )
+                )
 
             # --- Watchdog: memory threshold checks ---
 
@@ -460,47 +548,17 @@ async def _periodic_memory_cleanup(
                 logger.warning(
                     f"RSS {rss_mb:.0f}MB exceeds warning threshold "
                     f"{_WARN_THRESHOLD_MB}MB ({_MEMORY_WARN_PCT:.0%} of {_MEMORY_LIMIT_MB}MB) "
-                    f"— proactively evicting caches"
+                    f"— shrinking caches"
                 )
 
-                # Proactive cache eviction to prevent reaching critical threshold
-                evicted_total = 0
-
-                # Clear dashboard cache (in-memory portion)
-                try:
-                    from middleware.dashboard_cache_middleware import (
-                        clear_dashboard_cache,
-                    )
-
-                    evicted_total += clear_dashboard_cache()
-                except Exception as e:
-                    logger.debug(f"Dashboard cache clear skipped: {e}")
-
-                # Clear profile cache
-                profile_mw = cache_refs.get("profile_middleware")
-                if profile_mw is not None:
-                    try:
-                        profile_mw.clear_cache()
-                        evicted_total += 1  # count as 1 batch operation
-                    except Exception as e:
-                        logger.debug(f"Profile cache clear skipped: {e}")
-
-                # Clear template cache
-                template_mw = cache_refs.get("template_middleware")
-                if template_mw is not None:
-                    try:
-                        cm = getattr(template_mw, "cache_manager", None)
-                        if cm is not None:
-                            evicted_total += cm.cleanup_expired_entries()
-                    except Exception as e:
-                        logger.debug(f"Template cache clear skipped: {e}")
-
-                # Force garbage collection
+                # Priority-aware partial eviction (the budget loop keeps
+                # shrinking caches gradually while RSS keeps growing)
+                evicted = _enforce_cache_budget()
                 gc.collect()
 
                 rss_after = _get_rss_mb()
                 logger.warning(
-                    f"Proactive eviction complete: {evicted_total} items evicted, "
+                    f"Proactive eviction complete: {sum(evicted.values())} items evicted, "
                     f"RSS {rss_mb:.0f}MB -> {rss_after:.0f}MB "
                     f"(freed ~{rss_mb - rss_after:.0f}MB)"
                 )
@@ -516,8 +574,9 @@ async def memory_cleanup_lifespan(server: Any):
 
     Integrates:
     - Cache/session cleanup (every 5 min)
+    - Cache memory budget: RSS sampling + priority-aware partial eviction
+      of registered caches (every CACHE_BUDGET_SAMPLE_SECONDS)
     - psutil RSS/FD/CPU tracking (every 30 min, or when elevated)
-    - objgraph.growth() leak detection (every 15 min)
     - gc.callbacks for uncollectable reference cycles
     - aiodebug slow event-loop callback detection
     - aiomonitor async task inspector (localhost:20101)
@@ -575,6 +634,7 @@ async def memory_cleanup_lifespan(server: Any):
     cleanup_task = asyncio.create_task(
         _periodic_memory_cleanup(shutdown_event=shutdown_event)
     )
+    budget_task = asyncio.create_task(_cache_budget_loop())
 
     rss_mb = _get_rss_mb()
     logger.info(
@@ -604,8 +664,9 @@ async def memory_cleanup_lifespan(server: Any):
     finally:
         # Cancel background tasks
         cleanup_task.cancel()
+        budget_task.cancel()
         watchdog_task.cancel()
-        for t in (cleanup_task, watchdog_task):
+        for t in (cleanup_task, budget_task, watchdog_task):
             try:
                 await t
             except asyncio.CancelledError:
@@ -904,6 +965,7 @@ combined_server_lifespan = (
     | colbert_lifespan
     | session_state_lifespan
     | cache_middleware_lifespan
+    | webhook_delivery_lifespan
     | memory_cleanup_lifespan
     | cache_keepalive_lifespan  # After cleanup — needs DSL docs available
     | dynamic_instructions_lifespan
@@ -5,17 +5,27 @@ used by real tool calls (DSL docs, symbols, validation rules) to keep
 Anthropic's prompt cache warm.  Keepalive calls double as exploration —
 varying the user message after the cached prefix to discover new DSL
 patterns that can be indexed back into Qdrant.
+
+Scheduling is per module: each module's prefix is refreshed shortly before
+the provider cache TTL runs out, counted from its last cache-warming use.
+Real sampling calls with the same system prompt (``record_prefix_use``)
+count as warming uses, so a module kept warm by traffic gets no keepalive.
+A due keepalive is only sent when the expected savings on the next real
+call outweigh its cost; due modules are refreshed concurrently.
 """
 
 import asyncio
+import hashlib
 import json as _json
+import math
 import os
 import random
 import tempfile
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from config.enhanced_logging import setup_logger
 
@@ -278,6 +288,13 @@ class KeepaliveModuleConfig:
     total_full_price_usd: float = 0.0  # what it would cost without caching
     total_savings_usd: float = 0.0
 
+    # Scheduling state
+    last_warmed_at: float = 0.0  # last real or keepalive call with this prefix
+    next_keepalive_at: float = 0.0
+    traffic_refreshes: int = 0  # real calls that refreshed the prefix
+    skipped_unprofitable: int = 0
+    recent_traffic: Deque[float] = field(default_factory=lambda: deque(maxlen=64))
+
 
 # ---------------------------------------------------------------------------
 # System prompt builders — reuse the exact same context that real tool
@@ -636,15 +653,32 @@ _MODULE_PROMPT_BUILDERS: Dict[str, Callable[[], str]] = {
 # Engine
 # ---------------------------------------------------------------------------
 
+# Seconds between scheduler wake-ups at most (budget/idleness re-checks)
+_MAX_TICK_SECONDS = 60
+
+# Engine receiving real-traffic prefix uses (set while started)
+_active_engine: Optional["CacheKeepaliveEngine"] = None
+
+
+def _prefix_hash(system_prompt: str) -> str:
+    return hashlib.sha1(system_prompt.encode("utf-8", "replace")).hexdigest()
+
+
+def record_prefix_use(system_prompt: Optional[str]) -> None:
+    """Tell the running keepalive engine a real call used *system_prompt*."""
+    engine = _active_engine
+    if engine is not None and system_prompt:
+        engine.note_prefix_use(system_prompt)
+
 
 class CacheKeepaliveEngine:
     """Manages periodic keepalive calls to keep Anthropic prompt cache warm.
 
     Each registered module has its own system prompt prefix.  The engine
-    rotates through modules, sending a sampling call whose system message
-    matches the real validation agent prefix so Anthropic's cache stays
-    warm.  In *explore* mode the user message varies to discover novel
-    DSL patterns; in *ping* mode a minimal ack is requested.
+    schedules each module independently, sending a sampling call whose
+    system message matches the real validation agent prefix so Anthropic's
+    cache stays warm.  In *explore* mode the user message varies to
+    discover novel DSL patterns; in *ping* mode a minimal ack is requested.
     """
 
     def __init__(self, settings: Any) -> None:
@@ -655,6 +689,8 @@ class CacheKeepaliveEngine:
         # Aggregate validation agent costs (fed by sampling middleware)
         self._validation_total_cost_usd: float = 0.0
         self._validation_total_calls: int = 0
+        # sha1(system prompt) -> module name, for matching real traffic
+        self._prefix_index: Dict[str, str] = {}
 
     # -- registration -------------------------------------------------------
 
@@ -662,19 +698,104 @@ class CacheKeepaliveEngine:
         self._modules[config.module_name] = config
         logger.debug("Cache keepalive: registered module '%s'", config.module_name)
 
+    def _index_prefix(self, module: KeepaliveModuleConfig, system_prompt: str) -> None:
+        digest = _prefix_hash(system_prompt)
+        if self._prefix_index.get(digest) != module.module_name:
+            # Prompts can change (e.g. new DSL docs) — drop the old entry
+            self._prefix_index = {
+                h: name
+                for h, name in self._prefix_index.items()
+                if name != module.module_name
+            }
+            self._prefix_index[digest] = module.module_name
+
+    # -- scheduling ---------------------------------------------------------
+
+    def _refresh_after(self) -> float:
+        """Seconds after a warming use at which the next keepalive is due."""
+        interval = self._settings.cache_keepalive_interval_seconds
+        jitter = getattr(self._settings, "cache_keepalive_jitter_seconds", 300)
+        ttl = getattr(self._settings, "cache_keepalive_ttl_seconds", 3600)
+        delay = max(60, interval + random.uniform(-jitter, jitter))
+        # Always land before the provider cache expires
+        return min(delay, max(30, ttl - 30))
+
+    def _mark_warmed(self, module: KeepaliveModuleConfig, at: float) -> None:
+        module.last_warmed_at = at
+        module.next_keepalive_at = at + self._refresh_after()
+
+    def note_prefix_use(self, system_prompt: str) -> None:
+        """Record a real sampling call that used a module's cached prefix."""
+        name = self._prefix_index.get(_prefix_hash(system_prompt))
+        module = self._modules.get(name) if name else None
+        if module is None:
+            return
+        now = time.time()
+        module.traffic_refreshes += 1
+        module.recent_traffic.append(now)
+        self._mark_warmed(module, now)
+
+    def _keepalive_worthwhile(self, module: KeepaliveModuleConfig, now: float) -> bool:
+        """Weigh a due keepalive's cost against the savings it protects.
+
+        A keepalive keeps the prefix cached for one more refresh period; it
+        pays off if a real call arrives in that period (estimated from the
+        module's recent traffic rate) and then reads the prefix at 10% of
+        the input price instead of paying full price.  Modules whose prefix
+        never matched real traffic, or without cost data yet, fall back to
+        the global idleness check.
+        """
+        idle_timeout = getattr(
+            self._settings, "cache_keepalive_idle_timeout_seconds", 3600
+        )
+        if not module.traffic_refreshes or not module.total_keepalive_calls:
+            if not getattr(self._settings, "cache_keepalive_reactive", True):
+                return True
+            try:
+                from middleware.payment.cost_tracker import (
+                    seconds_since_last_activity,
+                )
+
+                return seconds_since_last_activity() <= idle_timeout
+            except Exception:
+                return True
+
+        recent = sum(1 for t in module.recent_traffic if now - t <= idle_timeout)
+        if not recent:
+            return False
+        rate = recent / idle_timeout
+        p_real_call = 1 - math.exp(
+            -rate * self._settings.cache_keepalive_interval_seconds
+        )
+
+        input_rate = self._settings.sampling_input_token_rate
+        output_rate = self._settings.sampling_output_token_rate
+        calls = module.total_keepalive_calls
+        prefix_tokens = module.total_input_tokens / calls
+        output_tokens = module.total_output_tokens / calls
+        expected_savings = p_real_call * prefix_tokens * input_rate * 0.9
+        cost = prefix_tokens * input_rate * 0.1 + output_tokens * output_rate
+        ratio = getattr(self._settings, "cache_keepalive_min_benefit_ratio", 1.0)
+        return expected_savings >= cost * ratio
+
     # -- lifecycle ----------------------------------------------------------
 
     async def start(self) -> None:
+        global _active_engine
         if self._task is not None:
             return
         self._load_persisted_stats()
+        _active_engine = self
         self._task = asyncio.create_task(
             self._keepalive_loop(), name="cache-keepalive-loop"
         )
 
     async def stop(self) -> None:
+        global _active_engine
         if self._task is None:
             return
+        if _active_engine is self:
+            _active_engine = None
         self._task.cancel()
         try:
             await self._task
@@ -694,35 +815,23 @@ class CacheKeepaliveEngine:
         idle_timeout = getattr(
             self._settings, "cache_keepalive_idle_timeout_seconds", 3600
         )
+        concurrency = max(1, getattr(self._settings, "cache_keepalive_concurrency", 2))
         logger.info(
             "Cache keepalive loop started (interval=%ds, jitter=+/-%ds, "
-            "reactive=%s, idle_timeout=%ds, modules=%s)",
+            "reactive=%s, idle_timeout=%ds, concurrency=%d, modules=%s)",
             interval,
             jitter,
             reactive,
             idle_timeout,
+            concurrency,
             list(self._modules.keys()),
         )
 
         # Small initial delay to let the server finish startup
         await asyncio.sleep(5)
 
-        last_loop_at = time.time()
-
+        slots = asyncio.Semaphore(concurrency)
         while True:
-            now = time.time()
-            elapsed = now - last_loop_at
-            # Detect OS sleep / event loop stalls — if elapsed > 2x interval,
-            # the cache TTL almost certainly expired.
-            if elapsed > interval * 2:
-                logger.warning(
-                    "Cache keepalive: loop gap detected (%.0fs elapsed, "
-                    "expected %ds). Likely OS sleep — cache will be cold.",
-                    elapsed,
-                    interval,
-                )
-            last_loop_at = now
-
             # ── Budget gate: skip if monthly budget is exceeded ──
             try:
                 from middleware.payment.cost_tracker import is_budget_exceeded
@@ -734,58 +843,73 @@ class CacheKeepaliveEngine:
             except Exception:
                 pass
 
-            # ── Reactive mode: only send keepalives within idle_timeout
-            #    of the last real sampling activity ──
-            if reactive:
-                try:
-                    from middleware.payment.cost_tracker import (
-                        seconds_since_last_activity,
-                    )
-
-                    idle_secs = seconds_since_last_activity()
-                    if idle_secs > idle_timeout:
-                        logger.debug(
-                            "Cache keepalive: IDLE (%.0fs since last activity, "
-                            "timeout=%ds) — sleeping",
-                            idle_secs,
-                            idle_timeout,
-                        )
-                        # Sleep longer when idle — check again in 60s in case
-                        # a real call happens and we should resume
-                        await asyncio.sleep(60)
-                        continue
-                except Exception:
-                    pass
-
+            now = time.time()
+            to_send: List[KeepaliveModuleConfig] = []
             for module in self._modules.values():
-                try:
-                    result = await self._send_keepalive(module)
-                    ct = result.get("cached_tokens", 0)
-                    savings = result.get("savings_usd", 0)
-                    status = "HIT" if ct > 0 else "MISS"
-                    logger.info(
-                        "Cache keepalive [%s]: %s cached_tokens=%d, "
-                        "call_savings=$%.6f, cumulative_savings=$%.6f, "
-                        "total_calls=%d",
+                if module.next_keepalive_at > now:
+                    continue  # warmed recently (by traffic or a keepalive)
+                # Detect OS sleep / event loop stalls — the cache TTL
+                # almost certainly expired while we weren't looking.
+                if module.next_keepalive_at and (
+                    now - module.next_keepalive_at > _MAX_TICK_SECONDS * 2
+                ):
+                    logger.warning(
+                        "Cache keepalive [%s]: loop gap detected (%.0fs overdue). "
+                        "Likely OS sleep — cache will be cold.",
                         module.module_name,
-                        status,
-                        ct,
-                        savings,
-                        module.total_savings_usd,
-                        module.total_keepalive_calls,
+                        now - module.next_keepalive_at,
                     )
-                except Exception:
-                    logger.exception(
-                        "Cache keepalive [%s]: send failed", module.module_name
+                if self._keepalive_worthwhile(module, now):
+                    to_send.append(module)
+                else:
+                    module.skipped_unprofitable += 1
+                    module.next_keepalive_at = now + _MAX_TICK_SECONDS
+                    logger.debug(
+                        "Cache keepalive [%s]: SKIPPED — idle or not worth the cost",
+                        module.module_name,
                     )
 
-            # Persist stats after each cycle
-            self._save_persisted_stats()
+            if to_send:
+                await asyncio.gather(
+                    *(self._scheduled_keepalive(module, slots) for module in to_send)
+                )
+                # Persist stats after each batch
+                self._save_persisted_stats()
+
+            next_due = min(
+                (m.next_keepalive_at for m in self._modules.values()),
+                default=now + _MAX_TICK_SECONDS,
+            )
+            await asyncio.sleep(
+                min(_MAX_TICK_SECONDS, max(1.0, next_due - time.time()))
+            )
 
-            # Jittered sleep — randomize within [interval - jitter, interval + jitter]
-            sleep_time = interval + random.uniform(-jitter, jitter)
-            sleep_time = max(60, sleep_time)  # floor at 60s
-            await asyncio.sleep(sleep_time)
+    async def _scheduled_keepalive(
+        self, module: KeepaliveModuleConfig, slots: asyncio.Semaphore
+    ) -> None:
+        async with slots:
+            try:
+                result = await self._send_keepalive(module)
+            except Exception:
+                logger.exception(
+                    "Cache keepalive [%s]: send failed", module.module_name
+                )
+                module.next_keepalive_at = time.time() + _MAX_TICK_SECONDS
+                return
+        ct = result.get("cached_tokens", 0)
+        savings = result.get("savings_usd", 0)
+        status = "HIT" if ct > 0 else "MISS"
+        logger.info(
+            "Cache keepalive [%s]: %s cached_tokens=%d, "
+            "call_savings=$%.6f, cumulative_savings=$%.6f, "
+            "total_calls=%d",
+            module.module_name,
+            status,
+            ct,
+            savings,
+            module.total_savings_usd,
+            module.total_keepalive_calls,
+        )
 
     # -- send a single keepalive call ---------------------------------------
 
@@ -794,6 +918,7 @@ class CacheKeepaliveEngine:
         import litellm
 
         system_prompt = module.get_system_prompt_fn()
+        self._index_prefix(module, system_prompt)
 
         if (
             self._settings.cache_keepalive_mode == "explore"
@@ -864,6 +989,7 @@ class CacheKeepaliveEngine:
 
         # Update module stats
         module.last_keepalive_at = time.time()
+        self._mark_warmed(module, module.last_keepalive_at)
         module.cached_tokens_last = cached_tokens
         module.total_keepalive_calls += 1
         module.total_cached_tokens += cached_tokens
@@ -1087,6 +1213,10 @@ class CacheKeepaliveEngine:
                 "total_savings_usd": round(mod.total_savings_usd, 6),
                 "last_keepalive_at": mod.last_keepalive_at,
                 "cached_tokens_last": mod.cached_tokens_last,
+                "last_warmed_at": mod.last_warmed_at,
+                "next_keepalive_at": mod.next_keepalive_at,
+                "traffic_refreshes": mod.traffic_refreshes,
+                "skipped_unprofitable": mod.skipped_unprofitable,
             }
             total_calls += mod.total_keepalive_calls
             total_cached += mod.total_cached_tokens
@@ -23,6 +23,7 @@ from fastmcp.server.middleware import Middleware, MiddlewareContext
 from fastmcp.tools import ToolResult
 from mcp.types import TextContent
 
+from config.cache_registry import register_cache, sampled_size
 from config.enhanced_logging import setup_logger
 
 logger = setup_logger()
@@ -56,6 +57,25 @@ _watched_tools: Set[str] = set()
 _last_dashboard_tool: Optional[str] = None
 
 
+def _evict_oldest_results(fraction: float) -> int:
+    """Drop the oldest ``fraction`` of in-memory results (memory budget)."""
+    oldest = sorted(_result_cache.values(), key=lambda e: e.timestamp)
+    victims = oldest[: max(1, int(len(oldest) * fraction))] if oldest else []
+    for entry in victims:
+        _result_cache.pop(entry.tool_name, None)
+    return len(victims)
+
+
+_cache_handle = register_cache(
+    "dashboard_results",
+    size_fn=lambda: sampled_size(
+        (e.data for e in list(_result_cache.values())), len(_result_cache)
+    ),
+    evict_fn=_evict_oldest_results,
+    priority=2,  # last-result snapshots; Redis and the next tool call refill it
+)
+
+
 def set_redis_store(store: Any) -> None:
     """Set the Redis store for dashboard cache offloading."""
     global _redis_store
@@ -75,7 +95,11 @@ def get_cached_result(tool_name: str) -> Optional[dict]:
     by the middleware's ``on_call_tool``.
     """
     entry = _result_cache.get(tool_name)
-    return entry.data if entry else None
+    if entry is None:
+        _cache_handle.miss()
+        return None
+    _cache_handle.hit()
+    return entry.data
 
 
 def set_last_dashboard_tool(tool_name: str) -> None:
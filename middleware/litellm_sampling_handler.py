@@ -311,6 +311,14 @@ class LiteLLMSamplingHandler:
 
         # Log cached tokens for Anthropic models (direct or Venice-proxied).
         if is_anthropic_model(self.default_model):
+            # This call refreshed the cached system prefix — postpone the
+            # keepalive for the matching module.
+            try:
+                from middleware.cache_keepalive import record_prefix_use
+
+                record_prefix_use(params.systemPrompt)
+            except Exception:
+                pass
             try:
                 usage = getattr(response, "usage", None)
                 if usage:
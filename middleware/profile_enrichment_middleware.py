@@ -49,6 +49,7 @@ from googleapiclient.errors import HttpError
 from typing_extensions import Any, Dict, List, Optional, Set
 
 from auth.context import get_auth_middleware
+from config.cache_registry import register_cache, sampled_size
 from config.enhanced_logging import redact_email, setup_logger
 
 logger = setup_logger()
@@ -92,6 +93,14 @@ class ProfileEnrichmentMiddleware(Middleware):
             OrderedDict()
         )  # LRU-bounded in-memory cache
         self._cache_timestamps: Dict[str, float] = {}
+        self._cache_handle = register_cache(
+            "profile_cache",
+            size_fn=lambda: sampled_size(
+                list(self._profile_cache.values()), len(self._profile_cache)
+            ),
+            evict_fn=self._evict_lru,
+            priority=5,  # refills cost one People API call per user
+        )
 
         # Optional Qdrant integration for persistent caching
         self._qdrant_middleware = qdrant_middleware
@@ -406,6 +415,7 @@ class ProfileEnrichmentMiddleware(Middleware):
         if self._enable_caching:
             current_time = time.time()
             for user_id in list(user_ids):
+                self._stats["total_lookups"] += 1
                 if user_id in self._profile_cache:
                     # Check if cache is still valid
                     cache_age = current_time - self._cache_timestamps.get(user_id, 0)
@@ -415,7 +425,12 @@ class ProfileEnrichmentMiddleware(Middleware):
                         )  # LRU: mark as recently used
                         profiles[user_id] = self._profile_cache[user_id]
                         user_ids.remove(user_id)
+                        self._stats["cache_hits"] += 1
+                        self._cache_handle.hit()
                         logger.debug(f"📦 Cache hit for user {user_id}")
+                        continue
+                self._stats["cache_misses"] += 1
+                self._cache_handle.miss()
 
         # Fetch remaining profiles from API
         if user_ids:
@@ -522,6 +537,16 @@ class ProfileEnrichmentMiddleware(Middleware):
         self._cache_timestamps.clear()
         logger.info("🧹 Profile cache cleared")
 
+    def _evict_lru(self, fraction: float) -> int:
+        """Drop the least recently used ``fraction`` of cached profiles."""
+        count = min(
+            len(self._profile_cache), max(1, int(len(self._profile_cache) * fraction))
+        )
+        for _ in range(count):
+            evicted_id, _ = self._profile_cache.popitem(last=False)
+            self._cache_timestamps.pop(evicted_id, None)
+        return count
+
     def cleanup_expired_entries(self) -> int:
         """Remove expired entries from the profile cache.
 
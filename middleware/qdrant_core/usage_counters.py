@@ -0,0 +1,451 @@
+"""
+Incremental per-tool / per-service usage counters.
+
+``QdrantSearchManager.get_analytics`` scrolls every stored tool response, so
+anything that only needs "how often / how recently / how healthy" pays for
+the whole response history.  ``UsageCounters`` keeps those aggregates up to
+date as ``QdrantUnifiedMiddleware.on_call_tool`` records each call:
+
+- calls, errors, last used (unix seconds)
+- per-hour call buckets (last 24h) and per-day buckets (last 30 days) for
+  24h / 7d / 30d activity; the bucket at a window's edge is weighted by
+  how much of it falls inside the window
+- a log2 latency histogram for p50 / p95 estimates
+- distinct users (global)
+
+Reads are O(tools) and return the same shape as ``get_analytics`` groups so
+the dynamic-instructions formatters work unchanged.  State is flushed to a
+small JSON file at most every ``usage_counters_flush_seconds``.  Workers
+share that file: each flush adds this worker's counts since its previous
+flush to the on-disk totals under an exclusive file lock.
+"""
+
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+_HOUR_SECONDS = 3600
+_DAY_SECONDS = 86400
+_RETAIN_HOURS = 25
+_RETAIN_DAYS = 31
+_LATENCY_BUCKETS = 24  # log2(ms) buckets: 0 → <1ms, 23 → ≥ ~70 min
+
+
+def _latency_bucket(ms: float) -> int:
+    return min(_LATENCY_BUCKETS - 1, max(0, math.ceil(math.log2(ms + 1))))
+
+
+def _new_entry() -> Dict[str, Any]:
+    return {
+        "calls": 0,
+        "errors": 0,
+        "last_used": None,
+        "hours": {},  # str(hour index) -> calls
+        "days": {},  # str(day index) -> calls
+        "latency": [0] * _LATENCY_BUCKETS,
+    }
+
+
+def _add_call_time(entry: Dict[str, Any], epoch: float, n: int = 1) -> None:
+    for key, width in (("hours", _HOUR_SECONDS), ("days", _DAY_SECONDS)):
+        buckets = entry.setdefault(key, {})
+        bucket = str(int(epoch // width))
+        buckets[bucket] = buckets.get(bucket, 0) + n
+
+
+def _windowed(buckets: Dict[str, int], width: int, now: float, window: float) -> int:
+    """Calls in the last ``window`` seconds from ``width``-second buckets.
+
+    Buckets wholly inside the window count fully; the one straddling the
+    window start counts in proportion to its overlap.
+    """
+    start = now - window
+    total = 0.0
+    for bucket, n in buckets.items():
+        bucket_end = (int(bucket) + 1) * width
+        overlap = min(1.0, (bucket_end - start) / width)
+        if overlap > 0:
+            total += n * overlap
+    return round(total)
+
+
+def _merge_entry(dst: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    dst["calls"] += delta["calls"]
+    dst["errors"] += delta["errors"]
+    if delta["last_used"]:
+        dst["last_used"] = max(dst["last_used"] or 0, delta["last_used"])
+    for key in ("hours", "days"):
+        buckets = dst.setdefault(key, {})
+        for bucket, n in delta.get(key, {}).items():
+            buckets[bucket] = buckets.get(bucket, 0) + n
+    dst["latency"] = [a + b for a, b in zip(dst["latency"], delta["latency"])]
+
+
+def _merge_tables(
+    dst: Dict[str, Dict[str, Any]], delta: Dict[str, Dict[str, Any]]
+) -> None:
+    for name, entry in delta.items():
+        _merge_entry(dst.setdefault(name, _new_entry()), entry)
+
+
+def _copy_table(table: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return json.loads(json.dumps(table))
+
+
+class UsageCounters:
+    """Thread-safe, incrementally maintained tool/service usage aggregates."""
+
+    def __init__(self, path: Optional[Path] = None, flush_interval: float = 60.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._tools: Dict[str, Dict[str, Any]] = {}
+        self._services: Dict[str, Dict[str, Any]] = {}
+        self._users: set = set()
+        # Counts recorded since the last flush, merged into the file on flush
+        self._pending_tools: Dict[str, Dict[str, Any]] = {}
+        self._pending_services: Dict[str, Dict[str, Any]] = {}
+        self._pending_users: set = set()
+        self._pending_seed: Optional[Dict[str, Any]] = None
+        self._seeded = False
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _bump(
+        entry: Dict[str, Any], now: float, execution_time_ms: float, is_error: bool
+    ) -> None:
+        entry["calls"] += 1
+        if is_error:
+            entry["errors"] += 1
+        entry["last_used"] = now
+        _add_call_time(entry, now)
+        entry["latency"][_latency_bucket(execution_time_ms)] += 1
+
+    def record(
+        self,
+        tool_name: str,
+        service: Optional[str],
+        execution_time_ms: float = 0.0,
+        is_error: bool = False,
+        user: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """Count one tool call."""
+        now = time.time() if now is None else now
+        service = service or "unknown"
+        with self._lock:
+            for table, name in (
+                (self._tools, tool_name),
+                (self._services, service),
+                (self._pending_tools, tool_name),
+                (self._pending_services, service),
+            ):
+                self._bump(
+                    table.setdefault(name, _new_entry()),
+                    now,
+                    execution_time_ms,
+                    is_error,
+                )
+            if user and user != "unknown":
+                self._users.add(user)
+                self._pending_users.add(user)
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Reading (get_analytics-compatible shape)
+    # ------------------------------------------------------------------
+
+    @property
+    def has_data(self) -> bool:
+        """True once counters were seeded from history or recorded a call."""
+        with self._lock:
+            return self._seeded or bool(self._tools)
+
+    @staticmethod
+    def _percentile(hist, q: float) -> Optional[float]:
+        total = sum(hist)
+        if not total:
+            return None
+        target = q * total
+        running = 0
+        for i, n in enumerate(hist):
+            running += n
+            if running >= target:
+                return float(2**i - 1)  # bucket upper bound in ms
+        return float(2 ** (len(hist) - 1))
+
+    def _group(self, entry: Dict[str, Any], now: float) -> Dict[str, Any]:
+        recent = {
+            "last_24h": _windowed(
+                entry.get("hours", {}), _HOUR_SECONDS, now, _DAY_SECONDS
+            ),
+            "last_7d": _windowed(entry["days"], _DAY_SECONDS, now, 7 * _DAY_SECONDS),
+            "last_30d": _windowed(entry["days"], _DAY_SECONDS, now, 30 * _DAY_SECONDS),
+        }
+        calls = entry["calls"]
+        last_used = entry["last_used"]
+        return {
+            "count": calls,
+            "has_errors": entry["errors"],
+            "error_rate": entry["errors"] / calls if calls else 0,
+            "latest_timestamp": (
+                time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(last_used))
+                if last_used
+                else None
+            ),
+            "recent_activity": recent,
+            "latency_p50_ms": self._percentile(entry["latency"], 0.5),
+            "latency_p95_ms": self._percentile(entry["latency"], 0.95),
+        }
+
+    def analytics(self, group_by: str = "tool_name") -> Dict[str, Any]:
+        """Aggregates grouped by ``tool_name`` or ``service``."""
+        now = time.time()
+        with self._lock:
+            source = self._services if group_by == "service" else self._tools
+            groups = {name: self._group(e, now) for name, e in source.items()}
+            unique_users = len(self._users)
+        total = sum(g["count"] for g in groups.values())
+        errors = sum(g["has_errors"] for g in groups.values())
+        return {
+            "total_responses": total,
+            "group_by": group_by,
+            "groups": groups,
+            "source": "usage_counters",
+            "summary": {
+                "total_groups": len(groups),
+                "total_unique_users": unique_users,
+                "overall_error_rate": errors / total if total else 0,
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # Seeding from the legacy scroll (one-time)
+    # ------------------------------------------------------------------
+
+    def seed_from_analytics(
+        self, tool_analytics: Optional[Dict], service_analytics: Optional[Dict]
+    ) -> None:
+        """Initialise counters from one full ``get_analytics`` scroll.
+
+        Only used when no persisted counters exist, so an existing response
+        history is reflected without re-scrolling on every refresh.
+        """
+        from datetime import datetime
+
+        def _entries(analytics: Optional[Dict]) -> Dict[str, Dict[str, Any]]:
+            entries = {}
+            for name, group in ((analytics or {}).get("groups") or {}).items():
+                entry = _new_entry()
+                entry["calls"] = group.get("count", 0)
+                entry["errors"] = group.get("has_errors", 0)
+                for ts in group.get("timestamps", []):
+                    try:
+                        epoch = datetime.fromisoformat(
+                            ts.replace("Z", "+00:00")
+                        ).timestamp()
+                    except (ValueError, TypeError, AttributeError):
+                        continue
+                    _add_call_time(entry, epoch)
+                    entry["last_used"] = max(entry["last_used"] or 0, epoch)
+                entries[name] = entry
+            return entries
+
+        users = set()
+        for group in ((tool_analytics or {}).get("groups") or {}).values():
+            users.update(u for u in group.get("users", []) if u != "unknown")
+
+        with self._lock:
+            if self._seeded or self._tools:
+                return
+            self._tools = _entries(tool_analytics)
+            self._services = _entries(service_analytics)
+            self._users = users
+            self._prune_locked()
+            self._seeded = True
+            self._pending_seed = {
+                "tools": _copy_table(self._tools),
+                "services": _copy_table(self._services),
+                "users": set(users),
+            }
+            self._dirty = True
+        logger.info(
+            f"📊 Usage counters seeded from history: {len(self._tools)} tools, "
+            f"{len(self._services)} services"
+        )
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _prune(tables) -> None:
+        hour_cutoff = int(time.time() // _HOUR_SECONDS) - _RETAIN_HOURS
+        day_cutoff = int(time.time() // _DAY_SECONDS) - _RETAIN_DAYS
+        for table in tables:
+            for entry in table.values():
+                entry["hours"] = {
+                    h: n
+                    for h, n in entry.get("hours", {}).items()
+                    if int(h) >= hour_cutoff
+                }
+                entry["days"] = {
+                    d: n for d, n in entry["days"].items() if int(d) >= day_cutoff
+                }
+
+    def _prune_locked(self) -> None:
+        self._prune((self._tools, self._services))
+
+    def _read_file(self) -> Optional[Dict[str, Any]]:
+        if not self.path or not self.path.exists():
+            return None
+        data = json.loads(self.path.read_text() or "{}")
+        if data.get("version") != 1:
+            return None
+        return data
+
+    def _load(self) -> None:
+        try:
+            data = self._read_file()
+        except Exception as e:
+            logger.warning(f"📊 Could not load usage counters from {self.path}: {e}")
+            return
+        if data is None:
+            return
+        self._tools = data.get("tools", {})
+        self._services = data.get("services", {})
+        self._users = set(data.get("users", []))
+        self._seeded = bool(data.get("seeded"))
+        logger.debug(f"📊 Loaded usage counters ({len(self._tools)} tools)")
+
+    def _take_pending_locked(self):
+        pending = (
+            self._pending_tools,
+            self._pending_services,
+            self._pending_users,
+            self._pending_seed,
+        )
+        self._pending_tools, self._pending_services = {}, {}
+        self._pending_users, self._pending_seed = set(), None
+        self._dirty = False
+        return pending
+
+    def _restore_pending_locked(self, pending) -> None:
+        tools, services, users, seed = pending
+        _merge_tables(self._pending_tools, tools)
+        _merge_tables(self._pending_services, services)
+        self._pending_users |= users
+        self._pending_seed = self._pending_seed or seed
+        self._dirty = True
+
+    def _merge_into_file(self, pending) -> Dict[str, Any]:
+        """Add ``pending`` to the on-disk totals under an exclusive file lock."""
+        import fcntl
+
+        tools, services, users, seed = pending
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_suffix(self.path.suffix + ".lock")
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                data = self._read_file()
+            except (OSError, ValueError) as e:
+                logger.warning(f"📊 Replacing unreadable usage counters: {e}")
+                data = None
+            data = data or {"version": 1, "seeded": False, "tools": {}, "services": {}}
+            merged_users = set(data.get("users", []))
+            if seed is not None and not data.get("seeded"):
+                # First worker to seed from history wins; others only add calls
+                _merge_tables(data["tools"], seed["tools"])
+                _merge_tables(data["services"], seed["services"])
+                merged_users |= seed["users"]
+            _merge_tables(data["tools"], tools)
+            _merge_tables(data["services"], services)
+            data["users"] = sorted(merged_users | users)
+            data["seeded"] = True
+            self._prune((data["tools"], data["services"]))
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, self.path)
+        return data
+
+    def flush(self) -> bool:
+        """Merge counts recorded since the last flush into the shared file.
+
+        Afterwards the in-memory view holds the merged totals of every
+        worker.  Returns True if written.
+        """
+        if not self.path:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            pending = self._take_pending_locked()
+            self._last_flush = time.monotonic()
+        try:
+            data = self._merge_into_file(pending)
+        except (OSError, ValueError) as e:
+            logger.warning(f"📊 Could not persist usage counters: {e}")
+            with self._lock:
+                self._restore_pending_locked(pending)
+            return False
+        with self._lock:
+            # Start from the merged totals and re-apply calls recorded meanwhile
+            self._tools, self._services = data["tools"], data["services"]
+            _merge_tables(self._tools, self._pending_tools)
+            _merge_tables(self._services, self._pending_services)
+            self._users = set(data["users"]) | self._pending_users
+            self._seeded = True
+        return True
+
+    def flush_due(self) -> bool:
+        """Whether there are unsaved counts and the flush interval has elapsed."""
+        return (
+            self._dirty
+            and self.path is not None
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    async def maybe_flush(self) -> None:
+        """Flush off-loop when dirty and the flush interval has elapsed."""
+        if self.flush_due():
+            await asyncio.to_thread(self.flush)
+
+
+_usage_counters: Optional[UsageCounters] = None
+_usage_counters_lock = threading.Lock()
+
+
+def get_usage_counters() -> UsageCounters:
+    """Process-wide UsageCounters, persisted per settings."""
+    global _usage_counters
+    if _usage_counters is None:
+        with _usage_counters_lock:
+            if _usage_counters is None:
+                from config.settings import get_settings
+
+                s = get_settings()
+                path = (
+                    Path(s.usage_counters_path)
+                    if s.usage_counters_path
+                    else Path(s.credentials_dir) / "usage_counters.json"
+                )
+                _usage_counters = UsageCounters(
+                    path=path, flush_interval=s.usage_counters_flush_seconds
+                )
+    return _usage_counters
@@ -36,6 +36,7 @@ from middleware.qdrant_core.storage import QdrantStorageManager
 
 # Re-export tools and resources for backward compatibility
 from middleware.qdrant_core.tools import setup_enhanced_qdrant_tools
+from middleware.qdrant_core.usage_counters import get_usage_counters
 
 logger = setup_logger()
 
@@ -113,6 +114,19 @@ def _sanitize_args_for_storage(args: dict) -> dict:
     }
 
 
+def _response_is_error(response: Any) -> bool:
+    """Error heuristic for usage counters (same rule as get_analytics)."""
+    if getattr(response, "is_error", False) or getattr(response, "isError", False):
+        return True
+    data = getattr(response, "structured_content", response)
+    if isinstance(data, dict):
+        status = data.get("status")
+        return bool(data.get("error")) or (
+            isinstance(status, str) and status.lower() == "error"
+        )
+    return False
+
+
 class QdrantUnifiedMiddleware(Middleware):
     """
     Unified Qdrant middleware that combines deferred initialization, enhanced user context
@@ -336,10 +350,6 @@ class QdrantUnifiedMiddleware(Middleware):
         if not self.client_manager.is_initialized:
             await self.initialize_middleware_and_reindexing()
 
-        # If no client available, just pass through
-        if not self.client_manager.is_available:
-            return await call_next(context)
-
         # Extract tool information
         tool_name = context.message.name
         tool_args = context.message.arguments or {}
@@ -347,6 +357,29 @@ class QdrantUnifiedMiddleware(Middleware):
         # Record start time for execution tracking
         start_time = time.time()
 
+        # If no client available, just pass through (usage counters are
+        # file-backed and still count the call)
+        if not self.client_manager.is_available:
+            is_error = True
+            try:
+                response = await call_next(context)
+                is_error = _response_is_error(response)
+                return response
+            finally:
+                user_email = None
+                try:
+                    from auth.context import get_user_email_context
+
+                    user_email = await get_user_email_context()
+                except Exception:
+                    pass
+                self._record_usage(
+                    tool_name,
+                    int((time.time() - start_time) * 1000),
+                    is_error=is_error,
+                    user_email=user_email,
+                )
+
         # Reset cost tracker for this tool execution
         try:
             from middleware.payment.cost_tracker import reset as reset_costs
@@ -355,12 +388,17 @@ class QdrantUnifiedMiddleware(Middleware):
         except Exception:
             pass
 
+        # Every call is counted exactly once, in the finally block below
+        is_error = True
+        execution_time_ms = None
+        user_email = None
         try:
             # Execute the tool
             response = await call_next(context)
 
             # Calculate execution time
             execution_time_ms = int((time.time() - start_time) * 1000)
+            is_error = _response_is_error(response)
 
             # Record in tool relationship graph (non-blocking)
             if self._tool_relationship_graph is not None:
@@ -381,8 +419,6 @@ class QdrantUnifiedMiddleware(Middleware):
                     logger.debug(f"Tool graph recording failed: {e}")
 
             # Enhanced user email extraction with priority order
-            user_email = None
-
             # Try to get from auth context first (most reliable)
             try:
                 from auth.context import get_user_email_context
@@ -447,6 +483,43 @@ class QdrantUnifiedMiddleware(Middleware):
             logger.error(f"Error in tool execution: {e}")
             raise
 
+        finally:
+            if execution_time_ms is None:
+                execution_time_ms = int((time.time() - start_time) * 1000)
+            self._record_usage(
+                tool_name, execution_time_ms, is_error=is_error, user_email=user_email
+            )
+
+    def _record_usage(
+        self,
+        tool_name: str,
+        execution_time_ms: int,
+        is_error: bool,
+        user_email: Optional[str] = None,
+    ) -> None:
+        """Update the incremental usage counters (never raises).
+
+        A due flush runs as a tracked background task, so no tool response
+        waits for the file merge.
+        """
+        try:
+            from middleware.qdrant_core.query_parser import extract_service_from_tool
+
+            counters = get_usage_counters()
+            counters.record(
+                tool_name,
+                extract_service_from_tool(tool_name),
+                execution_time_ms=execution_time_ms,
+                is_error=is_error,
+                user=user_email,
+            )
+            if counters.flush_due():
+                self.client_manager._track_task(
+                    asyncio.create_task(counters.maybe_flush())
+                )
+        except Exception as e:
+            logger.debug(f"Usage counter update failed: {e}")
+
     async def on_read_resource(self, context: MiddlewareContext, call_next):
         """
         FastMCP2 middleware hook for intercepting resource reads.
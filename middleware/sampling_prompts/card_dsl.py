@@ -98,15 +98,15 @@ def agent_validate_dsl(dsl_string: str) -> dict:
     }
 
 
-def agent_search_patterns(description: str, limit: int = 5) -> dict:
+async def agent_search_patterns(description: str, limit: int = 5) -> dict:
     """Search historical card patterns matching a description.
 
     Returns dict with has_dsl, dsl, patterns (list of matching DSL patterns
     with component_paths and instance_params), and classes.
     """
-    from gchat.wrapper_api import search_patterns_for_card
+    from gchat.wrapper_api import search_patterns_for_card_async
 
-    return search_patterns_for_card(description, limit=limit)
+    return await search_patterns_for_card_async(description, limit=limit)
 
 
 def agent_get_relationships() -> dict:
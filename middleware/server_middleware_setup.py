@@ -308,6 +308,23 @@ def setup_all_middleware(
     logger.info(f"🔧 Qdrant URL: {settings.qdrant_url}")
     logger.info(f"🔧 API Key configured: {bool(settings.qdrant_api_key)}")
 
+    # Tool co-usage graph (store attached and loaded by qdrant_lifespan)
+    if settings.tool_graph_backend != "none":
+        from adapters.module_wrapper.tool_relationship_graph import (
+            ToolRelationshipGraph,
+        )
+
+        qdrant_middleware.set_tool_relationship_graph(
+            ToolRelationshipGraph(
+                metrics_edge_threshold=settings.tool_graph_metrics_edge_threshold,
+                sync_interval_seconds=settings.tool_graph_sync_seconds,
+                snapshot_interval_seconds=settings.tool_graph_snapshot_seconds,
+            )
+        )
+        logger.info(
+            f"🕸️ Tool relationship graph enabled ({settings.tool_graph_backend})"
+        )
+
     # Connect sampling middleware to Qdrant
     if sampling_middleware:
         sampling_middleware.qdrant_middleware = qdrant_middleware
@@ -0,0 +1,260 @@
+"""
+Item resolution for ``service://{service}/{list_type}/{id}`` resources.
+
+List types without a dedicated get tool (Gmail labels, Chat spaces,
+calendars) used to be resolved by calling the list tool and scanning the
+result — a full list call per item read, and a miss whenever the item was
+beyond the first page.  Two pieces replace that:
+
+- a resolver registry: each service declares a direct get-by-ID handler
+  (``labels.get``, ``spaces.get``, ``calendarList.get``) with
+  ``register_item_resolver``.  Handlers return the item in its list tool's
+  entry shape, so an item looks the same whether it came from the index or
+  the API.  Drive files and calendar events already have
+  get tools (``get_drive_file_content``, ``get_event``) backed by the shared
+  Drive file cache and event store;
+- ``ListItemIndex``: a per-user, TTL-bounded index of items seen in list tool
+  results, keyed by each item's ``id`` only (never its display name), filled
+  whenever a list tool runs (directly or via a resource read), so most item
+  reads are answered without any API call.
+
+Usage:
+    index = get_list_item_index()
+    index.index(user_email, "gmail", "labels", list_result)
+    item = index.lookup(user_email, "gmail", "labels", "Label_12")
+
+    resolver = get_item_resolver("chat", "spaces")
+    if resolver:
+        item = await resolver.resolve(user_email, "spaces/AAAA")
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+from config.cache_registry import (
+    CacheHandle,
+    evict_first,
+    register_cache,
+    sampled_size,
+)
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+
+@dataclass
+class ItemResolver:
+    """Direct get-by-ID handler for one ``service/list_type``."""
+
+    service: str
+    list_type: str
+    api_method: str  # e.g. "labels.get", reported as the response's tool_called
+    # (user_email, item_id) -> item, shaped like the list tool's entries
+    fn: Callable[[str, str], Awaitable[Any]]
+
+    async def resolve(self, user_email: str, item_id: str) -> Any:
+        return await self.fn(user_email, item_id)
+
+
+_RESOLVERS: Dict[Tuple[str, str], ItemResolver] = {}
+
+
+def register_item_resolver(service: str, list_type: str, api_method: str):
+    """Decorator registering ``fn(user_email, item_id)`` as the get-by-ID handler."""
+
+    def decorator(fn: Callable[[str, str], Awaitable[Any]]):
+        _RESOLVERS[(service, list_type)] = ItemResolver(
+            service=service, list_type=list_type, api_method=api_method, fn=fn
+        )
+        return fn
+
+    return decorator
+
+
+def get_item_resolver(service: str, list_type: str) -> Optional[ItemResolver]:
+    return _RESOLVERS.get((service, list_type))
+
+
+# ----------------------------------------------------------------------
+# List-result index
+# ----------------------------------------------------------------------
+
+
+def iter_list_items(list_data: Any) -> Iterator[Dict[str, Any]]:
+    """Yield the item dicts of a serialized list tool result.
+
+    List tools return either a bare list or a response model whose items sit
+    in one or more list fields (``labels``, ``spaces``, ``calendars``,
+    ``items`` ...), possibly under ``result``.
+    """
+    if isinstance(list_data, list):
+        for item in list_data:
+            if isinstance(item, dict):
+                yield item
+    elif isinstance(list_data, dict):
+        for value in list_data.values():
+            if isinstance(value, list):
+                yield from (item for item in value if isinstance(item, dict))
+        if isinstance(list_data.get("result"), (dict, list)):
+            yield from iter_list_items(list_data["result"])
+
+
+@dataclass
+class _IndexedList:
+    items: Dict[str, Dict[str, Any]]
+    indexed_at: float = field(default_factory=time.monotonic)
+
+
+class ListItemIndex:
+    """LRU of list results keyed by (user email, service, list type), by item ID."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_lists: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_lists = max_lists
+        self._lists: "OrderedDict[Tuple[str, str, str], _IndexedList]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "indexed_items": 0}
+        self.cache_handle: Optional[CacheHandle] = None
+
+    @staticmethod
+    def _key(user_email: str, service: str, list_type: str) -> Tuple[str, str, str]:
+        return ((user_email or "").lower(), service, list_type)
+
+    def index(
+        self,
+        user_email: str,
+        service: str,
+        list_type: str,
+        list_data: Any,
+        id_field: str = "id",
+    ) -> int:
+        """Replace the indexed items for this list with ``list_data``'s items.
+
+        Items are keyed by ``id_field`` only: other fields such as a Gmail
+        label's display name must not resolve as IDs.
+        """
+        items: Dict[str, Dict[str, Any]] = {}
+        for item in iter_list_items(list_data):
+            value = item.get(id_field)
+            if isinstance(value, str) and value:
+                items.setdefault(value, item)
+                # "spaces/AAAA" is also addressable as "AAAA"
+                items.setdefault(value.rsplit("/", 1)[-1], item)
+        if not items:
+            return 0
+        key = self._key(user_email, service, list_type)
+        with self._lock:
+            self._lists[key] = _IndexedList(items)
+            self._lists.move_to_end(key)
+            while len(self._lists) > self.max_lists:
+                self._lists.popitem(last=False)
+        self.stats["indexed_items"] += len(items)
+        return len(items)
+
+    def lookup(
+        self, user_email: str, service: str, list_type: str, item_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """The item if it appeared in a list result within the TTL."""
+        key = self._key(user_email, service, list_type)
+        with self._lock:
+            entry = self._lists.get(key)
+            if entry is not None and (
+                time.monotonic() - entry.indexed_at > self.ttl_seconds
+            ):
+                del self._lists[key]
+                entry = None
+            item = entry.items.get(item_id) if entry is not None else None
+            if item is not None:
+                self._lists.move_to_end(key)
+        self.stats["hits" if item is not None else "misses"] += 1
+        if self.cache_handle is not None:
+            if item is not None:
+                self.cache_handle.hit()
+            else:
+                self.cache_handle.miss()
+        return item
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lists.clear()
+
+    def __len__(self) -> int:
+        return len(self._lists)
+
+
+_index: Optional[ListItemIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_list_item_index() -> ListItemIndex:
+    """Process-wide list-result index, registered with the cache budget."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                from config.settings import get_settings
+
+                s = get_settings()
+                index = ListItemIndex(
+                    ttl_seconds=s.service_item_index_ttl,
+                    max_lists=s.service_item_index_max_lists,
+                )
+                index.cache_handle = register_cache(
+                    "service_item_index",
+                    size_fn=lambda: sampled_size(
+                        (e.items for e in list(index._lists.values())),
+                        len(index._lists),
+                    ),
+                    evict_fn=lambda fraction: evict_first(index._lists, fraction),
+                    priority=3,
+                )
+                _index = index
+    return _index
+
+
+# ----------------------------------------------------------------------
+# Built-in resolvers
+# ----------------------------------------------------------------------
+
+
+@register_item_resolver("gmail", "labels", "labels.get")
+async def _get_gmail_label(user_email: str, label_id: str) -> Dict[str, Any]:
+    from gmail.labels import _label_info
+    from gmail.service import _get_gmail_service_with_fallback
+
+    gmail_service = await _get_gmail_service_with_fallback(user_email)
+    label = await asyncio.to_thread(
+        gmail_service.users().labels().get(userId="me", id=label_id).execute
+    )
+    return _label_info(label)
+
+
+@register_item_resolver("chat", "spaces", "spaces.get")
+async def _get_chat_space(user_email: str, space_id: str) -> Dict[str, Any]:
+    from gchat.chat_tools import _get_chat_service_with_fallback, _space_info
+
+    if not space_id.startswith("spaces/"):
+        space_id = f"spaces/{space_id}"
+    chat_service = await _get_chat_service_with_fallback(user_email)
+    if chat_service is None:
+        raise RuntimeError(f"No Chat service available for {user_email}")
+    space = await asyncio.to_thread(chat_service.spaces().get(name=space_id).execute)
+    return _space_info(space)
+
+
+@register_item_resolver("calendar", "calendars", "calendarList.get")
+async def _get_calendar(user_email: str, calendar_id: str) -> Dict[str, Any]:
+    from gcalendar.calendar_tools import (
+        _calendar_info,
+        _get_calendar_service_with_fallback,
+    )
+
+    calendar_service = await _get_calendar_service_with_fallback(user_email)
+    calendar = await asyncio.to_thread(
+        calendar_service.calendarList().get(calendarId=calendar_id).execute
+    )
+    return _calendar_info(calendar)
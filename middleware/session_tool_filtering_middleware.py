@@ -15,7 +15,8 @@ Key Features:
 - **Session Persistence**: Tool states persist across reconnections
 """
 
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from mcp.types import ToolListChangedNotification
@@ -38,6 +39,7 @@ from auth.context import (
     get_effective_session_id,
     get_session_context,
     get_session_disabled_tools,
+    get_session_tools_version,
     get_user_email_context,
     get_user_email_context_sync,
     is_known_session,
@@ -49,10 +51,33 @@ from auth.context import (
     set_effective_session_id,
     was_minimal_startup_applied,
 )
+from config.cache_registry import evict_first, register_cache
 from config.enhanced_logging import redact_email, setup_logger
 
 logger = setup_logger()
 
+# Global tool registry version — bumped whenever tools are enabled/disabled
+# globally, so memoized per-session tool lists are recomputed.
+_tool_registry_version = 0
+
+
+def bump_tool_registry_version() -> int:
+    """Invalidate memoized tool lists after a global registry change."""
+    global _tool_registry_version
+    _tool_registry_version += 1
+    return _tool_registry_version
+
+
+def _client_profile() -> Tuple[bool, bool]:
+    """Client capability profile of the current request (memo key part)."""
+    try:
+        from tools.client_capabilities import detect_ui_support
+
+        support = detect_ui_support()
+        return support.handshake_seen, support.renders
+    except Exception:
+        return False, False
+
 
 def get_service_for_tool(tool_name: str) -> str:
     """
@@ -315,6 +340,9 @@ class SessionToolFilteringMiddleware(Middleware):
         # Tools are disabled in session state, and this middleware filters them
     """
 
+    # Memoized (session, version) tool lists kept at most
+    MAX_MEMO_ENTRIES = 256
+
     def __init__(
         self,
         protected_tools: Optional[Set[str]] = None,
@@ -371,6 +399,21 @@ class SessionToolFilteringMiddleware(Middleware):
         # Prevents notification spam on repeated list_tools calls
         self._notified_sessions: Set[str] = set()
 
+        # Memoized filter results, keyed by (registry version, session ID,
+        # session tools version, client profile, ?services= filter). Entries
+        # keep the downstream tool names they were computed from, so a changed
+        # registry that was not announced via bump_tool_registry_version()
+        # still misses, and store only the visible names: hits filter the
+        # fresh downstream Tool objects, never return stale ones.
+        self._list_memo: "OrderedDict[Tuple[Any, ...], Tuple[Tuple[str, ...], FrozenSet[str]]]" = OrderedDict()
+        self._memo_stats = {"hits": 0, "misses": 0}
+        self._memo_handle = register_cache(
+            "session_tool_lists",
+            size_fn=lambda: len(self._list_memo) * 1024,  # name sets are small
+            evict_fn=lambda fraction: evict_first(self._list_memo, fraction),
+            priority=2,
+        )
+
         if self.minimal_startup:
             logger.info(
                 "🚀 SessionToolFilteringMiddleware: Minimal startup mode ENABLED"
@@ -805,7 +848,7 @@ class SessionToolFilteringMiddleware(Middleware):
             if ctx.request_context and ctx.request_context.request:
                 request = ctx.request_context.request
                 if hasattr(request, "query_params"):
-                    logger.info(
+                    logger.debug(
                         f"🔍 Got request from fastmcp_context, query_params: {dict(request.query_params)}"
                     )
                     http_params = _parse_request_params(request)
@@ -813,7 +856,7 @@ class SessionToolFilteringMiddleware(Middleware):
         # Fallback to global get_http_request() if context method failed
         if http_params is None:
             http_params = parse_http_connection_params()
-        logger.info(f"🔍 on_list_tools: http_params={http_params}")
+        logger.debug(f"🔍 on_list_tools: http_params={http_params}")
 
         # Extract tool names from the tools list (FastMCP v3 compatible)
         # This avoids relying on internal _tool_manager which changed in v3
@@ -840,6 +883,33 @@ class SessionToolFilteringMiddleware(Middleware):
         # Use the effective session ID for filtering
         session_id = effective_session_id
 
+        # Memo lookup: unchanged registry + session state + client profile +
+        # service filter means the previous filter result (and instructions)
+        # are still valid.
+        services = http_params.get("services")
+        memo_key = (
+            _tool_registry_version,
+            session_id,
+            get_session_tools_version(session_id),
+            _client_profile(),
+            tuple(services) if services is not None else None,
+        )
+        source_names = tuple(tool_names)
+        cached = self._list_memo.get(memo_key)
+        if cached is not None and cached[0] == source_names:
+            self._list_memo.move_to_end(memo_key)
+            self._memo_stats["hits"] += 1
+            self._memo_handle.hit()
+            visible = cached[1]
+            # Unnamed tools are always included, as in the filter below
+            return [
+                tool
+                for tool in all_tools
+                if not getattr(tool, "name", None) or tool.name in visible
+            ]
+        self._memo_stats["misses"] += 1
+        self._memo_handle.miss()
+
         # Refresh instructions to reflect session-enabled services
         # This ensures the instructions shown to the client match the available tools
         # Only refresh if we have an MCP instance and service filter was applied
@@ -856,6 +926,7 @@ class SessionToolFilteringMiddleware(Middleware):
                 logger.debug(
                     f"SessionToolFilteringMiddleware: Session {session_id[:8]}... has no disabled tools"
                 )
+            self._remember_list(memo_key, source_names, all_tools)
             return all_tools
 
         # Filter out session-disabled tools (except protected ones)
@@ -913,8 +984,23 @@ class SessionToolFilteringMiddleware(Middleware):
                             f"{session_id[:8]}...: {e}"
                         )
 
+        self._remember_list(memo_key, source_names, filtered_tools)
         return filtered_tools
 
+    def _remember_list(
+        self, key: Tuple[Any, ...], source_names: Tuple[str, ...], tools: List[Any]
+    ) -> None:
+        """Store a filtered list's tool names, keeping the memo bounded (LRU)."""
+        self._list_memo[key] = (
+            source_names,
+            frozenset(
+                name for name in (getattr(t, "name", None) for t in tools) if name
+            ),
+        )
+        self._list_memo.move_to_end(key)
+        while len(self._list_memo) > self.MAX_MEMO_ENTRIES:
+            self._list_memo.popitem(last=False)
+
     async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
         """
         Block execution of session-disabled tools.
@@ -1048,6 +1134,7 @@ def setup_session_tool_filtering_middleware(
 __all__ = [
     "SessionToolFilteringMiddleware",
     "setup_session_tool_filtering_middleware",
+    "bump_tool_registry_version",
     "get_service_for_tool",
     "get_tools_for_services",
     "parse_http_connection_params",
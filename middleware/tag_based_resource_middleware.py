@@ -25,6 +25,7 @@ from auth.context import get_user_email_context
 # Import centralized scope registry for dynamic service metadata
 from auth.scope_registry import ScopeRegistry
 
+from .service_item_resolvers import get_item_resolver, get_list_item_index
 from .service_list_response import (
     ServiceErrorResponse,
     ServiceItemDetailsResponse,
@@ -455,6 +456,9 @@ class TagBasedResourceMiddleware(Middleware):
                         timestamp=datetime.now(),
                         ttl_seconds=self.cache_ttl_seconds,
                     )
+                    self._index_list_result(
+                        service, list_type, user_email, serializable_result
+                    )
                     logger.debug(f"📦 Cached result from direct tool call: {tool_name}")
 
         return result
@@ -479,6 +483,18 @@ class TagBasedResourceMiddleware(Middleware):
                     return service_name, list_type_name
         return None, None
 
+    def _index_list_result(
+        self, service: str, list_type: str, user_email: str, list_data: Any
+    ) -> None:
+        """Make a list result's items resolvable by ID without another call.
+
+        List entries carry their ID as ``id``; the list type's ``id_field`` is
+        the get tool's parameter name, not an item key.
+        """
+        count = get_list_item_index().index(user_email, service, list_type, list_data)
+        if count:
+            logger.debug(f"🗂️ Indexed {count} item IDs for {service}/{list_type}")
+
     def _convert_result_to_serializable(self, result: Any) -> Any:
         """Convert a tool result to a JSON-serializable Python object.
 
@@ -683,6 +699,9 @@ class TagBasedResourceMiddleware(Middleware):
                     timestamp=datetime.now(),
                     ttl_seconds=self.cache_ttl_seconds,
                 )
+                self._index_list_result(
+                    service, list_type, user_email, serializable_result
+                )
                 logger.debug(f"📦 Cached ServiceListResponse for {service}/{list_type}")
 
             except Exception as e:
@@ -710,8 +729,10 @@ class TagBasedResourceMiddleware(Middleware):
 
         Uses a smart strategy:
         1. If there's a dedicated get_tool, use it directly
-        2. If no get_tool (like Gmail labels), extract the item from cached list data
-        3. If no cached list data, fetch the list and extract the item
+        2. If no get_tool (like Gmail labels), use the item from a recent list
+           result (ListItemIndex), else the service's registered get-by-ID
+           resolver (e.g. labels.get)
+        3. Without either, fetch the list and extract the item
 
         Args:
             service: Service name (e.g., "gmail", "drive")
@@ -769,15 +790,80 @@ class TagBasedResourceMiddleware(Middleware):
                 list_type_info,
                 user_email,
             )
-        else:
-            # Strategy 2: Extract from list data (for Gmail labels, etc.)
+        elif not await self._handle_specific_item_by_id(
+            service, list_type, item_id, context, list_type_info, user_email
+        ):
+            # Strategy 3: Extract from list data
             logger.debug(
-                f"📋 Extracting from list data (no dedicated get tool for {service}/{list_type})"
+                f"📋 Extracting from list data (no get tool or resolver for {service}/{list_type})"
             )
             await self._handle_specific_item_from_list(
                 service, list_type, item_id, context, list_type_info, user_email
             )
 
+    async def _handle_specific_item_by_id(
+        self,
+        service: str,
+        list_type: str,
+        item_id: str,
+        context: MiddlewareContext,
+        list_type_info: dict,
+        user_email: str,
+    ) -> bool:
+        """Resolve an item from the list-result index or a direct get-by-ID call.
+
+        Returns False when neither can answer, so the caller falls back to
+        fetching and scanning the list.
+        """
+        tool_called = f"{list_type_info.get('list_tool')}_index"
+        parameters = {"indexed_from_list": True, "item_id": item_id}
+        item = get_list_item_index().lookup(user_email, service, list_type, item_id)
+
+        if item is not None:
+            logger.debug(f"✅ Found '{item_id}' in indexed {service}/{list_type}")
+        else:
+            resolver = get_item_resolver(service, list_type)
+            if resolver is None:
+                return False
+
+            cache_key = (
+                f"service_item_details_{service}_{list_type}_{item_id}_{user_email}"
+            )
+            cache_entry = self.cache.get(cache_key)
+            if cache_entry is not None and not cache_entry.is_expired():
+                item = cache_entry.data
+            else:
+                try:
+                    item = await resolver.resolve(user_email, item_id)
+                except Exception as e:
+                    logger.warning(
+                        f"⚠️ {resolver.api_method} failed for {service}/{list_type}/{item_id}: {e}"
+                    )
+                    return False
+                self.cache[cache_key] = CacheEntry(
+                    data=item,
+                    timestamp=datetime.now(),
+                    ttl_seconds=self.cache_ttl_seconds,
+                )
+            tool_called = resolver.api_method
+            parameters = {"user_google_email": user_email, "item_id": item_id}
+            logger.debug(
+                f"🎯 Resolved {service}/{list_type}/{item_id} via {tool_called}"
+            )
+
+        response_model = ServiceItemDetailsResponse.from_middleware_data(
+            service=service,
+            list_type=list_type,
+            item_id=item_id,
+            tool_called=tool_called,
+            user_email=user_email,
+            parameters=parameters,
+            result=item,
+        )
+        cache_key = f"service_item_details_{service}_{list_type}_{item_id}_{user_email}"
+        await context.fastmcp_context.set_state(cache_key, response_model)
+        return True
+
     async def _handle_specific_item_with_get_tool(
         self,
         service: str,
@@ -896,6 +982,9 @@ class TagBasedResourceMiddleware(Middleware):
 
                 # Cache the fresh data
                 await context.fastmcp_context.set_state(raw_cache_key, cached_list_data)
+                self._index_list_result(
+                    service, list_type, user_email, cached_list_data
+                )
                 logger.debug(f"📦 Cached fresh list data with key: {raw_cache_key}")
 
             except Exception as e:
@@ -1179,6 +1268,7 @@ class TagBasedResourceMiddleware(Middleware):
     def clear_cache(self):
         """Clear all cached entries."""
         self.cache.clear()
+        get_list_item_index().clear()
         logger.debug("🧹 Cache cleared")
 
     def invalidate_cache(self, pattern: str = None):
@@ -8,6 +8,7 @@ FastMCP resource data to improve performance and reduce redundant API calls.
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
+from config.cache_registry import register_cache, sampled_size
 from config.enhanced_logging import setup_logger
 
 logger = setup_logger()
@@ -53,6 +54,14 @@ class CacheManager:
 
         # Resource cache: {resource_uri: {data: Any, expires_at: datetime}}
         self._resource_cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_handle = register_cache(
+            "template_resources",
+            size_fn=lambda: sampled_size(
+                list(self._resource_cache.values()), len(self._resource_cache)
+            ),
+            evict_fn=self.evict_fraction,
+            priority=4,
+        )
 
     def get_cached_resource(self, resource_uri: str) -> Optional[Any]:
         """
@@ -72,14 +81,17 @@ class CacheManager:
             return None
 
         if resource_uri not in self._resource_cache:
+            self._cache_handle.miss()
             return None
 
         cache_entry = self._resource_cache[resource_uri]
         if datetime.now() < cache_entry["expires_at"]:
+            self._cache_handle.hit()
             return cache_entry["data"]
 
         # Remove expired entry
         del self._resource_cache[resource_uri]
+        self._cache_handle.miss()
         return None
 
     def cache_resource(self, resource_uri: str, data: Any) -> None:
@@ -111,6 +123,26 @@ class CacheManager:
             for key in list(self._resource_cache)[:excess]:
                 del self._resource_cache[key]
 
+    def evict_fraction(self, fraction: float) -> int:
+        """
+        Evict a fraction of entries for the process-wide memory budget.
+
+        Expired entries go first, then the oldest by insertion order.
+
+        Args:
+            fraction: Share of current entries to drop (0-1]
+
+        Returns:
+            Number of entries removed
+        """
+        target = min(
+            len(self._resource_cache), max(1, int(len(self._resource_cache) * fraction))
+        )
+        removed = self.cleanup_expired_entries()
+        for key in list(self._resource_cache)[: max(0, target - removed)]:
+            del self._resource_cache[key]
+        return max(removed, target)
+
     def clear_cache(self) -> None:
         """
         Clear all cached resources and reset cache statistics.
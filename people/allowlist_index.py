@@ -0,0 +1,223 @@
+"""
+Per-user set of email addresses trusted through allow-listed contact groups.
+
+Gmail's trust list accepts People contact group specs (``group:Team`` or
+``groupId:contactGroups/123``).  Checking recipients against them used to
+run ``contactGroups.list`` plus one ``people.searchContacts`` per recipient,
+in series, on every send, draft and reply — a 50-recipient send spent more
+time on trust checks than on the send.  ``AllowlistMembershipIndex``
+instead expands the allowed groups once per user:
+
+- paginated ``contactGroups.list`` resolves group names to resourceNames;
+- ``contactGroups.get`` (``maxMembers`` = the group's ``memberCount``)
+  lists each group's members, and ``people.getBatchGet`` (200 per request)
+  reads their email addresses;
+- the resulting normalized email set is reused for
+  ``ALLOWLIST_MEMBERSHIP_TTL`` seconds, or until ``manage_people_contact_labels``
+  changes a label and invalidates it.
+
+Each recipient check is then a set lookup.
+
+Usage:
+    allowed = await get_allowlist_index(user_email).allowed_emails(
+        people_service, ["group:Team", "groupId:contactGroups/123"]
+    )
+    trusted = [r for r in recipients if normalize_email(r) in allowed]
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from config.cache_registry import (
+    CacheHandle,
+    evict_first,
+    register_cache,
+    sampled_size,
+)
+from config.enhanced_logging import setup_logger
+
+from .contact_index import _person_emails, normalize_email
+
+logger = setup_logger()
+
+CONTACT_GROUPS_PAGE_SIZE = 1000  # contactGroups.list maximum
+MAX_BATCH_GET = 200  # people.getBatchGet maximum
+DEFAULT_MAX_MEMBERS = 1000  # maxMembers when a group's memberCount is unknown
+MAX_INDEXED_USERS = 64
+
+
+def _spec_key(group_specs: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sorted({s.strip() for s in group_specs if s and s.strip()}))
+
+
+class AllowlistMembershipIndex:
+    """Members of allow-listed contact groups for one user."""
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        self.ttl_seconds = ttl_seconds
+        self._emails: FrozenSet[str] = frozenset()
+        self._specs: Optional[Tuple[str, ...]] = None
+        self._built_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self.stats = {"hits": 0, "builds": 0}
+
+    def _is_fresh(self, specs: Tuple[str, ...]) -> bool:
+        return (
+            self._built_at is not None
+            and self._specs == specs
+            and time.monotonic() - self._built_at < self.ttl_seconds
+        )
+
+    async def allowed_emails(
+        self, people_service, group_specs: Iterable[str]
+    ) -> FrozenSet[str]:
+        """Normalized emails of every member of the groups in ``group_specs``.
+
+        Concurrent callers share one build.  Build errors propagate and are
+        not cached.
+        """
+        specs = _spec_key(group_specs)
+        if not specs:
+            return frozenset()
+        if self._is_fresh(specs):
+            self.stats["hits"] += 1
+            return self._emails
+        async with self._lock:
+            if self._is_fresh(specs):
+                self.stats["hits"] += 1
+                return self._emails
+            emails = await asyncio.to_thread(self._build_sync, people_service, specs)
+            self._emails, self._specs = emails, specs
+            self._built_at = time.monotonic()
+            self.stats["builds"] += 1
+            logger.info(
+                f"👥 Indexed {len(emails)} allow-listed contact(s) "
+                f"from {len(specs)} group spec(s)"
+            )
+            return emails
+
+    def invalidate(self) -> None:
+        self._built_at = None
+
+    def __len__(self) -> int:
+        return len(self._emails)
+
+    # ------------------------------------------------------------------
+    # Build (worker thread)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _list_groups_sync(people_service) -> List[Dict[str, Any]]:
+        groups: List[Dict[str, Any]] = []
+        params: Dict[str, Any] = {"pageSize": CONTACT_GROUPS_PAGE_SIZE}
+        while True:
+            page = people_service.contactGroups().list(**params).execute()
+            groups.extend(page.get("contactGroups", []) or [])
+            next_page = page.get("nextPageToken")
+            if not next_page:
+                return groups
+            params["pageToken"] = next_page
+
+    @classmethod
+    def _resolve_groups_sync(
+        cls, people_service, specs: Tuple[str, ...]
+    ) -> Dict[str, int]:
+        """Allowed group resourceName -> memberCount (0 when unknown)."""
+        groups = cls._list_groups_sync(people_service)
+        by_name = {g["name"]: g for g in groups if g.get("name")}
+        counts = {
+            g["resourceName"]: g.get("memberCount", 0)
+            for g in groups
+            if g.get("resourceName")
+        }
+        resolved: Dict[str, int] = {}
+        for spec in specs:
+            lower = spec.lower()
+            if lower.startswith("groupid:"):
+                gid = spec[len("groupId:") :].strip()
+                if gid:
+                    resolved[gid] = counts.get(gid, 0)
+            elif lower.startswith("group:"):
+                name = spec[len("group:") :].strip()
+                group = by_name.get(name)
+                if group and group.get("resourceName"):
+                    resolved[group["resourceName"]] = group.get("memberCount", 0)
+                else:
+                    logger.warning(
+                        f"[allow_list_groups] No contact group found with name '{name}'"
+                    )
+            else:
+                logger.warning(f"[allow_list_groups] Unknown group spec format: {spec}")
+        return resolved
+
+    @classmethod
+    def _build_sync(cls, people_service, specs: Tuple[str, ...]) -> FrozenSet[str]:
+        members: List[str] = []
+        for gid, count in cls._resolve_groups_sync(people_service, specs).items():
+            group = (
+                people_service.contactGroups()
+                .get(resourceName=gid, maxMembers=count or DEFAULT_MAX_MEMBERS)
+                .execute()
+            )
+            members.extend(group.get("memberResourceNames", []) or [])
+
+        unique = list(dict.fromkeys(members))
+        emails: Set[str] = set()
+        for start in range(0, len(unique), MAX_BATCH_GET):
+            batch = (
+                people_service.people()
+                .getBatchGet(
+                    resourceNames=unique[start : start + MAX_BATCH_GET],
+                    personFields="emailAddresses",
+                )
+                .execute()
+            )
+            for response in batch.get("responses", []) or []:
+                emails |= _person_emails(response.get("person") or {})
+        return frozenset(emails)
+
+
+_indexes: "OrderedDict[str, AllowlistMembershipIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+_cache_handle: Optional[CacheHandle] = None
+
+
+def get_allowlist_index(user_email: str) -> AllowlistMembershipIndex:
+    """Process-wide allow-list membership index for ``user_email``."""
+    global _cache_handle
+    key = normalize_email(user_email)
+    with _indexes_lock:
+        if _cache_handle is None:
+            _cache_handle = register_cache(
+                "allowlist_membership",
+                size_fn=lambda: sampled_size(
+                    (i._emails for i in list(_indexes.values())), len(_indexes)
+                ),
+                evict_fn=lambda fraction: evict_first(_indexes, fraction),
+                priority=3,
+            )
+        index = _indexes.get(key)
+        if index is None:
+            _cache_handle.miss()
+            from config.settings import get_settings
+
+            index = _indexes[key] = AllowlistMembershipIndex(
+                ttl_seconds=get_settings().allowlist_membership_ttl
+            )
+            while len(_indexes) > MAX_INDEXED_USERS:
+                _indexes.popitem(last=False)
+        else:
+            _cache_handle.hit()
+        _indexes.move_to_end(key)
+        return index
+
+
+def invalidate_allowlist_index(user_email: str) -> None:
+    """Drop ``user_email``'s expanded groups (after label membership changes)."""
+    with _indexes_lock:
+        index = _indexes.get(normalize_email(user_email))
+    if index is not None:
+        index.invalidate()
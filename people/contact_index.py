@@ -0,0 +1,208 @@
+"""
+Per-user index of saved contacts by email address.
+
+Label management used to resolve every address with its own
+``people.searchContacts`` call (which also needs a warm-up request and is
+eventually consistent) and then create each miss with ``createContact``, so
+labelling a 300-person list meant 300–600 sequential API calls that could
+still miss freshly created contacts.  ``ContactIndex`` instead keeps
+normalized email -> resourceName for one user:
+
+- built from paginated ``people.connections.list`` with ``requestSyncToken``
+  and brought up to date with the sync token before each lookup (one call
+  when nothing changed; an expired token triggers a full rebuild);
+- contacts this server creates are recorded immediately, so they resolve
+  before sync propagation catches up;
+- misses are created with ``people.batchCreateContacts`` (200 per request).
+
+Usage:
+    index = get_contact_index(user_email)
+    matches = await index.resolve(people_service, emails)   # email -> [rn]
+    created, failed = await batch_create_contacts(people_service, misses)
+    index.record_created(created.values())
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from googleapiclient.errors import HttpError
+
+from config.enhanced_logging import setup_logger
+
+logger = setup_logger()
+
+CONNECTIONS_PAGE_SIZE = 1000  # connections.list maximum
+MAX_BATCH_CREATE = 200  # batchCreateContacts maximum
+
+
+def normalize_email(email: str) -> str:
+    return (email or "").strip().lower()
+
+
+def _person_emails(person: Dict[str, Any]) -> Set[str]:
+    return {
+        normalize_email(addr.get("value", ""))
+        for addr in person.get("emailAddresses", []) or []
+        if addr.get("value")
+    }
+
+
+class ContactIndex:
+    """Email -> contact resourceNames for one user, kept fresh by sync token."""
+
+    def __init__(self):
+        self._by_email: Dict[str, Set[str]] = {}
+        self._by_resource: Dict[str, Set[str]] = {}
+        self._sync_token: Optional[str] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self._by_resource)
+
+    def _remove(self, resource_name: str) -> None:
+        for email in self._by_resource.pop(resource_name, set()):
+            names = self._by_email.get(email)
+            if names is not None:
+                names.discard(resource_name)
+                if not names:
+                    del self._by_email[email]
+
+    def _put(self, person: Dict[str, Any]) -> None:
+        resource_name = person.get("resourceName")
+        if not resource_name:
+            return
+        self._remove(resource_name)
+        if (person.get("metadata") or {}).get("deleted"):
+            return
+        emails = _person_emails(person)
+        self._by_resource[resource_name] = emails
+        for email in emails:
+            self._by_email.setdefault(email, set()).add(resource_name)
+
+    def _list_pages(self, people_service, sync_token: Optional[str]):
+        """All connections pages (full, or changes since ``sync_token``)."""
+        params: Dict[str, Any] = {
+            "resourceName": "people/me",
+            "personFields": "emailAddresses,metadata",
+            "pageSize": CONNECTIONS_PAGE_SIZE,
+            "requestSyncToken": True,
+        }
+        if sync_token:
+            params["syncToken"] = sync_token
+        pages = []
+        while True:
+            page = people_service.people().connections().list(**params).execute()
+            pages.append(page)
+            next_page = page.get("nextPageToken")
+            if not next_page:
+                return pages
+            params["pageToken"] = next_page
+
+    async def sync(self, people_service) -> int:
+        """Apply changes since the last sync (full build the first time).
+
+        Returns the number of person records applied.
+        """
+        async with self._lock:
+            full = self._sync_token is None
+            try:
+                pages = await asyncio.to_thread(
+                    self._list_pages, people_service, self._sync_token
+                )
+            except HttpError as e:
+                if full or e.resp.status not in (400, 410):
+                    raise
+                logger.info("👥 Contact sync token expired, rebuilding index")
+                full = True
+                pages = await asyncio.to_thread(self._list_pages, people_service, None)
+
+            if full:
+                self._by_email.clear()
+                self._by_resource.clear()
+            applied = 0
+            for page in pages:
+                for person in page.get("connections", []) or []:
+                    self._put(person)
+                    applied += 1
+            self._sync_token = pages[-1].get("nextSyncToken")
+            if full:
+                logger.info(f"👥 Built contact index with {self.size} contact(s)")
+            return applied
+
+    def lookup(self, emails: Iterable[str]) -> Dict[str, List[str]]:
+        """Indexed resourceNames for each email (empty list when unknown)."""
+        return {
+            email: sorted(self._by_email.get(normalize_email(email), ()))
+            for email in emails
+        }
+
+    async def resolve(
+        self, people_service, emails: Iterable[str]
+    ) -> Dict[str, List[str]]:
+        """Sync, then look up ``emails``."""
+        await self.sync(people_service)
+        return self.lookup(emails)
+
+    def record_created(self, people: Iterable[Dict[str, Any]]) -> None:
+        """Index contacts this server just created."""
+        for person in people:
+            self._put(person)
+
+
+async def batch_create_contacts(
+    people_service, emails: List[str]
+) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """Create one contact per email via ``batchCreateContacts``.
+
+    Returns ``(created person by normalized email, failed emails)``.  Chunks
+    are sent one after another: People mutations for one user must not run
+    in parallel.
+    """
+    created: Dict[str, Dict[str, Any]] = {}
+    failed: List[str] = []
+    for start in range(0, len(emails), MAX_BATCH_CREATE):
+        chunk = emails[start : start + MAX_BATCH_CREATE]
+        body = {
+            "contacts": [
+                {"contactPerson": {"emailAddresses": [{"value": e.strip()}]}}
+                for e in chunk
+            ],
+            "readMask": "emailAddresses,metadata",
+        }
+        try:
+            result = await asyncio.to_thread(
+                people_service.people().batchCreateContacts(body=body).execute
+            )
+        except Exception as exc:
+            logger.error(f"Error creating {len(chunk)} contact(s): {exc}")
+            failed.extend(chunk)
+            continue
+
+        for response in result.get("createdPeople", []) or []:
+            person = response.get("person") or {}
+            if person.get("resourceName"):
+                for email in _person_emails(person):
+                    created[email] = person
+        failed.extend(e for e in chunk if normalize_email(e) not in created)
+    return created, failed
+
+
+_indexes: "OrderedDict[str, ContactIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+MAX_INDEXED_USERS = 64
+
+
+def get_contact_index(user_email: str) -> ContactIndex:
+    """Process-wide contact index for ``user_email``."""
+    key = normalize_email(user_email)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = ContactIndex()
+            while len(_indexes) > MAX_INDEXED_USERS:
+                _indexes.popitem(last=False)
+        _indexes.move_to_end(key)
+        return index
@@ -54,6 +54,8 @@ from auth.service_helpers import get_injected_service, request_service
 from config.enhanced_logging import setup_logger
 from tools.common_types import UserGoogleEmail
 
+from .allowlist_index import invalidate_allowlist_index
+from .contact_index import batch_create_contacts, get_contact_index, normalize_email
 from .people_types import (
     ContactLabelInfo,
     GetPeopleContactGroupMembersResponse,
@@ -220,36 +222,20 @@ async def _search_contacts_for_email(people_service, email: str) -> List[str]:
     return resource_names
 
 
-async def _create_contact_for_email(people_service, email: str) -> Optional[str]:
+async def _resolve_contacts(
+    people_service, user_email: str, emails: List[str]
+) -> Dict[str, List[str]]:
     """
-    Create a new contact with the given email address and return its resourceName.
+    Map each email to its contact resourceNames using the per-user contact
+    index, falling back to per-email searchContacts if the index can't sync.
     """
-    if not people_service or not email:
-        return None
-
-    normalized_email = email.strip()
-    if not normalized_email:
-        return None
-
     try:
-
-        def _create():
-            return (
-                people_service.people()
-                .createContact(body={"emailAddresses": [{"value": normalized_email}]})
-                .execute()
-            )
-
-        person = await asyncio.to_thread(_create)
-        resource_name = person.get("resourceName")
-        if not resource_name:
-            logger.error(
-                f"People API returned contact without resourceName for email '{normalized_email}'"
-            )
-        return resource_name
+        return await get_contact_index(user_email).resolve(people_service, emails)
     except Exception as exc:
-        logger.error(f"Error creating contact: {exc}")
-        return None
+        logger.warning(f"Contact index sync failed, searching per email: {exc}")
+    return {
+        addr: await _search_contacts_for_email(people_service, addr) for addr in emails
+    }
 
 
 def _chunked(items: List[str], chunk_size: int):
@@ -345,26 +331,30 @@ async def manage_people_contact_labels(
         existing_contacts: List[str] = []
         failed_emails: List[str] = []
         seen_resource_names = set()
+        missing_emails: List[str] = []
 
+        matches_by_email = await _resolve_contacts(
+            people_service, user_google_email, emails
+        )
         for addr in emails:
-            try:
-                matches = await _search_contacts_for_email(people_service, addr)
-                if matches:
-                    existing_contacts.append(addr)
-                    for rn in matches:
-                        if rn and rn not in seen_resource_names:
-                            seen_resource_names.add(rn)
-                else:
-                    rn = await _create_contact_for_email(people_service, addr)
-                    if rn:
-                        created_contacts.append(addr)
-                        if rn not in seen_resource_names:
-                            seen_resource_names.add(rn)
-                    else:
-                        failed_emails.append(addr)
-            except Exception as exc:
-                logger.error(f"Error processing contact for label_add: {exc}")
-                failed_emails.append(addr)
+            matches = matches_by_email.get(addr)
+            if matches:
+                existing_contacts.append(addr)
+                seen_resource_names.update(matches)
+            else:
+                missing_emails.append(addr)
+
+        if missing_emails:
+            created, failed = await batch_create_contacts(
+                people_service, missing_emails
+            )
+            get_contact_index(user_google_email).record_created(created.values())
+            for addr in missing_emails:
+                person = created.get(normalize_email(addr))
+                if person:
+                    created_contacts.append(addr)
+                    seen_resource_names.add(person["resourceName"])
+            failed_emails.extend(failed)
 
         resource_names_to_add = list(seen_resource_names)
 
@@ -389,6 +379,8 @@ async def manage_people_contact_labels(
             except Exception as exc:
                 batch_errors += 1
                 logger.error(f"Error adding contacts to label '{label_name}': {exc}")
+        if resource_names_to_add:
+            invalidate_allowlist_index(user_google_email)
 
         # Build message
         lines: List[str] = []
@@ -431,18 +423,15 @@ async def manage_people_contact_labels(
     no_match_emails: List[str] = []
     failed_emails: List[str] = []
 
+    matches_by_email = await _resolve_contacts(
+        people_service, user_google_email, emails
+    )
     for addr in emails:
-        try:
-            matches = await _search_contacts_for_email(people_service, addr)
-            if matches:
-                for rn in matches:
-                    if rn:
-                        resource_names_to_remove_set.add(rn)
-            else:
-                no_match_emails.append(addr)
-        except Exception as exc:
-            logger.error(f"Error processing contact for label_remove: {exc}")
-            failed_emails.append(addr)
+        matches = matches_by_email.get(addr)
+        if matches:
+            resource_names_to_remove_set.update(matches)
+        else:
+            no_match_emails.append(addr)
 
     resource_names_to_remove = list(resource_names_to_remove_set)
 
@@ -467,6 +456,8 @@ async def manage_people_contact_labels(
         except Exception as exc:
             batch_errors += 1
             logger.error(f"Error removing contacts from label '{label_name}': {exc}")
+    if resource_names_to_remove:
+        invalidate_allowlist_index(user_google_email)
 
     # Build message
     lines = []
@@ -14,6 +14,7 @@ import hashlib
 import mimetypes
 import os
 import time
+import weakref
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime
@@ -23,6 +24,7 @@ from pathlib import Path
 import requests
 from typing_extensions import Any, Dict, List, Optional
 
+from config.cache_registry import register_cache, sampled_size
 from config.enhanced_logging import setup_logger
 
 logger = setup_logger()
@@ -91,6 +93,29 @@ class RateLimiter:
         logger.debug(f"Rate limit check passed, daily count: {self.daily_count[today]}")
 
 
+# Live response caches (one per optimized client), sized/evicted together
+_live_caches: "weakref.WeakSet[LRUCache]" = weakref.WeakSet()
+
+
+def _response_cache_bytes() -> int:
+    return sum(
+        sampled_size((entry["data"] for entry in list(c.cache.values())), len(c.cache))
+        for c in list(_live_caches)
+    )
+
+
+def _evict_response_caches(fraction: float) -> int:
+    return sum(c.evict_fraction(fraction) for c in list(_live_caches))
+
+
+_response_cache_handle = register_cache(
+    "photos_api_responses",
+    size_fn=_response_cache_bytes,
+    evict_fn=_evict_response_caches,
+    priority=3,
+)
+
+
 class LRUCache:
     """LRU Cache with TTL support for API responses."""
 
@@ -99,6 +124,7 @@ class LRUCache:
         self.default_ttl = default_ttl
         self.cache = {}
         self.access_order = []
+        _live_caches.add(self)
 
     def _make_key(self, *args, **kwargs) -> str:
         """Create cache key from arguments."""
@@ -108,6 +134,7 @@ class LRUCache:
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired."""
         if key not in self.cache:
+            _response_cache_handle.miss()
             return None
 
         entry = self.cache[key]
@@ -118,8 +145,11 @@ class LRUCache:
             del self.cache[key]
             if key in self.access_order:
                 self.access_order.remove(key)
+            _response_cache_handle.miss()
             return None
 
+        _response_cache_handle.hit()
+
         # Move to end (most recently used)
         if key in self.access_order:
             self.access_order.remove(key)
@@ -150,6 +180,19 @@ class LRUCache:
 
         logger.debug(f"Cached entry with {ttl}s TTL: {key[:16]}...")
 
+    def evict_fraction(self, fraction: float) -> int:
+        """Evict the least recently used ``fraction`` of entries."""
+        if not self.access_order:
+            return 0
+        count = max(1, int(len(self.access_order) * fraction))
+        victims, self.access_order = (
+            self.access_order[:count],
+            self.access_order[count:],
+        )
+        for key in victims:
+            self.cache.pop(key, None)
+        return len(victims)
+
     def cleanup_expired(self) -> int:
         """Remove all expired entries. Returns count of removed entries."""
         now = time.time()
@@ -0,0 +1,84 @@
+"""
+Card Delivery Resources for FastMCP2 Google Workspace Platform.
+
+When ``CHAT_WEBHOOK_BACKGROUND_DELIVERY`` is enabled, ``send_dynamic_card``
+returns as soon as a webhook card is queued and reports a ``delivery_id``.
+This resource reports what happened to that delivery afterwards.
+
+Resource URIs:
+    chat://delivery/{delivery_id}  — status of a queued card delivery
+
+Statuses are kept in memory for the most recent deliveries of this server
+process (``DeliveryQueue.max_results``); older or unknown IDs report
+``unknown``.
+"""
+
+from typing import Any, Dict
+
+from fastmcp import FastMCP
+from fastmcp.resources import ResourceContent, ResourceResult
+from pydantic import Field
+from typing_extensions import Annotated
+
+from config.enhanced_logging import setup_logger
+from gchat.webhook_client import get_delivery_queue
+
+logger = setup_logger()
+
+
+def delivery_status(delivery_id: str) -> Dict[str, Any]:
+    """JSON-safe status of a queued card delivery."""
+    entry = get_delivery_queue().status(delivery_id)
+    if entry is None:
+        return {
+            "delivery_id": delivery_id,
+            "status": "unknown",
+            "error": "No recent delivery with this ID on this server",
+        }
+    result = entry.get("result")
+    return {
+        "delivery_id": delivery_id,
+        "status": entry["status"],
+        "status_code": getattr(result, "status_code", None),
+        "parts_sent": getattr(result, "parts_sent", None),
+        "failed_part": getattr(result, "failed_part", None),
+        "thread_key": getattr(result, "thread_key", None),
+        "error": entry.get("error") or getattr(result, "error", None),
+    }
+
+
+def setup_card_delivery_resources(mcp: FastMCP) -> None:
+    """Register card delivery status resources on the FastMCP server."""
+
+    logger.debug("Setting up card delivery resources")
+
+    @mcp.resource(
+        uri="chat://delivery/{delivery_id}",
+        name="Card Delivery Status",
+        description=(
+            "Status of a card queued for background webhook delivery by "
+            "send_dynamic_card (the delivery_id in its response message).\n\n"
+            "Status is one of: queued, delivered, failed, unknown."
+        ),
+        mime_type="application/json",
+        tags={"chat", "card", "delivery", "status", "google"},
+        annotations={"readOnlyHint": True, "idempotentHint": False},
+        meta={"version": "1.0", "category": "delivery"},
+    )
+    async def get_card_delivery_status(
+        delivery_id: Annotated[
+            str,
+            Field(
+                description="delivery_id returned for a queued card",
+                examples=["3f2a9c1b7d4e"],
+            ),
+        ],
+    ) -> ResourceResult:
+        """Status of a queued card delivery."""
+        status = delivery_status(delivery_id)
+        return ResourceResult(
+            contents=[ResourceContent(content=status, mime_type="application/json")],
+            meta={"status": status["status"]},
+        )
+
+    logger.debug("Card delivery resources registered: chat://delivery/{delivery_id}")
@@ -5,107 +5,50 @@ Provides resources that aggregate recent messages across all Google Chat
 spaces into one structured digest, making it trivial for an agent to "check chats."
 
 Uses the Chat API directly via _get_chat_service_with_fallback() rather than going
-through the tool registry.
+through the tool registry.  Digests are served from a per-user incremental store
+(gchat/digest_store.py) that only fetches messages newer than each space's
+watermark and skips spaces whose lastActiveTime has not advanced.
 
 Resource URIs (RFC 6570):
     chat://digest{?hours,limit}                    — all spaces, optional hours/limit
     chat://digest/space/{space_code}{?hours,limit}  — single space
 """
 
-import asyncio
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 
 from fastmcp import Context, FastMCP
 from fastmcp.resources import ResourceContent, ResourceResult
 from fastmcp.server.tasks import TaskConfig
 from pydantic import Field
-from typing_extensions import Annotated, Any, Dict, List, Optional
+from typing_extensions import Annotated, Optional
 
 from auth.context import get_user_email_context
 from config.enhanced_logging import setup_logger
+from config.settings import get_settings
 from gchat.chat_tools import _get_chat_service_with_fallback
-from gchat.chat_types import ChatDigest, DigestMessage, DigestSpace
+from gchat.chat_types import ChatDigest
+from gchat.digest_store import MAX_SPACES, get_digest_store
 
 logger = setup_logger()
 
-MAX_SPACES = 15
 DEFAULT_HOURS = 24
 DEFAULT_LIMIT = 10
 
 
-def _fetch_all_sync(
-    chat_service,
-    spaces_to_scan: List[Dict[str, Any]],
-    time_filter: str,
-    limit: int,
-) -> List[DigestSpace]:
-    """Synchronous function that fetches messages from all spaces sequentially.
-
-    Runs entirely in a single thread to avoid httplib2/SSL thread-safety issues.
-    The google-api-python-client uses httplib2 which is NOT thread-safe — running
-    multiple asyncio.to_thread() calls can corrupt SSL state even when awaited
-    sequentially (thread pool reuse). This function ensures all API calls happen
-    on exactly one thread.
-    """
-    active_spaces: List[DigestSpace] = []
-
-    for space in spaces_to_scan:
-        space_id = space.get("name", "")
-        display_name = space.get("displayName", "Unnamed Space")
-        space_type = space.get("spaceType", "UNKNOWN")
-
-        try:
-            response = (
-                chat_service.spaces()
-                .messages()
-                .list(
-                    parent=space_id,
-                    pageSize=limit,
-                    filter=time_filter,
-                    orderBy="createTime desc",
-                )
-                .execute()
-            )
-
-            raw_messages = response.get("messages", [])
-            if not raw_messages:
-                continue
-
-            messages: List[DigestMessage] = []
-            for msg in raw_messages:
-                sender = msg.get("sender", {})
-                sender_name = sender.get("displayName") or sender.get("name", "Unknown")
-                sender_email = sender.get("email")
-
-                messages.append(
-                    DigestMessage(
-                        id=msg.get("name", ""),
-                        text=msg.get("text", ""),
-                        sender_name=sender_name,
-                        sender_email=sender_email,
-                        create_time=msg.get("createTime", ""),
-                        thread_id=(
-                            msg.get("thread", {}).get("name")
-                            if "thread" in msg
-                            else None
-                        ),
-                    )
-                )
-
-            active_spaces.append(
-                DigestSpace(
-                    space_id=space_id,
-                    display_name=display_name,
-                    space_type=space_type,
-                    message_count=len(messages),
-                    messages=messages,
-                )
-            )
-
-        except Exception as e:
-            logger.debug(f"Skipping space {space_id} ({display_name}): {e}")
-
-    return active_spaces
+def _error_digest(
+    user_email: str, hours_back: int, limit: int, error: str
+) -> ChatDigest:
+    return ChatDigest(
+        user_email=user_email,
+        hours_back=hours_back,
+        limit=limit,
+        total_messages=0,
+        total_spaces_with_activity=0,
+        spaces_checked=0,
+        spaces=[],
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        error=error,
+    )
 
 
 async def _build_digest(
@@ -114,59 +57,43 @@ async def _build_digest(
     limit: int = DEFAULT_LIMIT,
     space_id_filter: Optional[str] = None,
 ) -> ChatDigest:
-    """Core digest builder used by all resource handlers."""
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours_back)
-
-    chat_service = await _get_chat_service_with_fallback(user_email)
-    if chat_service is None:
-        return ChatDigest(
-            user_email=user_email,
-            hours_back=hours_back,
-            limit=limit,
-            total_messages=0,
-            total_spaces_with_activity=0,
-            spaces_checked=0,
-            spaces=[],
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            error="Failed to authenticate with Google Chat. Use start_google_auth to authenticate first.",
-        )
+    """Core digest builder used by all resource handlers.
 
-    # Build time filter for server-side filtering
-    cutoff_str = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
-    time_filter = f'createTime > "{cutoff_str}"'
+    Reads come from the user's incremental digest store.  Unless a background
+    refresh kept it current, the store is first brought up to date, which
+    only fetches messages newer than each space's watermark.
+    """
+    store = get_digest_store(user_email)
+    refresh_seconds = get_settings().chat_digest_refresh_seconds
 
-    # Resolve which spaces to scan — run in single thread to avoid SSL issues
-    def _resolve_and_fetch() -> tuple:
-        """Resolve spaces and fetch all messages in one thread."""
-        if space_id_filter:
-            spaces = [{"name": space_id_filter}]
-            try:
-                space_info = chat_service.spaces().get(name=space_id_filter).execute()
-                spaces = [space_info]
-            except Exception as e:
-                logger.warning(f"Could not fetch space info for {space_id_filter}: {e}")
-        else:
-            response = chat_service.spaces().list(pageSize=MAX_SPACES).execute()
-            spaces = response.get("spaces", [])[:MAX_SPACES]
+    async def _service_factory():
+        return await _get_chat_service_with_fallback(user_email)
 
-        active = _fetch_all_sync(chat_service, spaces, time_filter, limit)
-        return spaces, active
+    store.ensure_background_refresh(_service_factory, refresh_seconds)
+    served_from_store = (
+        not space_id_filter
+        and refresh_seconds > 0
+        and store.is_fresh(2 * refresh_seconds)
+    )
 
-    try:
-        spaces_to_scan, active_spaces = await asyncio.to_thread(_resolve_and_fetch)
-    except Exception as e:
-        return ChatDigest(
-            user_email=user_email,
-            hours_back=hours_back,
-            limit=limit,
-            total_messages=0,
-            total_spaces_with_activity=0,
-            spaces_checked=0,
-            spaces=[],
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            error=f"Failed to fetch Chat digest: {e}",
-        )
+    spaces_checked = store.spaces_checked
+    if not served_from_store:
+        chat_service = await _service_factory()
+        if chat_service is None:
+            return _error_digest(
+                user_email,
+                hours_back,
+                limit,
+                "Failed to authenticate with Google Chat. Use start_google_auth to authenticate first.",
+            )
+        try:
+            spaces_checked = await store.refresh(chat_service, space_id_filter)
+        except Exception as e:
+            return _error_digest(
+                user_email, hours_back, limit, f"Failed to fetch Chat digest: {e}"
+            )
 
+    active_spaces = store.build(hours_back, limit, space_id_filter)
     total_messages = sum(s.message_count for s in active_spaces)
 
     return ChatDigest(
@@ -175,7 +102,7 @@ async def _build_digest(
         limit=limit,
         total_messages=total_messages,
         total_spaces_with_activity=len(active_spaces),
-        spaces_checked=len(spaces_to_scan),
+        spaces_checked=spaces_checked,
         spaces=active_spaces,
         timestamp=datetime.now(timezone.utc).isoformat(),
     )
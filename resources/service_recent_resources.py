@@ -4,14 +4,9 @@ Service Recent Resources for FastMCP2 Google Workspace Platform.
 This module provides resources for accessing recent files from Google Drive-based services
 including Drive, Docs, Sheets, Slides, and Forms using a unified Drive query approach.
 
-All Google Workspace documents are stored in Drive, so we use search_drive_files with
-simple type: syntax queries to get recent items for each service.
-
-Updated to use the newer, simpler Google Drive search syntax:
-- type:docs (instead of complex MIME type filters)
-- type:sheets
-- type:slides
-- type:forms
+All Google Workspace documents are stored in Drive, so one per-user snapshot of
+recently modified files (drive/recent_items.py) serves every Drive-based service:
+Docs, Sheets, Slides and Forms are split out of it locally by mimeType.
 """
 
 import asyncio
@@ -28,12 +23,7 @@ from auth.context import get_user_email_context
 from auth.scope_registry import ScopeRegistry
 from config.enhanced_logging import setup_logger
 from drive.drive_enums import MimeTypeFilter
-from drive.drive_search_types import DriveSearchResponse
-
-# Import the search_drive_files tool function directly
-# Resources call tools directly as async functions, not using forward()
-# (forward() is only for creating transformed tools)
-from drive.drive_tools import search_drive_files
+from drive.recent_items import get_recent_items_cache
 
 logger = setup_logger()
 
@@ -157,9 +147,8 @@ async def _get_recent_items(
     """
     Unified function to get recent items for any service (Drive-based or Photos).
 
-    This function calls the appropriate tools directly and processes their structured responses.
-    Note: Resources call tools as regular async functions - forward() is only used when creating
-    transformed tools, not when resources need to use existing tools.
+    Drive-based services are read from the user's cached recent items snapshot
+    (one files.list shared by all of them); photos calls its list tool directly.
 
     Args:
         service: Service name (drive, docs, sheets, slides, forms, photos)
@@ -169,7 +158,7 @@ async def _get_recent_items(
         ctx: FastMCP Context for tool access
 
     Returns:
-        Dictionary with recent items and metadata from the tool's structured response
+        Dictionary with recent items and metadata
     """
     if service not in SERVICE_INFO:
         return {
@@ -185,53 +174,22 @@ async def _get_recent_items(
             service, service_info, user_email, page_size, ctx
         )
 
-    # Drive-based services handling
-    date_str = _generate_date_query(days_back)
-    date_query = f"modifiedTime > '{date_str}'"
-
-    # Get the MIME type filter for the service
+    # Drive-based services are split out of one shared per-user snapshot
     mime_filter = service_info.get("mime_filter")
-
-    # Special handling for drive service
     if service == "drive" and service_info.get("exclude_folders"):
         mime_filter = MimeTypeFilter.EXCLUDE_FOLDERS
 
-    logger.debug(
-        f"📊 Searching {service} with MIME filter: {mime_filter}, date query: {date_query}"
-    )
-
     try:
-        # Call the search_drive_files tool with the new enum-based approach
-        # Using both mime_type parameter for type filtering and query for date filtering
-        result: DriveSearchResponse = await search_drive_files(
-            user_google_email=user_email,
-            query=date_query,  # Just the date filter, no complex MIME type strings
-            mime_type=mime_filter,  # Clean enum-based type filtering
-            page_size=page_size,
-        )
-
-        # Handle the structured response - it's a TypedDict (returns dict, not object)
+        snapshot = await get_recent_items_cache().get(user_email, days_back)
+        files = snapshot.for_service(service, page_size)
         logger.debug(
-            f"✅ Tool returned {result.get('resultCount', 0)} results for {service}"
+            f"✅ Recent snapshot served {len(files)} {service} items "
+            f"(age {snapshot.age_seconds:.0f}s)"
         )
 
-        # Check for errors in the structured response
-        if result.get("error"):
-            return {
-                "error": result["error"],
-                "service": service,
-                "query_used": date_query,
-                "mime_filter_used": mime_filter.value if mime_filter else None,
-                "timestamp": datetime.now().isoformat(),
-            }
-
-        # Extract files from the structured response
-        files = result.get("results", [])
-
         # Enhance each file with service metadata
         enhanced_files = []
         for file_info in files:
-            # Convert from DriveFileInfo to our enhanced format
             enhanced_file = {
                 "id": file_info.get("id"),
                 "name": file_info.get("name"),
@@ -243,7 +201,7 @@ async def _get_recent_items(
                 "service": service,
                 "service_name": service_info["name"],
                 "service_icon": service_info["icon"],
-                "retrieved_at": datetime.now().isoformat(),
+                "retrieved_at": snapshot.fetched_at_iso,
             }
             enhanced_files.append(enhanced_file)
 
@@ -252,19 +210,20 @@ async def _get_recent_items(
             "service_name": service_info["name"],
             "service_icon": service_info["icon"],
             "description": service_info["description"],
-            "query_used": result.get("processedQuery", date_query),
-            "query_type": result.get("queryType", "structured"),
+            "query_used": snapshot.query,
+            "query_type": "snapshot",
             "mime_filter": mime_filter.value if mime_filter else None,
             "days_back": days_back,
             "total_count": len(enhanced_files),
             "files": enhanced_files,
             "metadata": {
                 "user_email": user_email,
-                "search_date_from": date_str,
+                "search_date_from": _generate_date_query(days_back),
                 "search_date_to": datetime.now().isoformat(),
                 "type_filter": service,
-                "search_scope": result.get("searchScope", "user"),
-                "next_page_token": result.get("nextPageToken"),
+                "search_scope": "allDrives",
+                "snapshot_fetched_at": snapshot.fetched_at_iso,
+                "snapshot_complete": snapshot.complete,
             },
             "timestamp": datetime.now().isoformat(),
         }
@@ -274,7 +233,6 @@ async def _get_recent_items(
         return {
             "error": f"Failed to retrieve recent {service} items: {str(e)}",
             "service": service,
-            "query_used": date_query,
             "mime_filter": mime_filter.value if mime_filter else None,
             "timestamp": datetime.now().isoformat(),
         }
@@ -415,12 +373,12 @@ def setup_service_recent_resources(mcp: FastMCP) -> None:
     """
     Setup service recent resources for all Drive-based services.
 
-    These resources call the search_drive_files tool directly to get recent items.
-    Resources are data providers that USE tools - they don't transform them.
+    Drive-based services are served from the shared per-user recent items
+    snapshot; photos calls its list tool.
     """
 
     logger.debug(
-        "🔧 SETUP: Setting up service recent resources that call search_drive_files tool"
+        "🔧 SETUP: Setting up service recent resources backed by the recent items snapshot"
     )
 
     @mcp.resource(
@@ -436,7 +394,7 @@ Supported services:
   • forms (📝): Recent Google Forms
   • photos (📷): Recent Google Photos albums
 
-Drive-based services use Google Drive search with MIME type filters.
+Drive-based services share one cached Drive query per user, split by MIME type.
 Photos service uses Google Photos API to list recent albums.
 Returns items modified within the last 30 days by default.""",
         mime_type="application/json",
@@ -541,24 +499,33 @@ Note: Photos service returns albums (day range affects Drive services only).""",
         if not user_email:
             return json.dumps(_create_auth_error_response("all"))
 
-        # Get recent items from all services
+        # Drive-based services share one snapshot fetch; photos runs alongside
+        services = list(SERVICE_INFO.keys())
+        service_results = await asyncio.gather(
+            *(
+                _get_recent_items(
+                    service, user_email, days_back=30, page_size=10, ctx=ctx
+                )
+                for service in services
+            ),
+            return_exceptions=True,
+        )
+
         all_results = {}
         total_items = 0
-
-        for service in SERVICE_INFO.keys():
-            try:
-                service_result = await _get_recent_items(
-                    service, user_email, days_back=30, page_size=10, ctx=ctx
+        for service, service_result in zip(services, service_results):
+            if isinstance(service_result, Exception):
+                logger.error(
+                    f"Error getting recent items for {service}: {service_result}"
                 )
-                all_results[service] = service_result
-                if "files" in service_result:
-                    total_items += len(service_result["files"])
-            except Exception as e:
-                logger.error(f"Error getting recent items for {service}: {e}")
                 all_results[service] = {
-                    "error": f"Failed to get {service} items: {str(e)}",
+                    "error": f"Failed to get {service} items: {str(service_result)}",
                     "service": service,
                 }
+                continue
+            all_results[service] = service_result
+            if "files" in service_result:
+                total_items += len(service_result["files"])
 
         result = {
             "user_email": user_email,
@@ -580,6 +547,4 @@ Note: Photos service returns albums (day range affects Drive services only).""",
 
     logger.debug("✅ Service recent resources registered for Drive-based services")
     logger.debug(f"  Available services: {', '.join(SERVICE_INFO.keys())}")
-    logger.debug(
-        "  Resources call search_drive_files tool directly and return structured results"
-    )
+    logger.debug("  Drive-based services share one cached files.list snapshot per user")
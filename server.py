@@ -64,6 +64,7 @@ from prompts.gmail_prompts import setup_gmail_prompts
 from prompts.structured_response_demo_prompts import (
     setup_structured_response_demo_prompts,
 )
+from resources.card_delivery_resources import setup_card_delivery_resources
 from resources.chat_digest_resources import setup_chat_digest_resources
 from resources.gmail_resources import setup_gmail_resources
 from resources.service_list_resources import setup_service_list_resources
@@ -545,6 +546,9 @@ setup_service_recent_resources(mcp)
 # Setup chat digest resources (aggregated recent messages across Chat spaces)
 setup_chat_digest_resources(mcp)
 
+# Setup card delivery status resources (background webhook deliveries)
+setup_card_delivery_resources(mcp)
+
 # Setup template macro resources (discovery and usage examples)
 logger.info("📚 Registering template macro resources...")
 register_template_resources(mcp)
@@ -8,6 +8,7 @@ isn't present.
 """
 
 import os
+import sys
 
 import pytest
 
@@ -125,3 +126,19 @@ def pytest_collection_modifyitems(config, items):
             if any(s in module_name for s in substrings) and not check_fn():
                 item.add_marker(pytest.mark.skip(reason=f"CI skip: {reason}"))
                 break
+
+
+# ---------------------------------------------------------------------------
+# Process-wide caches — reset between tests so one test's API results never
+# answer another test's calls.
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def _reset_chat_member_directory():
+    """Clear the Chat member directory (gchat/member_directory.py) per test."""
+    yield
+    module = sys.modules.get("gchat.member_directory")
+    directory = getattr(module, "_directory", None) if module else None
+    if directory is not None:
+        directory.invalidate()
@@ -0,0 +1,344 @@
+"""
+Tests for the async ModuleWrapper search path.
+
+Covers concurrent per-stage prefetch with client-side RRF fusion
+(_query_prefetch_stages_async), the ``prefetched=`` hand-off into the sync
+rerankers, and search_hybrid_dispatch_async mode routing.
+"""
+
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from adapters.module_wrapper.search_mixin import SearchMixin
+from adapters.module_wrapper.types import PrefetchedCandidates
+from config.settings import override_settings
+
+# =========================================================================
+# FIXTURES
+# =========================================================================
+
+
+class MockSearchMixin(SearchMixin):
+    """Minimal concrete class for testing SearchMixin methods."""
+
+    def __init__(self):
+        self._initialized = True
+        self.client = MagicMock()
+        self.embedder = MagicMock()
+        self.collection_name = "test_collection"
+        self.components = {}
+        self.module = MagicMock()
+        self.symbol_mapping = {}
+        self.reverse_symbol_mapping = {}
+        self.relationships = {}
+
+
+@pytest.fixture
+def mixin():
+    return MockSearchMixin()
+
+
+def _unit_vec(dim: int, index: int = 0) -> List[float]:
+    vec = [0.0] * dim
+    vec[index % dim] = 1.0
+    return vec
+
+
+def _point(point_id, payload, vectors=None):
+    return SimpleNamespace(id=point_id, payload=payload, vector=vectors, score=0.5)
+
+
+def _stage(using, limit=10):
+    return SimpleNamespace(query=[0.1], using=using, filter=None, limit=limit)
+
+
+# =========================================================================
+# CONCURRENT PREFETCH + RRF FUSION
+# =========================================================================
+
+
+class TestQueryPrefetchStagesAsync:
+    """Each prefetch stage is an independent query; results fused by RRF."""
+
+    async def test_one_query_per_stage(self, mixin):
+        client = MagicMock()
+        client.query_points = AsyncMock(return_value=SimpleNamespace(points=[]))
+        stages = [_stage("components"), _stage("inputs"), _stage("relationships")]
+
+        await mixin._query_prefetch_stages_async(client, stages)
+
+        assert client.query_points.await_count == 3
+        used = {c.kwargs["using"] for c in client.query_points.await_args_list}
+        assert used == {"components", "inputs", "relationships"}
+        for call in client.query_points.await_args_list:
+            assert call.kwargs["with_vectors"] is True
+            assert call.kwargs["collection_name"] == "test_collection"
+
+    async def test_rrf_fusion_dedupes_and_orders(self, mixin):
+        a, b, c = _point("a", {}), _point("b", {}), _point("c", {})
+        by_stage = {
+            "components": [a, b],
+            "inputs": [b, c],
+            "relationships": [b],
+        }
+
+        async def _query(**kwargs):
+            return SimpleNamespace(points=by_stage[kwargs["using"]])
+
+        client = MagicMock()
+        client.query_points = _query
+        stages = [_stage(u) for u in by_stage]
+
+        fused = await mixin._query_prefetch_stages_async(client, stages)
+
+        assert [p.id for p in fused] == ["b", "a", "c"]
+
+    async def test_failing_stage_is_skipped(self, mixin):
+        a = _point("a", {})
+
+        async def _query(**kwargs):
+            if kwargs["using"] == "inputs":
+                raise RuntimeError("stage down")
+            return SimpleNamespace(points=[a])
+
+        client = MagicMock()
+        client.query_points = _query
+
+        fused = await mixin._query_prefetch_stages_async(
+            client, [_stage("components"), _stage("inputs")]
+        )
+
+        assert [p.id for p in fused] == ["a"]
+
+
+# =========================================================================
+# PREFETCHED HAND-OFF INTO SYNC RERANKERS
+# =========================================================================
+
+
+class TestPrefetchedRerank:
+    """Rerankers skip embedding and Qdrant when given prefetched candidates."""
+
+    def test_multidim_uses_prefetched_candidates(self, mixin):
+        colbert = [_unit_vec(128, i) for i in range(3)]
+        minilm = _unit_vec(384, 0)
+        point = _point(
+            "p1",
+            {"type": "class", "name": "Section"},
+            vectors={"components": colbert, "inputs": colbert, "relationships": minilm},
+        )
+        mixin._embed_with_colbert = MagicMock()
+        mixin._embed_with_minilm = MagicMock()
+
+        classes, _, _ = mixin.search_hybrid_multidim(
+            "build a card",
+            prefetched=PrefetchedCandidates(
+                query_colbert=colbert, query_minilm=minilm, points=[point]
+            ),
+        )
+
+        assert [r["name"] for r in classes] == ["Section"]
+        mixin.client.query_points.assert_not_called()
+        mixin._embed_with_colbert.assert_not_called()
+        mixin._embed_with_minilm.assert_not_called()
+
+    def test_multidim_empty_prefetched_returns_empty(self, mixin):
+        result = mixin.search_hybrid_multidim(
+            "build a card",
+            prefetched=PrefetchedCandidates(query_colbert=[[1.0]], query_minilm=[1.0]),
+        )
+        assert result == ([], [], [])
+
+
+# =========================================================================
+# ASYNC DISPATCH ROUTING
+# =========================================================================
+
+
+class TestSearchHybridDispatchAsync:
+    """Mode routing for search_hybrid_dispatch_async."""
+
+    async def test_rrf_mode_runs_sync_dispatch(self, mixin):
+        expected = ([{"name": "X"}], [], [])
+        mixin.search_hybrid_dispatch = MagicMock(return_value=expected)
+
+        with override_settings(search_mode="rrf", enable_multidim_search=False):
+            result = await mixin.search_hybrid_dispatch_async("build a card")
+
+        assert result == expected
+        mixin.search_hybrid_dispatch.assert_called_once()
+
+    async def test_multidim_mode_reranks_prefetched(self, mixin):
+        prefetched = PrefetchedCandidates(query_colbert=[[1.0]], query_minilm=[1.0])
+        mixin._prefetch_candidates_async = AsyncMock(return_value=prefetched)
+        mixin.search_hybrid_multidim = MagicMock(return_value=([], [], []))
+        mixin.search_hybrid_dispatch = MagicMock()
+
+        with (
+            override_settings(search_mode="multidim", search_shadow_scoring=False),
+            patch(
+                "config.qdrant_client.get_async_qdrant_client",
+                return_value=MagicMock(),
+            ),
+        ):
+            await mixin.search_hybrid_dispatch_async("build a card")
+
+        mixin.search_hybrid_dispatch.assert_not_called()
+        kwargs = mixin.search_hybrid_multidim.call_args.kwargs
+        assert kwargs["prefetched"] is prefetched
+
+    async def test_missing_async_client_falls_back(self, mixin):
+        mixin.search_hybrid_dispatch = MagicMock(return_value=([], [], []))
+
+        with (
+            override_settings(search_mode="learned"),
+            patch("config.qdrant_client.get_async_qdrant_client", return_value=None),
+        ):
+            await mixin.search_hybrid_dispatch_async("build a card")
+
+        mixin.search_hybrid_dispatch.assert_called_once()
+
+
+# =========================================================================
+# SYNC / ASYNC PREFETCH PARITY
+# =========================================================================
+
+
+def _stage_names(prefetch_list) -> List[str]:
+    return sorted(p.using for p in prefetch_list)
+
+
+class TestPrefetchParity:
+    """The async prefetch issues the same stages as the sync searches."""
+
+    @pytest.fixture
+    def embedded(self, mixin):
+        mixin._embed_with_colbert = MagicMock(return_value=[[0.5] * 128])
+        mixin._embed_with_minilm = MagicMock(return_value=[0.5] * 384)
+        mixin.client.query_points.return_value = SimpleNamespace(points=[])
+        return mixin
+
+    @pytest.mark.parametrize("include_classes", [True, False])
+    async def test_multidim_stages_match_sync(self, embedded, include_classes):
+        embedded.search_hybrid_multidim(
+            "build a card", include_classes=include_classes, content_text="hi"
+        )
+        sync_stages = _stage_names(
+            embedded.client.query_points.call_args.kwargs["prefetch"]
+        )
+
+        client = MagicMock()
+        client.query_points = AsyncMock(return_value=SimpleNamespace(points=[]))
+        await embedded._prefetch_candidates_async(
+            client,
+            "multidim",
+            description="build a card",
+            component_paths=None,
+            token_ratio=1.0,
+            content_feedback=None,
+            form_feedback=None,
+            include_classes=include_classes,
+            candidate_pool_size=20,
+            content_text="hi",
+        )
+        async_stages = sorted(
+            c.kwargs["using"] for c in client.query_points.await_args_list
+        )
+
+        assert async_stages == sync_stages
+        assert ("components" in async_stages) is include_classes
+
+    async def test_multidim_pool_is_truncated_like_sync(self, embedded):
+        many = [_point(i, {}) for i in range(100)]
+        client = MagicMock()
+        client.query_points = AsyncMock(return_value=SimpleNamespace(points=many))
+
+        prefetched = await embedded._prefetch_candidates_async(
+            client,
+            "multidim",
+            description="build a card",
+            component_paths=None,
+            token_ratio=1.0,
+            content_feedback=None,
+            form_feedback=None,
+            include_classes=True,
+            candidate_pool_size=5,
+            content_text=None,
+        )
+
+        assert len(prefetched.points) == 15
+
+    async def test_learned_uses_grouped_query_like_sync(self, embedded):
+        hits = [_point("a", {"type": "class"}), _point("b", {"type": "class"})]
+        grouped = SimpleNamespace(groups=[SimpleNamespace(id="class", hits=hits)])
+        embedded.client.query_points_groups.return_value = grouped
+        embedded._query_grouped_candidates(
+            [[0.5] * 128], [0.5] * 384, 20, group_size=20
+        )
+        sync_kwargs = embedded.client.query_points_groups.call_args.kwargs
+
+        client = MagicMock()
+        client.query_points = AsyncMock()
+        client.query_points_groups = AsyncMock(return_value=grouped)
+        prefetched = await embedded._prefetch_candidates_async(
+            client,
+            "learned",
+            description="build a card",
+            component_paths=None,
+            token_ratio=1.0,
+            content_feedback=None,
+            form_feedback=None,
+            include_classes=False,
+            candidate_pool_size=20,
+            content_text=None,
+        )
+        async_kwargs = client.query_points_groups.await_args.kwargs
+
+        client.query_points.assert_not_awaited()
+        assert [p.id for p in prefetched.points] == ["a", "b"]
+        assert _stage_names(async_kwargs["prefetch"]) == _stage_names(
+            sync_kwargs["prefetch"]
+        )
+        for key in ("group_by", "limit", "group_size"):
+            assert async_kwargs[key] == sync_kwargs[key]
+
+
+# =========================================================================
+# ASYNC CLIENT + CARD BUILDER BRIDGE
+# =========================================================================
+
+
+async def test_async_client_initializes_sync_client_off_loop():
+    import threading
+
+    from config import qdrant_client
+
+    loop_thread = threading.get_ident()
+    seen = []
+
+    def _sync_client():
+        seen.append(threading.get_ident())
+        return None
+
+    with patch.object(qdrant_client, "get_qdrant_client", _sync_client):
+        assert await qdrant_client.get_async_qdrant_client() is None
+
+    assert seen and seen[0] != loop_thread
+
+
+async def test_card_search_from_worker_thread_uses_async_path():
+    from gchat.card_builder import search
+
+    pattern = {"component_paths": ["Section"], "source": "wrapper_hybrid"}
+    with patch.object(
+        search, "query_wrapper_patterns_async", AsyncMock(return_value=pattern)
+    ) as async_search:
+        result = await search.run_with_async_search(
+            search.query_wrapper_patterns, "status card"
+        )
+
+    assert result == pattern
+    async_search.assert_awaited_once_with("status card", None)
@@ -171,3 +171,31 @@ class TestGchatCardBuilder:
             mock_reassign.assert_called_once()
             call_kwargs = mock_reassign.call_args
             assert call_kwargs.kwargs.get("domain_config") is GCHAT_DOMAIN
+
+
+class TestConcurrentBuilds:
+    """Builds on the shared builder run concurrently with their own state."""
+
+    async def test_concurrent_builds_do_not_share_state(self):
+        import asyncio
+        import threading
+
+        from gchat.card_builder.builder_v2 import SmartCardBuilderV2
+
+        builder = SmartCardBuilderV2()
+        both_running = threading.Barrier(2, timeout=5)
+
+        def fake_build(description, card_params, suggested_dsl=None):
+            builder._supply_map = {"text": [description]}
+            builder._jinja_applied = description == "styled"
+            both_running.wait()  # Raises BrokenBarrierError if builds serialize
+            return {"supply_map": builder._supply_map, "jinja": builder._jinja_applied}
+
+        with patch.object(builder, "build_from_params", side_effect=fake_build):
+            plain, styled = await asyncio.gather(
+                builder.build_from_params_async("plain", {}),
+                builder.build_from_params_async("styled", {}),
+            )
+
+        assert plain == {"supply_map": {"text": ["plain"]}, "jinja": False}
+        assert styled == {"supply_map": {"text": ["styled"]}, "jinja": True}
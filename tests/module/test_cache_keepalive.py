@@ -391,6 +391,103 @@ class TestCacheKeepaliveEngine:
         assert any("exploration output" in r.message for r in caplog.records)
 
 
+class TestKeepaliveScheduling:
+    """Per-module scheduling driven by real traffic and expected savings."""
+
+    def _module(self, engine, name, prompt):
+        cfg = KeepaliveModuleConfig(
+            module_name=name,
+            get_system_prompt_fn=lambda: prompt,
+            exploration_prompts=["Explore"],
+        )
+        engine.register_module(cfg)
+        return cfg
+
+    @pytest.mark.asyncio
+    async def test_traffic_postpones_keepalive(self, engine):
+        gchat = self._module(engine, "gchat", "gchat prefix")
+        email = self._module(engine, "email", "email prefix")
+        with patch(
+            "litellm.acompletion",
+            new_callable=AsyncMock,
+            return_value=_make_litellm_response(),
+        ):
+            await engine._send_keepalive(gchat)
+            await engine._send_keepalive(email)
+        due_before = email.next_keepalive_at
+
+        engine.note_prefix_use("email prefix")
+        engine.note_prefix_use("unrelated prompt")
+
+        assert email.traffic_refreshes == 1
+        assert email.last_warmed_at > email.last_keepalive_at
+        assert email.next_keepalive_at > due_before - 600  # rescheduled from now
+        assert gchat.traffic_refreshes == 0
+
+    @pytest.mark.asyncio
+    async def test_due_modules_sent_concurrently(self, engine, settings):
+        settings.cache_keepalive_concurrency = 2
+        for name in ("gchat", "email", "qdrant"):
+            self._module(engine, name, f"{name} prefix")
+        in_flight = peak = 0
+
+        async def _slow_send(module):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            engine._mark_warmed(module, 9e12)
+            return {"cached_tokens": 0}
+
+        real_sleep = asyncio.sleep
+        loop_sleeps = []
+
+        async def _sleep(delay):
+            if delay >= 1:  # startup delay, then stop after the first batch
+                loop_sleeps.append(delay)
+                if len(loop_sleeps) > 1:
+                    raise asyncio.CancelledError
+                return
+            await real_sleep(delay)
+
+        with (
+            patch.object(engine, "_send_keepalive", side_effect=_slow_send),
+            patch("middleware.cache_keepalive.asyncio.sleep", side_effect=_sleep),
+            patch.object(engine, "_keepalive_worthwhile", return_value=True),
+            patch.object(engine, "_save_persisted_stats"),
+        ):
+            engine_loop = asyncio.ensure_future(engine._keepalive_loop())
+            with pytest.raises(asyncio.CancelledError):
+                await engine_loop
+
+        assert peak == 2
+
+    def test_unprofitable_keepalive_skipped(self, engine, settings):
+        import time
+
+        cfg = self._module(engine, "gchat", "gchat prefix")
+        cfg.total_keepalive_calls = 1
+        cfg.total_input_tokens = 20000
+        cfg.total_output_tokens = 100
+        cfg.traffic_refreshes = 1
+        now = time.time()
+
+        # One real call in the last hour — likely another within 45 minutes
+        cfg.recent_traffic.append(now - 3000)
+        assert engine._keepalive_worthwhile(cfg, now)
+
+        # Traffic stopped: no expected savings
+        cfg.recent_traffic.clear()
+        cfg.recent_traffic.append(now - 7200)
+        assert not engine._keepalive_worthwhile(cfg, now)
+
+        # Demanding a large payoff makes a single recent call insufficient
+        cfg.recent_traffic.append(now - 3000)
+        settings.cache_keepalive_min_benefit_ratio = 10.0
+        assert not engine._keepalive_worthwhile(cfg, now)
+
+
 class TestExecuteKeepaliveModule:
     def test_register_execute_module(self, engine, settings):
         """Verify execute module registers when included in modules list."""
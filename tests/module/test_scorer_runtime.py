@@ -0,0 +1,108 @@
+"""Parity tests for the compiled NumPy learned-scorer runtime."""
+
+import numpy as np
+import pytest
+import torch
+
+from adapters.scorer_models import DualHeadMLP, ScorerMLP
+from adapters.scorer_runtime import LearnedScorerRuntime
+from adapters.unified_trn import UnifiedTRN
+
+ATOL = 1e-5
+
+
+@pytest.fixture(autouse=True)
+def _seed():
+    torch.manual_seed(0)
+
+
+class TestRuntimeParity:
+    """Compiled forward matches eager torch for every supported architecture."""
+
+    def test_unified_matches_torch(self):
+        model = UnifiedTRN(dropout=0.0).eval()
+        features = torch.randn(12, 17)
+        content = torch.randn(384)
+
+        with torch.no_grad():
+            ref = model(features, content.expand(12, -1), mode="search")
+        out = LearnedScorerRuntime.from_torch_model(model, "unified").score(
+            features.tolist(), content_emb=content.tolist(), with_halt=True
+        )
+
+        np.testing.assert_allclose(out.form, ref["form_score"].squeeze(-1), atol=ATOL)
+        np.testing.assert_allclose(
+            out.content, ref["content_score"].squeeze(-1), atol=ATOL
+        )
+        np.testing.assert_allclose(out.halt, ref["halt_prob"].squeeze(-1), atol=ATOL)
+
+    def test_dual_head_matches_torch(self):
+        model = DualHeadMLP().eval()
+        features = torch.randn(7, 17)
+
+        with torch.no_grad():
+            form_ref, content_ref = model(features)
+        out = LearnedScorerRuntime.from_torch_model(model, "dual_head").score(
+            features.tolist()
+        )
+
+        np.testing.assert_allclose(out.form, form_ref.squeeze(-1), atol=ATOL)
+        np.testing.assert_allclose(out.content, content_ref.squeeze(-1), atol=ATOL)
+        assert out.halt is None
+
+    def test_single_matches_torch(self):
+        model = ScorerMLP().eval()
+        features = torch.randn(5, 9)
+
+        with torch.no_grad():
+            ref = model(features).squeeze(-1)
+        out = LearnedScorerRuntime.from_torch_model(model, "single").score(
+            features.numpy()
+        )
+
+        np.testing.assert_allclose(out.form, ref, atol=ATOL)
+        assert out.content is None
+
+
+class TestRuntimeBatching:
+    """Buffer reuse and cross-request batching."""
+
+    def test_buffer_grows_and_is_reused(self):
+        runtime = LearnedScorerRuntime.from_torch_model(ScorerMLP().eval(), "single")
+        small = np.random.rand(3, 9).astype(np.float32)
+        large = np.random.rand(100, 9).astype(np.float32)
+
+        first = runtime.score(small.tolist()).form.copy()
+        runtime.score(large.tolist())
+        again = runtime.score(small.tolist()).form
+
+        np.testing.assert_allclose(first, again, atol=ATOL)
+
+
+class TestScoreLearnedCandidates:
+    """SearchMixin._score_learned_candidates: runtime and torch paths agree."""
+
+    def test_runtime_and_torch_fallback_agree(self, monkeypatch):
+        from adapters.module_wrapper.search_mixin import SearchMixin
+
+        model = UnifiedTRN(dropout=0.0).eval()
+        features = np.random.rand(6, 17).tolist()
+        content = np.random.rand(384).tolist()
+        monkeypatch.setattr(SearchMixin, "_learned_model", model)
+        monkeypatch.setattr(SearchMixin, "_learned_model_type", "unified")
+
+        monkeypatch.setattr(SearchMixin, "_learned_runtime", None)
+        eager = SearchMixin._score_learned_candidates(
+            SearchMixin(), features, content_emb=content, with_halt=True
+        )
+        monkeypatch.setattr(
+            SearchMixin,
+            "_learned_runtime",
+            LearnedScorerRuntime.from_torch_model(model, "unified"),
+        )
+        compiled = SearchMixin._score_learned_candidates(
+            SearchMixin(), features, content_emb=content, with_halt=True
+        )
+
+        for eager_scores, compiled_scores in zip(eager, compiled):
+            np.testing.assert_allclose(compiled_scores, eager_scores, atol=ATOL)
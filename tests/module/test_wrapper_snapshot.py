@@ -0,0 +1,77 @@
+"""Tests for ModuleWrapper startup snapshots (adapters/module_wrapper/snapshot.py)."""
+
+import pickle
+
+import pytest
+
+from adapters.module_wrapper import ModuleWrapper
+from adapters.module_wrapper.snapshot import _snapshot_path, load_snapshot
+from config.settings import override_settings
+
+MODULE = "card_framework.v2"
+
+
+def _wrapper(**kwargs):
+    return ModuleWrapper(MODULE, auto_initialize=False, max_depth=5, **kwargs)
+
+
+def _state(wrapper):
+    return (
+        {
+            key: (c.name, c.component_type, c.docstring, c.source, list(c.children))
+            for key, c in wrapper.components.items()
+        },
+        list(wrapper.root_components),
+        wrapper.symbol_mapping,
+        wrapper.relationships,
+    )
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path):
+    with override_settings(module_wrapper_snapshot_dir=str(tmp_path)):
+        yield tmp_path
+
+
+def test_restored_state_matches_full_introspection(snapshot_dir):
+    built = _wrapper()
+    built._introspect_module()
+    assert _snapshot_path(built).exists()
+
+    restored = _wrapper()
+    assert load_snapshot(restored) is True
+
+    assert _state(restored) == _state(built)
+    for key, component in built.components.items():
+        if component.component_type == "class":
+            assert restored.components[key].obj is component.obj
+
+
+def test_changed_source_falls_back_to_introspection(snapshot_dir):
+    built = _wrapper()
+    built._introspect_module()
+    path = _snapshot_path(built)
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    state["sources"][next(iter(state["sources"]))] = "0" * 64
+    with open(path, "wb") as f:
+        pickle.dump(state, f)
+
+    assert load_snapshot(_wrapper()) is False
+
+    rebuilt = _wrapper()
+    rebuilt._introspect_module()  # rewrites a valid snapshot
+    assert load_snapshot(_wrapper()) is True
+
+
+def test_config_change_uses_a_different_snapshot(snapshot_dir):
+    _wrapper()._introspect_module()
+
+    assert load_snapshot(_wrapper(index_nested=False)) is False
+
+
+def test_disabled_snapshots_are_not_written(snapshot_dir):
+    with override_settings(module_wrapper_snapshot_enabled=False):
+        _wrapper()._introspect_module()
+
+    assert list(snapshot_dir.iterdir()) == []
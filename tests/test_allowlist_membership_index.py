@@ -0,0 +1,153 @@
+"""
+Tests for the per-user allow-list contact group membership index.
+
+These tests use an in-memory People API stub, so they run in every
+environment.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+from gmail import compose
+from people.allowlist_index import AllowlistMembershipIndex
+
+USER = "owner@example.com"
+
+
+class _Request:
+    def __init__(self, fn):
+        self.fn = fn
+
+    def execute(self):
+        return self.fn()
+
+
+class FakePeople:
+    """contactGroups.list/get and people.getBatchGet stub."""
+
+    def __init__(self, groups):
+        # name -> list of member emails
+        self.groups = groups
+        self.calls = []
+
+    def contactGroups(self):
+        return self
+
+    def people(self):
+        return self
+
+    def list(self, pageToken=None, **kwargs):
+        def run():
+            self.calls.append(("groups.list", pageToken))
+            items = [
+                {
+                    "name": name,
+                    "resourceName": f"contactGroups/{name.lower()}",
+                    "memberCount": len(members),
+                }
+                for name, members in self.groups.items()
+            ]
+            start = int(pageToken or 0)
+            page = {"contactGroups": items[start : start + 1]}
+            if start + 1 < len(items):
+                page["nextPageToken"] = str(start + 1)
+            return page
+
+        return _Request(run)
+
+    def get(self, resourceName, maxMembers):
+        def run():
+            self.calls.append(("groups.get", resourceName, maxMembers))
+            name = next(n for n in self.groups if resourceName.endswith(n.lower()))
+            return {
+                "memberResourceNames": [
+                    f"people/{email}" for email in self.groups[name][:maxMembers]
+                ]
+            }
+
+        return _Request(run)
+
+    def getBatchGet(self, resourceNames, personFields):
+        def run():
+            self.calls.append(("batchGet", len(resourceNames)))
+            return {
+                "responses": [
+                    {
+                        "person": {
+                            "resourceName": rn,
+                            "emailAddresses": [{"value": rn.split("/", 1)[1]}],
+                        }
+                    }
+                    for rn in resourceNames
+                ]
+            }
+
+        return _Request(run)
+
+
+def _count(people, kind):
+    return sum(1 for call in people.calls if call[0] == kind)
+
+
+async def test_groups_expand_once_into_email_set():
+    team = [f"Member{i}@Example.com" for i in range(250)]
+    people = FakePeople({"Team": team, "Family": ["mom@example.com"], "Other": []})
+    index = AllowlistMembershipIndex(ttl_seconds=60)
+
+    allowed = await index.allowed_emails(
+        people, ["group:Team", "groupId:contactGroups/family", "group:Missing"]
+    )
+
+    assert "member7@example.com" in allowed
+    assert "mom@example.com" in allowed
+    assert len(allowed) == 251
+    assert _count(people, "groups.list") == 3  # one group per page
+    assert ("groups.get", "contactGroups/team", 250) in people.calls
+    assert [c[1] for c in people.calls if c[0] == "batchGet"] == [200, 51]
+
+    calls = len(people.calls)
+    assert (
+        await index.allowed_emails(
+            people, ["groupId:contactGroups/family", "group:Team", "group:Missing"]
+        )
+        is allowed
+    )
+    assert len(people.calls) == calls
+    assert index.stats == {"hits": 1, "builds": 1}
+
+
+async def test_invalidate_ttl_and_spec_changes_rebuild():
+    people = FakePeople({"Team": ["a@example.com"], "Family": ["b@example.com"]})
+    index = AllowlistMembershipIndex(ttl_seconds=60)
+
+    await index.allowed_emails(people, ["group:Team"])
+    people.groups["Team"].append("c@example.com")
+    index.invalidate()
+    assert "c@example.com" in await index.allowed_emails(people, ["group:Team"])
+
+    assert await index.allowed_emails(people, ["group:Family"]) == {"b@example.com"}
+
+    index.ttl_seconds = 0
+    await index.allowed_emails(people, ["group:Family"])
+    assert index.stats["builds"] == 4
+
+
+async def test_bulk_send_check_uses_one_expansion():
+    people = FakePeople({"Team": [f"m{i}@example.com" for i in range(40)]})
+    index = AllowlistMembershipIndex(ttl_seconds=60)
+    recipients = [f"m{i}@example.com" for i in range(50)]
+
+    with (
+        patch.object(
+            compose,
+            "_get_people_service_for_allow_list",
+            AsyncMock(return_value=people),
+        ),
+        patch.object(compose, "get_allowlist_index", return_value=index),
+    ):
+        allowed = await compose._filter_recipients_allowed_by_groups(
+            recipients, ["group:Team"], USER
+        )
+
+    assert sorted(allowed) == sorted(recipients[:40])
+    assert _count(people, "groups.get") == 1
+    assert _count(people, "batchGet") == 1
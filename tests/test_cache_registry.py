@@ -0,0 +1,117 @@
+"""Tests for the process-wide cache memory budget registry."""
+
+from collections import OrderedDict
+
+from config.cache_registry import (
+    CacheRegistry,
+    estimate_size,
+    evict_first,
+    sampled_size,
+)
+from middleware.template_core.cache_manager import CacheManager
+
+
+def _register(registry, name, cache, entry_bytes, priority):
+    return registry.register(
+        name,
+        size_fn=lambda: len(cache) * entry_bytes,
+        evict_fn=lambda fraction: evict_first(cache, fraction),
+        priority=priority,
+    )
+
+
+class TestSizeEstimates:
+    def test_nested_containers_counted(self):
+        flat = estimate_size("x" * 1000)
+        nested = estimate_size({"a": ["x" * 1000, "y" * 1000]})
+        assert nested > 2 * flat
+
+    def test_sampled_size_extrapolates(self):
+        values = ["x" * 1000] * 100
+        assert sampled_size(values, len(values)) >= 100 * 1000
+
+
+class TestCacheRegistry:
+    def test_within_budget_evicts_nothing(self):
+        registry = CacheRegistry(budget_bytes=10_000)
+        cache = OrderedDict((i, i) for i in range(10))
+        _register(registry, "small", cache, 100, priority=5)
+
+        assert registry.enforce() == {}
+        assert len(cache) == 10
+
+    def test_over_budget_evicts_partially_by_priority(self):
+        registry = CacheRegistry(budget_bytes=15_000)
+        cheap = OrderedDict((i, i) for i in range(100))
+        precious = OrderedDict((i, i) for i in range(100))
+        _register(registry, "cheap", cheap, 100, priority=1)
+        _register(registry, "precious", precious, 100, priority=4)
+
+        evicted = registry.enforce()
+
+        assert 0 < len(precious) < 100 and 0 < len(cheap) < 100
+        assert evicted["cheap"] == 4 * evicted["precious"]
+        assert list(cheap)[0] == evicted["cheap"]  # oldest entries went first
+        assert len(cheap) * 100 + len(precious) * 100 <= 15_000
+
+    def test_pressure_shrinks_gradually(self):
+        registry = CacheRegistry(budget_bytes=0)
+        cache = OrderedDict((i, i) for i in range(100))
+        _register(registry, "cache", cache, 100, priority=1)
+
+        registry.enforce(pressure_bytes=1_000_000)
+
+        assert len(cache) == 75  # at most 25% per pass, never wiped
+
+    def test_stats_report_hit_rate_and_evictions(self):
+        registry = CacheRegistry(budget_bytes=500)
+        cache = OrderedDict((i, i) for i in range(10))
+        handle = _register(registry, "cache", cache, 100, priority=1)
+        handle.hit()
+        handle.hit()
+        handle.miss()
+
+        registry.enforce()
+        stats = registry.stats()["caches"]["cache"]
+
+        assert stats["hit_rate"] == round(2 / 3, 4)
+        assert stats["evicted_entries"] == 5
+        assert stats["bytes"] == 500
+
+
+def test_cache_manager_evicts_expired_then_oldest():
+    cm = CacheManager(max_entries=10)
+    for i in range(4):
+        cm.cache_resource(f"uri_{i}", i)
+
+    assert cm.evict_fraction(0.5) == 2
+    assert cm.get_cached_resource("uri_0") is None
+    assert cm.get_cached_resource("uri_3") == 3
+
+
+def test_pressure_eviction_stops_once_rss_stops_growing(monkeypatch):
+    import lifespans.server_lifespans as lifespans_mod
+    from config import cache_registry
+
+    registry = CacheRegistry()
+    cache = OrderedDict((i, i) for i in range(100))
+    _register(registry, "models_dominate_rss", cache, 1000, priority=5)
+    monkeypatch.setattr(cache_registry, "get_cache_registry", lambda: registry)
+    monkeypatch.setattr(lifespans_mod, "_pressure_floor_mb", None)
+    warn = lifespans_mod._WARN_THRESHOLD_MB
+    rss = {"mb": warn + 500.0}
+    monkeypatch.setattr(lifespans_mod, "_get_rss_mb", lambda: rss["mb"])
+
+    assert lifespans_mod._enforce_cache_budget()
+    shrunk = len(cache)
+    for _ in range(5):
+        assert lifespans_mod._enforce_cache_budget() == {}
+    assert len(cache) == shrunk
+
+    rss["mb"] += 1
+    assert lifespans_mod._enforce_cache_budget()
+    assert len(cache) < shrunk
+
+    rss["mb"] = warn * 0.5
+    lifespans_mod._enforce_cache_budget()
+    assert lifespans_mod._pressure_floor_mb is None
@@ -0,0 +1,241 @@
+"""Tests for paginated and batched bulk Calendar operations (gcalendar/calendar_batch.py)."""
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+import gcalendar.calendar_batch as calendar_batch
+from gcalendar.calendar_batch import (
+    delete_events,
+    insert_events,
+    list_events_sync,
+    move_events,
+    run_batched,
+)
+
+
+def _http_error(status, reason=""):
+    return HttpError(httplib2.Response({"status": status}), reason.encode())
+
+
+class _Request:
+    def __init__(self, method, kwargs, result):
+        self.method = method
+        self.kwargs = kwargs
+        self.result = result
+
+    def execute(self):
+        return self.result
+
+
+class FakeBatch:
+    def __init__(self, service):
+        self.service = service
+        self.items = []
+
+    def add(self, request, request_id, callback):
+        self.items.append((request, request_id, callback))
+
+    def execute(self):
+        self.service.batch_sizes.append(len(self.items))
+        for request, request_id, callback in self.items:
+            response = self.service.respond(request)
+            if isinstance(response, Exception):
+                callback(request_id, None, response)
+            else:
+                callback(request_id, response, None)
+
+
+class FakeCalendar:
+    """Calendar service stub with pluggable per-request responses."""
+
+    def __init__(self, pages=None, responder=None):
+        self.pages = list(pages or [])
+        self.responder = responder or (lambda request: {"id": "new"})
+        self.list_calls = []
+        self.batch_sizes = []
+        self.requests = []
+
+    def events(self):
+        service = self
+
+        class _Events:
+            def list(self, **kw):
+                service.list_calls.append(kw)
+                return _Request("list", kw, service.pages.pop(0))
+
+            def __getattr__(self, method):
+                return lambda **kw: _Request(method, kw, None)
+
+        return _Events()
+
+    def new_batch_http_request(self):
+        return FakeBatch(self)
+
+    def respond(self, request):
+        self.requests.append(request)
+        return self.responder(request)
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setattr(calendar_batch, "BACKOFF_BASE_SECONDS", 0.0)
+
+
+def test_list_follows_page_tokens_until_limit():
+    service = FakeCalendar(
+        pages=[
+            {"items": [{"id": "a"}, {"id": "b"}], "nextPageToken": "p2"},
+            {"items": [{"id": "c"}], "nextPageToken": "p3"},
+        ]
+    )
+
+    events = list_events_sync(service, {"calendarId": "primary"}, limit=3)
+
+    assert [e["id"] for e in events] == ["a", "b", "c"]
+    assert service.list_calls[1]["pageToken"] == "p2"
+    assert service.list_calls[1]["maxResults"] == 1
+
+
+async def test_batches_are_chunked_and_progress_reported():
+    service = FakeCalendar()
+    progress = []
+
+    async def on_progress(done, total):
+        progress.append((done, total))
+
+    outcome = await run_batched(
+        service,
+        [(str(i), lambda: _Request("insert", {}, None)) for i in range(120)],
+        on_progress=on_progress,
+    )
+
+    assert len(outcome.succeeded) == 120
+    assert service.batch_sizes == [50, 50, 20]
+    assert progress == [(50, 120), (100, 120), (120, 120)]
+
+
+async def test_rate_limited_items_are_retried_individually():
+    attempts = {}
+
+    def responder(request):
+        key = request.kwargs["eventId"]
+        attempts[key] = attempts.get(key, 0) + 1
+        if key == "busy" and attempts[key] < 3:
+            return _http_error(403, "userRateLimitExceeded")
+        if key == "bad":
+            return _http_error(400, "invalid")
+        if key == "gone":
+            return _http_error(410, "deleted")
+        return ""
+
+    service = FakeCalendar(responder=responder)
+    outcome = await delete_events(service, ["ok", "busy", "bad", "gone"], "primary")
+
+    assert set(outcome.succeeded) == {"ok", "busy", "gone"}
+    assert set(outcome.failed) == {"bad"}
+    assert attempts == {"ok": 1, "busy": 3, "bad": 1, "gone": 1}
+    assert service.batch_sizes == [4, 1, 1]
+
+
+async def test_insert_retry_after_landed_5xx_does_not_duplicate():
+    created = {}
+
+    def responder(request):
+        if request.method == "get":
+            return created[request.kwargs["eventId"]]
+        event_id = request.kwargs["body"]["id"]
+        if event_id in created:
+            return _http_error(409, "duplicate")
+        created[event_id] = dict(request.kwargs["body"], htmlLink="link")
+        # The first attempt lands server-side but reports a 503
+        return _http_error(503, "backendError")
+
+    service = FakeCalendar(responder=responder)
+    outcome = await insert_events(
+        service, [("0", {"calendarId": "primary", "body": {"summary": "Standup"}})]
+    )
+
+    assert len(created) == 1
+    assert outcome.failed == {}
+    assert outcome.succeeded["0"]["summary"] == "Standup"
+    assert outcome.succeeded["0"]["id"] in created
+    methods = [r.method for r in service.requests]
+    assert methods == ["insert", "insert", "get"]
+
+
+async def test_insert_conflict_on_first_attempt_is_a_failure():
+    service = FakeCalendar(responder=lambda request: _http_error(409, "duplicate"))
+    outcome = await insert_events(
+        service, [("0", {"calendarId": "primary", "body": {"id": "taken"}})]
+    )
+
+    assert set(outcome.failed) == {"0"}
+
+
+async def test_move_uses_native_move_and_falls_back_to_copy_delete():
+    def responder(request):
+        if request.method == "move":
+            if request.kwargs["eventId"] == "foreign":
+                return _http_error(400, "cannotChangeOrganizer")
+            return {"id": request.kwargs["eventId"]}
+        if request.method == "insert":
+            return {"id": "copy-of-" + request.kwargs["body"]["summary"]}
+        return ""
+
+    service = FakeCalendar(responder=responder)
+    events = [
+        {"id": "plain", "summary": "plain"},
+        {"id": "foreign", "summary": "foreign"},
+    ]
+
+    results = await move_events(service, events, "src", "dst")
+
+    assert results["plain"] == {"newId": "plain", "status": "moved", "error": None}
+    assert results["foreign"]["newId"] == "copy-of-foreign"
+    methods = [(r.method, r.kwargs.get("eventId")) for r in service.requests]
+    assert ("delete", "plain") not in methods
+    assert ("delete", "foreign") in methods
+
+
+async def test_recurring_instances_move_with_their_series_master():
+    def responder(request):
+        if request.method == "move":
+            if request.kwargs["eventId"] == "locked":
+                return _http_error(403, "forbiddenForNonOrganizer")
+            return {"id": request.kwargs["eventId"]}
+        return {"id": "new"}
+
+    service = FakeCalendar(responder=responder)
+    events = [
+        {"id": "weekly_20260101", "recurringEventId": "weekly"},
+        {"id": "weekly_20260108", "recurringEventId": "weekly"},
+        {"id": "locked_20260102", "recurringEventId": "locked"},
+    ]
+
+    results = await move_events(service, events, "src", "dst")
+
+    assert results["weekly_20260101"] == {
+        "newId": "weekly_20260101",
+        "status": "moved",
+        "error": None,
+    }
+    assert results["weekly_20260108"]["status"] == "moved"
+    assert results["locked_20260102"]["status"] == "failed"
+    calls = [(r.method, r.kwargs.get("eventId")) for r in service.requests]
+    assert sorted(calls) == [("move", "locked"), ("move", "weekly")]
+
+
+async def test_move_that_exhausts_retries_is_not_copied():
+    def responder(request):
+        if request.method == "move":
+            return _http_error(503, "backendError")
+        return {"id": "new"}
+
+    service = FakeCalendar(responder=responder)
+
+    results = await move_events(service, [{"id": "busy", "summary": "busy"}], "s", "d")
+
+    assert results["busy"]["status"] == "failed"
+    assert "503" in results["busy"]["error"]
+    assert {r.method for r in service.requests} == {"move"}
@@ -0,0 +1,149 @@
+"""Tests for the sync-token backed calendar event store (gcalendar/event_store.py)."""
+
+from datetime import datetime, timedelta, timezone
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from gcalendar.event_store import EventStore
+
+
+def _iso(days_from_now: float) -> str:
+    dt = datetime.now(timezone.utc) + timedelta(days=days_from_now)
+    return dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _event(event_id, start_days, hours=1, **extra):
+    start = datetime.now(timezone.utc) + timedelta(days=start_days)
+    return {
+        "id": event_id,
+        "summary": event_id,
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": (start + timedelta(hours=hours)).isoformat()},
+        **extra,
+    }
+
+
+class _Request:
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self):
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class FakeCalendar:
+    """events().list() stub returning queued responses, recording params."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def events(self):
+        return self
+
+    def list(self, **kwargs):
+        self.calls.append(kwargs)
+        return _Request(self.responses.pop(0))
+
+
+@pytest.fixture
+def store():
+    return EventStore(past_days=30, future_days=60, max_age_seconds=300)
+
+
+async def test_full_sync_then_local_answers(store):
+    service = FakeCalendar(
+        {
+            "items": [_event("b", 3), _event("a", 1), _event("far", 20)],
+            "nextSyncToken": "t1",
+            "timeZone": "UTC",
+        }
+    )
+
+    first = await store.query(service, "u@x.com", "primary", _iso(0), _iso(5))
+    second = await store.query(service, "U@x.com", "u@x.com", _iso(0.5), _iso(2))
+
+    assert [e["id"] for e in first] == ["a", "b"]
+    assert [e["id"] for e in second] == ["a"]
+    assert len(service.calls) == 1
+    assert "timeMin" in service.calls[0] and "syncToken" not in service.calls[0]
+
+
+async def test_invalidation_triggers_incremental_sync(store):
+    service = FakeCalendar(
+        {"items": [_event("a", 1), _event("b", 2)], "nextSyncToken": "t1"},
+        {
+            "items": [{"id": "a", "status": "cancelled"}, _event("c", 3)],
+            "nextSyncToken": "t2",
+        },
+    )
+    await store.query(service, "u@x.com", "primary", _iso(0), _iso(5))
+
+    store.invalidate("u@x.com", "primary")
+    events = await store.query(service, "u@x.com", "primary", _iso(0), _iso(5))
+
+    assert [e["id"] for e in events] == ["b", "c"]
+    assert service.calls[1]["syncToken"] == "t1"
+    assert "timeMin" not in service.calls[1]
+
+
+async def test_gone_token_triggers_full_resync(store):
+    gone = HttpError(httplib2.Response({"status": 410}), b"fullSyncRequired")
+    service = FakeCalendar(
+        {"items": [_event("a", 1)], "nextSyncToken": "t1"},
+        gone,
+        {"items": [_event("z", 1)], "nextSyncToken": "t9"},
+    )
+    await store.query(service, "u@x.com", "primary", _iso(0), _iso(5))
+
+    events = await store.query(
+        service, "u@x.com", "primary", _iso(0), _iso(5), max_age_seconds=0
+    )
+
+    assert [e["id"] for e in events] == ["z"]
+    assert "syncToken" not in service.calls[2]
+
+
+async def test_windows_outside_sync_range_are_not_covered(store):
+    service = FakeCalendar()
+
+    assert await store.query(service, "u@x.com", "primary", _iso(-90), _iso(1)) is None
+    assert await store.query(service, "u@x.com", "primary", _iso(0), None) is None
+    assert service.calls == []
+
+
+async def test_all_day_events_use_calendar_timezone(store):
+    day = (datetime.now(timezone.utc) + timedelta(days=2)).date()
+    service = FakeCalendar(
+        {
+            "items": [
+                {
+                    "id": "allday",
+                    "start": {"date": day.isoformat()},
+                    "end": {"date": (day + timedelta(days=1)).isoformat()},
+                }
+            ],
+            "nextSyncToken": "t1",
+            "timeZone": "America/Los_Angeles",
+        }
+    )
+    # Local midnight in LA is 07:00/08:00 UTC: a window ending 06:00 UTC misses it
+    utc_midnight = datetime.combine(day, datetime.min.time(), timezone.utc)
+    before = (utc_midnight + timedelta(hours=6)).isoformat().replace("+00:00", "Z")
+    after = (utc_midnight + timedelta(hours=12)).isoformat().replace("+00:00", "Z")
+
+    assert await store.query(service, "u@x.com", "primary", _iso(1), before) == []
+    hits = await store.query(service, "u@x.com", "primary", _iso(1), after)
+    assert [e["id"] for e in hits] == ["allday"]
+
+
+async def test_get_only_serves_synced_calendars(store):
+    service = FakeCalendar({"items": [_event("a", 1)], "nextSyncToken": "t1"})
+
+    assert await store.get(service, "u@x.com", "primary", "a") is None
+    await store.query(service, "u@x.com", "primary", _iso(0), _iso(5))
+    assert (await store.get(service, "u@x.com", "primary", "a"))["id"] == "a"
@@ -14,7 +14,6 @@ from gchat.card_delivery import (
     _estimate_payload_bytes,
     _is_feedback_section,
     _is_retryable_status,
-    _post_webhook_with_retry,
     _split_card_payload,
 )
 
@@ -224,36 +223,6 @@ def test_retryable_statuses():
     assert _is_retryable_status(400) is False
 
 
-# ---------------------------------------------------------------------------
-# Retry — _post_webhook_with_retry
-# ---------------------------------------------------------------------------
-
-
-@patch("gchat.card_delivery.requests.post")
-@patch("gchat.card_delivery.time.sleep")
-def test_retry_on_429(mock_sleep, mock_post):
-    fail_resp = MagicMock(status_code=429, text="rate limited")
-    ok_resp = MagicMock(status_code=200, text="ok")
-    mock_post.side_effect = [fail_resp, ok_resp]
-
-    resp = _post_webhook_with_retry("https://example.com", {"test": 1}, max_retries=3)
-    assert resp.status_code == 200
-    assert mock_post.call_count == 2
-    mock_sleep.assert_called_once()
-
-
-@patch("gchat.card_delivery.requests.post")
-@patch("gchat.card_delivery.time.sleep")
-def test_retry_exhausted(mock_sleep, mock_post):
-    fail_resp = MagicMock(status_code=503, text="unavailable")
-    mock_post.return_value = fail_resp
-
-    resp = _post_webhook_with_retry("https://example.com", {"test": 1}, max_retries=3)
-    assert resp.status_code == 503
-    assert mock_post.call_count == 3
-    assert mock_sleep.call_count == 2  # sleeps between attempts, not after last
-
-
 # ---------------------------------------------------------------------------
 # Thread key on all parts
 # ---------------------------------------------------------------------------
@@ -0,0 +1,160 @@
+"""Tests for the incremental per-user store behind chat://digest."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from gchat import digest_store
+from gchat.digest_store import ChatDigestStore
+
+USER = "user@example.com"
+SPACE = "spaces/AAA"
+
+
+def _ts(hours_ago):
+    dt = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _msg(i, hours_ago):
+    return {
+        "name": f"{SPACE}/messages/m{i}",
+        "text": f"message {i}",
+        "createTime": _ts(hours_ago),
+        "sender": {"name": "users/1", "displayName": "Ada"},
+    }
+
+
+class _Request:
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self):
+        return self.response
+
+
+class FakeChat:
+    def __init__(self):
+        self.space = {"name": SPACE, "displayName": "Team", "spaceType": "SPACE"}
+        self.stored = []
+        self.message_filters = []
+
+    def spaces(self):
+        return self
+
+    def messages(self):
+        return _Messages(self)
+
+    def list(self, **params):
+        return _Request({"spaces": [self.space]})
+
+    def get(self, name):
+        return _Request(self.space)
+
+
+class _Messages:
+    def __init__(self, chat):
+        self.chat = chat
+
+    def list(self, **params):
+        self.chat.message_filters.append(params["filter"])
+        since = params["filter"].split('"')[1]
+        newer = [m for m in self.chat.stored if m["createTime"] > since]
+        newer.sort(key=lambda m: m["createTime"], reverse=True)
+        return _Request({"messages": newer})
+
+
+@pytest.fixture(autouse=True)
+def no_member_lookups():
+    with patch.object(digest_store, "get_member_directory") as directory:
+        directory.return_value.get_members_sync.return_value = {}
+        yield
+
+
+def test_refresh_fetches_only_after_watermark():
+    chat = FakeChat()
+    chat.stored = [_msg(0, 5), _msg(1, 2)]
+    store = ChatDigestStore(USER)
+
+    chat.space["lastActiveTime"] = _ts(2)
+    store.refresh_sync(chat)
+    watermark = chat.stored[1]["createTime"]
+    assert store._spaces[SPACE].last_message_create_time == watermark
+
+    chat.stored.append(_msg(2, 1))
+    chat.space["lastActiveTime"] = _ts(1)
+    store.refresh_sync(chat)
+
+    assert chat.message_filters[-1] == f'createTime > "{watermark}"'
+    assert store.stats["new_messages"] == 3
+    [space] = store.build(hours_back=24, limit=10)
+    assert [m.text for m in space.messages] == ["message 2", "message 1", "message 0"]
+    assert space.messages[0].sender_name == "Ada"
+
+
+def test_inactive_space_is_not_queried():
+    chat = FakeChat()
+    chat.stored = [_msg(0, 1)]
+    chat.space["lastActiveTime"] = _ts(1)
+    store = ChatDigestStore(USER)
+
+    store.refresh_sync(chat)
+    store.refresh_sync(chat)
+
+    assert len(chat.message_filters) == 1
+    assert store.stats["skipped_spaces"] == 1
+    assert store.spaces_checked == 1
+
+
+def test_store_round_trips_and_build_respects_window(tmp_path):
+    chat = FakeChat()
+    chat.stored = [_msg(0, 30), _msg(1, 3), _msg(2, 2)]
+    chat.space["lastActiveTime"] = _ts(2)
+    path = tmp_path / "digest.enc"
+    fernet = Fernet(Fernet.generate_key())
+    ChatDigestStore(USER, path, fernet).refresh_sync(chat)
+
+    assert b"message" not in path.read_bytes()
+    reloaded = ChatDigestStore(USER, path, fernet)
+    assert reloaded._spaces[SPACE].last_active_time == chat.space["lastActiveTime"]
+
+    [space] = reloaded.build(hours_back=24, limit=10)
+    assert space.display_name == "Team"
+    assert [m.text for m in space.messages] == ["message 2", "message 1"]
+    assert reloaded.build(hours_back=48, limit=1)[0].message_count == 1
+    assert reloaded.build(hours_back=1, limit=10) == []
+
+
+def test_store_without_key_stays_in_memory(tmp_path):
+    chat = FakeChat()
+    chat.stored = [_msg(0, 1)]
+    path = tmp_path / "digest.enc"
+    ChatDigestStore(USER, path).refresh_sync(chat)
+
+    assert not path.exists()
+
+
+def test_evicted_store_stops_background_refresh(tmp_path):
+    from config.settings import override_settings
+
+    async def scenario():
+        with override_settings(chat_digest_store_dir=str(tmp_path)):
+            store = digest_store.get_digest_store(USER)
+
+            async def factory():
+                return None
+
+            store.ensure_background_refresh(factory, interval_seconds=60)
+            task = store._background
+            assert digest_store._evict_stores(1.0) >= 1
+            await asyncio.sleep(0)
+            return task
+
+    try:
+        task = asyncio.run(scenario())
+    finally:
+        digest_store._stores.clear()
+    assert task.cancelled()
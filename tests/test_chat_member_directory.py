@@ -0,0 +1,129 @@
+"""Tests for the per-space Chat member directory cache (gchat/member_directory.py)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from gchat.member_directory import (
+    MemberDirectory,
+    fetch_space_members_sync,
+    resolve_sender,
+)
+
+
+def _membership(uid, name=None, space="spaces/S"):
+    return {
+        "name": f"{space}/members/{uid}",
+        "role": "ROLE_MEMBER",
+        "member": {"name": f"users/{uid}", "displayName": name or uid, "type": "HUMAN"},
+    }
+
+
+def _chat_service(pages):
+    """Chat service mock whose members().list() returns successive pages."""
+    service = MagicMock()
+    responses = iter(pages)
+    service.spaces().members().list.side_effect = lambda **kw: MagicMock(
+        execute=MagicMock(return_value=next(responses))
+    )
+    service.spaces().members().list.reset_mock()
+    return service
+
+
+class TestFetch:
+    def test_paginates_members_list(self):
+        service = _chat_service(
+            [
+                {"memberships": [_membership("1", "Ann")], "nextPageToken": "p2"},
+                {"memberships": [_membership("2", "Bob")]},
+            ]
+        )
+
+        members = fetch_space_members_sync(service, "spaces/S")
+
+        assert members["users/1"]["displayName"] == "Ann"
+        assert members["users/2"]["membership"] == "spaces/S/members/2"
+        calls = service.spaces().members().list.call_args_list
+        assert len(calls) == 2
+        assert calls[1].kwargs["pageToken"] == "p2"
+
+
+class TestDirectory:
+    async def test_cached_within_ttl(self):
+        directory = MemberDirectory(ttl_seconds=60)
+        service = _chat_service([{"memberships": [_membership("1")]}])
+
+        await directory.get_members(service, "u@x.com", "spaces/S")
+        await directory.get_members(service, "U@x.com", "spaces/S")
+
+        assert service.spaces().members().list.call_count == 1
+
+    async def test_stale_entry_served_and_refreshed_in_background(self):
+        directory = MemberDirectory(ttl_seconds=0)
+        first = _chat_service([{"memberships": [_membership("1", "Old")]}])
+        fresh = _chat_service([{"memberships": [_membership("1", "New")]}])
+        await directory.get_members(first, "u@x.com", "spaces/S")
+
+        members = await directory.get_members(
+            first,
+            "u@x.com",
+            "spaces/S",
+            service_factory=AsyncMock(return_value=fresh),
+        )
+        assert members["users/1"]["displayName"] == "Old"
+
+        await asyncio.gather(*directory._refresh_tasks)
+        # Read the entry directly: ttl=0 would make any read refetch
+        entry = directory._lookup(directory._key("u@x.com", "spaces/S"))
+        assert entry.members["users/1"]["displayName"] == "New"
+
+    async def test_stale_entry_without_factory_refetches(self):
+        directory = MemberDirectory(ttl_seconds=0)
+        service = _chat_service(
+            [{"memberships": [_membership("1")]}, {"memberships": []}]
+        )
+        await directory.get_members(service, "u@x.com", "spaces/S")
+
+        members = await directory.get_members(service, "u@x.com", "spaces/S")
+
+        assert members == {}
+        assert service.spaces().members().list.call_count == 2
+
+    async def test_membership_writes_update_cache(self):
+        directory = MemberDirectory(ttl_seconds=60)
+        service = _chat_service([{"memberships": [_membership("1")]}])
+        await directory.get_members(service, "u@x.com", "spaces/S")
+
+        directory.record_membership("u@x.com", "spaces/S", _membership("2", "Bob"))
+        directory.remove_membership("u@x.com", "spaces/S/members/1")
+
+        members = await directory.get_members(service, "u@x.com", "spaces/S")
+        assert set(members) == {"users/2"}
+
+    def test_users_are_isolated(self):
+        directory = MemberDirectory(ttl_seconds=60)
+        directory.get_members_sync(
+            _chat_service([{"memberships": [_membership("1")]}]), "a@x.com", "spaces/S"
+        )
+        other = _chat_service([{"memberships": []}])
+
+        assert directory.get_members_sync(other, "b@x.com", "spaces/S") == {}
+        assert other.spaces().members().list.call_count == 1
+
+
+class TestResolveSender:
+    def test_prefers_directory(self):
+        members = {"users/1": {"displayName": "Ann", "email": "ann@x.com"}}
+        assert resolve_sender({"name": "users/1"}, members) == ("Ann", "ann@x.com")
+
+    @pytest.mark.parametrize(
+        "sender,expected",
+        [
+            ({"name": "users/9", "displayName": "Bot"}, ("Bot", None)),
+            ({"name": "users/9"}, ("users/9", None)),
+            ({}, ("Unknown Sender", None)),
+        ],
+    )
+    def test_falls_back_to_message_sender(self, sender, expected):
+        assert resolve_sender(sender, {}) == expected
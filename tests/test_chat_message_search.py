@@ -0,0 +1,239 @@
+"""Tests for cross-space Chat message search (gchat/message_search.py)."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from config.settings import override_settings
+from gchat.message_search import ChatMessageIndex, fan_out, search_all_spaces
+
+
+def _ts(minutes_ago: int) -> str:
+    dt = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _msg(space, n, text, minutes_ago):
+    return {
+        "name": f"{space}/messages/{n}",
+        "text": text,
+        "createTime": _ts(minutes_ago),
+        "sender": {"name": "users/1", "displayName": "Ann"},
+    }
+
+
+class FakeChat:
+    """Chat service stub: spaces().list(), messages().list(), members().list()."""
+
+    def __init__(self, spaces, messages_by_space, members_by_space=None):
+        self.spaces_list = spaces
+        self.messages_by_space = messages_by_space
+        self.members_by_space = members_by_space or {}
+        self.message_calls = []
+        self.member_calls = []
+
+    def spaces(self):
+        svc = MagicMock()
+        svc.list.side_effect = lambda **kw: MagicMock(
+            execute=lambda: {"spaces": self.spaces_list}
+        )
+
+        def _messages_list(**kw):
+            self.message_calls.append(kw)
+            since = kw["filter"].split('"')[1]
+            msgs = [
+                m
+                for m in self.messages_by_space.get(kw["parent"], [])
+                if m["createTime"] > since
+            ]
+            return MagicMock(execute=lambda: {"messages": msgs})
+
+        def _members_list(**kw):
+            self.member_calls.append(kw["parent"])
+            memberships = self.members_by_space.get(kw["parent"], [])
+            return MagicMock(execute=lambda: {"memberships": memberships})
+
+        svc.messages().list.side_effect = _messages_list
+        svc.members().list.side_effect = _members_list
+        return svc
+
+
+class TestFanOut:
+    async def test_bounded_concurrency_and_service_reuse(self):
+        factory = AsyncMock(side_effect=lambda: object())
+        running, peak = 0, 0
+
+        def worker(service, space_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            time.sleep(0.02)
+            running -= 1
+            return space_id
+
+        outcome = await fan_out(
+            [f"spaces/{i}" for i in range(12)], worker, factory, 3, 5.0
+        )
+
+        assert len(outcome.results) == 12
+        assert peak <= 3
+        assert factory.await_count <= 3
+
+    async def test_deadline_and_failures_reported(self):
+        def worker(service, space_id):
+            if space_id == "spaces/bad":
+                raise RuntimeError("403")
+            if space_id == "spaces/slow":
+                time.sleep(0.5)
+            return []
+
+        outcome = await fan_out(
+            ["spaces/ok", "spaces/bad", "spaces/slow"],
+            worker,
+            AsyncMock(side_effect=lambda: object()),
+            3,
+            0.1,
+        )
+
+        assert list(outcome.results) == ["spaces/ok"]
+        assert outcome.failed == ["spaces/bad"]
+        assert outcome.timed_out == ["spaces/slow"]
+
+    async def test_failed_spaces_return_their_service(self):
+        factory = AsyncMock(side_effect=[None, object(), object(), object()])
+
+        def worker(service, space_id):
+            if space_id.startswith("spaces/bad"):
+                raise RuntimeError("403")
+            return space_id
+
+        spaces = ["spaces/bad1", "spaces/bad2"] + [f"spaces/{i}" for i in range(5)]
+        outcome = await fan_out(spaces, worker, factory, 2, 2.0)
+
+        assert sorted(outcome.failed) == ["spaces/bad1", "spaces/bad2"]
+        assert len(outcome.results) == 5
+        assert outcome.timed_out == []
+
+
+class TestMessageIndex:
+    def test_incremental_refresh_uses_watermark(self):
+        chat = FakeChat([], {"spaces/A": [_msg("spaces/A", 1, "Deploy done", 30)]})
+        index = ChatMessageIndex(lookback_days=7, max_per_space=100)
+
+        assert index.refresh_space_sync(chat, "spaces/A") == 1
+        chat.messages_by_space["spaces/A"].append(
+            _msg("spaces/A", 2, "deploy failed", 5)
+        )
+        assert index.refresh_space_sync(chat, "spaces/A") == 1
+
+        watermark = chat.messages_by_space["spaces/A"][0]["createTime"]
+        assert watermark in chat.message_calls[1]["filter"]
+        hits = index.search("DEPLOY", ["spaces/A"], per_space_limit=10)
+        assert [h["text"] for h in hits] == ["deploy failed", "Deploy done"]
+
+    def test_all_terms_must_match(self):
+        chat = FakeChat(
+            [],
+            {
+                "spaces/A": [
+                    _msg("spaces/A", 1, "budget review friday", 10),
+                    _msg("spaces/A", 2, "budget", 5),
+                ]
+            },
+        )
+        index = ChatMessageIndex(lookback_days=7, max_per_space=100)
+        index.refresh_space_sync(chat, "spaces/A")
+
+        hits = index.search("budget friday", ["spaces/A"], per_space_limit=10)
+        assert [h["name"] for h in hits] == ["spaces/A/messages/1"]
+
+
+class TestSearchAllSpaces:
+    @pytest.mark.parametrize("mode", ["live", "index"])
+    async def test_searches_every_space_with_coverage(self, mode):
+        spaces = [{"name": f"spaces/{i}", "displayName": f"S{i}"} for i in range(15)]
+        chat = FakeChat(
+            spaces,
+            {
+                "spaces/12": [_msg("spaces/12", 1, "quarterly report", 10)],
+                "spaces/3": [_msg("spaces/3", 1, "report draft", 20)],
+            },
+        )
+
+        with override_settings(chat_search_concurrency=4):
+            hits, coverage = await search_all_spaces(
+                chat,
+                AsyncMock(return_value=chat),
+                f"{mode}@x.com",
+                "report",
+                per_space_limit=5,
+                mode=mode,
+            )
+
+        assert [h["_spaceId"] for h in hits] == ["spaces/12", "spaces/3"]
+        assert hits[0]["_spaceName"] == "S12"
+        assert coverage["spacesTotal"] == 15
+        assert coverage["spacesSearched"] == 15
+        assert coverage["complete"] is True
+        assert coverage["mode"] == mode
+
+    async def test_senders_resolve_from_member_directory(self):
+        spaces = [{"name": f"spaces/{i}", "displayName": f"S{i}"} for i in range(4)]
+        chat = FakeChat(
+            spaces,
+            {
+                "spaces/1": [_msg("spaces/1", 1, "report", 10)],
+                "spaces/2": [_msg("spaces/2", 1, "report", 20)],
+            },
+            {"spaces/1": [{"member": {"name": "users/1", "displayName": "Ann Lee"}}]},
+        )
+
+        hits, _ = await search_all_spaces(
+            chat, AsyncMock(return_value=chat), "members@x.com", "report", 5
+        )
+
+        assert [h["_senderName"] for h in hits] == ["Ann Lee", "Ann"]
+        # Only the spaces with hits are looked up
+        assert sorted(chat.member_calls) == ["spaces/1", "spaces/2"]
+
+    async def test_index_skips_spaces_without_new_activity(self):
+        spaces = [
+            {"name": f"spaces/{i}", "displayName": f"S{i}", "lastActiveTime": _ts(60)}
+            for i in range(3)
+        ]
+        chat = FakeChat(spaces, {"spaces/1": [_msg("spaces/1", 1, "report", 90)]})
+
+        async def _search():
+            return await search_all_spaces(
+                chat,
+                AsyncMock(return_value=chat),
+                "skip@x.com",
+                "report",
+                per_space_limit=5,
+                mode="index",
+            )
+
+        await _search()
+        assert len(chat.message_calls) == 3
+
+        spaces[2]["lastActiveTime"] = _ts(1)
+        hits, coverage = await _search()
+
+        assert [c["parent"] for c in chat.message_calls[3:]] == ["spaces/2"]
+        assert [h["_spaceId"] for h in hits] == ["spaces/1"]
+        assert coverage["spacesUnchanged"] == 2
+        assert coverage["spacesSearched"] == 3
+        assert coverage["complete"] is True
+
+    def test_message_index_is_registered_with_cache_budget(self):
+        from config.cache_registry import get_cache_registry
+        from gchat.message_search import _indexes, get_message_index
+
+        get_message_index("budget@x.com")
+        handle = get_cache_registry().get("chat_message_index")
+
+        assert handle is not None
+        assert handle.evict_fn(1.0) >= 1
+        assert "budget@x.com" not in _indexes
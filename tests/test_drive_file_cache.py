@@ -0,0 +1,136 @@
+"""Tests for the shared Drive file metadata cache (drive/file_cache.py)."""
+
+import pytest
+
+from drive.file_cache import DriveFileCache
+
+
+class _Request:
+    def __init__(self, fn):
+        self.fn = fn
+
+    def execute(self):
+        return self.fn()
+
+
+class _Batch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.service.batches.append([rid for rid, _ in self.requests])
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
+class FakeDrive:
+    """files().get / batch / changes() stub over an in-memory file table."""
+
+    def __init__(self, files):
+        self.files_by_id = files
+        self.gets = []
+        self.batches = []
+        self.change_pages = []
+
+    def files(self):
+        return self
+
+    def get(self, fileId, fields, supportsAllDrives=True):
+        def run():
+            self.gets.append((fileId, fields))
+            if fileId not in self.files_by_id:
+                raise LookupError(fileId)
+            return dict(self.files_by_id[fileId])
+
+        return _Request(run)
+
+    def new_batch_http_request(self, callback):
+        return _Batch(self, callback)
+
+    def changes(self):
+        return self
+
+    def getStartPageToken(self, **kwargs):
+        return _Request(lambda: {"startPageToken": "p1"})
+
+    def list(self, **kwargs):
+        return _Request(lambda: self.change_pages.pop(0))
+
+
+def _file(file_id, version="1", **extra):
+    return {
+        "id": file_id,
+        "name": file_id,
+        "mimeType": "text/plain",
+        "version": version,
+        **extra,
+    }
+
+
+@pytest.fixture
+def cache():
+    return DriveFileCache(ttl_seconds=300)
+
+
+async def test_misses_are_batched_and_then_served_locally(cache):
+    drive = FakeDrive({"a": _file("a"), "b": _file("b")})
+
+    found, errors = await cache.fetch_many(drive, "u@x.com", ["a", "b", "missing"])
+    again, _ = await cache.fetch_many(drive, "U@x.com", ["a", "b"], fields="name")
+
+    assert set(found) == {"a", "b"} and set(errors) == {"missing"}
+    assert drive.batches == [["a", "b", "missing"]]
+    assert set(again) == {"a", "b"}
+    assert len(drive.gets) == 3  # nothing refetched
+
+
+async def test_listing_primes_and_field_gaps_refetch(cache):
+    drive = FakeDrive({"a": _file("a", owners=["me"])})
+    cache.prime("u@x.com", [{"id": "a", "name": "a", "mimeType": "text/plain"}])
+
+    name_only, _ = await cache.fetch_many(drive, "u@x.com", ["a"], fields="name")
+    with_owners, _ = await cache.fetch_many(drive, "u@x.com", ["a"], fields="owners")
+
+    assert name_only["a"]["name"] == "a"
+    assert with_owners["a"]["owners"] == ["me"]
+    assert [g[0] for g in drive.gets] == ["a"]
+
+
+async def test_new_revision_replaces_record(cache):
+    cache.store("u@x.com", _file("a", version="1", description="old"))
+    cache.prime("u@x.com", [_file("a", version="2")])
+
+    record = cache.lookup("u@x.com", "a")
+
+    assert record["version"] == "2"
+    assert "description" not in record
+
+
+async def test_invalidation_and_change_polling(cache):
+    drive = FakeDrive({"a": _file("a"), "b": _file("b")})
+    cache.changes_poll_seconds = 0.001
+    await cache.fetch_many(drive, "u@x.com", ["a", "b"])  # first poll seeds token
+
+    cache.invalidate("u@x.com", "a")
+    assert cache.lookup("u@x.com", "a") is None
+
+    drive.change_pages.append(
+        {
+            "changes": [
+                {"fileId": "b", "file": _file("b", version="5", name="renamed")},
+                {"fileId": "zzz", "removed": True},
+            ],
+            "newStartPageToken": "p2",
+        }
+    )
+    cache._change_tokens["u@x.com"] = ("p1", 0.0)
+    assert await cache.maybe_poll_changes(drive, "u@x.com") == 2
+    assert cache.lookup("u@x.com", "b")["name"] == "renamed"
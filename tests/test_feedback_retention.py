@@ -0,0 +1,113 @@
+"""Tests for instance_pattern retention (gchat/feedback_retention.py)."""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from qdrant_client import QdrantClient, models
+
+from gchat.feedback_retention import InstancePatternRetention
+
+COLLECTION = "retention_test"
+
+
+@pytest.fixture
+def client():
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        COLLECTION,
+        vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE),
+    )
+    return client
+
+
+def _store(client, name, age_minutes, positive=False, legacy=False):
+    ts = datetime.now() - timedelta(minutes=age_minutes)
+    payload = {
+        "type": "instance_pattern",
+        "name": name,
+        "timestamp": ts.isoformat(),
+        "content_feedback": "positive" if positive else None,
+        "form_feedback": None,
+    }
+    if not legacy:
+        payload["created_at"] = ts.timestamp()
+    client.upsert(
+        COLLECTION,
+        points=[
+            models.PointStruct(id=str(uuid.uuid4()), vector=[1.0, 0.0], payload=payload)
+        ],
+    )
+
+
+def _names(client):
+    points, _ = client.scroll(COLLECTION, limit=100, with_payload=["name"])
+    return sorted(p.payload["name"] for p in points)
+
+
+def test_deletes_oldest_expendable_first(client):
+    _store(client, "old_positive", 100, positive=True)
+    _store(client, "old", 90)
+    _store(client, "mid", 50)
+    _store(client, "new", 10)
+    _store(client, "newest", 1)
+    retention = InstancePatternRetention(lambda: client, COLLECTION, max_patterns=3)
+
+    assert retention.run() == 2
+
+    assert _names(client) == ["new", "newest", "old_positive"]
+
+
+def test_positive_patterns_go_once_expendable_are_exhausted(client):
+    for i in range(4):
+        _store(client, f"pos{i}", 100 - i, positive=True)
+    _store(client, "plain", 50)
+    retention = InstancePatternRetention(lambda: client, COLLECTION, max_patterns=2)
+
+    retention.run()
+
+    assert _names(client) == ["pos2", "pos3"]
+
+
+def test_legacy_points_are_backfilled_and_ordered(client):
+    _store(client, "legacy_old", 100, legacy=True)
+    _store(client, "fresh", 1)
+    retention = InstancePatternRetention(lambda: client, COLLECTION, max_patterns=1)
+
+    retention.run()
+
+    assert _names(client) == ["fresh"]
+
+
+def test_scheduling_uses_interval_and_high_water(client):
+    for i in range(10):
+        _store(client, f"p{i}", 10 - i)
+    retention = InstancePatternRetention(
+        lambda: client,
+        COLLECTION,
+        max_patterns=10,
+        high_water_ratio=1.2,
+        interval_seconds=3600,
+    )
+
+    assert retention.maybe_run(background=False)  # first pass seeds the count
+    for i in range(2):
+        retention.record_store()
+        assert not retention.maybe_run(background=False)
+    retention.record_store()  # estimate 13 > high water 12
+    assert retention.is_due()
+
+
+def test_tied_legacy_points_delete_only_the_excess(client):
+    for i in range(5):
+        _store(client, f"undated{i}", 0, legacy=True)
+    client.set_payload(
+        COLLECTION, payload={"timestamp": "not a date"}, points=models.Filter()
+    )
+    _store(client, "fresh", 1)
+    retention = InstancePatternRetention(lambda: client, COLLECTION, max_patterns=3)
+
+    assert retention.run() == 3
+
+    assert len(_names(client)) == 3
+    assert "fresh" in _names(client)
@@ -0,0 +1,135 @@
+"""Tests for the Forms schema cache and streaming response export."""
+
+import json
+
+import pytest
+
+from forms.form_schema_cache import FormSchemaCache
+from forms.response_export import export_responses
+from gmail.attachment_server import cleanup_attachment, get_attachment_path
+
+
+class _Request:
+    def __init__(self, fn):
+        self.fn = fn
+
+    def execute(self):
+        return self.fn()
+
+
+class FakeForms:
+    """forms().get / forms().responses().list stub over in-memory data."""
+
+    def __init__(self, form, responses, page_size=2):
+        self.form = form
+        self.all_responses = responses
+        self.page_size = page_size
+        self.gets = []
+        self.lists = []
+
+    def forms(self):
+        return self
+
+    def responses(self):
+        return self
+
+    def get(self, formId, fields=None):
+        def run():
+            self.gets.append(fields)
+            if fields == "revisionId":
+                return {"revisionId": self.form["revisionId"]}
+            return dict(self.form)
+
+        return _Request(run)
+
+    def list(self, formId, pageSize, pageToken=None):
+        def run():
+            self.lists.append(pageToken)
+            start = int(pageToken or 0)
+            end = start + self.page_size
+            page = {"responses": self.all_responses[start:end]}
+            if end < len(self.all_responses):
+                page["nextPageToken"] = str(end)
+            return page
+
+        return _Request(run)
+
+
+def _form(revision="r1"):
+    return {
+        "revisionId": revision,
+        "info": {"title": "Survey"},
+        "items": [
+            {"itemId": "q1", "title": "Name", "questionItem": {}},
+            {"itemId": "x", "title": "Section", "pageBreakItem": {}},
+        ],
+    }
+
+
+def _responses(n):
+    return [
+        {
+            "responseId": f"r{i}",
+            "lastSubmittedTime": "2024-01-01T00:00:00Z",
+            "answers": {"q1": {"textAnswers": {"answers": [{"value": f"v{i}"}]}}},
+        }
+        for i in range(n)
+    ]
+
+
+async def test_schema_cache_revalidates_by_revision():
+    service = FakeForms(_form(), [])
+    cache = FormSchemaCache(ttl_seconds=300)
+
+    first = await cache.get(service, "u@x.com", "f1")
+    second = await cache.get(service, "U@x.com", "f1")
+    assert first is second
+    assert list(first.question_map) == ["q1"]
+    assert service.gets == [None]
+
+    cache.ttl_seconds = 0
+    await cache.get(service, "u@x.com", "f1")
+    assert service.gets == [None, "revisionId"]
+
+    service.form = _form(revision="r2")
+    refreshed = await cache.get(service, "u@x.com", "f1")
+    assert refreshed.revision_id == "r2"
+    assert service.gets == [None, "revisionId", "revisionId", None]
+
+
+async def test_export_walks_all_pages_inline():
+    service = FakeForms(_form(), _responses(5))
+    schema = await FormSchemaCache().get(service, "u@x.com", "f1")
+    progress = []
+
+    async def on_page(pages, count):
+        progress.append((pages, count))
+
+    result = await export_responses(
+        service, "f1", schema, inline_max=100, on_page=on_page
+    )
+
+    assert result.count == 5 and result.pages == 3 and result.file_id is None
+    assert service.lists == [None, "2", "4"]
+    assert progress == [(1, 2), (2, 4), (3, 5)]
+    assert result.responses[4]["answers"][0] == {
+        "questionId": "q1",
+        "questionTitle": "Name",
+        "answer": "v4",
+    }
+
+
+@pytest.mark.parametrize("stage_to_file", [None, True])
+async def test_large_export_is_staged_to_jsonl(stage_to_file):
+    service = FakeForms(_form(), _responses(5))
+    schema = await FormSchemaCache().get(service, "u@x.com", "f1")
+
+    result = await export_responses(
+        service, "f1", schema, inline_max=3, stage_to_file=stage_to_file
+    )
+
+    with open(get_attachment_path(result.file_id), encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert result.responses == [] and result.count == 5
+    assert [row["responseId"] for row in rows] == [f"r{i}" for i in range(5)]
+    cleanup_attachment(result.file_id)
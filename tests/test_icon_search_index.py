@@ -0,0 +1,112 @@
+"""Tests for the persisted icon embedding index in gchat/icon_search.py."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+import gchat.icon_search as icon_search
+from config.settings import override_settings
+
+ICONS = {"trending_up", "schedule", "folder", "check_circle"}
+
+
+class _FakeEmbedder:
+    """Deterministic 8D embeddings; counts embedded texts."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        for text in texts:
+            rng = np.random.default_rng(abs(hash(text)) % (2**32))
+            yield rng.standard_normal(8).astype(np.float32)
+
+
+@pytest.fixture
+def fake_env(tmp_path, monkeypatch):
+    embedder = _FakeEmbedder()
+    service = MagicMock()
+    service.get_model_sync.return_value = embedder
+    service.get_model_name.return_value = "BAAI/bge-small-en-v1.5"
+
+    monkeypatch.setattr(icon_search, "_icon_embeddings", None)
+    monkeypatch.setattr(icon_search, "_icon_names", None)
+    monkeypatch.setattr(icon_search, "_embedder", None)
+    monkeypatch.setattr(icon_search, "_query_cache", icon_search.OrderedDict())
+
+    with (
+        override_settings(icon_index_dir=str(tmp_path)),
+        patch("config.embedding_service.get_embedding_service", return_value=service),
+        patch("gchat.material_icons.MATERIAL_ICONS", ICONS),
+    ):
+        yield embedder, tmp_path
+
+
+def _reset_index(monkeypatch):
+    monkeypatch.setattr(icon_search, "_icon_embeddings", None)
+    monkeypatch.setattr(icon_search, "_icon_names", None)
+
+
+class TestPersistedIndex:
+    def test_build_writes_artifact(self, fake_env):
+        embedder, tmp_path = fake_env
+
+        icon_search._ensure_index()
+
+        artifacts = list(tmp_path.glob("icons_BAAI_bge-small-en-v1.5_*.npy"))
+        assert len(artifacts) == 1
+        assert icon_search._icon_embeddings.shape == (len(ICONS), 8)
+        assert len(embedder.calls) == 1
+
+    def test_second_load_memory_maps_without_embedding(self, fake_env, monkeypatch):
+        embedder, _ = fake_env
+        icon_search._ensure_index()
+        built = np.array(icon_search._icon_embeddings)
+        _reset_index(monkeypatch)
+
+        icon_search._ensure_index()
+
+        assert isinstance(icon_search._icon_embeddings, np.memmap)
+        np.testing.assert_allclose(icon_search._icon_embeddings, built)
+        assert len(embedder.calls) == 1
+
+    def test_icon_list_change_misses_artifact(self, fake_env, monkeypatch):
+        embedder, tmp_path = fake_env
+        icon_search._ensure_index()
+        _reset_index(monkeypatch)
+
+        with patch("gchat.material_icons.MATERIAL_ICONS", ICONS | {"home"}):
+            icon_search._ensure_index()
+
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+        assert len(embedder.calls) == 2
+
+
+class TestQuerySearch:
+    def test_query_embeddings_are_cached(self, fake_env):
+        embedder, _ = fake_env
+        icon_search._ensure_index()
+
+        icon_search.semantic_icon_search("TREND_UP", min_score=-1.0)
+        icon_search.semantic_icon_search("trend up", min_score=-1.0)
+
+        # One batch for the icons, one for the (normalized) query
+        assert len(embedder.calls) == 2
+
+    def test_exact_name_ranks_first(self, fake_env):
+        icon_search._ensure_index()
+
+        results = icon_search.semantic_icon_search_top_k("folder", top_k=3)
+
+        assert results[0][0] == "folder"
+        assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+        scores = [s for _, s in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_top_k_matches_full_sort(self):
+        scores = np.random.default_rng(0).standard_normal(50)
+        expected = np.argsort(scores)[::-1][:7]
+        np.testing.assert_array_equal(icon_search._top_k(scores, 7), expected)
+        assert len(icon_search._top_k(scores, 500)) == 50
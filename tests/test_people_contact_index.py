@@ -0,0 +1,181 @@
+"""
+Tests for the per-user People contact index and batched label management.
+
+These tests use an in-memory People API stub, so they run in every
+environment.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from people.contact_index import ContactIndex
+from people.people_tools import manage_people_contact_labels
+
+
+def _person(rn, *emails, deleted=False):
+    person = {"resourceName": rn, "emailAddresses": [{"value": e} for e in emails]}
+    if deleted:
+        person["metadata"] = {"deleted": True}
+    return person
+
+
+class _Request:
+    def __init__(self, fn):
+        self.fn = fn
+
+    def execute(self):
+        return self.fn()
+
+
+class FakePeople:
+    """connections.list / batchCreateContacts / contactGroups stub."""
+
+    def __init__(self, contacts, page_size=2):
+        self.contacts = contacts
+        self.page_size = page_size
+        self.pending_changes = []
+        self.expired = False
+        self.calls = []
+        self.modified = []
+        self._next_rn = 100
+
+    def people(self):
+        return self
+
+    def connections(self):
+        return self
+
+    def contactGroups(self):
+        return self
+
+    def members(self):
+        return self
+
+    def list(self, resourceName=None, pageToken=None, syncToken=None, **kwargs):
+        def run():
+            if resourceName is None:  # contactGroups().list
+                return {
+                    "contactGroups": [
+                        {"name": "Team", "resourceName": "contactGroups/team"}
+                    ]
+                }
+            self.calls.append(("list", syncToken, pageToken))
+            if syncToken:
+                if self.expired:
+                    raise HttpError(resp=MagicMock(status=410), content=b"expired")
+                changes, self.pending_changes = self.pending_changes, []
+                return {"connections": changes, "nextSyncToken": "s2"}
+            start = int(pageToken or 0)
+            end = start + self.page_size
+            page = {"connections": self.contacts[start:end]}
+            if end < len(self.contacts):
+                page["nextPageToken"] = str(end)
+            else:
+                page["nextSyncToken"] = "s1"
+            return page
+
+        return _Request(run)
+
+    def batchCreateContacts(self, body):
+        def run():
+            self.calls.append(("batchCreate", len(body["contacts"])))
+            created = []
+            for contact in body["contacts"]:
+                self._next_rn += 1
+                person = dict(contact["contactPerson"])
+                person["resourceName"] = f"people/c{self._next_rn}"
+                created.append({"person": person})
+            return {"createdPeople": created}
+
+        return _Request(run)
+
+    def modify(self, resourceName, body):
+        return _Request(lambda: self.modified.append((resourceName, body)))
+
+
+async def test_full_build_then_incremental_sync():
+    service = FakePeople(
+        [
+            _person("people/a", "A@x.com"),
+            _person("people/b", "b@x.com", "shared@x.com"),
+            _person("people/c", "shared@x.com"),
+        ]
+    )
+    index = ContactIndex()
+
+    found = await index.resolve(service, ["a@x.com", "shared@x.com", "z@x.com"])
+    assert found == {
+        "a@x.com": ["people/a"],
+        "shared@x.com": ["people/b", "people/c"],
+        "z@x.com": [],
+    }
+    assert [c[2] for c in service.calls] == [None, "2"]
+
+    service.pending_changes = [
+        _person("people/c", deleted=True),
+        _person("people/a", "renamed@x.com"),
+    ]
+    found = await index.resolve(service, ["a@x.com", "renamed@x.com", "shared@x.com"])
+    assert service.calls[-1] == ("list", "s1", None)
+    assert found == {
+        "a@x.com": [],
+        "renamed@x.com": ["people/a"],
+        "shared@x.com": ["people/b"],
+    }
+
+
+async def test_expired_sync_token_rebuilds():
+    service = FakePeople([_person("people/a", "a@x.com")])
+    index = ContactIndex()
+    await index.sync(service)
+
+    service.expired = True
+    service.contacts = [_person("people/b", "b@x.com")]
+    found = await index.resolve(service, ["a@x.com", "b@x.com"])
+
+    assert found == {"a@x.com": [], "b@x.com": ["people/b"]}
+
+
+@pytest.fixture
+def people_service():
+    service = FakePeople([_person("people/a", "a@x.com")])
+    with (
+        patch("people.people_tools._get_people_service", return_value=service),
+        patch("people.people_tools.get_contact_index", return_value=ContactIndex()),
+    ):
+        yield service
+
+
+async def test_label_add_batches_creation_and_membership(people_service):
+    emails = ["a@x.com"] + [f"new{i}@x.com" for i in range(250)]
+
+    result = await manage_people_contact_labels(
+        "label_add", email=emails, label="Team", user_google_email="u@x.com"
+    )
+
+    assert result.success is True
+    assert result.contacts_existing == 1
+    assert result.contacts_created == 250
+    assert result.contacts_modified == 251
+    assert [c for c in people_service.calls if c[0] == "batchCreate"] == [
+        ("batchCreate", 200),
+        ("batchCreate", 50),
+    ]
+    assert len(people_service.modified) == 2  # 200 + 51 resource names
+
+
+async def test_label_remove_reports_unknown_emails(people_service):
+    result = await manage_people_contact_labels(
+        "label_remove",
+        email="a@x.com, nobody@x.com",
+        label="Team",
+        user_google_email="u@x.com",
+    )
+
+    assert result.contacts_modified == 1
+    assert result.contacts_not_found == 1
+    assert people_service.modified == [
+        ("contactGroups/team", {"resourceNamesToRemove": ["people/a"]})
+    ]
@@ -0,0 +1,131 @@
+"""Tests for the shared per-user recent items snapshot behind recent://."""
+
+import asyncio
+import re
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+from drive.recent_items import SERVICE_MIME_TYPES, RecentItemsCache
+from resources import service_recent_resources as recent
+
+USER = "user@example.com"
+
+
+def _file(i, kind, days_ago=1):
+    modified = datetime.now(timezone.utc) - timedelta(days=days_ago, minutes=i)
+    return {
+        "id": f"f{i}",
+        "name": f"{kind}-{i}",
+        "mimeType": SERVICE_MIME_TYPES.get(kind, "application/pdf"),
+        "modifiedTime": modified.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+    }
+
+
+class _Request:
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self):
+        return self.response
+
+
+class FakeDrive:
+    def __init__(self, files):
+        self.files_data = files
+        self.token = "100"
+        self.list_calls = []
+
+    def files(self):
+        return self
+
+    def changes(self):
+        return self
+
+    def list(self, **params):
+        self.list_calls.append(params)
+        mime_types = re.findall(r"mimeType = '([^']+)'", params["q"])
+        matches = [
+            f for f in self.files_data if not mime_types or f["mimeType"] in mime_types
+        ]
+        page = {"files": matches[: params["pageSize"]]}
+        if len(matches) > params["pageSize"]:
+            page["nextPageToken"] = "next"
+        return _Request(page)
+
+    def getStartPageToken(self, **_):
+        return _Request({"startPageToken": self.token})
+
+
+def _cache(drive, **kwargs):
+    return RecentItemsCache(AsyncMock(return_value=drive), **kwargs)
+
+
+async def test_one_query_serves_every_service():
+    files = [_file(0, "docs"), _file(1, "sheets"), _file(2, "pdf"), _file(3, "docs")]
+    drive = FakeDrive(files)
+    cache = _cache(drive)
+
+    with patch.object(recent, "get_recent_items_cache", return_value=cache):
+        results = {
+            service: await recent._get_recent_items(service, USER, page_size=10)
+            for service in ("drive", "docs", "sheets", "slides", "forms")
+        }
+
+    # One Workspace query plus one page of any file type for recent://drive
+    assert len(drive.list_calls) == 2
+    assert drive.list_calls[0]["orderBy"] == "modifiedTime desc"
+    assert drive.list_calls[0]["corpora"] == "allDrives"
+    assert [f["name"] for f in results["docs"]["files"]] == ["docs-0", "docs-3"]
+    assert results["drive"]["total_count"] == 4
+    assert results["slides"]["files"] == []
+    assert cache.stats["misses"] == 1 and cache.stats["hits"] == 4
+
+
+async def test_stale_snapshot_revalidates_in_background():
+    drive = FakeDrive([_file(0, "docs")])
+    cache = _cache(drive, ttl_seconds=0)
+    first = await cache.get(USER)
+
+    # Token unchanged: served stale, renewed without listing again
+    assert await cache.get(USER) is first
+    await asyncio.gather(*cache._inflight.values())
+    assert len(drive.list_calls) == 2
+    assert cache.stats["revalidated"] == 1
+
+    # Token moved: the background refresh relists
+    drive.token = "101"
+    drive.files_data = [_file(5, "sheets"), _file(0, "docs")]
+    assert await cache.get(USER) is first
+    await asyncio.gather(*cache._inflight.values())
+    refreshed = await cache.get(USER)
+    assert len(drive.list_calls) == 4
+    assert refreshed.for_service("sheets", 5)[0]["name"] == "sheets-5"
+
+
+async def test_concurrent_misses_share_one_fetch_and_age_out_files():
+    drive = FakeDrive([_file(0, "docs"), _file(1, "docs", days_ago=40)])
+    cache = _cache(drive)
+
+    snapshots = await asyncio.gather(*(cache.get(USER) for _ in range(5)))
+
+    assert len(drive.list_calls) == 2
+    assert all(s is snapshots[0] for s in snapshots)
+    assert [f["id"] for f in snapshots[0].for_service("drive", 10)] == ["f0"]
+
+
+async def test_other_file_types_do_not_crowd_out_workspace_files(monkeypatch):
+    monkeypatch.setattr("drive.recent_items.PAGE_SIZE", 30)
+    uploads = [_file(i, "pdf") for i in range(50)]
+    docs = [_file(100 + i, "docs") for i in range(40)]
+    forms = [_file(200, "forms")]
+    drive = FakeDrive(uploads + docs + forms)
+    cache = _cache(drive)
+
+    snapshot = await cache.get(USER)
+
+    assert len(snapshot.for_service("docs", 20)) == 20
+    assert [f["name"] for f in snapshot.for_service("forms", 20)] == ["forms-200"]
+    assert [f["id"] for f in snapshot.for_service("drive", 3)] == ["f0", "f1", "f2"]
+    assert not snapshot.complete
+    # Workspace page, then one targeted query per short service, then drive
+    assert len(drive.list_calls) == 5
@@ -0,0 +1,152 @@
+"""Tests for ID-indexed service://{service}/{list_type}/{id} resolution."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from middleware import tag_based_resource_middleware as tbr
+from middleware.service_item_resolvers import ItemResolver, ListItemIndex
+from middleware.tag_based_resource_middleware import TagBasedResourceMiddleware
+
+USER = "user@example.com"
+LABELS = {
+    "labels": [
+        {"id": "INBOX", "name": "INBOX", "type": "system"},
+        {"id": "Label_7", "name": "Receipts", "type": "user"},
+    ],
+    "total_count": 2,
+}
+
+
+class _State:
+    def __init__(self):
+        self.values = {}
+
+    async def set_state(self, key, value):
+        self.values[key] = value
+
+    async def get_state(self, key):
+        return self.values.get(key)
+
+
+@pytest.fixture
+def env():
+    mw = TagBasedResourceMiddleware()
+    index = ListItemIndex(ttl_seconds=60)
+    context = SimpleNamespace(fastmcp_context=_State())
+    with (
+        patch.object(tbr, "get_list_item_index", return_value=index),
+        patch.object(tbr, "get_user_email_context", AsyncMock(return_value=USER)),
+        patch.object(
+            mw, "_get_available_tools", AsyncMock(return_value={"list_gmail_labels"})
+        ),
+        patch.object(mw, "_call_tool_with_context", AsyncMock(return_value=LABELS)),
+    ):
+        yield mw, index, context
+
+
+def _details(context, item_id):
+    return context.fastmcp_context.values[
+        f"service_item_details_gmail_labels_{item_id}_{USER}"
+    ]
+
+
+async def test_listed_items_resolve_from_index(env):
+    mw, index, context = env
+    await mw._handle_list_items("gmail", "labels", context)
+    assert mw._call_tool_with_context.await_count == 1
+
+    with patch.object(tbr, "get_item_resolver") as resolver:
+        await mw._handle_specific_item("gmail", "labels", "Label_7", context)
+
+    resolver.assert_not_called()
+    assert mw._call_tool_with_context.await_count == 1
+    assert _details(context, "Label_7").result["name"] == "Receipts"
+    assert index.stats["hits"] == 1
+
+
+async def test_unindexed_item_uses_direct_get(env):
+    mw, index, context = env
+    fetch = AsyncMock(return_value={"id": "Label_99", "name": "Old"})
+    resolver = ItemResolver("gmail", "labels", "labels.get", fetch)
+
+    with patch.object(tbr, "get_item_resolver", return_value=resolver):
+        await mw._handle_specific_item("gmail", "labels", "Label_99", context)
+        await mw._handle_specific_item("gmail", "labels", "Label_99", context)
+
+    fetch.assert_awaited_once_with(USER, "Label_99")
+    mw._call_tool_with_context.assert_not_awaited()
+    details = _details(context, "Label_99")
+    assert details.tool_called == "labels.get"
+    assert details.result["name"] == "Old"
+
+
+async def test_without_resolver_falls_back_to_list_and_indexes(env):
+    mw, index, context = env
+    with patch.object(tbr, "get_item_resolver", return_value=None):
+        await mw._handle_specific_item("gmail", "labels", "INBOX", context)
+
+    assert _details(context, "INBOX").result["type"] == "system"
+    assert index.lookup(USER, "gmail", "labels", "Label_7")["name"] == "Receipts"
+
+
+def test_index_expires_and_accepts_short_ids():
+    index = ListItemIndex(ttl_seconds=60)
+    index.index(USER, "chat", "spaces", {"spaces": [{"id": "spaces/AAAA"}]})
+
+    assert index.lookup(USER.upper(), "chat", "spaces", "AAAA") is not None
+    assert index.lookup(USER, "chat", "spaces", "spaces/AAAA") is not None
+
+    index.ttl_seconds = -1
+    assert index.lookup(USER, "chat", "spaces", "AAAA") is None
+    assert len(index) == 0
+
+
+def test_index_keys_items_by_id_only():
+    index = ListItemIndex(ttl_seconds=60)
+    index.index(USER, "gmail", "labels", LABELS)
+
+    assert index.lookup(USER, "gmail", "labels", "Label_7")["name"] == "Receipts"
+    assert index.lookup(USER, "gmail", "labels", "Receipts") is None
+
+
+async def test_resolvers_return_list_entry_shape():
+    from unittest.mock import MagicMock
+
+    from gchat.chat_types import SpaceInfo
+    from gmail.gmail_types import GmailLabelInfo
+    from middleware.service_item_resolvers import get_item_resolver
+
+    gmail = MagicMock()
+    gmail.users().labels().get().execute.return_value = {
+        "id": "Label_7",
+        "name": "Receipts",
+        "type": "user",
+        "messagesTotal": 3,
+    }
+    chat = MagicMock()
+    chat.spaces().get().execute.return_value = {
+        "name": "spaces/AAAA",
+        "displayName": "Team",
+        "spaceType": "SPACE",
+        "createTime": "2026-01-01T00:00:00Z",
+    }
+
+    with (
+        patch(
+            "gmail.service._get_gmail_service_with_fallback",
+            AsyncMock(return_value=gmail),
+        ),
+        patch(
+            "gchat.chat_tools._get_chat_service_with_fallback",
+            AsyncMock(return_value=chat),
+        ),
+    ):
+        label = await get_item_resolver("gmail", "labels").resolve(USER, "Label_7")
+        space = await get_item_resolver("chat", "spaces").resolve(USER, "AAAA")
+
+    assert set(label) == set(GmailLabelInfo.__annotations__)
+    assert label["messagesTotal"] == 3
+    assert set(space) == set(SpaceInfo.__annotations__)
+    assert space["id"] == "spaces/AAAA"
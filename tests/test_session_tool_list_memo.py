@@ -0,0 +1,99 @@
+"""Tests for memoized per-session tool lists in SessionToolFilteringMiddleware."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from auth.context import (
+    clear_session,
+    disable_tool_for_session_sync,
+    get_session_tools_version,
+)
+from middleware import session_tool_filtering_middleware as stf
+from middleware.session_tool_filtering_middleware import (
+    SessionToolFilteringMiddleware,
+    bump_tool_registry_version,
+)
+
+SESSION = "memo-session-0001"
+
+
+def _tools(*names):
+    return [SimpleNamespace(name=name) for name in names]
+
+
+@pytest.fixture
+def middleware():
+    mw = SessionToolFilteringMiddleware(protected_tools={"manage_tools"})
+    mw._processed_sessions.add(SESSION)
+    clear_session(SESSION)
+    with (
+        patch.object(stf, "get_session_context", return_value=SESSION),
+        patch.object(stf, "parse_http_connection_params", return_value={}),
+    ):
+        yield mw
+    clear_session(SESSION)
+
+
+async def _list(mw, tools):
+    async def call_next(_context):
+        return tools
+
+    return await mw.on_list_tools(SimpleNamespace(fastmcp_context=None), call_next)
+
+
+async def test_repeated_listing_is_served_from_memo(middleware):
+    tools = _tools("manage_tools", "send_gmail_message", "list_spaces")
+    disable_tool_for_session_sync("list_spaces", SESSION)
+
+    first = await _list(middleware, tools)
+    with patch.object(stf, "get_session_disabled_tools") as lookup:
+        second = await _list(middleware, tools)
+
+    lookup.assert_not_called()
+    assert second == first
+    assert [t.name for t in first] == ["manage_tools", "send_gmail_message"]
+    assert middleware._memo_stats == {"hits": 1, "misses": 1}
+
+
+async def test_session_and_registry_changes_invalidate(middleware):
+    tools = _tools("manage_tools", "send_gmail_message", "list_spaces")
+    await _list(middleware, tools)
+
+    version = get_session_tools_version(SESSION)
+    disable_tool_for_session_sync("send_gmail_message", SESSION)
+    assert get_session_tools_version(SESSION) != version
+    listed = await _list(middleware, tools)
+    assert [t.name for t in listed] == ["manage_tools", "list_spaces"]
+
+    bump_tool_registry_version()
+    await _list(middleware, tools)
+    # Downstream list changed without a version bump: still recomputed
+    listed = await _list(middleware, tools[:2])
+    assert [t.name for t in listed] == ["manage_tools"]
+    assert middleware._memo_stats["hits"] == 0
+
+
+async def test_memo_hit_returns_fresh_tool_objects(middleware):
+    disable_tool_for_session_sync("list_spaces", SESSION)
+    await _list(middleware, _tools("manage_tools", "list_spaces"))
+
+    fresh = _tools("manage_tools", "list_spaces")
+    fresh[0].description = "updated without a rename"
+    listed = await _list(middleware, fresh)
+
+    assert middleware._memo_stats["hits"] == 1
+    assert listed == [fresh[0]]
+    assert listed[0] is fresh[0]
+
+
+async def test_service_filter_is_part_of_the_memo_key(middleware):
+    tools = _tools("manage_tools", "list_spaces")
+    await _list(middleware, tools)
+    with patch.object(
+        stf, "parse_http_connection_params", return_value={"services": ["chat"]}
+    ):
+        await _list(middleware, tools)
+
+    assert middleware._memo_stats == {"hits": 0, "misses": 2}
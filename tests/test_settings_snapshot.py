@@ -0,0 +1,78 @@
+"""Tests for the read-only hot-path settings snapshot."""
+
+import pytest
+
+import config.settings as settings_module
+from config.settings import (
+    SettingsSnapshot,
+    get_settings,
+    override_settings,
+    reload_settings,
+    settings_version,
+)
+
+
+class TestSettingsSnapshot:
+    """get_settings() caching, read-only enforcement, reload and overrides."""
+
+    def test_get_settings_returns_same_instance(self):
+        """Repeated calls return the cached snapshot without re-validation."""
+        assert get_settings() is get_settings()
+        assert isinstance(get_settings(), SettingsSnapshot)
+
+    def test_snapshot_is_read_only(self):
+        """Writes to the snapshot raise instead of mutating shared state."""
+        snap = get_settings()
+        with pytest.raises(AttributeError):
+            snap.search_mode = "learned"
+        with pytest.raises(AttributeError):
+            del snap.search_mode
+
+    def test_snapshot_is_deeply_frozen(self):
+        """The wrapped model and returned containers cannot alter the snapshot."""
+        snap = get_settings()
+        with pytest.raises(AttributeError):
+            snap._settings.search_mode = "learned"
+        with pytest.raises(AttributeError):
+            snap._settings._fallback_drive_scopes = []
+        snap._fallback_drive_scopes.append("https://example.com/scope")
+        assert "https://example.com/scope" not in snap._fallback_drive_scopes
+
+    def test_snapshot_is_isolated_from_module_settings(self, monkeypatch):
+        """Mutating the module-level instance does not leak into the snapshot."""
+        snap = get_settings()
+        original = snap.search_mode
+        monkeypatch.setattr(settings_module.settings, "search_mode", "learned")
+        assert snap.search_mode == original
+
+    def test_snapshot_delegates_properties(self):
+        """Properties and methods of Settings remain reachable."""
+        snap = get_settings()
+        assert snap.protocol in ("http", "https")
+        assert isinstance(snap.get_gmail_allow_list(), list)
+
+    def test_reload_bumps_version(self, monkeypatch):
+        """reload_settings() re-reads the environment and bumps the version."""
+        before = settings_version()
+        monkeypatch.setenv("SEARCH_MODE", "learned")
+        snap = reload_settings()
+        try:
+            assert settings_version() == before + 1
+            assert snap.version == settings_version()
+            assert get_settings() is snap
+            assert get_settings().search_mode == "learned"
+            assert settings_module.settings.search_mode == "learned"
+        finally:
+            monkeypatch.delenv("SEARCH_MODE")
+            reload_settings()
+
+    def test_override_settings_restores_previous_values(self):
+        """override_settings() applies values temporarily and restores them."""
+        original = get_settings().search_mode
+        version = settings_version()
+        with override_settings(search_mode="recursive") as snap:
+            assert get_settings() is snap
+            assert get_settings().search_mode == "recursive"
+            assert settings_version() > version
+        assert get_settings().search_mode == original
+        assert settings_version() > version
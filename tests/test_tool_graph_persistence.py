@@ -0,0 +1,129 @@
+"""Tests for ToolRelationshipGraph persistence and bounded session history."""
+
+import time
+
+from adapters.module_wrapper.tool_graph_store import FileToolGraphStore
+from adapters.module_wrapper.tool_relationship_graph import ToolRelationshipGraph
+
+
+def _edge(graph, src, dst):
+    g = graph._graph
+    return g.get_edge_data(graph._name_to_idx[src], graph._name_to_idx[dst])
+
+
+def _calls(graph, session, *tools):
+    for tool in tools:
+        graph.record_tool_call(tool, "chat", session_id=session)
+
+
+async def test_workers_share_graph_through_file_store(tmp_path):
+    a, b = ToolRelationshipGraph(), ToolRelationshipGraph()
+    _calls(a, "s1", "list_spaces", "send_message")  # recorded before attaching
+    await a.attach_store(FileToolGraphStore(tmp_path))
+    await b.attach_store(FileToolGraphStore(tmp_path))
+
+    _calls(b, "s2", "list_spaces", "send_message")
+    await b.sync()
+    await a.sync()
+
+    for graph in (a, b):
+        edge = _edge(graph, "list_spaces", "send_message")
+        assert edge.co_occurrence_count == 2
+        assert edge.unique_session_count == 2
+        assert graph.get_node_info("list_spaces")["call_count"] == 2
+
+
+async def test_restart_resumes_from_snapshot_and_log(tmp_path):
+    graph = ToolRelationshipGraph()
+    await graph.attach_store(FileToolGraphStore(tmp_path))
+    _calls(graph, "s1", "search_drive_files", "get_drive_file_content")
+    await graph.sync(snapshot=True)
+    _calls(graph, "s1", "search_drive_files")  # logged after the snapshot
+    await graph.close()
+
+    restarted = ToolRelationshipGraph()
+    await restarted.attach_store(FileToolGraphStore(tmp_path))
+
+    assert restarted.get_node_info("search_drive_files")["call_count"] == 2
+    edge = _edge(restarted, "get_drive_file_content", "search_drive_files")
+    assert edge.co_occurrence_count == 1
+    assert _edge(restarted, "search_drive_files", "get_drive_file_content")
+
+
+async def test_snapshot_compacts_expired_segments(tmp_path):
+    store = FileToolGraphStore(tmp_path, retention_seconds=0)
+    graph = ToolRelationshipGraph()
+    await graph.attach_store(store)
+    _calls(graph, "s1", "a", "b")
+    await graph.sync()
+    old = tmp_path / "edges-1.jsonl"
+    next(tmp_path.glob("edges-*.jsonl")).rename(old)  # pretend it is old
+
+    await graph.sync(snapshot=True)
+    assert not old.exists()
+
+    restarted = ToolRelationshipGraph()
+    await restarted.attach_store(FileToolGraphStore(tmp_path))
+    assert _edge(restarted, "a", "b").co_occurrence_count == 1
+
+
+def test_session_history_is_bounded():
+    graph = ToolRelationshipGraph()
+    graph.MAX_SESSIONS = 3
+    now = time.time() * 1000
+    graph.record_tool_call("a", session_id="stale", timestamp_ms=now - 7200_000)
+    for i in range(5):
+        _calls(graph, f"s{i}", "a", "b", "c", "d", "e")
+
+    assert list(graph._session_history) == ["s2", "s3", "s4"]
+    session = graph._session_history["s4"]
+    assert [name for name, _ in session.recent] == ["c", "d", "e"]
+
+
+def test_metrics_refresh_in_background_after_threshold():
+    graph = ToolRelationshipGraph(metrics_edge_threshold=3)
+    _calls(graph, "s1", "a", "b")
+    assert "Core: 1." in graph.get_relationship_text("a")  # first use: computed
+
+    _calls(graph, "s2", "c", "d", "e")
+    deadline = time.time() + 5
+    while (
+        graph._metrics_stale or graph._metrics_refreshing
+    ) and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert not graph._metrics_stale
+    assert graph._k_cores[graph._name_to_idx["d"]] >= 1
+
+
+def test_full_session_edge_set_evicts_oldest_pair():
+    graph = ToolRelationshipGraph()
+    graph.PREDECESSOR_WINDOW = 1
+    graph.MAX_SESSION_EDGES = 2
+    # a->b and b->c fill the set; c->b evicts a->b and is then seen again
+    _calls(graph, "s1", "a", "b", "c", "b", "c", "b")
+
+    edge = _edge(graph, "c", "b")
+    assert edge.co_occurrence_count == 2
+    assert edge.unique_session_count == 1
+    assert list(graph._session_history["s1"].edges) == [("b", "c"), ("c", "b")]
+
+
+async def test_idle_worker_syncs_on_a_timer(tmp_path):
+    import asyncio
+
+    a = ToolRelationshipGraph(sync_interval_seconds=0.01)
+    b = ToolRelationshipGraph(sync_interval_seconds=0.01)
+    await a.attach_store(FileToolGraphStore(tmp_path))
+    await b.attach_store(FileToolGraphStore(tmp_path))
+    try:
+        _calls(a, "s1", "list_spaces", "send_message")
+        await a.sync()
+        for _ in range(100):  # b records nothing and is never synced by hand
+            if "send_message" in b._name_to_idx:
+                break
+            await asyncio.sleep(0.01)
+        assert _edge(b, "list_spaces", "send_message").co_occurrence_count == 1
+    finally:
+        await a.close()
+        await b.close()
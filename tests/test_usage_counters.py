@@ -0,0 +1,197 @@
+"""Tests for incremental usage counters and their use by dynamic instructions."""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from middleware.qdrant_core.usage_counters import UsageCounters
+from tools.dynamic_instructions import DynamicInstructionsBuilder
+
+
+@pytest.fixture
+def counters(tmp_path):
+    return UsageCounters(path=tmp_path / "usage.json", flush_interval=0)
+
+
+class TestUsageCounters:
+    def test_record_aggregates_by_tool_and_service(self, counters):
+        counters.record("send_gmail_message", "gmail", 120, user="a@x.com")
+        counters.record("send_gmail_message", "gmail", 80, is_error=True)
+        counters.record("list_events", "calendar", 10, user="b@x.com")
+
+        tools = counters.analytics("tool_name")
+        gmail = tools["groups"]["send_gmail_message"]
+        assert tools["total_responses"] == 3
+        assert gmail["count"] == 2
+        assert gmail["has_errors"] == 1
+        assert gmail["recent_activity"]["last_24h"] == 2
+        assert gmail["latency_p50_ms"] is not None
+        assert tools["summary"]["total_unique_users"] == 2
+        assert tools["summary"]["overall_error_rate"] == pytest.approx(1 / 3)
+
+        services = counters.analytics("service")
+        assert services["groups"]["gmail"]["count"] == 2
+        assert services["groups"]["calendar"]["count"] == 1
+
+    def test_old_days_fall_out_of_recent_windows(self, counters):
+        counters.record("t", "s", now=time.time() - 10 * 86400)
+        counters.record("t", "s")
+
+        recent = counters.analytics()["groups"]["t"]["recent_activity"]
+        assert recent == {"last_24h": 1, "last_7d": 1, "last_30d": 2}
+
+    def test_flush_and_reload_round_trip(self, counters, tmp_path):
+        counters.record("t", "s", 5, user="a@x.com")
+        assert counters.flush() is True
+        assert counters.flush() is False  # nothing new
+
+        reloaded = UsageCounters(path=tmp_path / "usage.json")
+        assert reloaded.has_data
+        assert reloaded.analytics()["groups"]["t"]["count"] == 1
+        assert reloaded.analytics()["summary"]["total_unique_users"] == 1
+
+    def test_seed_from_analytics(self, counters):
+        ts = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+        tool_analytics = {
+            "groups": {
+                "t": {
+                    "count": 3,
+                    "has_errors": 1,
+                    "timestamps": [ts, ts, ts],
+                    "users": ["a@x.com"],
+                }
+            }
+        }
+        counters.seed_from_analytics(tool_analytics, {"groups": {}})
+
+        group = counters.analytics()["groups"]["t"]
+        assert group["count"] == 3
+        assert group["recent_activity"]["last_24h"] == 3
+        # Seeding is one-time; later seeds are ignored
+        counters.seed_from_analytics({"groups": {"x": {"count": 9}}}, None)
+        assert "x" not in counters.analytics()["groups"]
+
+    def test_partial_buckets_are_weighted_at_window_edges(self, counters):
+        now = time.time()
+        # 30h ago is outside the 24h window even though it was "yesterday"
+        counters.record("t", "s", now=now - 30 * 3600)
+        counters.record("t", "s", now=now - 3600)
+
+        recent = counters.analytics()["groups"]["t"]["recent_activity"]
+        assert recent["last_24h"] == 1
+        assert recent["last_7d"] == 2
+
+    def test_workers_merge_into_one_file(self, tmp_path):
+        path = tmp_path / "usage.json"
+        worker_a = UsageCounters(path=path)
+        worker_b = UsageCounters(path=path)
+
+        worker_a.record("t", "s", user="a@x.com")
+        worker_b.record("t", "s", user="b@x.com")
+        worker_b.record("u", "s")
+        assert worker_a.flush() and worker_b.flush()
+        worker_a.record("t", "s")
+        assert worker_a.flush()
+
+        merged = UsageCounters(path=path).analytics()
+        assert merged["groups"]["t"]["count"] == 3
+        assert merged["groups"]["u"]["count"] == 1
+        assert merged["summary"]["total_unique_users"] == 2
+        # A flushing worker also sees the other workers' calls
+        assert worker_a.analytics()["total_responses"] == 4
+
+
+class TestMiddlewareRecordsOnce:
+    async def test_failure_after_tool_success_is_not_double_counted(self):
+        from middleware import qdrant_middleware as qm
+
+        mw = qm.QdrantUnifiedMiddleware.__new__(qm.QdrantUnifiedMiddleware)
+        mw.client_manager = MagicMock(is_initialized=True, is_available=True)
+        mw.storage_manager = MagicMock()
+        mw._tool_relationship_graph = None
+        mw._record_usage = MagicMock()
+        context = MagicMock()
+        context.message.name = "list_events"
+        context.message.arguments = {}
+
+        with (
+            patch.object(qm, "get_session_context", AsyncMock(return_value="s")),
+            patch.object(qm, "_sanitize_for_storage", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError),
+        ):
+            await mw.on_call_tool(context, AsyncMock(return_value={"ok": True}))
+
+        mw._record_usage.assert_called_once()
+        assert mw._record_usage.call_args.kwargs["is_error"] is False
+
+    async def test_calls_are_counted_while_qdrant_is_unavailable(self):
+        from middleware import qdrant_middleware as qm
+
+        mw = qm.QdrantUnifiedMiddleware.__new__(qm.QdrantUnifiedMiddleware)
+        mw.client_manager = MagicMock(is_initialized=True, is_available=False)
+        mw._record_usage = MagicMock()
+        context = MagicMock()
+        context.message.name = "list_events"
+        context.message.arguments = {}
+
+        assert await mw.on_call_tool(context, AsyncMock(return_value={"ok": 1})) == {
+            "ok": 1
+        }
+
+        mw._record_usage.assert_called_once()
+        assert mw._record_usage.call_args.args[0] == "list_events"
+
+
+class TestDynamicInstructionsUsesCounters:
+    def _builder(self):
+        middleware = MagicMock()
+        middleware.client_manager.is_available = True
+        middleware.search_manager.get_analytics = AsyncMock(
+            return_value={"groups": {}, "total_responses": 0}
+        )
+        return DynamicInstructionsBuilder(qdrant_middleware=middleware), middleware
+
+    async def test_reads_counters_without_scrolling(self, counters):
+        counters.record("list_events", "calendar", 10)
+        builder, middleware = self._builder()
+
+        with patch(
+            "tools.dynamic_instructions.get_usage_counters", return_value=counters
+        ):
+            analytics = await builder.get_tool_analytics()
+            services = await builder.get_service_analytics()
+
+        assert analytics["groups"]["list_events"]["count"] == 1
+        assert services["groups"]["calendar"]["count"] == 1
+        middleware.search_manager.get_analytics.assert_not_awaited()
+
+    async def test_empty_counters_seed_once_from_scroll(self, counters):
+        builder, middleware = self._builder()
+
+        with patch(
+            "tools.dynamic_instructions.get_usage_counters", return_value=counters
+        ):
+            await builder.get_tool_analytics()
+            await builder.get_tool_analytics()
+
+        # One scroll per group_by, only on the first refresh
+        assert middleware.search_manager.get_analytics.await_count == 2
+        assert counters.has_data
+
+    async def test_collection_probes_run_concurrently(self):
+        builder, _ = self._builder()
+        client_manager = MagicMock(is_initialized=True)
+        client_manager.client.get_collection.return_value = SimpleNamespace(
+            points_count=5, vectors_count=5, status="green"
+        )
+
+        with patch(
+            "tools.dynamic_instructions.get_or_create_client_manager",
+            return_value=client_manager,
+        ):
+            summary = await builder.get_collection_summary()
+
+        assert [c["points_count"] for c in summary] == [5, 5]
+        assert client_manager.client.get_collection.call_count == 2
@@ -0,0 +1,168 @@
+"""Tests for pooled webhook delivery (gchat/webhook_client.py)."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from gchat import webhook_client
+from gchat.webhook_client import DeliveryQueue, WebhookClient
+
+URL = "https://chat.googleapis.com/v1/spaces/AAA/messages?key=k&token=t"
+
+
+def _client_with(handler, **kwargs) -> WebhookClient:
+    client = WebhookClient(**kwargs)
+    transport = httpx.MockTransport(handler)
+    client._client_for = lambda url: httpx.AsyncClient(transport=transport)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep_jitter(monkeypatch):
+    monkeypatch.setattr(webhook_client, "BACKOFF_BASE_SECONDS", 0.01)
+
+
+async def test_retry_after_is_honoured():
+    calls = []
+
+    def handler(request):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+        return httpx.Response(200, json={"name": "spaces/AAA/messages/1"})
+
+    client = _client_with(handler, min_interval_seconds=0)
+
+    resp = await client.post(URL, {"text": "hi"})
+
+    assert resp.status_code == 200
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.2
+
+
+async def test_sends_to_same_space_are_spaced():
+    calls = []
+
+    def handler(request):
+        calls.append(time.monotonic())
+        return httpx.Response(200)
+
+    client = _client_with(handler, min_interval_seconds=0.1)
+
+    for _ in range(3):
+        await client.post(URL, {"text": "hi"})
+
+    assert calls[2] - calls[0] >= 0.2
+
+
+async def test_slot_wait_happens_outside_the_lock():
+    client = WebhookClient(min_interval_seconds=0.2)
+    key = "chat.googleapis.com/v1/spaces/AAA/messages"
+    await client.acquire_slot(key)
+
+    waiter = asyncio.create_task(client.acquire_slot(key))
+    await asyncio.sleep(0.05)
+
+    assert not waiter.done()
+    assert not client._slot_locks[key].locked()
+    await waiter
+
+
+async def test_transport_errors_raise_after_retries():
+    def handler(request):
+        raise httpx.ConnectError("boom", request=request)
+
+    client = _client_with(handler, min_interval_seconds=0)
+
+    with pytest.raises(httpx.TransportError):
+        await client.post(URL, {"text": "hi"}, max_retries=2)
+
+
+async def test_queue_records_delivery_status():
+    class Result:
+        success = False
+        error = "HTTP 400"
+
+    async def ok():
+        return None
+
+    async def bad():
+        return Result()
+
+    queue = DeliveryQueue()
+    ok_id, bad_id = queue.submit(ok), queue.submit(bad)
+    assert queue.status(ok_id)["status"] == "queued"
+
+    await queue.drain()
+
+    assert queue.status(ok_id)["status"] == "delivered"
+    assert queue.status(bad_id)["status"] == "failed"
+
+
+async def test_shutdown_drains_queue_then_closes_clients(monkeypatch):
+    delivered = []
+
+    async def job():
+        await asyncio.sleep(0.05)
+        delivered.append(client._clients["chat.googleapis.com"][1].is_closed)
+
+    client = WebhookClient(min_interval_seconds=0)
+    client._client_for(URL)
+    queue = DeliveryQueue()
+    monkeypatch.setattr(webhook_client, "_client", client)
+    monkeypatch.setattr(webhook_client, "_queue", queue)
+    delivery_id = queue.submit(job)
+
+    await webhook_client.shutdown_webhook_delivery()
+
+    assert delivered == [False]
+    assert queue.status(delivery_id)["status"] == "delivered"
+    assert client._clients == {}
+
+
+def test_client_replaced_on_loop_change_is_closed():
+    client = WebhookClient(min_interval_seconds=0)
+
+    async def _open():
+        opened = client._client_for(URL)
+        await asyncio.sleep(0)  # let the replaced client's close task run
+        return opened
+
+    first = asyncio.run(_open())
+    second = asyncio.run(_open())
+
+    assert first is not second
+    assert first.is_closed
+    assert not second.is_closed
+
+    asyncio.run(client.aclose())
+
+    assert first.is_closed
+    assert second.is_closed
+
+
+async def test_delivery_status_lookup(monkeypatch):
+    from resources.card_delivery_resources import delivery_status
+
+    class Result:
+        success = True
+        status_code = 200
+        parts_sent = 2
+        failed_part = None
+        thread_key = "spaces/AAA/threads/t"
+        error = None
+
+    async def job():
+        return Result()
+
+    queue = DeliveryQueue()
+    monkeypatch.setattr(webhook_client, "_queue", queue)
+    delivery_id = queue.submit(job)
+    await queue.drain()
+
+    status = delivery_status(delivery_id)
+    assert status["status"] == "delivered"
+    assert status["parts_sent"] == 2
+    assert delivery_status("missing")["status"] == "unknown"
@@ -18,6 +18,8 @@ from typing_extensions import List, Literal
 
 from auth.context import get_auth_middleware
 from config.enhanced_logging import setup_logger
+from people.allowlist_index import get_allowlist_index
+from people.contact_index import normalize_email
 from tools.common_types import UserGoogleEmail
 
 logger = setup_logger()
@@ -146,105 +148,6 @@ async def _get_people_service_for_trust(user_email: UserGoogleEmail):
         return None
 
 
-async def _resolve_allowed_group_ids(
-    group_entries: List[AllowListEntry],
-    people_service,
-) -> List[str]:
-    """
-    Resolve configured People group entries into contact group resourceNames.
-
-    Supports:
-      - kind="people_group_name"  → resolved via contactGroups.list() name matching
-      - kind="people_group_id"    → used as-is
-    """
-    allowed_ids: List[str] = []
-    if not people_service or not group_entries:
-        return allowed_ids
-
-    try:
-
-        def _list_groups():
-            return people_service.contactGroups().list(pageSize=200).execute()
-
-        result = await asyncio.to_thread(_list_groups)
-        groups = result.get("contactGroups", []) or []
-        name_to_id = {
-            g.get("name", ""): g.get("resourceName")
-            for g in groups
-            if g.get("name") and g.get("resourceName")
-        }
-
-        for entry in group_entries:
-            if entry.kind == "people_group_id":
-                gid = entry.value.strip()
-                if gid:
-                    allowed_ids.append(gid)
-            elif entry.kind == "people_group_name":
-                gid = name_to_id.get(entry.value)
-                if gid:
-                    allowed_ids.append(gid)
-                else:
-                    logger.warning(
-                        f"[trust_list] No contact group found with name '{entry.value}'"
-                    )
-    except Exception as exc:
-        logger.error(
-            f"Failed to resolve trust list group specs via People API: {exc}",
-            exc_info=True,
-        )
-
-    return allowed_ids
-
-
-async def _get_contact_group_ids_for_email(email: str, people_service) -> List[str]:
-    """
-    Fetch contact group resourceNames for a given email using People API.
-
-    Uses people.searchContacts with readMask including memberships.
-    """
-    group_ids: List[str] = []
-    if not people_service or not email:
-        return group_ids
-
-    try:
-
-        def _search():
-            return (
-                people_service.people()
-                .searchContacts(
-                    query=email,
-                    readMask="emailAddresses,memberships",
-                )
-                .execute()
-            )
-
-        result = await asyncio.to_thread(_search)
-        containers = (
-            result.get("results")
-            or result.get("connections")
-            or result.get("people")
-            or []
-        )
-
-        for item in containers:
-            person = item.get("person", item)
-            if not isinstance(person, dict):
-                continue
-            for membership in person.get("memberships", []):
-                cgm = membership.get("contactGroupMembership")
-                if cgm:
-                    gid = cgm.get("contactGroupResourceName")
-                    if gid:
-                        group_ids.append(gid)
-    except Exception as exc:
-        logger.error(
-            f"Failed to fetch contact group memberships for {email}: {exc}",
-            exc_info=True,
-        )
-
-    return group_ids
-
-
 async def filter_recipients_allowed_by_groups(
     recipients: List[str],
     entries: List[AllowListEntry],
@@ -253,9 +156,8 @@ async def filter_recipients_allowed_by_groups(
     """
     Determine which recipients should be considered allowed based on People groups.
 
-    Steps:
-      1) Resolve configured group specs → contact group resourceNames
-      2) For each recipient, fetch memberships and see if they belong to any allowed group
+    The configured groups are expanded into a per-user set of member emails
+    (see ``people.allowlist_index``), so each recipient is a set lookup.
     """
     allowed_recipients: List[str] = []
 
@@ -270,21 +172,23 @@ async def filter_recipients_allowed_by_groups(
     if not people_service:
         return allowed_recipients
 
-    allowed_group_ids = await _resolve_allowed_group_ids(group_entries, people_service)
-    if not allowed_group_ids:
+    try:
+        allowed_emails = await get_allowlist_index(user_google_email).allowed_emails(
+            people_service, [e.raw for e in group_entries]
+        )
+    except Exception as exc:
+        logger.error(
+            f"Failed to expand trust list group members via People API: {exc}",
+            exc_info=True,
+        )
         return allowed_recipients
 
-    allowed_group_ids_set = set(allowed_group_ids)
-
     # De-duplicate recipients for efficiency
-    unique_recipients = sorted(set(recipients))
-    for email in unique_recipients:
-        group_ids = await _get_contact_group_ids_for_email(email, people_service)
-        if not group_ids:
-            continue
-
-        if allowed_group_ids_set.intersection(group_ids):
-            allowed_recipients.append(email)
+    allowed_recipients = [
+        email
+        for email in sorted(set(recipients))
+        if normalize_email(email) in allowed_emails
+    ]
 
     if allowed_recipients:
         logger.info(
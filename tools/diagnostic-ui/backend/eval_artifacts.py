@@ -0,0 +1,136 @@
+"""Precomputed evaluation artifacts for the ML dashboard routes.
+
+Reports that rescore the whole validation set (ablations, sweeps, confusion
+matrices) are computed once per (checkpoint hash, dataset hash) in a worker
+process and persisted as JSON next to the checkpoint, so opening the
+dashboard no longer runs torch on the server's event loop.
+
+Usage:
+    cache = ArtifactCache(checkpoint_path, dataset_paths)
+    reports = await cache.get_or_compute(compute_fn)   # fn runs in a worker
+"""
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+ARTIFACT_VERSION = 1  # Bump when report contents change
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Single spawn-based worker (torch does not survive fork well)."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """Evaluation reports for one checkpoint, keyed by content hashes."""
+
+    def __init__(self, checkpoint_path: Path, dataset_paths: Iterable[Path]):
+        self.checkpoint_path = checkpoint_path
+        self.dataset_paths = list(dataset_paths)
+        self.artifact_dir = checkpoint_path.parent / "eval_artifacts"
+        # (path, mtime_ns, size) -> sha256, so hashes are recomputed only on change
+        self._hashes: Dict[tuple, str] = {}
+        self._reports: Dict[str, dict] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _hash(self, path: Path) -> str:
+        if not path.exists():
+            return "missing"
+        stat = path.stat()
+        stamp = (str(path), stat.st_mtime_ns, stat.st_size)
+        if stamp not in self._hashes:
+            self._hashes[stamp] = file_sha256(path)
+        return self._hashes[stamp]
+
+    def key(self) -> str:
+        """``<checkpoint hash>-<dataset hash>`` for the files as they are now."""
+        dataset = hashlib.sha256()
+        for path in self.dataset_paths:
+            dataset.update(f"{path.name}:{self._hash(path)}".encode())
+        return (
+            f"v{ARTIFACT_VERSION}-{self._hash(self.checkpoint_path)[:16]}"
+            f"-{dataset.hexdigest()[:16]}"
+        )
+
+    def _artifact_path(self, key: str) -> Path:
+        return self.artifact_dir / f"{self.checkpoint_path.stem}-{key}.json"
+
+    def cached(self, key: Optional[str] = None) -> Optional[dict]:
+        """Reports from memory or disk, or None if not computed yet."""
+        key = key or self.key()
+        if key in self._reports:
+            return self._reports[key]
+        path = self._artifact_path(key)
+        if path.exists():
+            try:
+                with open(path) as f:
+                    self._reports[key] = json.load(f)
+                return self._reports[key]
+            except (OSError, ValueError):
+                pass
+        return None
+
+    def _persist(self, key: str, reports: dict) -> None:
+        try:
+            self.artifact_dir.mkdir(parents=True, exist_ok=True)
+            path = self._artifact_path(key)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump(reports, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # Read-only checkpoint dir: keep the in-memory copy only
+
+    def status(self) -> dict:
+        key = self.key()
+        return {
+            "key": key,
+            "cached": self.cached(key) is not None,
+            "computing": key in self._inflight,
+            "artifact_path": str(self._artifact_path(key)),
+        }
+
+    async def _compute_and_store(self, key: str, compute: Callable[[], dict]):
+        loop = asyncio.get_running_loop()
+        reports = await loop.run_in_executor(_get_executor(), compute)
+        self._reports[key] = reports
+        await asyncio.to_thread(self._persist, key, reports)
+        return reports
+
+    async def get_or_compute(self, compute: Callable[[], dict]) -> dict:
+        """Cached reports, or run ``compute`` once in the worker process.
+
+        Concurrent callers for the same key share one computation, which
+        keeps running if a caller disconnects.
+        """
+        key = await asyncio.to_thread(self.key)
+        reports = await asyncio.to_thread(self.cached, key)
+        if reports is not None:
+            return reports
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._compute_and_store(key, compute))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _f: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
@@ -1,11 +1,13 @@
 """ML evaluation endpoints for the learned scorer MLP diagnostic dashboard."""
 
+import asyncio
 import json
 import math
 from pathlib import Path
 from typing import List, Optional
 
 import numpy as np
+from eval_artifacts import ArtifactCache
 from fastapi import APIRouter
 from pydantic import BaseModel
 
@@ -97,7 +99,7 @@ def _load_model():
         return _model
 
     torch = _load_torch()
-    import torch.nn as nn
+    from adapters.scorer_models import DualHeadMLP, ScorerMLP
 
     ckpt = torch.load(str(_CHECKPOINT_PATH), map_location="cpu", weights_only=False)
     hidden = ckpt.get("hidden_dim", 32)
@@ -116,51 +118,21 @@ def _load_model():
         FEATURE_NAMES = FEATURE_NAMES_V1
 
     if _model_type == "dual_head":
-        head_dim = ckpt.get("head_dim", 24)
-
-        class _DualHeadMLP(nn.Module):
-            def __init__(self):
-                super().__init__()
-                self.backbone = nn.Sequential(
-                    nn.Linear(input_dim, hidden),
-                    nn.SiLU(),
-                    nn.Dropout(dropout),
-                    nn.Linear(hidden, hidden),
-                    nn.SiLU(),
-                    nn.Dropout(dropout),
-                )
-                self.form_head = nn.Sequential(
-                    nn.Linear(hidden, head_dim),
-                    nn.SiLU(),
-                    nn.Linear(head_dim, 1),
-                )
-                self.content_head = nn.Sequential(
-                    nn.Linear(hidden, head_dim),
-                    nn.SiLU(),
-                    nn.Linear(head_dim, 1),
-                )
-
-            def forward(self, x):
-                shared = self.backbone(x)
-                return self.form_head(shared), self.content_head(shared)
-
-        model = _DualHeadMLP()
+        model = DualHeadMLP(
+            input_dim=input_dim,
+            hidden_dim=hidden,
+            head_dim=ckpt.get("head_dim", 24),
+            dropout=dropout,
+        )
         model.load_state_dict(ckpt["model_state_dict"])
         model.eval()
         _model = model
         _state_dict = ckpt["model_state_dict"]
         return model
 
-    # Single-head model
-    mlp = nn.Sequential(
-        nn.Linear(input_dim, hidden),
-        nn.SiLU(),
-        nn.Dropout(dropout),
-        nn.Linear(hidden, hidden),
-        nn.SiLU(),
-        nn.Dropout(dropout),
-        nn.Linear(hidden, 1),
-    )
+    # Single-head model -- keep the bare Sequential (layer-indexed by the
+    # activation endpoints) and un-prefixed state-dict keys
+    mlp = ScorerMLP(input_dim=input_dim, hidden_dim=hidden, dropout=dropout).mlp
     raw_sd = ckpt["model_state_dict"]
     sd = {}
     for k, v in raw_sd.items():
@@ -277,38 +249,122 @@ def _score_candidates_dual(
 
 
 # ---------------------------------------------------------------------------
-# Endpoint 1: Score Distribution
+# Precomputed evaluation reports
+#
+# Validation-set reports (distribution, ablations, alpha sweep, confusion)
+# are computed together in the eval_artifacts worker process, scoring every
+# group in one padded tensor per pass, and cached per checkpoint + dataset
+# hash.  Endpoints only read the cached result.
 # ---------------------------------------------------------------------------
-@router.get("/ml/score-distribution")
-async def score_distribution():
-    """Score distribution for positive vs negative candidates on validation data."""
-    model = _load_model()
-    val_groups, _ = _load_groups()
+_artifacts = ArtifactCache(
+    _CHECKPOINT_PATH,
+    [
+        _QDRANT_GROUPS,
+        _SYNTHETIC_GROUPS,
+        _SYNTHETIC_GROUPS_V2,
+        _SYNTHETIC_GROUPS_V3,
+        _SYNTHETIC_GROUPS_V5,
+    ],
+)
+
+
+class _PaddedGroups:
+    """Non-empty validation groups padded to [groups, candidates, features]."""
+
+    def __init__(self, groups: List[dict]):
+        groups = [g for g in groups if g.get("candidates")]
+        n_cand = max((len(g["candidates"]) for g in groups), default=0)
+        shape = (len(groups), n_cand)
+        self.x = np.zeros(shape + (len(FEATURE_NAMES),), dtype=np.float32)
+        self.mask = np.zeros(shape, dtype=bool)
+        self.form_labels = np.zeros(shape, dtype=np.float32)
+        self.content_labels = np.zeros(shape, dtype=np.float32)
+        self.names: List[List[str]] = []
+        for gi, group in enumerate(groups):
+            candidates = group["candidates"]
+            n = len(candidates)
+            self.x[gi, :n] = [_candidate_features(c) for c in candidates]
+            self.mask[gi, :n] = True
+            self.form_labels[gi, :n] = [
+                c.get("form_label", c.get("label", 0.0)) for c in candidates
+            ]
+            self.content_labels[gi, :n] = [
+                c.get("content_label", 0.0) for c in candidates
+            ]
+            self.names.append([c.get("name", "?") for c in candidates])
+
+    @property
+    def n_groups(self) -> int:
+        return self.x.shape[0]
+
+    def score(self, model, feature_mask=None):
+        """(form, content) scores for every candidate in one forward pass.
+
+        Single-head models return the same array for both heads.
+        """
+        torch = _load_torch()
+        x = self.x
+        if feature_mask is not None:
+            x = x.copy()
+            x[:, :, feature_mask] = 0.0
+        flat = torch.from_numpy(x.reshape(-1, x.shape[-1]))
+        with torch.no_grad():
+            if _model_type == "dual_head":
+                form_s, content_s = model(flat)
+                form = form_s.squeeze(-1).numpy().reshape(self.mask.shape)
+                content = content_s.squeeze(-1).numpy().reshape(self.mask.shape)
+                return form, content
+            scores = model(flat).squeeze(-1).numpy().reshape(self.mask.shape)
+        return scores, scores
+
+    @staticmethod
+    def combine(form, content, alpha: float = 0.6):
+        if _model_type == "dual_head":
+            return alpha * form + (1 - alpha) * content
+        return form
 
-    positive_scores = []
-    negative_scores = []
+    def top1(self, scores) -> np.ndarray:
+        """Index of the best-scoring real candidate in each group."""
+        if not self.n_groups:
+            return np.zeros(0, dtype=int)
+        return np.where(self.mask, scores, -np.inf).argmax(axis=1)
+
+    def hits(self, scores, labels) -> np.ndarray:
+        return labels[np.arange(self.n_groups), self.top1(scores)] > 0.5
+
+    def accuracy(self, scores, labels=None, rows=None) -> float:
+        hits = self.hits(scores, self.form_labels if labels is None else labels)
+        if rows is not None:
+            hits = hits[rows]
+        return float(hits.mean()) if hits.size else 0.0
+
+    def has_content_label(self) -> np.ndarray:
+        return (self.content_labels > 0.5).any(axis=1)
+
+
+def _feature_groups() -> dict:
+    if _feature_version >= 5:
+        return _FEATURE_GROUPS_V5
+    if _feature_version in (3, 4):
+        return _FEATURE_GROUPS_V3
+    if _feature_version == 2:
+        return _FEATURE_GROUPS_V2
+    return _FEATURE_GROUPS_V1
 
-    for group in val_groups:
-        candidates = group.get("candidates", [])
-        if not candidates:
-            continue
-        scores = _score_candidates(model, candidates)
-        for c, s in zip(candidates, scores):
-            label = c.get("form_label", c.get("label", 0.0))
-            if label > 0.5:
-                positive_scores.append(s)
-            else:
-                negative_scores.append(s)
 
-    pos = np.array(positive_scores) if positive_scores else np.array([0.0])
-    neg = np.array(negative_scores) if negative_scores else np.array([0.0])
+def _report_score_distribution(model, pg: _PaddedGroups, n_val_groups: int) -> dict:
+    form, content = pg.score(model)
+    scores = pg.combine(form, content)[pg.mask].astype(np.float64)
+    positive = pg.form_labels[pg.mask] > 0.5
+    pos = scores[positive] if positive.any() else np.array([0.0])
+    neg = scores[~positive] if (~positive).any() else np.array([0.0])
 
     return {
         "positive_scores": [round(float(x), 4) for x in pos],
         "negative_scores": [round(float(x), 4) for x in neg],
-        "n_val_groups": len(val_groups),
-        "n_positive": len(positive_scores),
-        "n_negative": len(negative_scores),
+        "n_val_groups": n_val_groups,
+        "n_positive": int(positive.sum()),
+        "n_negative": int((~positive).sum()),
         "mean_positive": round(float(pos.mean()), 4),
         "mean_negative": round(float(neg.mean()), 4),
         "std_positive": round(float(pos.std()), 4),
@@ -318,15 +374,8 @@ async def score_distribution():
     }
 
 
-# ---------------------------------------------------------------------------
-# Endpoint 2: Feature Importance
-# ---------------------------------------------------------------------------
-@router.get("/ml/feature-importance")
-async def feature_importance():
-    """Feature importance via weight magnitude and zero-out ablation."""
+def _report_feature_importance(model, pg: _PaddedGroups) -> dict:
     torch = _load_torch()
-    model = _load_model()
-    val_groups, _ = _load_groups()
 
     # Method A: Weight magnitude (L2 norm of each input column in layer 1)
     # Dual-head: backbone.0.weight, Single-head: 0.weight
@@ -337,37 +386,11 @@ async def feature_importance():
     weight_magnitude = [round(n / total, 4) for n in col_norms]
 
     # Method B: Zero-out ablation on val set
-    # First compute baseline accuracy
-    def compute_accuracy(feature_mask=None):
-        correct = 0
-        total_groups = 0
-        for group in val_groups:
-            candidates = group.get("candidates", [])
-            if not candidates:
-                continue
-            features = [_candidate_features(c) for c in candidates]
-            x = torch.tensor(features, dtype=torch.float32)
-            if feature_mask is not None:
-                x[:, feature_mask] = 0.0
-            with torch.no_grad():
-                if _model_type == "dual_head":
-                    form_s, content_s = model(x)
-                    scores = 0.6 * form_s.squeeze(-1) + 0.4 * content_s.squeeze(-1)
-                else:
-                    scores = model(x).squeeze(-1)
-            top_idx = scores.argmax().item()
-            labels = [c.get("form_label", c.get("label", 0.0)) for c in candidates]
-            if labels[top_idx] > 0.5:
-                correct += 1
-            total_groups += 1
-        return correct / total_groups if total_groups > 0 else 0.0
-
-    baseline = compute_accuracy()
-    n_features = len(FEATURE_NAMES)
-    ablation_impact = []
-    for i in range(n_features):
-        ablated = compute_accuracy(feature_mask=i)
-        ablation_impact.append(round(baseline - ablated, 4))
+    baseline = pg.accuracy(pg.combine(*pg.score(model)))
+    ablation_impact = [
+        round(baseline - pg.accuracy(pg.combine(*pg.score(model, i))), 4)
+        for i in range(len(FEATURE_NAMES))
+    ]
 
     return {
         "feature_names": FEATURE_NAMES,
@@ -377,85 +400,18 @@ async def feature_importance():
     }
 
 
-# ---------------------------------------------------------------------------
-# Endpoint 2b: Grouped Feature Ablation
-# ---------------------------------------------------------------------------
-_FEATURE_GROUPS_V3 = {
-    "sim_c": {"indices": [0, 1, 2, 3], "label": "Components ColBERT (sim_c_*)"},
-    "sim_i": {"indices": [4, 5, 6, 7], "label": "Inputs ColBERT (sim_i_*)"},
-    "sim_r": {"indices": [8], "label": "Relationships MiniLM (sim_r)"},
-    "structural": {"indices": [9, 10, 11, 12, 13], "label": "Structural DAG"},
-}
-
-_FEATURE_GROUPS_V5 = {
-    "sim_c": {"indices": [0, 1, 2, 3], "label": "Components ColBERT (sim_c_*)"},
-    "sim_i": {"indices": [4, 5, 6, 7], "label": "Inputs ColBERT (sim_i_*)"},
-    "sim_r": {"indices": [8], "label": "Relationships MiniLM (sim_r)"},
-    "structural": {"indices": [9, 10, 11, 12, 13], "label": "Structural DAG"},
-    "content": {
-        "indices": [14, 15, 16],
-        "label": "Content (sim_content, density, alignment)",
-    },
-}
-
-_FEATURE_GROUPS_V2 = {
-    "similarities": {"indices": [0, 1, 2], "label": "Similarities"},
-    "structural": {"indices": [3, 4, 5, 6, 7], "label": "Structural DAG"},
-}
-
-_FEATURE_GROUPS_V1 = {
-    "similarities": {"indices": [0, 1, 2], "label": "Similarities"},
-    "query_norms": {"indices": [3, 4, 5], "label": "Query norms"},
-    "candidate_norms": {"indices": [6, 7, 8], "label": "Candidate norms"},
-}
+def _report_group_ablation(model, pg: _PaddedGroups) -> dict:
+    groups = _feature_groups()
 
+    def accuracy_masked(mask_indices):
+        return pg.accuracy(pg.combine(*pg.score(model, mask_indices or None)))
 
-@router.get("/ml/group-ablation")
-async def group_ablation():
-    """Grouped feature ablation — zero entire feature groups and pairwise combos."""
-    torch = _load_torch()
-    model = _load_model()
-    val_groups, _ = _load_groups()
-
-    if _feature_version >= 5:
-        groups = _FEATURE_GROUPS_V5
-    elif _feature_version in (3, 4):
-        groups = _FEATURE_GROUPS_V3
-    elif _feature_version == 2:
-        groups = _FEATURE_GROUPS_V2
-    else:
-        groups = _FEATURE_GROUPS_V1
-
-    def compute_accuracy_masked(mask_indices):
-        correct = 0
-        total_g = 0
-        for group in val_groups:
-            candidates = group.get("candidates", [])
-            if not candidates:
-                continue
-            features = [_candidate_features(c) for c in candidates]
-            x = torch.tensor(features, dtype=torch.float32)
-            if mask_indices:
-                x[:, mask_indices] = 0.0
-            with torch.no_grad():
-                if _model_type == "dual_head":
-                    form_s, content_s = model(x)
-                    scores = 0.6 * form_s.squeeze(-1) + 0.4 * content_s.squeeze(-1)
-                else:
-                    scores = model(x).squeeze(-1)
-            top_idx = scores.argmax().item()
-            labels = [c.get("form_label", c.get("label", 0.0)) for c in candidates]
-            if labels[top_idx] > 0.5:
-                correct += 1
-            total_g += 1
-        return correct / total_g if total_g > 0 else 0.0
-
-    baseline = compute_accuracy_masked([])
+    baseline = accuracy_masked([])
 
     # Single-group ablation
     single_results = []
     for name, info in groups.items():
-        acc = compute_accuracy_masked(info["indices"])
+        acc = accuracy_masked(info["indices"])
         single_results.append(
             {
                 "group": name,
@@ -474,7 +430,7 @@ async def group_ablation():
         for j in range(i + 1, len(group_names)):
             g1, g2 = group_names[i], group_names[j]
             combined = groups[g1]["indices"] + groups[g2]["indices"]
-            acc = compute_accuracy_masked(combined)
+            acc = accuracy_masked(combined)
             pairwise_results.append(
                 {
                     "groups": [g1, g2],
@@ -490,8 +446,7 @@ async def group_ablation():
     all_indices = list(range(len(FEATURE_NAMES)))
     for name, info in groups.items():
         keep = set(info["indices"])
-        mask = [i for i in all_indices if i not in keep]
-        acc = compute_accuracy_masked(mask)
+        acc = accuracy_masked([i for i in all_indices if i not in keep])
         only_results.append(
             {
                 "group": name,
@@ -511,6 +466,246 @@ async def group_ablation():
     }
 
 
+def _report_content_form_matrix(model, pg: _PaddedGroups) -> dict:
+    if _model_type != "dual_head":
+        return {
+            "error": "Requires dual-head model (V5+)",
+            "model_type": _model_type,
+        }
+
+    from collections import defaultdict
+
+    form, content = pg.score(model)
+    by_component = defaultdict(
+        lambda: {
+            "form_scores": [],
+            "content_scores": [],
+            "form_correct": 0,
+            "content_correct": 0,
+            "total": 0,
+        }
+    )
+    n_scored = 0
+    for gi, names in enumerate(pg.names):
+        for ci, name in enumerate(names):
+            entry = by_component[name]
+            entry["form_scores"].append(round(float(form[gi, ci]), 4))
+            entry["content_scores"].append(round(float(content[gi, ci]), 4))
+            if pg.form_labels[gi, ci] > 0.5:
+                entry["form_correct"] += 1
+            if pg.content_labels[gi, ci] > 0.5:
+                entry["content_correct"] += 1
+            entry["total"] += 1
+            n_scored += 1
+
+    summary = []
+    for name, data in sorted(by_component.items()):
+        summary.append(
+            {
+                "component": name,
+                "mean_form_score": round(float(np.mean(data["form_scores"])), 4),
+                "mean_content_score": round(float(np.mean(data["content_scores"])), 4),
+                "form_accuracy": round(data["form_correct"] / max(data["total"], 1), 3),
+                "content_accuracy": round(
+                    data["content_correct"] / max(data["total"], 1), 3
+                ),
+                "n_samples": data["total"],
+            }
+        )
+
+    return {
+        "model_type": _model_type,
+        "n_candidates_scored": n_scored,
+        "components": summary,
+    }
+
+
+def _report_content_ablation(model, pg: _PaddedGroups) -> dict:
+    content_rows = pg.has_content_label()
+
+    def per_head_accuracy(feature_mask=None):
+        form, content = pg.score(model, feature_mask)
+        return (
+            pg.accuracy(form),
+            pg.accuracy(content, pg.content_labels, content_rows),
+            pg.accuracy(pg.combine(form, content)),
+        )
+
+    base_form, base_content, base_combined = per_head_accuracy()
+    form_abl, content_abl, combined_abl = [], [], []
+    for i in range(len(FEATURE_NAMES)):
+        f, c, cb = per_head_accuracy(feature_mask=i)
+        form_abl.append(round(base_form - f, 4))
+        content_abl.append(round(base_content - c, 4))
+        combined_abl.append(round(base_combined - cb, 4))
+
+    return {
+        "feature_names": FEATURE_NAMES,
+        "form_ablation": form_abl,
+        "content_ablation": content_abl,
+        "combined_ablation": combined_abl,
+        "baseline_form": round(base_form, 4),
+        "baseline_content": round(base_content, 4),
+        "baseline_combined": round(base_combined, 4),
+    }
+
+
+def _report_alpha_sweep(model, pg: _PaddedGroups) -> dict:
+    if _model_type != "dual_head":
+        return {"error": "Requires dual-head model", "model_type": _model_type}
+
+    form, content = pg.score(model)
+    alphas = [round(a * 0.05, 2) for a in range(21)]  # 0.0..1.0
+    combined_accs = [
+        round(pg.accuracy(pg.combine(form, content, alpha)), 4) for alpha in alphas
+    ]
+    optimal_idx = max(range(len(combined_accs)), key=lambda i: combined_accs[i])
+
+    return {
+        "alphas": alphas,
+        "combined_accuracy": combined_accs,
+        "form_accuracy": round(pg.accuracy(form), 4),
+        "content_accuracy": round(
+            pg.accuracy(content, pg.content_labels, pg.has_content_label()), 4
+        ),
+        "optimal_alpha": alphas[optimal_idx],
+        "optimal_accuracy": combined_accs[optimal_idx],
+        "current_alpha": 0.6,
+        "n_groups": pg.n_groups,
+    }
+
+
+def _report_head_confusion(model, pg: _PaddedGroups) -> dict:
+    from collections import defaultdict
+
+    form, content = pg.score(model)
+
+    def confusion(scores, labels, rows):
+        counts = defaultdict(lambda: defaultdict(int))
+        correct = total = 0
+        predicted_idx = pg.top1(scores)
+        for gi in np.flatnonzero(rows):
+            names = pg.names[gi]
+            positives = np.flatnonzero(labels[gi, : len(names)] > 0.5)
+            if not positives.size:
+                continue
+            predicted = int(predicted_idx[gi])
+            counts[names[predicted]][names[positives[0]]] += 1
+            # Correct if the predicted candidate has a positive label
+            if labels[gi, predicted] > 0.5:
+                correct += 1
+            total += 1
+
+        matrix_labels = sorted(
+            set(counts) | {e for row in counts.values() for e in row}
+        )
+        label_idx = {lb: i for i, lb in enumerate(matrix_labels)}
+        matrix = [[0] * len(matrix_labels) for _ in matrix_labels]
+        for predicted, expecteds in counts.items():
+            for expected, count in expecteds.items():
+                matrix[label_idx[predicted]][label_idx[expected]] = count
+        return {
+            "labels": matrix_labels,
+            "matrix": matrix,
+            "accuracy": round(correct / max(total, 1), 4),
+            "n_groups": total,
+        }
+
+    all_rows = np.ones(pg.n_groups, dtype=bool)
+    return {
+        "form_head": confusion(form, pg.form_labels, all_rows),
+        "content_head": confusion(content, pg.content_labels, pg.has_content_label()),
+    }
+
+
+def _compute_eval_reports() -> dict:
+    """Every precomputed report; runs in the eval_artifacts worker process."""
+    model = _load_model()
+    val_groups, _ = _load_groups()
+    pg = _PaddedGroups(val_groups)
+    return {
+        "score_distribution": _report_score_distribution(model, pg, len(val_groups)),
+        "feature_importance": _report_feature_importance(model, pg),
+        "group_ablation": _report_group_ablation(model, pg),
+        "content_form_matrix": _report_content_form_matrix(model, pg),
+        "content_ablation": _report_content_ablation(model, pg),
+        "alpha_sweep": _report_alpha_sweep(model, pg),
+        "head_confusion": _report_head_confusion(model, pg),
+    }
+
+
+async def _eval_report(name: str) -> dict:
+    reports = await _artifacts.get_or_compute(_compute_eval_reports)
+    return reports[name]
+
+
+@router.get("/ml/eval-artifacts")
+async def eval_artifacts_status(warm: bool = False):
+    """Artifact cache status; ``warm=true`` starts computing in the background."""
+    status = await asyncio.to_thread(_artifacts.status)
+    if warm and not status["cached"] and not status["computing"]:
+        asyncio.ensure_future(_artifacts.get_or_compute(_compute_eval_reports))
+        status["computing"] = True
+    return status
+
+
+# ---------------------------------------------------------------------------
+# Endpoint 1: Score Distribution
+# ---------------------------------------------------------------------------
+@router.get("/ml/score-distribution")
+async def score_distribution():
+    """Score distribution for positive vs negative candidates on validation data."""
+    return await _eval_report("score_distribution")
+
+
+# ---------------------------------------------------------------------------
+# Endpoint 2: Feature Importance
+# ---------------------------------------------------------------------------
+@router.get("/ml/feature-importance")
+async def feature_importance():
+    """Feature importance via weight magnitude and zero-out ablation."""
+    return await _eval_report("feature_importance")
+
+
+# ---------------------------------------------------------------------------
+# Endpoint 2b: Grouped Feature Ablation
+# ---------------------------------------------------------------------------
+_FEATURE_GROUPS_V3 = {
+    "sim_c": {"indices": [0, 1, 2, 3], "label": "Components ColBERT (sim_c_*)"},
+    "sim_i": {"indices": [4, 5, 6, 7], "label": "Inputs ColBERT (sim_i_*)"},
+    "sim_r": {"indices": [8], "label": "Relationships MiniLM (sim_r)"},
+    "structural": {"indices": [9, 10, 11, 12, 13], "label": "Structural DAG"},
+}
+
+_FEATURE_GROUPS_V5 = {
+    "sim_c": {"indices": [0, 1, 2, 3], "label": "Components ColBERT (sim_c_*)"},
+    "sim_i": {"indices": [4, 5, 6, 7], "label": "Inputs ColBERT (sim_i_*)"},
+    "sim_r": {"indices": [8], "label": "Relationships MiniLM (sim_r)"},
+    "structural": {"indices": [9, 10, 11, 12, 13], "label": "Structural DAG"},
+    "content": {
+        "indices": [14, 15, 16],
+        "label": "Content (sim_content, density, alignment)",
+    },
+}
+
+_FEATURE_GROUPS_V2 = {
+    "similarities": {"indices": [0, 1, 2], "label": "Similarities"},
+    "structural": {"indices": [3, 4, 5, 6, 7], "label": "Structural DAG"},
+}
+
+_FEATURE_GROUPS_V1 = {
+    "similarities": {"indices": [0, 1, 2], "label": "Similarities"},
+    "query_norms": {"indices": [3, 4, 5], "label": "Query norms"},
+    "candidate_norms": {"indices": [6, 7, 8], "label": "Candidate norms"},
+}
+
+
+@router.get("/ml/group-ablation")
+async def group_ablation():
+    """Grouped feature ablation — zero entire feature groups and pairwise combos."""
+    return await _eval_report("group_ablation")
+
+
 # ---------------------------------------------------------------------------
 # Endpoint 3: Per-Group Performance
 # ---------------------------------------------------------------------------
@@ -996,84 +1191,7 @@ async def content_form_matrix():
 
     Returns a matrix of (content_type, component) → content_score.
     """
-    model = _load_model()
-    if _model_type != "dual_head":
-        return {
-            "error": "Requires dual-head model (V5+)",
-            "model_type": _model_type,
-        }
-
-    torch = _load_torch()
-    val_groups, _ = _load_groups()
-
-    # Collect per-candidate form and content scores
-    matrix_data = []
-    for group in val_groups:
-        candidates = group.get("candidates", [])
-        if not candidates:
-            continue
-        features = [_candidate_features(c) for c in candidates]
-        x = torch.tensor(features, dtype=torch.float32)
-        with torch.no_grad():
-            form_s, content_s = model(x)
-        form_list = form_s.squeeze(-1).tolist()
-        content_list = content_s.squeeze(-1).tolist()
-
-        for c, fs, cs in zip(candidates, form_list, content_list):
-            matrix_data.append(
-                {
-                    "name": c.get("name", "?"),
-                    "form_label": c.get("form_label", c.get("label", 0)),
-                    "content_label": c.get("content_label", 0),
-                    "form_score": round(fs, 4),
-                    "content_score": round(cs, 4),
-                }
-            )
-
-    # Aggregate by component name
-    from collections import defaultdict
-
-    by_component = defaultdict(
-        lambda: {
-            "form_scores": [],
-            "content_scores": [],
-            "form_correct": 0,
-            "content_correct": 0,
-            "total": 0,
-        }
-    )
-    for d in matrix_data:
-        entry = by_component[d["name"]]
-        entry["form_scores"].append(d["form_score"])
-        entry["content_scores"].append(d["content_score"])
-        if d["form_label"] > 0.5:
-            entry["form_correct"] += 1
-        if d["content_label"] > 0.5:
-            entry["content_correct"] += 1
-        entry["total"] += 1
-
-    summary = []
-    for name, data in sorted(by_component.items()):
-        fs = data["form_scores"]
-        cs = data["content_scores"]
-        summary.append(
-            {
-                "component": name,
-                "mean_form_score": round(np.mean(fs), 4),
-                "mean_content_score": round(np.mean(cs), 4),
-                "form_accuracy": round(data["form_correct"] / max(data["total"], 1), 3),
-                "content_accuracy": round(
-                    data["content_correct"] / max(data["total"], 1), 3
-                ),
-                "n_samples": data["total"],
-            }
-        )
-
-    return {
-        "model_type": _model_type,
-        "n_candidates_scored": len(matrix_data),
-        "components": summary,
-    }
+    return await _eval_report("content_form_matrix")
 
 
 # ---------------------------------------------------------------------------
@@ -1082,75 +1200,7 @@ async def content_form_matrix():
 @router.get("/ml/content-ablation")
 async def content_ablation():
     """Per-head ablation: zero each feature and measure form/content/combined top1 independently."""
-    torch = _load_torch()
-    model = _load_model()
-    val_groups, _ = _load_groups()
-
-    def compute_per_head_accuracy(feature_mask=None):
-        form_ok = content_ok = combined_ok = total = 0
-        content_total = 0
-        for group in val_groups:
-            candidates = group.get("candidates", [])
-            if not candidates:
-                continue
-            features = [_candidate_features(c) for c in candidates]
-            x = torch.tensor(features, dtype=torch.float32)
-            if feature_mask is not None:
-                x[:, feature_mask] = 0.0
-            with torch.no_grad():
-                if _model_type == "dual_head":
-                    form_s, content_s = model(x)
-                    form_scores = form_s.squeeze(-1)
-                    content_scores = content_s.squeeze(-1)
-                    combined = 0.6 * form_scores + 0.4 * content_scores
-                else:
-                    combined = model(x).squeeze(-1)
-                    form_scores = combined
-                    content_scores = combined
-
-            form_labels = [c.get("form_label", c.get("label", 0.0)) for c in candidates]
-            content_labels = [c.get("content_label", 0.0) for c in candidates]
-
-            # Form top1
-            top_combined = combined.argmax().item()
-            if form_labels[top_combined] > 0.5:
-                combined_ok += 1
-            top_form = form_scores.argmax().item()
-            if form_labels[top_form] > 0.5:
-                form_ok += 1
-            total += 1
-
-            # Content top1 (only if group has content labels)
-            if any(cl > 0.5 for cl in content_labels):
-                top_content = content_scores.argmax().item()
-                if content_labels[top_content] > 0.5:
-                    content_ok += 1
-                content_total += 1
-
-        return (
-            form_ok / max(total, 1),
-            content_ok / max(content_total, 1),
-            combined_ok / max(total, 1),
-        )
-
-    base_form, base_content, base_combined = compute_per_head_accuracy()
-    n_features = len(FEATURE_NAMES)
-    form_abl, content_abl, combined_abl = [], [], []
-    for i in range(n_features):
-        f, c, cb = compute_per_head_accuracy(feature_mask=i)
-        form_abl.append(round(base_form - f, 4))
-        content_abl.append(round(base_content - c, 4))
-        combined_abl.append(round(base_combined - cb, 4))
-
-    return {
-        "feature_names": FEATURE_NAMES,
-        "form_ablation": form_abl,
-        "content_ablation": content_abl,
-        "combined_ablation": combined_abl,
-        "baseline_form": round(base_form, 4),
-        "baseline_content": round(base_content, 4),
-        "baseline_combined": round(base_combined, 4),
-    }
+    return await _eval_report("content_ablation")
 
 
 # ---------------------------------------------------------------------------
@@ -1159,72 +1209,7 @@ async def content_ablation():
 @router.get("/ml/alpha-sweep")
 async def alpha_sweep():
     """Sweep alpha from 0 to 1 and measure combined accuracy at each value."""
-    torch = _load_torch()
-    model = _load_model()
-    val_groups, _ = _load_groups()
-
-    if _model_type != "dual_head":
-        return {"error": "Requires dual-head model", "model_type": _model_type}
-
-    # Pre-compute all form/content scores once
-    group_data = []
-    for group in val_groups:
-        candidates = group.get("candidates", [])
-        if not candidates:
-            continue
-        features = [_candidate_features(c) for c in candidates]
-        x = torch.tensor(features, dtype=torch.float32)
-        with torch.no_grad():
-            form_s, content_s = model(x)
-        form_labels = [c.get("form_label", c.get("label", 0.0)) for c in candidates]
-        content_labels = [c.get("content_label", 0.0) for c in candidates]
-        group_data.append(
-            {
-                "form_scores": form_s.squeeze(-1),
-                "content_scores": content_s.squeeze(-1),
-                "form_labels": form_labels,
-                "content_labels": content_labels,
-            }
-        )
-
-    alphas = [round(a * 0.05, 2) for a in range(21)]  # 0.0..1.0
-    combined_accs = []
-    for alpha in alphas:
-        correct = 0
-        for gd in group_data:
-            combined = alpha * gd["form_scores"] + (1 - alpha) * gd["content_scores"]
-            top_idx = combined.argmax().item()
-            if gd["form_labels"][top_idx] > 0.5:
-                correct += 1
-        combined_accs.append(round(correct / max(len(group_data), 1), 4))
-
-    # Form-only and content-only accuracy (constant across alpha)
-    form_correct = sum(
-        1
-        for gd in group_data
-        if gd["form_labels"][gd["form_scores"].argmax().item()] > 0.5
-    )
-    content_total = 0
-    content_correct = 0
-    for gd in group_data:
-        if any(cl > 0.5 for cl in gd["content_labels"]):
-            top_c = gd["content_scores"].argmax().item()
-            if gd["content_labels"][top_c] > 0.5:
-                content_correct += 1
-            content_total += 1
-
-    optimal_idx = max(range(len(combined_accs)), key=lambda i: combined_accs[i])
-
-    return {
-        "alphas": alphas,
-        "combined_accuracy": combined_accs,
-        "form_accuracy": round(form_correct / max(len(group_data), 1), 4),
-        "content_accuracy": round(content_correct / max(content_total, 1), 4),
-        "optimal_alpha": alphas[optimal_idx],
-        "optimal_accuracy": combined_accs[optimal_idx],
-        "current_alpha": 0.6,
-        "n_groups": len(group_data),
-    }
+    return await _eval_report("alpha_sweep")
 
 
 # ---------------------------------------------------------------------------
@@ -1233,97 +1218,7 @@ async def alpha_sweep():
 @router.get("/ml/head-confusion")
 async def head_confusion():
     """Confusion matrices for form and content heads independently."""
-    torch = _load_torch()
-    model = _load_model()
-    val_groups, _ = _load_groups()
-
-    from collections import defaultdict
-
-    form_confusion = defaultdict(lambda: defaultdict(int))
-    content_confusion = defaultdict(lambda: defaultdict(int))
-    form_correct = 0
-    content_correct = 0
-    form_total = 0
-    content_total = 0
-
-    for group in val_groups:
-        candidates = group.get("candidates", [])
-        if not candidates:
-            continue
-        features = [_candidate_features(c) for c in candidates]
-        x = torch.tensor(features, dtype=torch.float32)
-        with torch.no_grad():
-            if _model_type == "dual_head":
-                form_s, content_s = model(x)
-                form_scores = form_s.squeeze(-1)
-                content_scores = content_s.squeeze(-1)
-            else:
-                scores = model(x).squeeze(-1)
-                form_scores = scores
-                content_scores = scores
-
-        form_labels = [c.get("form_label", c.get("label", 0.0)) for c in candidates]
-        content_labels = [c.get("content_label", 0.0) for c in candidates]
-
-        # Form head: predicted vs expected
-        form_predicted_idx = form_scores.argmax().item()
-        form_expected_idx = next(
-            (i for i, lb in enumerate(form_labels) if lb > 0.5), None
-        )
-        if form_expected_idx is not None:
-            predicted_name = candidates[form_predicted_idx].get("name", "?")
-            expected_name = candidates[form_expected_idx].get("name", "?")
-            form_confusion[predicted_name][expected_name] += 1
-            # Correct if the predicted candidate has a positive label
-            if form_labels[form_predicted_idx] > 0.5:
-                form_correct += 1
-            form_total += 1
-
-        # Content head: predicted vs expected
-        if any(cl > 0.5 for cl in content_labels):
-            content_predicted_idx = content_scores.argmax().item()
-            content_expected_idx = next(
-                (i for i, lb in enumerate(content_labels) if lb > 0.5), None
-            )
-            if content_expected_idx is not None:
-                predicted_name = candidates[content_predicted_idx].get("name", "?")
-                expected_name = candidates[content_expected_idx].get("name", "?")
-                content_confusion[predicted_name][expected_name] += 1
-                if content_labels[content_predicted_idx] > 0.5:
-                    content_correct += 1
-                content_total += 1
-
-    def build_matrix(confusion_dict):
-        labels = sorted(
-            set(
-                list(confusion_dict.keys())
-                + [e for row in confusion_dict.values() for e in row.keys()]
-            )
-        )
-        label_idx = {lb: i for i, lb in enumerate(labels)}
-        matrix = [[0] * len(labels) for _ in labels]
-        for predicted, expecteds in confusion_dict.items():
-            for expected, count in expecteds.items():
-                matrix[label_idx[predicted]][label_idx[expected]] = count
-        return labels, matrix
-
-    form_labels_list, form_matrix = build_matrix(form_confusion)
-    content_labels_list, content_matrix = build_matrix(content_confusion)
-
-    return {
-        "form_head": {
-            "labels": form_labels_list,
-            "matrix": form_matrix,
-            "accuracy": round(form_correct / max(form_total, 1), 4),
-            "n_groups": form_total,
-        },
-        "content_head": {
-            "labels": content_labels_list,
-            "matrix": content_matrix,
-            "accuracy": round(content_correct / max(content_total, 1), 4),
-            "n_groups": content_total,
-        },
-    }
+    return await _eval_report("head_confusion")
 
 
 # ---------------------------------------------------------------------------
@@ -48,6 +48,7 @@ from auth.scope_registry import ScopeRegistry
 from config.enhanced_logging import setup_logger
 from config.settings import settings
 from middleware.qdrant_core.client import get_or_create_client_manager
+from middleware.qdrant_core.usage_counters import get_usage_counters
 
 logger = setup_logger()
 
@@ -172,6 +173,7 @@ class DynamicInstructionsBuilder:
         self._cached_instructions: Optional[str] = None
         self._cache_timestamp: Optional[datetime] = None
         self._cache_ttl_seconds = 300  # 5 minute cache
+        self._seed_lock = asyncio.Lock()
 
     @property
     def is_qdrant_available(self) -> bool:
@@ -193,62 +195,70 @@ class DynamicInstructionsBuilder:
             logger.debug(f"📊 Qdrant availability check failed: {e}")
             return False
 
+    async def _seed_usage_counters(self) -> None:
+        """One-time seed of the usage counters from the full analytics scroll.
+
+        Only runs when no persisted counters exist (fresh deploy with an
+        existing response history); afterwards counters are maintained
+        incrementally by QdrantUnifiedMiddleware.
+        """
+        async with self._seed_lock:
+            counters = get_usage_counters()
+            if counters.has_data or not self.is_qdrant_available:
+                return
+            search_manager = self.qdrant_middleware.search_manager
+            if not search_manager:
+                return
+
+            tool_analytics, service_analytics = await asyncio.gather(
+                search_manager.get_analytics(group_by="tool_name"),
+                search_manager.get_analytics(group_by="service"),
+            )
+            if (tool_analytics or {}).get("error") or (service_analytics or {}).get(
+                "error"
+            ):
+                logger.debug("📊 Analytics scroll failed; usage counters not seeded")
+                return
+            counters.seed_from_analytics(tool_analytics, service_analytics)
+            await asyncio.to_thread(counters.flush)
+
+    async def _get_counter_analytics(self, group_by: str) -> Optional[Dict]:
+        """Read aggregates from the incremental usage counters (O(tools))."""
+        counters = get_usage_counters()
+        if not counters.has_data:
+            await self._seed_usage_counters()
+        if not counters.has_data:
+            return None
+        analytics = counters.analytics(group_by=group_by)
+        return analytics if analytics["groups"] else None
+
     async def get_tool_analytics(self) -> Optional[Dict]:
         """
-        Fetch tool usage analytics from Qdrant.
+        Fetch tool usage analytics from the incremental usage counters.
 
         Returns:
             Dict with analytics data or None if unavailable
         """
-        if not self.is_qdrant_available:
-            logger.debug("📊 Qdrant not available for analytics")
-            return None
-
         try:
-            # Access the search manager from the middleware
-            search_manager = self.qdrant_middleware.search_manager
-            if not search_manager:
-                logger.debug("📊 Search manager not available")
-                return None
-
-            # Get analytics grouped by tool_name
-            analytics = await search_manager.get_analytics(group_by="tool_name")
-
-            if analytics and not analytics.get("error"):
+            analytics = await self._get_counter_analytics("tool_name")
+            if analytics:
                 logger.info(
                     f"📊 Retrieved analytics: {analytics.get('total_responses', 0)} total responses"
                 )
-                return analytics
-            else:
-                logger.debug(f"📊 Analytics returned error or empty: {analytics}")
-                return None
-
+            return analytics
         except Exception as e:
             logger.warning(f"📊 Failed to get tool analytics: {e}")
             return None
 
     async def get_service_analytics(self) -> Optional[Dict]:
         """
-        Fetch service-level analytics from Qdrant.
+        Fetch service-level analytics from the incremental usage counters.
 
         Returns:
             Dict with service analytics or None if unavailable
         """
-        if not self.is_qdrant_available:
-            return None
-
         try:
-            search_manager = self.qdrant_middleware.search_manager
-            if not search_manager:
-                return None
-
-            # Get analytics grouped by service field
-            analytics = await search_manager.get_analytics(group_by="service")
-
-            if analytics and not analytics.get("error"):
-                return analytics
-            return None
-
+            return await self._get_counter_analytics("service")
         except Exception as e:
             logger.warning(f"📊 Failed to get service analytics: {e}")
             return None
@@ -263,8 +273,6 @@ class DynamicInstructionsBuilder:
         Returns:
             List of dicts with collection name, point count, status, and purpose
         """
-        collections_info = []
-
         # Define collections to report on with their purposes
         collections_to_check = [
             (settings.tool_collection, "Tool responses & analytics"),
@@ -283,40 +291,38 @@ class DynamicInstructionsBuilder:
                 logger.debug("📊 Qdrant client not available after initialization")
                 return []
 
-            for collection_name, purpose in collections_to_check:
+            async def _probe(collection_name: str, purpose: str) -> Dict[str, Any]:
                 try:
                     # Get collection info from Qdrant
                     collection_info = await asyncio.to_thread(
                         client_manager.client.get_collection, collection_name
                     )
-
-                    collections_info.append(
-                        {
-                            "name": collection_name,
-                            "points_count": getattr(collection_info, "points_count", 0)
-                            or 0,
-                            "vectors_count": getattr(
-                                collection_info, "vectors_count", 0
-                            )
-                            or 0,
-                            "status": str(
-                                getattr(collection_info, "status", "unknown")
-                            ),
-                            "purpose": purpose,
-                        }
-                    )
+                    return {
+                        "name": collection_name,
+                        "points_count": getattr(collection_info, "points_count", 0)
+                        or 0,
+                        "vectors_count": getattr(collection_info, "vectors_count", 0)
+                        or 0,
+                        "status": str(getattr(collection_info, "status", "unknown")),
+                        "purpose": purpose,
+                    }
                 except Exception as e:
                     # Collection might not exist yet
                     logger.debug(f"📊 Collection {collection_name} not available: {e}")
-                    collections_info.append(
-                        {
-                            "name": collection_name,
-                            "points_count": 0,
-                            "vectors_count": 0,
-                            "status": "not_found",
-                            "purpose": purpose,
-                        }
-                    )
+                    return {
+                        "name": collection_name,
+                        "points_count": 0,
+                        "vectors_count": 0,
+                        "status": "not_found",
+                        "purpose": purpose,
+                    }
+
+            # Probe all collections concurrently
+            collections_info = list(
+                await asyncio.gather(
+                    *(_probe(name, purpose) for name, purpose in collections_to_check)
+                )
+            )
 
             return collections_info
 
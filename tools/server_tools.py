@@ -34,9 +34,11 @@ from auth.context import (
 from auth.middleware import CredentialStorageMode
 from config.enhanced_logging import setup_logger
 from config.settings import settings
+from middleware.session_tool_filtering_middleware import bump_tool_registry_version
 from tools.common_types import GoogleServiceType, UserGoogleEmail
 from tools.dynamic_instructions import refresh_instructions_for_session
 from tools.server_types import (
+    CacheMetrics,
     CredentialInfo,
     HealthCheckResponse,
     ManageCredentialsResponse,
@@ -275,7 +277,12 @@ async def health_check(
 
             import gc as _gc
 
+            from config.cache_registry import get_cache_registry
+
             gc_stats = _gc.get_stats()
+            registry = get_cache_registry()
+            registry.measure()
+            cache_stats = registry.stats()
             memory_health = MemoryHealth(
                 rss_mb=rss_mb,
                 vms_mb=proc_health["vms_mb"],
@@ -292,6 +299,17 @@ async def health_check(
                 gc_gen1_collections=gc_stats[1]["collections"],
                 gc_gen2_collections=gc_stats[2]["collections"],
                 gc_uncollectable=sum(g["uncollectable"] for g in gc_stats),
+                cache_budget_mb=round(cache_stats["budget_bytes"] / 1048576, 1),
+                caches=[
+                    CacheMetrics(
+                        name=name,
+                        bytes=c["bytes"],
+                        priority=c["priority"],
+                        hit_rate=c["hit_rate"],
+                        evicted_entries=c["evicted_entries"],
+                    )
+                    for name, c in cache_stats["caches"].items()
+                ],
             )
 
             # Degrade overall status based on memory pressure
@@ -1144,6 +1162,7 @@ def setup_server_tools(mcp: FastMCP) -> None:
 
             # Notify MCP client of tool list change
             if affected:
+                bump_tool_registry_version()
                 await ctx.send_notification(ToolListChangedNotification())
             return ManageToolsResponse(
                 success=len(affected) > 0,
@@ -1234,6 +1253,7 @@ def setup_server_tools(mcp: FastMCP) -> None:
 
             # Notify MCP client of tool list change
             if affected:
+                bump_tool_registry_version()
                 await ctx.send_notification(ToolListChangedNotification())
             return ManageToolsResponse(
                 success=True,
@@ -1320,6 +1340,7 @@ def setup_server_tools(mcp: FastMCP) -> None:
 
             # Notify MCP client of tool list change
             if affected:
+                bump_tool_registry_version()
                 await ctx.send_notification(ToolListChangedNotification())
             return ManageToolsResponse(
                 success=len(affected) > 0,
@@ -1409,6 +1430,7 @@ def setup_server_tools(mcp: FastMCP) -> None:
 
             # Notify MCP client of tool list change
             if affected:
+                bump_tool_registry_version()
                 await ctx.send_notification(ToolListChangedNotification())
             return ManageToolsResponse(
                 success=True,
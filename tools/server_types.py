@@ -30,6 +30,20 @@ class OAuthFlowStatus(BaseModel):
     )
 
 
+class CacheMetrics(BaseModel):
+    """Size and effectiveness of one registered in-process cache."""
+
+    name: str = Field(..., description="Registered cache name")
+    bytes: int = Field(..., description="Estimated size in bytes (last sample)")
+    priority: int = Field(
+        ..., description="Eviction priority (higher gives up less under pressure)"
+    )
+    hit_rate: float = Field(..., description="Hits / lookups since startup (0-1)")
+    evicted_entries: int = Field(
+        ..., description="Entries evicted by the memory budget since startup"
+    )
+
+
 class MemoryHealth(BaseModel):
     """Memory and process health metrics."""
 
@@ -69,6 +83,12 @@ class MemoryHealth(BaseModel):
     gc_uncollectable: int = Field(
         ..., description="Total uncollectable objects across all generations"
     )
+    cache_budget_mb: float = Field(
+        0.0, description="Memory budget shared by registered caches in MB"
+    )
+    caches: List[CacheMetrics] = Field(
+        default_factory=list, description="Per-cache memory and hit rate metrics"
+    )
 
 
 class HealthCheckResponse(BaseModel):